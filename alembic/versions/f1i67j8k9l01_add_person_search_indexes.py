@@ -0,0 +1,69 @@
+"""add person full-text search vector and trigram indexes
+
+Revision ID: f1i67j8k9l01
+Revises: e0h56i7j8k90
+Create Date: 2026-01-05
+
+Replaces the six-column ILIKE scan on the People list with:
+- persons.search_vector: generated, weighted tsvector (names > title > email > notes)
+- GIN index on search_vector for ranked prefix matching
+- pg_trgm GIN indexes on full_name and email for substring matching
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1i67j8k9l01'
+down_revision = 'e0h56i7j8k90'
+branch_labels = None
+depends_on = None
+
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, "
+    "coalesce(full_name, '') || ' ' || coalesce(first_name, '') || ' ' || "
+    "coalesce(last_name, '') || ' ' || coalesce(nickname, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(email, '')), 'C') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(notes, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    # Trigram support for substring (ILIKE '%q%') matching
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Generated column is maintained by Postgres on every INSERT/UPDATE
+    op.execute(
+        f"ALTER TABLE persons ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+    )
+
+    op.create_index(
+        'ix_persons_search_vector',
+        'persons',
+        ['search_vector'],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_persons_full_name_trgm',
+        'persons',
+        ['full_name'],
+        postgresql_using='gin',
+        postgresql_ops={'full_name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_persons_email_trgm',
+        'persons',
+        ['email'],
+        postgresql_using='gin',
+        postgresql_ops={'email': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_persons_email_trgm', table_name='persons')
+    op.drop_index('ix_persons_full_name_trgm', table_name='persons')
+    op.drop_index('ix_persons_search_vector', table_name='persons')
+    op.drop_column('persons', 'search_vector')
+    # pg_trgm extension is left installed; other objects may depend on it
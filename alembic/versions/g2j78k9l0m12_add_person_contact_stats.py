@@ -0,0 +1,56 @@
+"""add denormalized last_contact_at and interaction_count to persons
+
+Revision ID: g2j78k9l0m12
+Revises: f1i67j8k9l01
+Create Date: 2026-01-06
+
+Persisted copies of the interaction aggregates so the People list can show,
+sort and filter by "last contacted" without loading interactions.
+Maintained by app.services.contact_stats; backfilled here.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'g2j78k9l0m12'
+down_revision = 'f1i67j8k9l01'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'persons',
+        sa.Column('last_contact_at', sa.DateTime(timezone=True), nullable=True,
+                  comment='Most recent interaction date (denormalized)'),
+    )
+    op.add_column(
+        'persons',
+        sa.Column('interaction_count', sa.Integer(), nullable=False, server_default='0',
+                  comment='Number of interactions (denormalized)'),
+    )
+
+    # Backfill from existing interactions
+    op.execute("""
+        UPDATE persons p
+        SET interaction_count = s.interaction_count,
+            last_contact_at = s.last_contact_at
+        FROM (
+            SELECT person_id,
+                   count(*) AS interaction_count,
+                   max(coalesce(timezone('UTC', interaction_date::timestamp), created_at)) AS last_contact_at
+            FROM interactions
+            WHERE person_id IS NOT NULL
+            GROUP BY person_id
+        ) s
+        WHERE p.id = s.person_id
+    """)
+
+    op.create_index('ix_persons_last_contact_at', 'persons', ['last_contact_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_persons_last_contact_at', table_name='persons')
+    op.drop_column('persons', 'interaction_count')
+    op.drop_column('persons', 'last_contact_at')
@@ -0,0 +1,32 @@
+"""add month/day expression index on persons.birthday
+
+Revision ID: h3k89l0m1n23
+Revises: g2j78k9l0m12
+Create Date: 2026-01-07
+
+Lets the dashboard birthday widgets look up birthdays by month/day range
+(including windows that wrap past New Year) instead of scanning every
+person with a birthday. Queried by app.services.birthday_service.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'h3k89l0m1n23'
+down_revision = 'g2j78k9l0m12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_persons_birthday_md',
+        'persons',
+        [sa.text('(CAST(EXTRACT(month FROM birthday) * 100 + EXTRACT(day FROM birthday) AS INTEGER))')],
+        postgresql_where=sa.text('birthday IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_persons_birthday_md', table_name='persons')
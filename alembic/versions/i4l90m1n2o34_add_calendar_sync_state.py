@@ -0,0 +1,63 @@
+"""add calendar_sync_state table
+
+Revision ID: i4l90m1n2o34
+Revises: h3k89l0m1n23
+Create Date: 2026-01-08
+
+Per-account Calendar API sync token and status, so a background job keeps
+calendar_events current incrementally and views read only the local table.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'i4l90m1n2o34'
+down_revision = 'h3k89l0m1n23'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'calendar_sync_state',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('google_account_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('google_accounts.id', ondelete='CASCADE'), nullable=False),
+
+        # Calendar API incremental sync
+        sa.Column('sync_token', sa.Text(), nullable=True,
+                  comment='Calendar API nextSyncToken for incremental sync'),
+        sa.Column('window_start', sa.DateTime(timezone=True), nullable=True,
+                  comment='timeMin of the full sync the token belongs to'),
+
+        # Sync timestamps
+        sa.Column('last_full_sync_at', sa.DateTime(timezone=True), nullable=True,
+                  comment='When the last full sync completed'),
+        sa.Column('last_incremental_sync_at', sa.DateTime(timezone=True), nullable=True,
+                  comment='When the last incremental sync completed'),
+
+        # Current status
+        sa.Column('sync_status', sa.String(50), server_default='never_synced'),
+        sa.Column('error_message', sa.Text(), nullable=True,
+                  comment='Error details if last sync failed'),
+
+        # Statistics
+        sa.Column('events_synced', sa.Integer(), server_default='0',
+                  comment='Total event changes synced from this account'),
+        sa.Column('last_sync_event_count', sa.Integer(), server_default='0',
+                  comment='Event changes synced in last sync operation'),
+
+        # Timestamps
+        sa.Column('created_at', sa.DateTime(timezone=True),
+                  server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True),
+                  server_default=sa.func.now(), onupdate=sa.func.now()),
+
+        sa.UniqueConstraint('google_account_id', name='uq_calendar_sync_state_account'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('calendar_sync_state')
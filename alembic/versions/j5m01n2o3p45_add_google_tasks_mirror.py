@@ -0,0 +1,78 @@
+"""add google_task_lists and google_tasks tables
+
+Revision ID: j5m01n2o3p45
+Revises: i4l90m1n2o34
+Create Date: 2026-01-09
+
+Local mirror of Google Tasks (open tasks only), refreshed in the background
+with updatedMin so the tasks widgets read Postgres instead of the API.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'j5m01n2o3p45'
+down_revision = 'i4l90m1n2o34'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'google_task_lists',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('google_account_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('google_accounts.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('google_list_id', sa.String(255), nullable=False,
+                  comment='Google Tasks task list ID'),
+        sa.Column('title', sa.String(500), server_default='Untitled'),
+        sa.Column('tasks_synced_at', sa.DateTime(timezone=True), nullable=True,
+                  comment='updatedMin for the next incremental refresh (NULL: full refresh)'),
+        sa.Column('created_at', sa.DateTime(timezone=True),
+                  server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True),
+                  server_default=sa.func.now(), onupdate=sa.func.now()),
+
+        sa.UniqueConstraint('google_account_id', 'google_list_id',
+                            name='uq_google_task_lists_account_list'),
+    )
+
+    op.create_table(
+        'google_tasks',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('task_list_id', postgresql.UUID(as_uuid=True),
+                  sa.ForeignKey('google_task_lists.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('google_task_id', sa.String(255), nullable=False,
+                  comment='Google Tasks task ID'),
+        sa.Column('parent_id', sa.String(255), nullable=True,
+                  comment='Google task ID of the parent task (subtasks)'),
+        sa.Column('title', sa.Text(), server_default=''),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(20), server_default='needsAction'),
+        sa.Column('position', sa.String(64), nullable=True,
+                  comment='Google sort key among siblings'),
+        sa.Column('due', sa.DateTime(timezone=True), nullable=True,
+                  comment='Raw due timestamp from the API'),
+        sa.Column('due_date', sa.Date(), nullable=True),
+        sa.Column('due_time', sa.Time(), nullable=True,
+                  comment='Local due time; NULL for date-only tasks'),
+        sa.Column('google_updated_at', sa.DateTime(timezone=True), nullable=True,
+                  comment='Last modification time reported by Google'),
+        sa.Column('created_at', sa.DateTime(timezone=True),
+                  server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True),
+                  server_default=sa.func.now(), onupdate=sa.func.now()),
+
+        sa.UniqueConstraint('task_list_id', 'google_task_id', name='uq_google_tasks_list_task'),
+    )
+    op.create_index('idx_google_tasks_list_position', 'google_tasks', ['task_list_id', 'position'])
+    op.create_index('idx_google_tasks_due_date', 'google_tasks', ['due_date'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_google_tasks_due_date', table_name='google_tasks')
+    op.drop_index('idx_google_tasks_list_position', table_name='google_tasks')
+    op.drop_table('google_tasks')
+    op.drop_table('google_task_lists')
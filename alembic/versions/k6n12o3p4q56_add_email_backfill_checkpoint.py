@@ -0,0 +1,46 @@
+"""add email backfill checkpoint to email_sync_state
+
+Revision ID: k6n12o3p4q56
+Revises: j5m01n2o3p45
+Create Date: 2026-01-10
+
+The initial Gmail sync stores only the newest messages. A background
+backfill walks older history one date window at a time, in bounded chunks.
+It keeps its position (window and messages.list page token) here, so it
+resumes after a restart.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'k6n12o3p4q56'
+down_revision = 'j5m01n2o3p45'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('email_sync_state', sa.Column(
+        'backfill_before', sa.Date(), nullable=True,
+        comment='Exclusive upper bound of the date window being backfilled',
+    ))
+    op.add_column('email_sync_state', sa.Column(
+        'backfill_page_token', sa.Text(), nullable=True,
+        comment='messages.list page token within the current backfill window',
+    ))
+    op.add_column('email_sync_state', sa.Column(
+        'backfill_messages', sa.Integer(), server_default='0',
+        comment='Messages stored by the backfill so far',
+    ))
+    op.add_column('email_sync_state', sa.Column(
+        'backfill_completed_at', sa.DateTime(timezone=True), nullable=True,
+        comment='When the backfill reached the oldest message in the mailbox',
+    ))
+
+
+def downgrade() -> None:
+    op.drop_column('email_sync_state', 'backfill_completed_at')
+    op.drop_column('email_sync_state', 'backfill_messages')
+    op.drop_column('email_sync_state', 'backfill_page_token')
+    op.drop_column('email_sync_state', 'backfill_before')
@@ -0,0 +1,77 @@
+"""add email label indexes and per-label unread counts
+
+Revision ID: l7o23p4q5r67
+Revises: k6n12o3p4q56
+Create Date: 2026-01-11
+
+The inbox filters email_messages by folder/label with JSONB containment
+(labels @> '["INBOX"]'), which had no index. It also counted unread inbox
+messages with another containment scan on every page load. This migration
+adds:
+- a jsonb_path_ops GIN index on labels for label filters
+- partial indexes, in listing order, for the inbox, unread inbox and sent
+  folders
+- email_sync_state.unread_counts: unread messages per label, refreshed by
+  the sync instead of counted per request
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'l7o23p4q5r67'
+down_revision = 'k6n12o3p4q56'
+branch_labels = None
+depends_on = None
+
+
+INBOX_PREDICATE = """labels @> '["INBOX"]'::jsonb"""
+SENT_PREDICATE = """labels @> '["SENT"]'::jsonb"""
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_email_messages_labels',
+        'email_messages',
+        ['labels'],
+        postgresql_using='gin',
+        postgresql_ops={'labels': 'jsonb_path_ops'},
+    )
+    for name, predicate in (
+        ('idx_email_messages_inbox_date', INBOX_PREDICATE),
+        ('idx_email_messages_inbox_unread', f"NOT is_read AND {INBOX_PREDICATE}"),
+        ('idx_email_messages_sent_date', SENT_PREDICATE),
+    ):
+        op.create_index(
+            name,
+            'email_messages',
+            [sa.text('internal_date DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text(predicate),
+        )
+
+    op.add_column('email_sync_state', sa.Column(
+        'unread_counts', postgresql.JSONB(), server_default='{}',
+        comment='Unread message count per Gmail label ID',
+    ))
+    # Seed the counts; later syncs keep them current
+    op.execute("""
+        UPDATE email_sync_state s
+        SET unread_counts = coalesce((
+            SELECT jsonb_object_agg(label, n)
+            FROM (
+                SELECT label, count(*) AS n
+                FROM email_messages m, jsonb_array_elements_text(m.labels) AS label
+                WHERE m.google_account_id = s.google_account_id AND NOT m.is_read
+                GROUP BY label
+            ) counts
+        ), '{}'::jsonb)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('email_sync_state', 'unread_counts')
+    op.drop_index('idx_email_messages_sent_date', table_name='email_messages')
+    op.drop_index('idx_email_messages_inbox_unread', table_name='email_messages')
+    op.drop_index('idx_email_messages_inbox_date', table_name='email_messages')
+    op.drop_index('idx_email_messages_labels', table_name='email_messages')
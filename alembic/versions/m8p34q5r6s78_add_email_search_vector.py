@@ -0,0 +1,61 @@
+"""add email full-text search vector
+
+Revision ID: m8p34q5r6s78
+Revises: l7o23p4q5r67
+Create Date: 2026-01-12
+
+Replaces the ILIKE '%q%' scan over subject, snippet and sender in inbox
+search with:
+- email_messages.search_vector: generated, weighted tsvector
+  (subject > sender > recipients > snippet)
+- GIN index on search_vector for ranked prefix matching and from:/to:
+  name searches
+- jsonb_path_ops GIN index on to_emails for to:address searches
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'm8p34q5r6s78'
+down_revision = 'l7o23p4q5r67'
+branch_labels = None
+depends_on = None
+
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, coalesce(subject, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(from_name, '') || ' ' || "
+    "translate(coalesce(from_email, ''), '@.', '  ')), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, translate(coalesce("
+    "jsonb_path_query_array(to_emails, '$[*].* ? (@.type() == \"string\")')::text, ''), "
+    "'@.', '  ')), 'C') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(snippet, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    # Generated column is maintained by Postgres on every INSERT/UPDATE
+    op.execute(
+        f"ALTER TABLE email_messages ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+    )
+
+    op.create_index(
+        'idx_email_messages_search_vector',
+        'email_messages',
+        ['search_vector'],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'idx_email_messages_to_emails',
+        'email_messages',
+        ['to_emails'],
+        postgresql_using='gin',
+        postgresql_ops={'to_emails': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_email_messages_to_emails', table_name='email_messages')
+    op.drop_index('idx_email_messages_search_vector', table_name='email_messages')
+    op.drop_column('email_messages', 'search_vector')
@@ -0,0 +1,30 @@
+"""add email cache thread index
+
+Revision ID: n9q45r6s7t89
+Revises: m8p34q5r6s78
+Create Date: 2026-01-13
+
+email_cache is now a read-through cache for thread details as well as
+person searches. Thread lookups filter by account and Gmail thread id,
+which only the (person_id, gmail_thread_id) unique constraint covered.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'n9q45r6s7t89'
+down_revision = 'm8p34q5r6s78'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_email_cache_thread',
+        'email_cache',
+        ['google_account_id', 'gmail_thread_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_email_cache_thread', table_name='email_cache')
@@ -0,0 +1,35 @@
+"""add stored gmail labels to email sync state
+
+Revision ID: o0r56s7t8u90
+Revises: n9q45r6s7t89
+Create Date: 2026-01-14
+
+The inbox called labels().list for every active account on each page view.
+The label list is now stored per account and refreshed by the sync.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'o0r56s7t8u90'
+down_revision = 'n9q45r6s7t89'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('email_sync_state', sa.Column(
+        'label_names', postgresql.JSONB(),
+        comment='Gmail label ID -> display name',
+    ))
+    op.add_column('email_sync_state', sa.Column(
+        'labels_synced_at', sa.DateTime(timezone=True),
+        comment='When label_names was last fetched from Gmail',
+    ))
+
+
+def downgrade() -> None:
+    op.drop_column('email_sync_state', 'labels_synced_at')
+    op.drop_column('email_sync_state', 'label_names')
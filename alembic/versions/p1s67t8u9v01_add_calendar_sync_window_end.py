@@ -0,0 +1,36 @@
+"""add calendar sync window end
+
+Revision ID: p1s67t8u9v01
+Revises: o0r56s7t8u90
+Create Date: 2026-01-15
+
+Calendar views read calendar_events only, so a range outside the synced
+window showed no events. The window end is stored next to its start, so
+views can tell and fetch the missing range. Existing states are filled
+with the window their last full sync used (365 days after it).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'p1s67t8u9v01'
+down_revision = 'o0r56s7t8u90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('calendar_sync_state', sa.Column(
+        'window_end', sa.DateTime(timezone=True),
+        comment='End of the synced range (full sync timeMax, widened on demand)',
+    ))
+    op.execute("""
+        UPDATE calendar_sync_state
+        SET window_end = last_full_sync_at + interval '365 days'
+        WHERE window_start IS NOT NULL AND last_full_sync_at IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('calendar_sync_state', 'window_end')
@@ -18,10 +18,60 @@ class Settings(BaseSettings):
     db_user: str = "blackbook"
     db_password: str = ""
 
+    # Connection pool settings
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # Seconds before a connection is replaced (-1 = never)
+    db_statement_timeout_ms: int = 0  # Per-statement timeout (0 = no limit)
+    db_application_name: str = "blackbook"  # Shown in pg_stat_activity
+
+    # Query profiler: per-request query counts/DB time in response headers
+    # and aggregated on /debug/perf (adds a little overhead per statement)
+    query_profiler_enabled: bool = False
+    # Log a possible N+1 when one statement repeats this often in a request
+    query_profiler_repeat_threshold: int = 10
+
     # Application settings
     secret_key: str = "change-me-in-production"
     debug: bool = False
 
+    # Worker threads for sync route handlers and other blocking work.
+    # Keep at or below db_pool_size + db_max_overflow so threads don't
+    # queue waiting for a database connection.
+    threadpool_size: int = 15
+
+    # Concurrent Google API calls across accounts (see google_executor);
+    # per-account limit keeps each user under Google's per-user quotas
+    google_api_max_workers: int = 8
+    google_api_per_account_concurrency: int = 4
+
+    # Background backfill of older Gmail history, after the initial sync.
+    # Walks back window_days at a time, pages_per_run list pages (100
+    # messages each) per run, down to backfill_days (0: whole mailbox)
+    email_backfill_enabled: bool = True
+    email_backfill_interval_minutes: int = 10
+    email_backfill_days: int = 365
+    email_backfill_window_days: int = 30
+    email_backfill_pages_per_run: int = 5
+
+    # Gmail searches cached in email_cache: fresh for ttl_minutes, then
+    # served while refreshed in the background, deleted after max_age_hours
+    email_cache_ttl_minutes: int = 60
+    email_cache_max_age_hours: int = 24
+    email_cache_cleanup_interval_minutes: int = 60
+
+    # Gmail label list stored per account, refreshed by the sync when older
+    email_labels_ttl_minutes: int = 60
+
+    # Background calendar sync (views read calendar_events only)
+    calendar_sync_enabled: bool = True
+    calendar_sync_interval_minutes: int = 5
+
+    # Background Google Tasks refresh (widgets read the google_tasks mirror)
+    tasks_sync_enabled: bool = True
+    tasks_sync_interval_minutes: int = 5
+
     # Google OAuth settings
     google_client_id: str = ""
     google_client_secret: str = ""
@@ -10,14 +10,33 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from app.config import get_settings
 
+
+def _connect_args(settings) -> dict:
+    """psycopg2 connection arguments: application_name and statement_timeout."""
+    connect_args = {"application_name": settings.db_application_name}
+    if settings.db_statement_timeout_ms > 0:
+        connect_args["options"] = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+    return connect_args
+
+
 # Create engine (synchronous)
 settings = get_settings()
 engine = create_engine(
     settings.database_url,
     echo=settings.debug,  # Log SQL when DEBUG=true
     pool_pre_ping=True,  # Verify connections before use
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    connect_args=_connect_args(settings),
 )
 
+if settings.query_profiler_enabled:
+    from app.utils import query_profiler
+
+    query_profiler.enable(engine)
+
 # Session factory
 SessionLocal = sessionmaker(
     bind=engine,
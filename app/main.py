@@ -12,6 +12,8 @@ from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.database import get_db, SessionLocal
+from app.utils import query_profiler
+from app.utils.concurrency import configure_threadpool
 from app.routers import persons, organizations, interactions, views, tags, graph, auth, emails, calendar, pending_contacts
 from app.routers import emails_inbox
 from app.routers import settings as settings_router
@@ -26,6 +28,7 @@ from app.routers import lookups_admin
 from app.routers import dashboard
 from app.routers import tasks
 from app.routers import christmas_lists
+from app.routers import debug
 from app.routers.views import create_default_views
 
 # Initialize FastAPI app
@@ -69,11 +72,43 @@ app.include_router(lookups_admin.router)
 app.include_router(dashboard.router)
 app.include_router(tasks.router)
 app.include_router(christmas_lists.router)
+# /debug/perf only has data when the profiler middleware runs
+if settings.query_profiler_enabled:
+    app.include_router(debug.router)
+
+
+async def query_profiler_middleware(request: Request, call_next):
+    """Record SQL statement count and DB time per request."""
+    if request.url.path.startswith("/static"):
+        return await call_next(request)
+
+    with query_profiler.capture() as stats:
+        response = await call_next(request)
+
+    route = request.scope.get("route")
+    route_key = f"{request.method} {route.path}" if route else "(unmatched)"
+    budget = query_profiler.get_query_budget(getattr(route, "endpoint", None))
+    query_profiler.profiler.add(route_key, stats)
+    query_profiler.check_request(route_key, stats, budget, settings.query_profiler_repeat_threshold)
+
+    response.headers[query_profiler.QUERY_COUNT_HEADER] = str(stats.count)
+    response.headers[query_profiler.QUERY_TIME_HEADER] = f"{stats.total_ms:.1f}"
+    if budget is not None:
+        response.headers[query_profiler.QUERY_BUDGET_HEADER] = str(budget)
+    return response
+
+
+# Only profiled deployments pay for the extra middleware layer per request
+if settings.query_profiler_enabled:
+    app.middleware("http")(query_profiler_middleware)
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize default views and start background tasks on application startup."""
+    # Bound the threadpool that sync route handlers run in
+    configure_threadpool(settings.threadpool_size)
+
     # Create default views and Christmas tags
     db = SessionLocal()
     try:
@@ -85,10 +120,18 @@ async def startup_event():
     finally:
         db.close()
 
-    # Start email sync scheduler
+    # Start email (sync, backfill and cache cleanup), calendar and tasks sync schedulers
     try:
         from app.tasks.email_sync import start_scheduler
+        from app.tasks.email_backfill import start_email_backfill
+        from app.tasks.email_cache_cleanup import start_email_cache_cleanup
+        from app.tasks.calendar_sync import start_calendar_sync
+        from app.tasks.tasks_sync import start_tasks_sync
         start_scheduler()
+        start_email_backfill()
+        start_email_cache_cleanup()
+        start_calendar_sync()
+        start_tasks_sync()
     except ImportError:
         # APScheduler not installed yet
         pass
@@ -103,9 +146,12 @@ async def shutdown_event():
     except ImportError:
         pass
 
+    from app.services.google_executor import shutdown_google_executor
+    shutdown_google_executor()
+
 
 @app.get("/", response_class=HTMLResponse)
-async def home(request: Request):
+def home(request: Request):
     """Home page with dashboard."""
     return templates.TemplateResponse(
         request,
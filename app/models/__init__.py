@@ -55,6 +55,8 @@ from app.models.record_snapshot import RecordSnapshot, ChangeSource
 from app.models.email_message import EmailMessage
 from app.models.email_person_link import EmailPersonLink, EmailLinkType, EmailLinkSource
 from app.models.email_sync_state import EmailSyncState, SyncStatus
+from app.models.calendar_sync_state import CalendarSyncState
+from app.models.google_task import GoogleTaskList, GoogleTask
 
 # Settings
 from app.models.setting import Setting
@@ -140,6 +142,9 @@ __all__ = [
     "EmailMessage",
     "EmailPersonLink",
     "EmailSyncState",
+    "CalendarSyncState",
+    "GoogleTaskList",
+    "GoogleTask",
     # Phase 6: Email Inbox enums
     "EmailLinkType",
     "EmailLinkSource",
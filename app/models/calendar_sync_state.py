@@ -0,0 +1,199 @@
+"""
+CalendarSyncState model for tracking Google Calendar sync progress per account.
+
+Each connected Google account has its own sync state, allowing for:
+- Incremental sync using Calendar API sync tokens
+- Tracking last sync time and status
+- Error reporting and recovery
+"""
+
+import uuid
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from sqlalchemy import (
+    String,
+    Text,
+    Integer,
+    DateTime,
+    ForeignKey,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship as orm_relationship
+
+from app.models.base import Base
+from app.models.email_sync_state import SyncStatus
+
+if TYPE_CHECKING:
+    from app.models.google_account import GoogleAccount
+
+
+class CalendarSyncState(Base):
+    """
+    Tracks calendar sync state for each connected Google account.
+
+    After a full sync of the primary calendar, Google returns a sync token;
+    later syncs pass it back to receive only changed and cancelled events.
+    Google expires tokens with 410 Gone, after which a full sync is needed.
+
+    This model stores:
+    - The sync token and the range of events it covers: the full sync
+      window, widened when views ask for dates outside it
+    - Sync timestamps and status
+    - Error information for debugging
+    - Statistics (events synced, etc.)
+    """
+
+    __tablename__ = "calendar_sync_state"
+    __table_args__ = (
+        UniqueConstraint("google_account_id", name="uq_calendar_sync_state_account"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    google_account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("google_accounts.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # Calendar API incremental sync
+    sync_token: Mapped[str | None] = mapped_column(
+        Text,
+        comment="Calendar API nextSyncToken for incremental sync",
+    )
+    window_start: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        comment="Start of the synced range (full sync timeMin, widened on demand)",
+    )
+    window_end: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        comment="End of the synced range (full sync timeMax, widened on demand)",
+    )
+
+    # Sync timestamps
+    last_full_sync_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        comment="When the last full sync completed",
+    )
+    last_incremental_sync_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        comment="When the last incremental sync completed",
+    )
+
+    # Current status
+    sync_status: Mapped[str] = mapped_column(
+        String(50),
+        default=SyncStatus.NEVER_SYNCED.value,
+    )
+    error_message: Mapped[str | None] = mapped_column(
+        Text,
+        comment="Error details if last sync failed",
+    )
+
+    # Statistics
+    events_synced: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        comment="Total event changes synced from this account",
+    )
+    last_sync_event_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        comment="Event changes synced in last sync operation",
+    )
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    # Relationships
+    google_account: Mapped["GoogleAccount"] = orm_relationship(
+        "GoogleAccount",
+        back_populates="calendar_sync_state",
+    )
+
+    def __repr__(self) -> str:
+        return f"<CalendarSyncState(account={self.google_account_id}, status={self.sync_status})>"
+
+    @property
+    def needs_full_sync(self) -> bool:
+        """Check if this account needs a full sync (never synced or no sync token)."""
+        return (
+            self.sync_status == SyncStatus.NEVER_SYNCED.value
+            or self.sync_token is None
+        )
+
+    def covers(self, start: datetime, end: datetime) -> bool:
+        """Whether events in [start, end) are in the synced range."""
+        return (
+            self.window_start is not None
+            and self.window_end is not None
+            and self.window_start <= start
+            and end <= self.window_end
+        )
+
+    @property
+    def is_syncing(self) -> bool:
+        """Check if sync is currently in progress."""
+        return self.sync_status == SyncStatus.SYNCING.value
+
+    @property
+    def has_error(self) -> bool:
+        """Check if last sync failed."""
+        return self.sync_status == SyncStatus.ERROR.value
+
+    @property
+    def last_sync_at(self) -> datetime | None:
+        """Get the most recent sync time (full or incremental)."""
+        if self.last_incremental_sync_at and self.last_full_sync_at:
+            return max(self.last_incremental_sync_at, self.last_full_sync_at)
+        return self.last_incremental_sync_at or self.last_full_sync_at
+
+    def start_sync(self) -> None:
+        """Mark sync as started."""
+        self.sync_status = SyncStatus.SYNCING.value
+        self.error_message = None
+
+    def complete_sync(
+        self,
+        sync_token: str | None = None,
+        events_synced: int = 0,
+        is_full_sync: bool = False,
+    ) -> None:
+        """Mark sync as completed successfully."""
+        self.sync_status = SyncStatus.IDLE.value
+        self.error_message = None
+        self.last_sync_event_count = events_synced
+        self.events_synced = (self.events_synced or 0) + events_synced
+
+        if sync_token:
+            self.sync_token = sync_token
+
+        now = datetime.now(timezone.utc)
+        if is_full_sync:
+            self.last_full_sync_at = now
+        else:
+            self.last_incremental_sync_at = now
+
+    def fail_sync(self, error: str) -> None:
+        """Mark sync as failed with error message."""
+        self.sync_status = SyncStatus.ERROR.value
+        self.error_message = error
+
+    def reset_sync_token(self) -> None:
+        """Forget the sync token (expired with 410 Gone) so the next sync is full."""
+        self.sync_token = None
+        self.window_start = None
+        self.window_end = None
@@ -35,6 +35,7 @@ class EmailCache(Base):
 
     Stores fetched email threads temporarily to reduce API calls.
     Cache entries expire after a configurable TTL (default 1 hour).
+    Read and written through app.services.email_thread_cache.
     """
 
     __tablename__ = "email_cache"
@@ -42,6 +43,8 @@ class EmailCache(Base):
         UniqueConstraint("person_id", "gmail_thread_id", name="uq_email_cache_person_thread"),
         Index("idx_email_cache_person_id", "person_id"),
         Index("idx_email_cache_cached_at", "cached_at"),
+        # Thread details lookups (EmailThreadCache.thread_details)
+        Index("idx_email_cache_thread", "google_account_id", "gmail_thread_id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -7,9 +7,10 @@ Full email content is fetched on-demand from Gmail API, not stored locally.
 
 import uuid
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import (
+    Computed,
     String,
     Text,
     Boolean,
@@ -19,8 +20,9 @@ from sqlalchemy import (
     ForeignKey,
     UniqueConstraint,
     Index,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship as orm_relationship
 
 from app.models.base import Base
@@ -30,6 +32,24 @@ if TYPE_CHECKING:
     from app.models.email_person_link import EmailPersonLink
 
 
+# Partial index predicates; queries match them with labels.contains([...])
+INBOX_PREDICATE = """labels @> '["INBOX"]'::jsonb"""
+SENT_PREDICATE = """labels @> '["SENT"]'::jsonb"""
+
+# Weighted search document: subject > sender > recipients > snippet.
+# Addresses are split on '@' and '.' so names, local parts and domain
+# labels match as words; recipients are every string in to_emails.
+EMAIL_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, coalesce(subject, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(from_name, '') || ' ' || "
+    "translate(coalesce(from_email, ''), '@.', '  ')), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, translate(coalesce("
+    "jsonb_path_query_array(to_emails, '$[*].* ? (@.type() == \"string\")')::text, ''), "
+    "'@.', '  ')), 'C') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(snippet, '')), 'D')"
+)
+
+
 class EmailMessage(Base):
     """
     Gmail message metadata stored locally for fast filtering and search.
@@ -54,6 +74,41 @@ class EmailMessage(Base):
         Index("idx_email_messages_date", "internal_date", postgresql_ops={"internal_date": "DESC"}),
         Index("idx_email_messages_from", "from_email"),
         Index("idx_email_messages_read", "is_read"),
+        # Folder/label filters (labels @> '["X"]')
+        Index(
+            "idx_email_messages_labels",
+            "labels",
+            postgresql_using="gin",
+            postgresql_ops={"labels": "jsonb_path_ops"},
+        ),
+        # The default inbox listing, its unread filter and the sent folder,
+        # in listing order
+        Index(
+            "idx_email_messages_inbox_date",
+            "internal_date", "id",
+            postgresql_ops={"internal_date": "DESC", "id": "DESC"},
+            postgresql_where=text(INBOX_PREDICATE),
+        ),
+        Index(
+            "idx_email_messages_inbox_unread",
+            "internal_date", "id",
+            postgresql_ops={"internal_date": "DESC", "id": "DESC"},
+            postgresql_where=text(f"NOT is_read AND {INBOX_PREDICATE}"),
+        ),
+        Index(
+            "idx_email_messages_sent_date",
+            "internal_date", "id",
+            postgresql_ops={"internal_date": "DESC", "id": "DESC"},
+            postgresql_where=text(SENT_PREDICATE),
+        ),
+        # Inbox search: free text and from:/to: fragments, and to:address
+        Index("idx_email_messages_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "idx_email_messages_to_emails",
+            "to_emails",
+            postgresql_using="gin",
+            postgresql_ops={"to_emails": "jsonb_path_ops"},
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -150,6 +205,13 @@ class EmailMessage(Base):
         default=0,
     )
 
+    # Full-text search document (generated column, never written by the app)
+    search_vector: Mapped[Any] = mapped_column(
+        TSVECTOR,
+        Computed(EMAIL_SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
+    )
+
     # Sync tracking
     history_id: Mapped[int | None] = mapped_column(
         BigInteger,
@@ -5,10 +5,12 @@ Each connected Google account has its own sync state, allowing for:
 - Incremental sync using Gmail history API
 - Tracking last sync time and status
 - Error reporting and recovery
+- A resumable backfill of older history, checkpointed per page
+- Unread counts per label, refreshed by each sync
 """
 
 import uuid
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING
 
@@ -17,11 +19,12 @@ from sqlalchemy import (
     Text,
     Integer,
     BigInteger,
+    Date,
     DateTime,
     ForeignKey,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship as orm_relationship
 
 from app.models.base import Base
@@ -108,6 +111,44 @@ class EmailSyncState(Base):
         comment="Messages synced in last sync operation",
     )
 
+    # Unread messages per Gmail label, recomputed at the end of every sync
+    # (the only writer of is_read/labels), so pages don't count per request
+    unread_counts: Mapped[dict | None] = mapped_column(
+        JSONB,
+        default=dict,
+        comment="Unread message count per Gmail label ID",
+    )
+
+    # Gmail label list, refreshed by the sync every email_labels_ttl_minutes
+    # (see app.services.gmail_labels), so inbox renders don't call labels().list
+    label_names: Mapped[dict | None] = mapped_column(
+        JSONB,
+        comment="Gmail label ID -> display name",
+    )
+    labels_synced_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        comment="When label_names was last fetched from Gmail",
+    )
+
+    # Backfill of older history (see GmailSyncService.backfill)
+    backfill_before: Mapped[date | None] = mapped_column(
+        Date,
+        comment="Exclusive upper bound of the date window being backfilled",
+    )
+    backfill_page_token: Mapped[str | None] = mapped_column(
+        Text,
+        comment="messages.list page token within the current backfill window",
+    )
+    backfill_messages: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        comment="Messages stored by the backfill so far",
+    )
+    backfill_completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        comment="When the backfill reached the oldest message in the mailbox",
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
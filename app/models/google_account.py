@@ -19,8 +19,10 @@ from app.models.base import Base
 
 if TYPE_CHECKING:
     from app.models.calendar_event import CalendarEvent
+    from app.models.calendar_sync_state import CalendarSyncState
     from app.models.email_message import EmailMessage
     from app.models.email_sync_state import EmailSyncState
+    from app.models.google_task import GoogleTaskList
     from app.models.person_google_link import PersonGoogleLink
     from app.models.tag_google_link import TagGoogleLink
 
@@ -83,6 +85,17 @@ class GoogleAccount(Base):
         back_populates="google_account",
         cascade="all, delete-orphan",
     )
+    calendar_sync_state: Mapped["CalendarSyncState | None"] = orm_relationship(
+        "CalendarSyncState",
+        back_populates="google_account",
+        uselist=False,
+        cascade="all, delete-orphan",
+    )
+    task_lists: Mapped[list["GoogleTaskList"]] = orm_relationship(
+        "GoogleTaskList",
+        back_populates="google_account",
+        cascade="all, delete-orphan",
+    )
     email_messages: Mapped[list["EmailMessage"]] = orm_relationship(
         "EmailMessage",
         back_populates="google_account",
@@ -0,0 +1,183 @@
+"""
+GoogleTaskList and GoogleTask models mirroring Google Tasks locally.
+
+The tasks widgets read these tables instead of listing every task list and
+task from Google on each render. A background job refreshes them with
+updatedMin, and the write operations in TasksService update them in place.
+Only open tasks are mirrored: completed, hidden and deleted tasks are removed.
+"""
+
+import uuid
+from datetime import date, datetime, time, timezone
+from typing import TYPE_CHECKING
+
+from sqlalchemy import (
+    String,
+    Text,
+    Date,
+    Time,
+    DateTime,
+    ForeignKey,
+    UniqueConstraint,
+    Index,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship as orm_relationship
+
+from app.models.base import Base
+
+if TYPE_CHECKING:
+    from app.models.google_account import GoogleAccount
+
+
+class GoogleTaskList(Base):
+    """
+    A Google Tasks list of a connected account.
+
+    tasks_synced_at is when the last refresh of this list started; the next
+    refresh asks Google only for tasks updated since then.
+    """
+
+    __tablename__ = "google_task_lists"
+    __table_args__ = (
+        UniqueConstraint(
+            "google_account_id", "google_list_id",
+            name="uq_google_task_lists_account_list"
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    google_account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("google_accounts.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    google_list_id: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Google Tasks task list ID",
+    )
+    title: Mapped[str] = mapped_column(
+        String(500),
+        default="Untitled",
+    )
+    tasks_synced_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        comment="updatedMin for the next incremental refresh (NULL: full refresh)",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    # Relationships
+    google_account: Mapped["GoogleAccount"] = orm_relationship(
+        "GoogleAccount",
+        back_populates="task_lists",
+    )
+    tasks: Mapped[list["GoogleTask"]] = orm_relationship(
+        "GoogleTask",
+        back_populates="task_list",
+        cascade="all, delete-orphan",
+        order_by="GoogleTask.position",
+    )
+
+    def __repr__(self) -> str:
+        return f"<GoogleTaskList(title={self.title!r})>"
+
+
+class GoogleTask(Base):
+    """
+    An open task of a mirrored task list.
+
+    Due dates are split once, when the task is stored: date-only tasks
+    (midnight UTC in the API) keep their UTC date and have no due_time,
+    timed tasks are converted to the app's local timezone.
+    """
+
+    __tablename__ = "google_tasks"
+    __table_args__ = (
+        UniqueConstraint(
+            "task_list_id", "google_task_id",
+            name="uq_google_tasks_list_task"
+        ),
+        Index("idx_google_tasks_list_position", "task_list_id", "position"),
+        Index("idx_google_tasks_due_date", "due_date"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    task_list_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("google_task_lists.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    google_task_id: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Google Tasks task ID",
+    )
+    parent_id: Mapped[str | None] = mapped_column(
+        String(255),
+        comment="Google task ID of the parent task (subtasks)",
+    )
+    title: Mapped[str] = mapped_column(
+        Text,
+        default="",
+    )
+    notes: Mapped[str | None] = mapped_column(Text)
+    status: Mapped[str] = mapped_column(
+        String(20),
+        default="needsAction",
+    )
+    position: Mapped[str | None] = mapped_column(
+        String(64),
+        comment="Google sort key among siblings",
+    )
+    due: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        comment="Raw due timestamp from the API",
+    )
+    due_date: Mapped[date | None] = mapped_column(Date)
+    due_time: Mapped[time | None] = mapped_column(
+        Time,
+        comment="Local due time; NULL for date-only tasks",
+    )
+    google_updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        comment="Last modification time reported by Google",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    # Relationships
+    task_list: Mapped["GoogleTaskList"] = orm_relationship(
+        "GoogleTaskList",
+        back_populates="tasks",
+    )
+
+    def __repr__(self) -> str:
+        return f"<GoogleTask(title={self.title!r}, due={self.due_date})>"
+
+    @property
+    def is_subtask(self) -> bool:
+        return bool(self.parent_id)
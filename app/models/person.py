@@ -9,20 +9,37 @@ from typing import TYPE_CHECKING, Any
 from sqlalchemy import (
     String,
     Text,
+    Integer,
     Boolean,
     Date,
     DateTime,
     ForeignKey,
     Enum,
     UniqueConstraint,
+    Computed,
+    Index,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship as orm_relationship
-from sqlalchemy.ext.hybrid import hybrid_property
 
 from app.models.base import Base
 from app.models.organization import RelationshipType
 
+# Birthday as an integer MMDD key, indexed for year-agnostic range lookups
+PERSON_BIRTHDAY_MD_SQL = "(CAST(EXTRACT(month FROM birthday) * 100 + EXTRACT(day FROM birthday) AS INTEGER))"
+
+# Weighted full-text document for people search (kept in sync by Postgres).
+# Uses the 'simple' configuration so names and prefixes are not stemmed.
+PERSON_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple'::regconfig, "
+    "coalesce(full_name, '') || ' ' || coalesce(first_name, '') || ' ' || "
+    "coalesce(last_name, '') || ' ' || coalesce(nickname, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(email, '')), 'C') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(notes, '')), 'D')"
+)
+
 if TYPE_CHECKING:
     from app.models.tag import Tag
     from app.models.organization import Organization
@@ -44,6 +61,27 @@ class Person(Base):
     """Person/contact entity."""
 
     __tablename__ = "persons"
+    __table_args__ = (
+        Index("ix_persons_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_persons_full_name_trgm",
+            "full_name",
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_persons_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        # Month/day key for birthday widgets (see app.services.birthday_service)
+        Index(
+            "ix_persons_birthday_md",
+            text(PERSON_BIRTHDAY_MD_SQL),
+            postgresql_where=text("birthday IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -113,6 +151,27 @@ class Person(Base):
         comment="Last sync timestamp with Google Contacts",
     )
 
+    # Denormalized from interactions (maintained by app.services.contact_stats)
+    last_contact_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        index=True,
+        comment="Most recent interaction date (denormalized)",
+    )
+    interaction_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment="Number of interactions (denormalized)",
+    )
+
+    # Full-text search document (generated column, never written by the app)
+    search_vector: Mapped[Any] = mapped_column(
+        TSVECTOR,
+        Computed(PERSON_SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=datetime.utcnow,
@@ -227,17 +286,14 @@ class Person(Base):
         foreign_keys=[my_relationship_type_id],
     )
 
-    @hybrid_property
+    @property
     def last_contact(self) -> datetime | None:
-        """Get the most recent interaction date for this person."""
-        if not self.interactions:
-            return None
-        dates = [
-            i.interaction_date or i.created_at
-            for i in self.interactions
-            if i.interaction_date or i.created_at
-        ]
-        return max(dates) if dates else None
+        """Get the most recent interaction date for this person.
+
+        Reads the denormalized last_contact_at column, so the interactions
+        collection does not need to be loaded.
+        """
+        return self.last_contact_at
 
     @property
     def primary_email(self) -> str | None:
@@ -48,7 +48,7 @@ class ChatMessageResponse(BaseModel):
 
 
 @router.get("/research-new", response_class=HTMLResponse)
-async def research_new_entity_page(
+def research_new_entity_page(
     request: Request,
     type: str,
     name: str,
@@ -80,7 +80,7 @@ async def research_new_entity_page(
 
 
 @router.get("", response_class=HTMLResponse)
-async def ai_chat_page(
+def ai_chat_page(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -246,7 +246,7 @@ async def send_message(
 
 
 @router.get("/conversations/{entity_type}/{entity_id}")
-async def list_conversations(
+def list_conversations(
     entity_type: str,
     entity_id: UUID,
     db: Session = Depends(get_db),
@@ -284,7 +284,7 @@ async def list_conversations(
 
 
 @router.get("/conversation/{conversation_id}/messages")
-async def get_conversation_messages(
+def get_conversation_messages(
     conversation_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -311,7 +311,7 @@ async def get_conversation_messages(
 
 
 @router.delete("/conversation/{conversation_id}")
-async def delete_conversation(
+def delete_conversation(
     conversation_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -330,7 +330,7 @@ async def delete_conversation(
 
 
 @router.get("/status")
-async def get_ai_status(
+def get_ai_status(
     db: Session = Depends(get_db),
 ):
     """
@@ -348,7 +348,7 @@ async def get_ai_status(
 
 
 @router.get("/prompts")
-async def get_quick_prompts(
+def get_quick_prompts(
     entity_type: str = "both",
     db: Session = Depends(get_db),
 ):
@@ -383,7 +383,7 @@ async def get_quick_prompts(
 
 
 @router.get("/recent")
-async def get_recent_conversations(
+def get_recent_conversations(
     limit: int = 5,
     db: Session = Depends(get_db),
 ):
@@ -430,7 +430,7 @@ async def get_recent_conversations(
 
 
 @router.get("/widget", response_class=HTMLResponse)
-async def get_recent_conversations_widget(
+def get_recent_conversations_widget(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -479,7 +479,7 @@ async def get_recent_conversations_widget(
 
 
 @router.get("/search/people")
-async def search_people_for_research(
+def search_people_for_research(
     q: str = "",
     limit: int = 50,
     db: Session = Depends(get_db),
@@ -519,7 +519,7 @@ async def search_people_for_research(
 
 
 @router.get("/search/organizations")
-async def search_organizations_for_research(
+def search_organizations_for_research(
     q: str = "",
     limit: int = 50,
     db: Session = Depends(get_db),
@@ -555,7 +555,7 @@ async def search_organizations_for_research(
 
 
 @router.get("/suggestions-widget", response_class=HTMLResponse)
-async def get_suggestions_widget(
+def get_suggestions_widget(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -619,7 +619,7 @@ class SuggestionResponse(BaseModel):
 
 
 @router.get("/suggestions/{entity_type}/{entity_id}")
-async def get_pending_suggestions(
+def get_pending_suggestions(
     entity_type: str,
     entity_id: UUID,
     db: Session = Depends(get_db),
@@ -655,7 +655,7 @@ async def get_pending_suggestions(
 
 
 @router.post("/suggestions/{suggestion_id}/accept")
-async def accept_suggestion(
+def accept_suggestion(
     suggestion_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -677,7 +677,7 @@ async def accept_suggestion(
 
 
 @router.post("/suggestions/{suggestion_id}/reject")
-async def reject_suggestion(
+def reject_suggestion(
     suggestion_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -699,7 +699,7 @@ async def reject_suggestion(
 
 
 @router.post("/suggestions/{entity_type}/{entity_id}/accept-all")
-async def accept_all_suggestions(
+def accept_all_suggestions(
     entity_type: str,
     entity_id: UUID,
     db: Session = Depends(get_db),
@@ -722,7 +722,7 @@ async def accept_all_suggestions(
 
 
 @router.post("/suggestions/{entity_type}/{entity_id}/reject-all")
-async def reject_all_suggestions(
+def reject_all_suggestions(
     entity_type: str,
     entity_id: UUID,
     db: Session = Depends(get_db),
@@ -745,7 +745,7 @@ async def reject_all_suggestions(
 
 
 @router.get("/suggestions/{entity_type}/{entity_id}/stats")
-async def get_suggestion_stats(
+def get_suggestion_stats(
     entity_type: str,
     entity_id: UUID,
     db: Session = Depends(get_db),
@@ -766,7 +766,7 @@ async def get_suggestion_stats(
 
 
 @router.get("/suggestions/pending-count")
-async def get_global_pending_count(
+def get_global_pending_count(
     db: Session = Depends(get_db),
 ):
     """
@@ -781,7 +781,7 @@ async def get_global_pending_count(
 
 
 @router.get("/usage")
-async def get_ai_usage_stats(
+def get_ai_usage_stats(
     db: Session = Depends(get_db),
 ):
     """
@@ -960,7 +960,7 @@ async def send_research_new_message(
 
 
 @router.get("/usage-widget", response_class=HTMLResponse)
-async def get_usage_widget(
+def get_usage_widget(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -234,7 +234,7 @@ async def research_organization_background(
 
 
 @router.get("/result/{result_id}")
-async def get_research_result(result_id: str):
+def get_research_result(result_id: str):
     """
     Get the result of a research operation.
 
@@ -248,7 +248,7 @@ async def get_research_result(result_id: str):
 
 
 @router.get("/results")
-async def list_research_results(
+def list_research_results(
     entity_type: str | None = None,
     entity_id: UUID | None = None,
     limit: int = 20,
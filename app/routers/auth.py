@@ -47,7 +47,7 @@ def _verify_state(state: str) -> bool:
 
 
 @router.get("/google/connect")
-async def connect_google_account(
+def connect_google_account(
     request: Request,
     redirect_to: str = Query("/settings", description="URL to redirect after auth"),
 ):
@@ -76,7 +76,7 @@ async def connect_google_account(
 
 
 @router.get("/google/callback")
-async def google_oauth_callback(
+def google_oauth_callback(
     request: Request,
     code: str = Query(..., description="Authorization code from Google"),
     state: str = Query(..., description="State parameter for CSRF protection"),
@@ -162,7 +162,7 @@ async def google_oauth_callback(
 
 
 @router.post("/google/disconnect/{account_id}", response_class=HTMLResponse)
-async def disconnect_google_account(
+def disconnect_google_account(
     request: Request,
     account_id: UUID,
     db: Session = Depends(get_db),
@@ -206,7 +206,7 @@ async def disconnect_google_account(
 
 
 @router.get("/google/accounts")
-async def list_google_accounts(
+def list_google_accounts(
     db: Session = Depends(get_db),
     active_only: bool = Query(True, description="Only return active accounts"),
 ):
@@ -237,7 +237,7 @@ async def list_google_accounts(
 
 
 @router.post("/google/refresh/{account_id}")
-async def refresh_google_credentials(
+def refresh_google_credentials(
     account_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -273,7 +273,7 @@ async def refresh_google_credentials(
 
 
 @router.get("/google/status/{account_id}")
-async def check_google_account_status(
+def check_google_account_status(
     account_id: UUID,
     db: Session = Depends(get_db),
 ):
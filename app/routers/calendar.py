@@ -17,6 +17,7 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models import CalendarEvent, Interaction, InteractionMedium, CalendarSettings
+from app.services.contact_stats import refresh_contact_stats
 from app.services.calendar_service import (
     CalendarService,
     CalendarServiceError,
@@ -24,6 +25,7 @@ from app.services.calendar_service import (
     CalendarAPIError,
     get_calendar_service,
 )
+from app.services.calendar_sync_service import get_calendar_sync_service
 
 
 class EventCreate(BaseModel):
@@ -101,7 +103,7 @@ def get_today_tomorrow_local(local_tz: ZoneInfo) -> tuple[date, date]:
 
 
 @router.get("/today", response_class=HTMLResponse)
-async def get_todays_events(
+def get_todays_events(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -155,7 +157,7 @@ async def get_todays_events(
 
 
 @router.get("/upcoming", response_class=HTMLResponse)
-async def get_upcoming_events(
+def get_upcoming_events(
     request: Request,
     days: int = 7,
     offset: int = 0,
@@ -215,7 +217,7 @@ async def get_upcoming_events(
 
 
 @router.get("/event/{event_id}", response_class=HTMLResponse)
-async def get_event_details(
+def get_event_details(
     request: Request,
     event_id: UUID,
     db: Session = Depends(get_db),
@@ -243,7 +245,7 @@ async def get_event_details(
 
 
 @router.post("/event/{event_id}/log")
-async def log_meeting_as_interaction(
+def log_meeting_as_interaction(
     event_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -266,6 +268,7 @@ async def log_meeting_as_interaction(
     medium = InteractionMedium.video_call if event.is_video_call else InteractionMedium.meeting
 
     created_count = 0
+    touched_person_ids = set()
     for attendee in matched_attendees:
         if not attendee["person_id"]:
             continue
@@ -295,7 +298,9 @@ async def log_meeting_as_interaction(
         )
         db.add(interaction)
         created_count += 1
+        touched_person_ids.add(person_id)
 
+    refresh_contact_stats(db, touched_person_ids)
     db.commit()
 
     return {
@@ -306,7 +311,7 @@ async def log_meeting_as_interaction(
 
 
 @router.post("/sync", response_class=HTMLResponse)
-async def sync_calendar_events(
+def sync_calendar_events(
     request: Request,
     days: int = 30,
     db: Session = Depends(get_db),
@@ -347,8 +352,52 @@ async def sync_calendar_events(
         )
 
 
+@router.post("/refresh", response_class=HTMLResponse)
+def refresh_calendar(
+    request: Request,
+    account_id: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Pull calendar changes from Google now.
+
+    Calendar views read the local table, which the background sync keeps
+    current; this applies pending changes immediately (incremental when a
+    sync token is stored). Triggers a "calendarRefreshed" HTMX event so
+    widgets can reload.
+
+    Args:
+        account_id: Optional Google account UUID to refresh only that account
+
+    Returns:
+        HTML partial with sync result
+    """
+    selected_account_id = None
+    if account_id:
+        try:
+            selected_account_id = UUID(account_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid account ID")
+
+    results = get_calendar_sync_service(db).refresh(selected_account_id)
+    errors = [error for result in results.values() for error in result.errors]
+
+    response = templates.TemplateResponse(
+        "calendar/_sync_result.html",
+        {
+            "request": request,
+            "success": not errors,
+            "events_synced": sum(r.events_synced + r.events_deleted for r in results.values()),
+            "pending_created": 0,
+            "message": "; ".join(errors),
+        },
+    )
+    response.headers["HX-Trigger"] = "calendarRefreshed"
+    return response
+
+
 @router.post("/full-sync")
-async def full_sync_calendar(
+def full_sync_calendar(
     days: int = 30,
     auto_create_interactions: bool = True,
     db: Session = Depends(get_db),
@@ -390,7 +439,7 @@ async def full_sync_calendar(
 
 
 @router.post("/auto-interactions")
-async def create_auto_interactions(
+def create_auto_interactions(
     days: int = 30,
     db: Session = Depends(get_db),
 ):
@@ -422,7 +471,7 @@ async def create_auto_interactions(
 
 
 @router.post("/create")
-async def create_calendar_event(
+def create_calendar_event(
     event_create: EventCreate,
     db: Session = Depends(get_db),
 ):
@@ -516,7 +565,7 @@ async def create_calendar_event(
 
 
 @router.put("/update/{google_event_id}")
-async def update_calendar_event(
+def update_calendar_event(
     google_event_id: str,
     event_update: EventUpdate,
     db: Session = Depends(get_db),
@@ -614,7 +663,7 @@ async def update_calendar_event(
 
 
 @router.post("/event/{google_event_id}/move")
-async def move_calendar_event(
+def move_calendar_event(
     google_event_id: str,
     event_move: EventMove,
     db: Session = Depends(get_db),
@@ -701,7 +750,7 @@ async def move_calendar_event(
 
 
 @router.get("/week-view", response_class=HTMLResponse)
-async def get_week_view(
+def get_week_view(
     request: Request,
     days: int = 5,
     account_id: Optional[str] = None,
@@ -786,7 +835,7 @@ async def get_week_view(
 
 
 @router.get("/month-view", response_class=HTMLResponse)
-async def get_month_view(
+def get_month_view(
     request: Request,
     month: int | None = None,
     year: int | None = None,
@@ -913,7 +962,7 @@ async def get_month_view(
 
 
 @router.get("/api/today")
-async def api_get_todays_events(
+def api_get_todays_events(
     db: Session = Depends(get_db),
 ):
     """
@@ -948,7 +997,7 @@ async def api_get_todays_events(
 
 
 @router.get("/api/upcoming")
-async def api_get_upcoming_events(
+def api_get_upcoming_events(
     days: int = 7,
     db: Session = Depends(get_db),
 ):
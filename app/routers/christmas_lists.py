@@ -37,7 +37,7 @@ class BulkAssignRequest(BaseModel):
 
 
 @router.get("", response_class=HTMLResponse)
-async def christmas_lists_index(
+def christmas_lists_index(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -62,7 +62,7 @@ async def christmas_lists_index(
 
 
 @router.get("/polish", response_class=HTMLResponse)
-async def christmas_list_polish(
+def christmas_list_polish(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -86,7 +86,7 @@ async def christmas_list_polish(
 
 
 @router.get("/english", response_class=HTMLResponse)
-async def christmas_list_english(
+def christmas_list_english(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -110,7 +110,7 @@ async def christmas_list_english(
 
 
 @router.get("/suggestions", response_class=HTMLResponse)
-async def christmas_list_suggestions(
+def christmas_list_suggestions(
     request: Request,
     db: Session = Depends(get_db),
     page: int = 1,
@@ -159,7 +159,7 @@ async def christmas_list_suggestions(
 
 
 @router.post("/assign")
-async def assign_to_list(
+def assign_to_list(
     request_data: AssignRequest,
     db: Session = Depends(get_db),
 ):
@@ -194,7 +194,7 @@ async def assign_to_list(
 
 
 @router.post("/remove")
-async def remove_from_list(
+def remove_from_list(
     request_data: AssignRequest,
     db: Session = Depends(get_db),
 ):
@@ -229,7 +229,7 @@ async def remove_from_list(
 
 
 @router.post("/bulk-assign")
-async def bulk_assign(
+def bulk_assign(
     request_data: BulkAssignRequest,
     db: Session = Depends(get_db),
 ):
@@ -261,7 +261,7 @@ async def bulk_assign(
 
 
 @router.get("/export/{list_type}")
-async def export_list(
+def export_list(
     list_type: str,
     db: Session = Depends(get_db),
 ):
@@ -289,7 +289,7 @@ async def export_list(
 
 
 @router.get("/table/{list_type}", response_class=HTMLResponse)
-async def get_list_table(
+def get_list_table(
     list_type: str,
     request: Request,
     db: Session = Depends(get_db),
@@ -314,7 +314,7 @@ async def get_list_table(
 
 
 @router.get("/suggestions-table", response_class=HTMLResponse)
-async def get_suggestions_table(
+def get_suggestions_table(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -20,12 +20,15 @@ from zoneinfo import ZoneInfo
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
+from starlette.datastructures import FormData
 from pydantic import BaseModel
 from sqlalchemy import extract, or_
 from sqlalchemy.orm import Session, joinedload
 
 from app.database import get_db
 from app.models import Person, GoogleAccount, Setting, PersonEmail, CalendarEvent
+from app.services.birthday_service import get_birthdays_for_month, get_todays_birthdays, get_upcoming_birthdays
+from app.utils.concurrency import get_form_data
 
 
 class DashboardLayoutUpdate(BaseModel):
@@ -36,100 +39,8 @@ router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 templates = Jinja2Templates(directory="app/templates")
 
 
-def get_upcoming_birthdays(db: Session, days: int = 30) -> list[dict]:
-    """
-    Get upcoming birthdays within the next N days.
-
-    Returns a list of birthday data dictionaries sorted by days until birthday.
-    """
-    today = date.today()
-
-    # Get all people with birthdays
-    people_with_birthdays = (
-        db.query(Person)
-        .filter(Person.birthday.isnot(None))
-        .all()
-    )
-
-    # Filter to upcoming birthdays within the next N days
-    upcoming_birthdays = []
-    for person in people_with_birthdays:
-        # Calculate this year's birthday
-        try:
-            this_year_birthday = person.birthday.replace(year=today.year)
-        except ValueError:
-            # Handle Feb 29 for non-leap years
-            this_year_birthday = person.birthday.replace(year=today.year, day=28)
-
-        # Check if birthday has passed this year
-        if this_year_birthday < today:
-            # Use next year's birthday
-            try:
-                next_birthday = person.birthday.replace(year=today.year + 1)
-            except ValueError:
-                next_birthday = person.birthday.replace(year=today.year + 1, day=28)
-        else:
-            next_birthday = this_year_birthday
-
-        # Calculate days until birthday
-        days_until = (next_birthday - today).days
-
-        if 0 <= days_until <= days:
-            # Calculate age they'll be turning
-            age = next_birthday.year - person.birthday.year
-
-            upcoming_birthdays.append({
-                "person": person,
-                "birthday_date": next_birthday,
-                "days_until": days_until,
-                "age": age,
-                "is_today": days_until == 0,
-                "is_tomorrow": days_until == 1,
-                "is_this_week": days_until <= 7,
-            })
-
-    # Sort by days until birthday
-    upcoming_birthdays.sort(key=lambda x: x["days_until"])
-    return upcoming_birthdays
-
-
-def get_birthdays_for_month(db: Session, year: int, month: int) -> dict[int, list[dict]]:
-    """
-    Get all birthdays that fall within a specific month.
-
-    Returns a dictionary mapping day of month to list of birthday data.
-    """
-    # Get all people with birthdays
-    people_with_birthdays = (
-        db.query(Person)
-        .filter(Person.birthday.isnot(None))
-        .all()
-    )
-
-    # Group birthdays by day of month
-    birthdays_by_day = {}
-    for person in people_with_birthdays:
-        if person.birthday.month == month:
-            day = person.birthday.day
-            # Handle Feb 29 in non-leap years
-            if month == 2 and day == 29 and not calendar.isleap(year):
-                day = 28
-
-            age = year - person.birthday.year
-
-            if day not in birthdays_by_day:
-                birthdays_by_day[day] = []
-
-            birthdays_by_day[day].append({
-                "person": person,
-                "age": age,
-            })
-
-    return birthdays_by_day
-
-
 @router.get("/today-widget", response_class=HTMLResponse)
-async def get_today_widget(
+def get_today_widget(
     request: Request,
     account_id: Optional[str] = None,
     db: Session = Depends(get_db),
@@ -146,7 +57,7 @@ async def get_today_widget(
     today = date.today()
 
     # Get today's birthdays
-    todays_birthdays = [b for b in get_upcoming_birthdays(db, days=0) if b["is_today"]]
+    todays_birthdays = get_todays_birthdays(db)
 
     # Parse account_id if provided
     selected_account_id = None
@@ -194,7 +105,7 @@ async def get_today_widget(
 
 
 @router.get("/birthdays-widget", response_class=HTMLResponse)
-async def get_birthdays_widget(
+def get_birthdays_widget(
     request: Request,
     view: str = "list",
     days: int = 30,
@@ -267,7 +178,7 @@ async def get_birthdays_widget(
 
 
 @router.get("/tasks-widget", response_class=HTMLResponse)
-async def get_tasks_widget(
+def get_tasks_widget(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -364,7 +275,7 @@ async def get_tasks_widget(
 
 
 @router.get("/tasks-widget-expanded", response_class=HTMLResponse)
-async def get_tasks_widget_expanded(
+def get_tasks_widget_expanded(
     request: Request,
     account_id: Optional[str] = None,
     db: Session = Depends(get_db),
@@ -448,7 +359,7 @@ async def get_tasks_widget_expanded(
 
 
 @router.post("/save-layout")
-async def save_dashboard_layout(
+def save_dashboard_layout(
     layout_update: DashboardLayoutUpdate,
     db: Session = Depends(get_db),
 ):
@@ -490,7 +401,7 @@ async def save_dashboard_layout(
 
 
 @router.get("/mini-calendar", response_class=HTMLResponse)
-async def get_mini_calendar(
+def get_mini_calendar(
     request: Request,
     month: Optional[int] = None,
     year: Optional[int] = None,
@@ -535,7 +446,7 @@ async def get_mini_calendar(
 
 
 @router.get("/schedule-widget", response_class=HTMLResponse)
-async def get_schedule_widget(
+def get_schedule_widget(
     request: Request,
     selected_date: Optional[str] = None,
     account_id: Optional[str] = None,
@@ -609,7 +520,7 @@ async def get_schedule_widget(
 
 
 @router.get("/birthdays-compact", response_class=HTMLResponse)
-async def get_birthdays_compact(
+def get_birthdays_compact(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -628,7 +539,7 @@ async def get_birthdays_compact(
 
 
 @router.get("/tasks-panel", response_class=HTMLResponse)
-async def get_tasks_panel(
+def get_tasks_panel(
     request: Request,
     view: str = "today",
     account_id: Optional[str] = None,
@@ -790,7 +701,7 @@ async def get_tasks_panel(
 
 
 @router.get("/add-task-modal", response_class=HTMLResponse)
-async def get_add_task_modal(
+def get_add_task_modal(
     request: Request,
     parent_task_id: Optional[str] = None,
     list_id: Optional[str] = None,
@@ -832,7 +743,7 @@ async def get_add_task_modal(
 
 
 @router.get("/add-event-form", response_class=HTMLResponse)
-async def get_add_event_form(
+def get_add_event_form(
     request: Request,
     event_id: Optional[str] = None,
     account_id: Optional[str] = None,
@@ -939,7 +850,7 @@ async def get_add_event_form(
 
 
 @router.get("/api/google-accounts")
-async def get_google_accounts(db: Session = Depends(get_db)):
+def get_google_accounts(db: Session = Depends(get_db)):
     """
     Get list of active Google accounts for the dashboard filter.
 
@@ -955,7 +866,7 @@ async def get_google_accounts(db: Session = Depends(get_db)):
 
 
 @router.get("/quick-add-person", response_class=HTMLResponse)
-async def get_quick_add_person_form(
+def get_quick_add_person_form(
     request: Request,
     email: Optional[str] = None,
     name: Optional[str] = None,
@@ -991,9 +902,10 @@ async def get_quick_add_person_form(
 
 
 @router.post("/quick-add-person")
-async def create_quick_person(
+def create_quick_person(
     request: Request,
     db: Session = Depends(get_db),
+    form: FormData = Depends(get_form_data),
 ):
     """
     Quick create a person with name and email.
@@ -1004,7 +916,6 @@ async def create_quick_person(
     Returns:
         JSON with success status and the new person's info
     """
-    form = await request.form()
     first_name = form.get("first_name", "").strip()
     last_name = form.get("last_name", "").strip()
     email = form.get("email", "").strip()
@@ -1066,7 +977,7 @@ async def create_quick_person(
 
 
 @router.get("/people-search")
-async def search_people_for_guests(
+def search_people_for_guests(
     q: str = "",
     db: Session = Depends(get_db),
 ):
@@ -1145,7 +1056,7 @@ async def search_people_for_guests(
 
 
 @router.get("/event-detail/{google_event_id}", response_class=HTMLResponse)
-async def get_event_detail(
+def get_event_detail(
     request: Request,
     google_event_id: str,
     account_id: Optional[str] = None,
@@ -1218,7 +1129,7 @@ async def get_event_detail(
 
 
 @router.get("/task-detail/{list_id}/{task_id}", response_class=HTMLResponse)
-async def get_task_detail(
+def get_task_detail(
     request: Request,
     list_id: str,
     task_id: str,
@@ -1262,7 +1173,7 @@ async def get_task_detail(
 
 
 @router.delete("/event/{google_event_id}")
-async def delete_event(
+def delete_event(
     google_event_id: str,
     account_id: Optional[str] = None,
     db: Session = Depends(get_db),
@@ -1385,7 +1296,7 @@ def get_tasks_for_date_range(
 # =============================================================================
 
 @router.get("/calendar-view/day", response_class=HTMLResponse)
-async def get_calendar_day_view(
+def get_calendar_day_view(
     request: Request,
     date: Optional[str] = None,
     account_id: Optional[str] = None,
@@ -1488,7 +1399,7 @@ async def get_calendar_day_view(
 
 
 @router.get("/calendar-view/week", response_class=HTMLResponse)
-async def get_calendar_week_view(
+def get_calendar_week_view(
     request: Request,
     date: Optional[str] = None,
     account_id: Optional[str] = None,
@@ -1614,7 +1525,7 @@ async def get_calendar_week_view(
 
 
 @router.get("/calendar-view/month", response_class=HTMLResponse)
-async def get_calendar_month_view(
+def get_calendar_month_view(
     request: Request,
     date: Optional[str] = None,
     account_id: Optional[str] = None,
@@ -1731,7 +1642,7 @@ async def get_calendar_month_view(
 
 
 @router.get("/calendar-view/schedule", response_class=HTMLResponse)
-async def get_calendar_schedule_view(
+def get_calendar_schedule_view(
     request: Request,
     date: Optional[str] = None,
     account_id: Optional[str] = None,
@@ -0,0 +1,64 @@
+"""
+Debug routes for Perun's BlackBook.
+
+Shows the per-route query profile collected when QUERY_PROFILER_ENABLED=true,
+plus the connection pool status. Mounted only when profiling is enabled.
+"""
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.templating import Jinja2Templates
+
+from app.config import get_settings
+from app.database import engine
+from app.utils import query_profiler
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+templates = Jinja2Templates(directory="app/templates")
+
+SORT_OPTIONS = {
+    "total_ms": "Total DB time",
+    "avg_ms": "Avg DB time",
+    "max_queries": "Max queries",
+    "avg_queries": "Avg queries",
+    "worst_repeat_count": "Repeated statement",
+    "requests": "Requests",
+}
+
+
+@router.get("/perf", response_class=HTMLResponse)
+def perf_page(
+    request: Request,
+    sort: str = Query("total_ms", description="Sort column"),
+):
+    """
+    Aggregated query counts and DB time per route.
+    """
+    if sort not in SORT_OPTIONS:
+        sort = "total_ms"
+
+    settings = get_settings()
+    return templates.TemplateResponse(
+        "debug/perf.html",
+        {
+            "request": request,
+            "title": "Performance",
+            "enabled": query_profiler.is_enabled(),
+            "routes": query_profiler.profiler.routes(sort_by=sort),
+            "sort": sort,
+            "sort_options": SORT_OPTIONS,
+            "pool_status": engine.pool.status(),
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "threadpool_size": settings.threadpool_size,
+        },
+    )
+
+
+@router.post("/perf/reset")
+def reset_perf():
+    """
+    Clear the aggregated profile.
+    """
+    query_profiler.profiler.reset()
+    return RedirectResponse(url="/debug/perf", status_code=303)
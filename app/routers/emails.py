@@ -4,10 +4,9 @@ Email history routes for Perun's BlackBook.
 Handles fetching and displaying email history from connected Gmail accounts.
 """
 
-from datetime import datetime, timezone, timedelta
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
@@ -16,7 +15,6 @@ from app.database import get_db
 from app.models import (
     Person,
     GoogleAccount,
-    EmailCache,
     Interaction,
     InteractionMedium,
     InteractionSource,
@@ -26,88 +24,33 @@ from app.services.gmail_service import (
     GmailServiceError,
     GmailAuthError,
     GmailAPIError,
-    EmailThread,
 )
+from app.services.email_thread_cache import (
+    EmailThreadCache,
+    cached_row_count,
+    clear_person_threads,
+    email_cache_stats,
+    evict_expired,
+    refresh_person_threads,
+)
+from app.services.contact_stats import refresh_contact_stats
 
 router = APIRouter(prefix="/emails", tags=["emails"])
 templates = Jinja2Templates(directory="app/templates")
 
-# Cache TTL in hours
-CACHE_TTL_HOURS = 1
-
-
-def _get_cached_threads(
-    db: Session,
-    person_id: UUID,
-    account_id: UUID | None = None,
-) -> list[dict] | None:
-    """
-    Get cached email threads for a person.
-
-    Returns None if cache is expired or doesn't exist.
-    """
-    cache_cutoff = datetime.now(timezone.utc) - timedelta(hours=CACHE_TTL_HOURS)
-
-    query = db.query(EmailCache).filter(
-        EmailCache.person_id == person_id,
-        EmailCache.cached_at >= cache_cutoff,
-    )
-
-    if account_id:
-        query = query.filter(EmailCache.google_account_id == account_id)
-
-    cached = query.order_by(EmailCache.last_message_date.desc()).all()
-
-    if not cached:
-        return None
-
-    return [
-        {
-            "thread_id": c.gmail_thread_id,
-            "account_id": str(c.google_account_id),
-            "account_email": c.google_account.email if c.google_account else "",
-            "subject": c.subject,
-            "snippet": c.snippet,
-            "participants": c.participants or [],
-            "last_message_date": c.last_message_date.isoformat() if c.last_message_date else None,
-            "message_count": c.message_count,
-            "gmail_link": f"https://mail.google.com/mail/u/0/#all/{c.gmail_thread_id}",
-            "cached": True,
-        }
-        for c in cached
-    ]
-
-
-def _cache_threads(
-    db: Session,
-    person_id: UUID,
-    threads: list[EmailThread],
-) -> None:
-    """Cache email threads for a person."""
-    # Delete old cache entries for this person
-    db.query(EmailCache).filter(EmailCache.person_id == person_id).delete()
-
-    # Insert new cache entries
-    for thread in threads:
-        cache_entry = EmailCache(
-            person_id=person_id,
-            google_account_id=thread.account_id,
-            gmail_thread_id=thread.thread_id,
-            subject=thread.subject,
-            snippet=thread.snippet,
-            participants=thread.participants,
-            last_message_date=thread.last_message_date,
-            message_count=thread.message_count,
-        )
-        db.add(cache_entry)
-
-    db.commit()
+def _merge_threads(local: list[dict], older: list[dict]) -> list[dict]:
+    """Add Gmail threads to the synced ones (synced copy wins), newest first."""
+    seen = {(t["account_id"], t["thread_id"]) for t in local}
+    merged = local + [t for t in older if (t["account_id"], t["thread_id"]) not in seen]
+    merged.sort(key=lambda t: t["last_message_date"] or "", reverse=True)
+    return merged
 
 
 @router.get("/person/{person_id}", response_class=HTMLResponse)
-async def get_person_emails(
+def get_person_emails(
     request: Request,
     person_id: UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     account_id: UUID | None = Query(None, description="Filter by specific Google account"),
     refresh: bool = Query(False, description="Force refresh from Gmail API"),
@@ -126,30 +69,46 @@ async def get_person_emails(
     # Check if any Google accounts are connected
     has_accounts = db.query(GoogleAccount).filter_by(is_active=True).count() > 0
 
-    threads = []
-    from_cache = False
+    gmail_service = GmailService(db)
 
-    # Check cache first (unless refresh requested)
-    if not refresh:
-        cached = _get_cached_threads(db, person_id, account_id)
-        if cached is not None:
-            threads = cached
-            from_cache = True
-
-    # Fetch fresh from Gmail API if needed
-    if not threads and not from_cache:
-        try:
-            gmail_service = GmailService(db)
-            email_threads = gmail_service.search_emails_for_person(person_id, max_results)
-
-            # Cache the results
-            _cache_threads(db, person_id, email_threads)
-            threads = [t.to_dict() for t in email_threads]
-            from_cache = False
+    # Synced messages first: no Gmail API calls
+    threads = [
+        t.to_dict() for t in gmail_service.local_email_history(person_id, max_results, account_id)
+    ]
 
-        except (GmailAuthError, GmailAPIError, GmailServiceError):
-            # Silently fail and show empty state for HTMX requests
-            threads = []
+    # Older history comes from Gmail, read through email_cache. On a miss,
+    # Gmail is searched when refresh is requested or nothing is synced for
+    # this person yet; stale results are shown and refreshed in the background
+    older = None
+    searched_gmail = False
+    try:
+        cached = EmailThreadCache(db, gmail_service).person_threads(
+            person_id,
+            max_results,
+            account_id,
+            refresh=refresh,
+            fetch=refresh or not threads,
+        )
+        if cached is not None:
+            older = [t.to_dict() for t in cached.threads]
+            searched_gmail = not cached.from_cache
+            if cached.stale:
+                background_tasks.add_task(refresh_person_threads, person_id, max_results)
+    except (GmailAuthError, GmailAPIError, GmailServiceError):
+        # Silently fail and show empty state for HTMX requests
+        cached = None
+    from_cache = cached is not None and cached.from_cache
+
+    if older:
+        threads = _merge_threads(threads, older)[:max_results]
+
+    # Offer a Gmail search while some account's history isn't fully synced
+    older_in_gmail = (
+        has_accounts
+        and not from_cache
+        and not searched_gmail
+        and gmail_service.has_unsynced_history(account_id)
+    )
 
     # Return HTML partial for HTMX
     return templates.TemplateResponse(
@@ -158,6 +117,7 @@ async def get_person_emails(
             "request": request,
             "threads": threads,
             "from_cache": from_cache,
+            "older_in_gmail": older_in_gmail,
             "person_id": str(person_id),
             "has_accounts": has_accounts,
         },
@@ -165,20 +125,22 @@ async def get_person_emails(
 
 
 @router.get("/person/{person_id}/refresh", response_class=HTMLResponse)
-async def refresh_person_emails(
+def refresh_person_emails(
     request: Request,
     person_id: UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     max_results: int = Query(50, ge=1, le=100),
 ):
     """
     Force refresh email history for a person.
 
-    Bypasses cache and fetches fresh data from Gmail API.
+    Bypasses cache and searches Gmail for history older than the sync.
     """
-    return await get_person_emails(
+    return get_person_emails(
         request=request,
         person_id=person_id,
+        background_tasks=background_tasks,
         db=db,
         refresh=True,
         max_results=max_results,
@@ -186,7 +148,7 @@ async def refresh_person_emails(
 
 
 @router.get("/thread/{account_id}/{thread_id}")
-async def get_thread_details(
+def get_thread_details(
     account_id: UUID,
     thread_id: str,
     db: Session = Depends(get_db),
@@ -200,8 +162,7 @@ async def get_thread_details(
         raise HTTPException(status_code=404, detail="Google account not found")
 
     try:
-        gmail_service = GmailService(db)
-        thread = gmail_service.get_thread_details(thread_id, account_id)
+        thread = EmailThreadCache(db, GmailService(db)).thread_details(thread_id, account_id)
 
         if not thread:
             raise HTTPException(status_code=404, detail="Thread not found")
@@ -221,7 +182,7 @@ async def get_thread_details(
 
 
 @router.post("/thread/{account_id}/{thread_id}/log")
-async def log_email_as_interaction(
+def log_email_as_interaction(
     account_id: UUID,
     thread_id: str,
     person_id: UUID = Query(..., description="Person to log interaction for"),
@@ -252,8 +213,7 @@ async def log_email_as_interaction(
 
     # Get thread details
     try:
-        gmail_service = GmailService(db)
-        thread = gmail_service.get_thread_details(thread_id, account_id)
+        thread = EmailThreadCache(db, GmailService(db)).thread_details(thread_id, account_id)
 
         if not thread:
             raise HTTPException(status_code=404, detail="Thread not found")
@@ -276,6 +236,7 @@ async def log_email_as_interaction(
             if not person.contacted or person.contacted is False:
                 person.contacted = True
 
+        refresh_contact_stats(db, [person_id])
         db.commit()
 
         return {
@@ -298,7 +259,7 @@ async def log_email_as_interaction(
 
 
 @router.get("/accounts")
-async def list_email_accounts(
+def list_email_accounts(
     db: Session = Depends(get_db),
 ):
     """
@@ -318,15 +279,14 @@ async def list_email_accounts(
 
 
 @router.delete("/cache/person/{person_id}")
-async def clear_person_email_cache(
+def clear_person_email_cache(
     person_id: UUID,
     db: Session = Depends(get_db),
 ):
     """
     Clear cached email data for a person.
     """
-    deleted = db.query(EmailCache).filter(EmailCache.person_id == person_id).delete()
-    db.commit()
+    deleted = clear_person_threads(db, person_id)
 
     return {
         "success": True,
@@ -335,7 +295,7 @@ async def clear_person_email_cache(
 
 
 @router.delete("/cache/expired")
-async def clear_expired_cache(
+def clear_expired_cache(
     db: Session = Depends(get_db),
     hours: int = Query(24, ge=1, description="Delete cache entries older than this many hours"),
 ):
@@ -344,11 +304,17 @@ async def clear_expired_cache(
 
     By default, removes entries older than 24 hours.
     """
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-    deleted = db.query(EmailCache).filter(EmailCache.cached_at < cutoff).delete()
-    db.commit()
+    deleted = evict_expired(db, hours)
 
     return {
         "success": True,
         "message": f"Cleared {deleted} expired cache entries",
     }
+
+
+@router.get("/cache/stats")
+def get_cache_stats(db: Session = Depends(get_db)):
+    """
+    Email cache hit/miss counters since startup, and current row count.
+    """
+    return {**email_cache_stats(), "rows": cached_row_count(db)}
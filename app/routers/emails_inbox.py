@@ -11,8 +11,8 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, Request, HTTPException, BackgroundTasks
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import desc, func, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import desc
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.database import get_db
 from app.models import (
@@ -23,7 +23,22 @@ from app.models import (
     Person,
     PersonEmail,
 )
-from app.services.gmail_sync_service import get_gmail_sync_service, get_gmail_labels
+from app.services.email_search import (
+    email_search_filters,
+    email_search_rank,
+    parse_email_search,
+)
+from app.services.gmail_labels import inbox_label_hierarchy
+from app.services.gmail_sync_service import get_gmail_sync_service
+from app.utils.pagination import (
+    InvalidCursorError,
+    approximate_count,
+    count_rows,
+    cursor_url,
+    paginate_by_cursor,
+    paginate_by_ids,
+)
+from app.utils.query_profiler import query_budget
 
 router = APIRouter(prefix="/emails", tags=["emails"])
 templates = Jinja2Templates(directory="app/templates")
@@ -33,7 +48,8 @@ DEFAULT_PAGE_SIZE = 50
 
 
 @router.get("", response_class=HTMLResponse)
-async def email_inbox(
+@query_budget(15)
+def email_inbox(
     request: Request,
     db: Session = Depends(get_db),
     page: int = Query(1, ge=1),
@@ -50,66 +66,20 @@ async def email_inbox(
     # Get all connected Google accounts
     accounts = db.query(GoogleAccount).filter_by(is_active=True).all()
 
-    # Build email query
-    query = db.query(EmailMessage).options(
-        joinedload(EmailMessage.person_links).joinedload(EmailPersonLink.person)
+    query = _build_email_query(
+        db,
+        account_id=account_id,
+        q=q,
+        folder=folder,
+        label=label,
+        unread_only=unread_only,
     )
 
-    # Filter by account
-    if account_id:
-        try:
-            query = query.filter(EmailMessage.google_account_id == UUID(account_id))
-        except ValueError:
-            pass
-
-    # Filter by folder
-    if folder == "inbox":
-        query = query.filter(EmailMessage.labels.contains(["INBOX"]))
-    elif folder == "sent":
-        query = query.filter(EmailMessage.labels.contains(["SENT"]))
-    elif folder == "drafts":
-        query = query.filter(EmailMessage.labels.contains(["DRAFT"]))
-    elif folder == "spam":
-        query = query.filter(EmailMessage.labels.contains(["SPAM"]))
-    elif folder == "trash":
-        query = query.filter(EmailMessage.labels.contains(["TRASH"]))
-
-    # Filter by Gmail label
-    if label:
-        query = query.filter(EmailMessage.labels.contains([label]))
-
-    # Filter unread only
-    if unread_only:
-        query = query.filter(EmailMessage.is_read == False)
-
-    # Search
-    if q:
-        search_term = f"%{q}%"
-        query = query.filter(
-            or_(
-                EmailMessage.subject.ilike(search_term),
-                EmailMessage.snippet.ilike(search_term),
-                EmailMessage.from_email.ilike(search_term),
-                EmailMessage.from_name.ilike(search_term),
-            )
-        )
-
-    # Order by date (newest first)
-    query = query.order_by(desc(EmailMessage.internal_date))
-
-    # Get total count
-    total_count = query.count()
-    total_pages = (total_count + per_page - 1) // per_page
-
-    # Paginate
-    offset = (page - 1) * per_page
-    emails = query.offset(offset).limit(per_page).all()
-
-    # Get unread counts per folder
-    unread_inbox = db.query(func.count(EmailMessage.id)).filter(
-        EmailMessage.is_read == False,
-        EmailMessage.labels.contains(["INBOX"]),
-    ).scalar() or 0
+    # Page ids first, then batch-load linked contacts for the visible rows
+    result = paginate_by_ids(db, query, EmailMessage, page, per_page, _email_list_load_options())
+    emails = result.items
+    total_count = result.total_count
+    total_pages = result.total_pages
 
     # Get sync state for each account
     sync_states = {}
@@ -119,8 +89,15 @@ async def email_inbox(
         ).first()
         sync_states[str(account.id)] = state
 
-    # Get distinct Gmail labels from synced emails
-    gmail_labels = _get_gmail_labels(db, account_id)
+    # Unread inbox count, kept per account and label by the sync
+    unread_inbox = sum(
+        (state.unread_counts or {}).get("INBOX", 0)
+        for state in sync_states.values()
+        if state
+    )
+
+    # Gmail label sidebar from the label lists stored by the sync
+    gmail_labels = _get_gmail_labels(db, accounts, sync_states, account_id)
 
     # Group emails by date for display
     email_groups = _group_emails_by_date(emails)
@@ -150,7 +127,8 @@ async def email_inbox(
 
 
 @router.get("/table", response_class=HTMLResponse)
-async def email_inbox_table(
+@query_budget(10)
+def email_inbox_table(
     request: Request,
     db: Session = Depends(get_db),
     page: int = Query(1, ge=1),
@@ -160,58 +138,82 @@ async def email_inbox_table(
     folder: str = Query("inbox"),
     label: Optional[str] = Query(None),
     unread_only: bool = Query(False),
+    cursor: Optional[str] = Query(None, description="Keyset cursor; pass empty to start infinite scroll"),
+    last_group: Optional[str] = Query(None, description="Date group the previous cursor page ended in"),
+    count: str = Query("exact", description="Footer count: 'exact' or 'approx'"),
 ):
     """
     HTMX partial for email list table.
+
+    Passing `cursor` switches to keyset pagination (newest first): an empty
+    cursor renders the list with an infinite-scroll sentinel, and a cursor
+    from a previous response renders only the next emails. Next-page URLs
+    carry the last rendered date group, so a group continuing across pages
+    gets no second header.
     """
-    # Build email query (same as inbox)
-    query = db.query(EmailMessage).options(
-        joinedload(EmailMessage.person_links).joinedload(EmailPersonLink.person)
+    query = _build_email_query(
+        db,
+        account_id=account_id,
+        q=q,
+        folder=folder,
+        label=label,
+        unread_only=unread_only,
+        ranked=cursor is None,
     )
 
-    if account_id:
+    next_url = None
+    cursor_mode = cursor is not None
+    if cursor_mode:
         try:
-            query = query.filter(EmailMessage.google_account_id == UUID(account_id))
-        except ValueError:
-            pass
-
-    if folder == "inbox":
-        query = query.filter(EmailMessage.labels.contains(["INBOX"]))
-    elif folder == "sent":
-        query = query.filter(EmailMessage.labels.contains(["SENT"]))
-    elif folder == "drafts":
-        query = query.filter(EmailMessage.labels.contains(["DRAFT"]))
-    elif folder == "spam":
-        query = query.filter(EmailMessage.labels.contains(["SPAM"]))
-    elif folder == "trash":
-        query = query.filter(EmailMessage.labels.contains(["TRASH"]))
-
-    if label:
-        query = query.filter(EmailMessage.labels.contains([label]))
-
-    if unread_only:
-        query = query.filter(EmailMessage.is_read == False)
-
-    if q:
-        search_term = f"%{q}%"
-        query = query.filter(
-            or_(
-                EmailMessage.subject.ilike(search_term),
-                EmailMessage.snippet.ilike(search_term),
-                EmailMessage.from_email.ilike(search_term),
-                EmailMessage.from_name.ilike(search_term),
+            cursor_page = paginate_by_cursor(
+                db,
+                query,
+                EmailMessage,
+                EmailMessage.internal_date,
+                True,
+                cursor,
+                per_page,
+                _email_list_load_options(),
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        emails = cursor_page.items
+        email_groups = _group_emails_by_date(emails)
+        if cursor_page.has_more:
+            last_label = email_groups[-1]["label"] if email_groups else last_group
+            next_url = cursor_url(request, cursor_page.next_cursor, last_group=last_label or "")
+
+        # Follow-up scroll requests only need the next emails
+        if cursor:
+            return templates.TemplateResponse(
+                "emails/_email_rows.html",
+                {
+                    "request": request,
+                    "email_groups": email_groups,
+                    "last_group": last_group,
+                    "next_url": next_url,
+                },
             )
-        )
-
-    query = query.order_by(desc(EmailMessage.internal_date))
-
-    total_count = query.count()
-    total_pages = (total_count + per_page - 1) // per_page
-
-    offset = (page - 1) * per_page
-    emails = query.offset(offset).limit(per_page).all()
 
-    email_groups = _group_emails_by_date(emails)
+        if count == "approx":
+            total_count = approximate_count(db, query, EmailMessage)
+        else:
+            total_count = count_rows(query, EmailMessage.id)
+        total_pages = 1
+    else:
+        result = paginate_by_ids(
+            db,
+            query,
+            EmailMessage,
+            page,
+            per_page,
+            _email_list_load_options(),
+            approximate=count == "approx",
+        )
+        emails = result.items
+        total_count = result.total_count
+        total_pages = result.total_pages
+        email_groups = _group_emails_by_date(emails)
 
     # Get accounts for empty state
     accounts = db.query(GoogleAccount).filter_by(is_active=True).all()
@@ -227,6 +229,9 @@ async def email_inbox_table(
             "per_page": per_page,
             "total_count": total_count,
             "total_pages": total_pages,
+            "cursor_mode": cursor_mode,
+            "count_is_approx": count == "approx",
+            "next_url": next_url,
             "account_id": account_id or "",
             "q": q or "",
             "folder": folder,
@@ -236,8 +241,77 @@ async def email_inbox_table(
     )
 
 
+# Gmail system labels behind each folder tab
+FOLDER_LABELS = {
+    "inbox": "INBOX",
+    "sent": "SENT",
+    "drafts": "DRAFT",
+    "spam": "SPAM",
+    "trash": "TRASH",
+}
+
+
+def _build_email_query(
+    db: Session,
+    account_id: Optional[str] = None,
+    q: Optional[str] = None,
+    folder: str = "inbox",
+    label: Optional[str] = None,
+    unread_only: bool = False,
+    ranked: bool = True,
+):
+    """
+    Build the inbox query with all filters applied, newest first.
+    Returns the query object (not executed) for further processing.
+
+    Free-text searches are ordered by relevance first unless ranked is
+    False (keyset pagination needs the plain date order).
+
+    No eager loads are attached: callers page ids with paginate_by_ids()
+    and load linked contacts for the visible rows only.
+    """
+    query = db.query(EmailMessage)
+
+    # Filter by account
+    if account_id:
+        try:
+            query = query.filter(EmailMessage.google_account_id == UUID(account_id))
+        except ValueError:
+            pass
+
+    # Filter by folder ("all" and unknown folders are unfiltered)
+    folder_label = FOLDER_LABELS.get(folder)
+    if folder_label:
+        query = query.filter(EmailMessage.labels.contains([folder_label]))
+
+    # Filter by Gmail label
+    if label:
+        query = query.filter(EmailMessage.labels.contains([label]))
+
+    # Filter unread only
+    if unread_only:
+        query = query.filter(EmailMessage.is_read == False)
+
+    # Search: full-text and Gmail-style operators (from:, to:, has:, before:, after:)
+    order = []
+    if q:
+        search = parse_email_search(q)
+        query = query.filter(*email_search_filters(search))
+        rank = email_search_rank(search) if ranked else None
+        if rank is not None:
+            order.append(rank)
+
+    # Order by date (newest first), id as tiebreaker so pages are stable
+    return query.order_by(*order, desc(EmailMessage.internal_date), desc(EmailMessage.id))
+
+
+def _email_list_load_options():
+    """Loader options for the linked contacts the email list renders."""
+    return [selectinload(EmailMessage.person_links).joinedload(EmailPersonLink.person)]
+
+
 @router.get("/{email_id}", response_class=HTMLResponse)
-async def email_detail(
+def email_detail(
     request: Request,
     email_id: UUID,
     db: Session = Depends(get_db),
@@ -271,7 +345,7 @@ async def email_detail(
 
 
 @router.post("/sync", response_class=HTMLResponse)
-async def trigger_sync(
+def trigger_sync(
     request: Request,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
@@ -317,7 +391,7 @@ async def trigger_sync(
 
 
 @router.post("/sync-folder", response_class=HTMLResponse)
-async def trigger_folder_sync(
+def trigger_folder_sync(
     request: Request,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
@@ -396,7 +470,7 @@ async def trigger_folder_sync(
 
 
 @router.post("/{email_id}/link-person", response_class=HTMLResponse)
-async def link_email_to_person(
+def link_email_to_person(
     request: Request,
     email_id: UUID,
     person_id: UUID = Query(...),
@@ -476,134 +550,34 @@ def _run_folder_sync(db: Session, account_id: UUID, label_id: str) -> None:
             sync_service.sync_folder(account, label_id, max_results=200)
 
 
-def _get_gmail_labels(db: Session, account_id: Optional[str] = None) -> list[dict]:
+def _get_gmail_labels(
+    db: Session,
+    accounts: list[GoogleAccount],
+    sync_states: dict[str, EmailSyncState | None],
+    account_id: Optional[str] = None,
+) -> list[dict]:
     """
-    Get ALL Gmail labels from the Gmail API.
+    Gmail label sidebar (parent labels with children) for the inbox.
 
-    Fetches all user labels directly from Gmail API (not limited to synced emails).
-    Returns hierarchical label structure (parent labels with children).
-    Excludes system labels like UNREAD, CATEGORY_*.
+    Reads the label lists the sync stores per account; only an account whose
+    labels were never fetched (e.g. not synced yet) calls the Gmail API.
     """
-    # System labels to exclude from display (these are internal Gmail labels)
-    system_labels = {
-        "UNREAD", "STARRED", "IMPORTANT", "CHAT", "SPAM", "TRASH",
-        "CATEGORY_PERSONAL", "CATEGORY_SOCIAL", "CATEGORY_PROMOTIONS",
-        "CATEGORY_UPDATES", "CATEGORY_FORUMS",
-    }
-
-    # Standard folders we already show
-    standard_folders = {"INBOX", "SENT", "DRAFT", "DRAFTS"}
-
-    # Additional labels to exclude (system/internal labels by name)
-    excluded_label_names = {
-        # Star colors (Gmail internal)
-        "BLUE_STAR", "GREEN_STAR", "RED_STAR", "YELLOW_STAR", "ORANGE_STAR", "PURPLE_STAR",
-        "BLUE_INFO", "GREEN_CHECK", "YELLOW_BANG", "RED_BANG",
-        "BLUE_CIRCLE", "GREEN_CIRCLE", "RED_CIRCLE", "YELLOW_CIRCLE", "ORANGE_CIRCLE", "PURPLE_CIRCLE",
-        # Other system labels
-        "Junk E-mail",
-        "Snoozed", "Important",
-    }
-
-    # Get ALL labels directly from Gmail API
-    label_names = {}  # Maps label_id -> label_name
-    accounts = db.query(GoogleAccount).filter_by(is_active=True).all()
-
     if account_id:
-        try:
-            account_uuid = UUID(account_id)
-            account = db.query(GoogleAccount).filter_by(id=account_uuid).first()
-            if account:
-                label_names = get_gmail_labels(account)
-        except ValueError:
-            pass
-    else:
-        # Get labels from all accounts
-        for account in accounts:
-            account_labels = get_gmail_labels(account)
-            label_names.update(account_labels)
-
-    # Build flat list from ALL Gmail labels (not just synced emails)
-    flat_labels = []
-    for label_id, display_name in label_names.items():
-        # Filter out system labels and standard folders
-        if label_id in system_labels:
-            continue
-        if display_name in standard_folders:
-            continue
-        if display_name in system_labels:
-            continue
-        if display_name in excluded_label_names:
-            continue
-        # Also filter star/circle labels that might have different casing
-        if display_name.upper() in excluded_label_names or display_name.replace("_", " ").upper() in {n.replace("_", " ").upper() for n in excluded_label_names}:
-            continue
-
-        flat_labels.append({
-            "name": label_id,
-            "display_name": display_name,
-        })
-
-    # Build hierarchical structure
-    # Gmail uses "/" to separate parent/child labels (e.g., "News/Bloomberg")
-    hierarchy = {}
-    standalone = []
-
-    for label in flat_labels:
-        display_name = label["display_name"]
-        if "/" in display_name:
-            # This is a nested label
-            parts = display_name.split("/")
-            parent_name = parts[0]
-            child_name = "/".join(parts[1:])  # Handle deeply nested labels
-
-            if parent_name not in hierarchy:
-                hierarchy[parent_name] = {
-                    "name": None,  # Parent may not have its own label ID
-                    "display_name": parent_name,
-                    "children": [],
-                }
-
-            hierarchy[parent_name]["children"].append({
-                "name": label["name"],
-                "display_name": child_name,
-            })
-        else:
-            # Check if this is a parent of nested labels
-            is_parent = any(
-                l["display_name"].startswith(display_name + "/")
-                for l in flat_labels
-            )
-            if is_parent:
-                if display_name not in hierarchy:
-                    hierarchy[display_name] = {
-                        "name": label["name"],
-                        "display_name": display_name,
-                        "children": [],
-                    }
-                else:
-                    # Update with actual label ID
-                    hierarchy[display_name]["name"] = label["name"]
-            else:
-                standalone.append(label)
-
-    # Convert hierarchy to sorted list
-    result_labels = []
-
-    # Add hierarchical labels (sorted by parent name)
-    for parent_name in sorted(hierarchy.keys(), key=str.lower):
-        parent = hierarchy[parent_name]
-        # Sort children alphabetically
-        parent["children"].sort(key=lambda x: x["display_name"].lower())
-        result_labels.append(parent)
+        accounts = [account for account in accounts if str(account.id) == account_id]
 
-    # Add standalone labels (sorted alphabetically)
-    standalone.sort(key=lambda x: x["display_name"].lower())
-    for label in standalone:
-        label["children"] = []  # No children
-        result_labels.append(label)
-
-    return result_labels
+    states = []
+    for account in accounts:
+        state = sync_states.get(str(account.id))
+        if state is None or state.label_names is None:
+            try:
+                get_gmail_sync_service(db).refresh_labels(account)
+            except Exception:
+                continue
+            state = db.query(EmailSyncState).filter_by(google_account_id=account.id).first()
+            sync_states[str(account.id)] = state
+        states.append(state)
+
+    return inbox_label_hierarchy(states)
 
 
 def _group_emails_by_date(emails: list[EmailMessage]) -> list[dict]:
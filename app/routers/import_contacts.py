@@ -41,7 +41,7 @@ IMPORT_FILES_DIR.mkdir(parents=True, exist_ok=True)
 
 
 @router.post("/google", response_class=HTMLResponse)
-async def sync_google_contacts(
+def sync_google_contacts(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -105,7 +105,7 @@ async def sync_google_contacts(
 
 
 @router.post("/google/{account_id}", response_class=HTMLResponse)
-async def sync_google_contacts_for_account(
+def sync_google_contacts_for_account(
     request: Request,
     account_id: UUID,
     db: Session = Depends(get_db),
@@ -186,7 +186,7 @@ async def sync_google_contacts_for_account(
 
 
 @router.post("/linkedin", response_class=HTMLResponse)
-async def import_linkedin_csv(
+def import_linkedin_csv(
     request: Request,
     file: UploadFile = File(..., description="LinkedIn Connections.csv file"),
     db: Session = Depends(get_db),
@@ -223,7 +223,7 @@ async def import_linkedin_csv(
 
     try:
         # Read file content
-        content = await file.read()
+        content = file.file.read()
         file_size = len(content)
 
         # Generate unique filename for storage
@@ -335,7 +335,7 @@ async def import_linkedin_csv(
 
 
 @router.get("/status")
-async def get_import_status(
+def get_import_status(
     db: Session = Depends(get_db),
 ):
     """
@@ -365,7 +365,7 @@ async def get_import_status(
 
 
 @router.get("/history", response_class=HTMLResponse)
-async def get_import_history(
+def get_import_history(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -384,7 +384,7 @@ async def get_import_history(
 
 
 @router.get("/history/{history_id}/download")
-async def download_import_file(
+def download_import_file(
     history_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -412,7 +412,7 @@ async def download_import_file(
 
 
 @router.post("/google/push/{person_id}", response_class=HTMLResponse)
-async def push_person_to_google(
+def push_person_to_google(
     request: Request,
     person_id: UUID,
     account_id: UUID = Form(...),
@@ -15,6 +15,16 @@ from sqlalchemy.orm import Session, joinedload
 
 from app.database import get_db
 from app.models import Interaction, InteractionMedium, Person
+from app.services.contact_stats import refresh_contact_stats
+from app.utils.pagination import (
+    InvalidCursorError,
+    approximate_count,
+    count_rows,
+    cursor_url,
+    paginate_by_cursor,
+    paginate_by_ids,
+)
+from app.utils.query_profiler import query_budget
 
 router = APIRouter(prefix="/interactions", tags=["interactions"])
 templates = Jinja2Templates(directory="app/templates")
@@ -24,7 +34,8 @@ DEFAULT_PAGE_SIZE = 20
 
 
 @router.get("", response_class=HTMLResponse)
-async def list_interactions(
+@query_budget(8)
+def list_interactions(
     request: Request,
     db: Session = Depends(get_db),
     page: int = Query(1, ge=1),
@@ -46,13 +57,13 @@ async def list_interactions(
         sort_order=sort_order,
     )
 
-    # Get total count for pagination
-    total_count = query_result.count()
-    total_pages = (total_count + per_page - 1) // per_page
-
-    # Apply pagination
-    offset = (page - 1) * per_page
-    interactions = query_result.offset(offset).limit(per_page).all()
+    # Page ids first, then load the visible rows
+    result = paginate_by_ids(
+        db, query_result, Interaction, page, per_page, _interaction_list_load_options()
+    )
+    interactions = result.items
+    total_count = result.total_count
+    total_pages = result.total_pages
 
     return templates.TemplateResponse(
         "interactions/list.html",
@@ -74,7 +85,8 @@ async def list_interactions(
 
 
 @router.get("/table", response_class=HTMLResponse)
-async def list_interactions_table(
+@query_budget(8)
+def list_interactions_table(
     request: Request,
     db: Session = Depends(get_db),
     page: int = Query(1, ge=1),
@@ -83,9 +95,15 @@ async def list_interactions_table(
     medium: Optional[str] = Query(None, description="Filter by interaction medium"),
     sort_by: str = Query("interaction_date", description="Sort column"),
     sort_order: str = Query("desc", description="Sort order: asc or desc"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor; pass empty to start infinite scroll"),
+    count: str = Query("exact", description="Footer count: 'exact' or 'approx'"),
 ):
     """
     HTMX partial - returns just the table body for dynamic updates.
+
+    Passing `cursor` switches to keyset pagination: an empty cursor renders
+    the table with an infinite-scroll sentinel, and a cursor from a previous
+    response renders only the next rows.
     """
     # Build the query with filters applied
     query_result = _build_interaction_query(
@@ -96,13 +114,52 @@ async def list_interactions_table(
         sort_order=sort_order,
     )
 
-    # Get total count for pagination
-    total_count = query_result.count()
-    total_pages = (total_count + per_page - 1) // per_page
+    next_url = None
+    cursor_mode = cursor is not None
+    if cursor_mode:
+        try:
+            cursor_page = paginate_by_cursor(
+                db,
+                query_result,
+                Interaction,
+                _get_sort_column(sort_by),
+                sort_order.lower() == "desc",
+                cursor,
+                per_page,
+                _interaction_list_load_options(),
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        interactions = cursor_page.items
+        if cursor_page.has_more:
+            next_url = cursor_url(request, cursor_page.next_cursor)
+
+        # Follow-up scroll requests only need the next rows
+        if cursor:
+            return templates.TemplateResponse(
+                "interactions/_rows.html",
+                {"request": request, "interactions": interactions, "next_url": next_url},
+            )
 
-    # Apply pagination
-    offset = (page - 1) * per_page
-    interactions = query_result.offset(offset).limit(per_page).all()
+        if count == "approx":
+            total_count = approximate_count(db, query_result, Interaction)
+        else:
+            total_count = count_rows(query_result, Interaction.id)
+        total_pages = 1
+    else:
+        # Page ids first, then load the visible rows
+        result = paginate_by_ids(
+            db,
+            query_result,
+            Interaction,
+            page,
+            per_page,
+            _interaction_list_load_options(),
+            approximate=count == "approx",
+        )
+        interactions = result.items
+        total_count = result.total_count
+        total_pages = result.total_pages
 
     return templates.TemplateResponse(
         "interactions/_table.html",
@@ -113,6 +170,9 @@ async def list_interactions_table(
             "per_page": per_page,
             "total_count": total_count,
             "total_pages": total_pages,
+            "cursor_mode": cursor_mode,
+            "count_is_approx": count == "approx",
+            "next_url": next_url,
             "q": q or "",
             "medium": medium or "",
             "sort_by": sort_by,
@@ -131,11 +191,11 @@ def _build_interaction_query(
     """
     Build the interaction query with all filters and sorting applied.
     Returns the query object (not executed) for further processing.
+
+    No eager loads are attached: callers page ids with paginate_by_ids()
+    and load the person for the visible rows only.
     """
-    # Start with base query, eager load person relationship
-    query = db.query(Interaction).options(
-        joinedload(Interaction.person),
-    )
+    query = db.query(Interaction)
 
     # Apply text search filter
     if q:
@@ -156,16 +216,21 @@ def _build_interaction_query(
         except ValueError:
             pass  # Invalid medium, ignore filter
 
-    # Apply sorting
+    # Apply sorting (Interaction.id is the final tiebreaker so pages are stable)
     sort_column = _get_sort_column(sort_by)
     if sort_order.lower() == "desc":
-        query = query.order_by(desc(sort_column))
+        query = query.order_by(desc(sort_column), desc(Interaction.id))
     else:
-        query = query.order_by(asc(sort_column))
+        query = query.order_by(asc(sort_column), asc(Interaction.id))
 
     return query
 
 
+def _interaction_list_load_options():
+    """Loader options for what interactions/_row.html renders."""
+    return [joinedload(Interaction.person)]
+
+
 def _get_sort_column(sort_by: str):
     """Map sort_by parameter to SQLAlchemy column."""
     column_map = {
@@ -179,7 +244,7 @@ def _get_sort_column(sort_by: str):
 
 
 @router.get("/new", response_class=HTMLResponse)
-async def new_interaction_form(
+def new_interaction_form(
     request: Request,
     db: Session = Depends(get_db),
     person_id: Optional[str] = Query(None, description="Pre-select a person"),
@@ -212,7 +277,7 @@ async def new_interaction_form(
 
 
 @router.post("", response_class=HTMLResponse)
-async def create_interaction(
+def create_interaction(
     request: Request,
     db: Session = Depends(get_db),
     person_id: Optional[str] = Form(None),
@@ -261,6 +326,7 @@ async def create_interaction(
     )
 
     db.add(interaction)
+    refresh_contact_stats(db, [person_uuid])
     db.commit()
     db.refresh(interaction)
 
@@ -271,7 +337,7 @@ async def create_interaction(
 
 
 @router.get("/{interaction_id}", response_class=HTMLResponse)
-async def interaction_detail(
+def interaction_detail(
     request: Request,
     interaction_id: UUID,
     db: Session = Depends(get_db),
@@ -297,7 +363,7 @@ async def interaction_detail(
 
 
 @router.get("/{interaction_id}/edit", response_class=HTMLResponse)
-async def edit_interaction_form(
+def edit_interaction_form(
     request: Request,
     interaction_id: UUID,
     db: Session = Depends(get_db),
@@ -328,7 +394,7 @@ async def edit_interaction_form(
 
 
 @router.put("/{interaction_id}", response_class=HTMLResponse)
-async def update_interaction(
+def update_interaction(
     request: Request,
     interaction_id: UUID,
     db: Session = Depends(get_db),
@@ -372,7 +438,8 @@ async def update_interaction(
         except ValueError:
             pass
 
-    # Update interaction
+    # Update interaction (remember the previous person for stats refresh)
+    previous_person_id = interaction.person_id
     interaction.person_id = person_uuid
     interaction.person_name = person_name
     interaction.medium = medium_enum
@@ -380,6 +447,7 @@ async def update_interaction(
     interaction.notes = notes.strip() if notes else None
     interaction.files_sent = files_sent.strip() if files_sent else None
 
+    refresh_contact_stats(db, [previous_person_id, person_uuid])
     db.commit()
     db.refresh(interaction)
 
@@ -387,7 +455,7 @@ async def update_interaction(
 
 
 @router.delete("/{interaction_id}")
-async def delete_interaction(
+def delete_interaction(
     request: Request,
     interaction_id: UUID,
     db: Session = Depends(get_db),
@@ -405,6 +473,7 @@ async def delete_interaction(
     person_id = interaction.person_id
 
     db.delete(interaction)
+    refresh_contact_stats(db, [person_id])
     db.commit()
 
     # Check if this is an HTMX or fetch request
@@ -27,7 +27,7 @@ router = APIRouter(prefix="/api/lookups", tags=["lookups"])
 
 
 @router.get("/categories")
-async def get_categories(
+def get_categories(
     active_only: bool = Query(True, description="Only return active categories"),
     db: Session = Depends(get_db),
 ):
@@ -58,7 +58,7 @@ async def get_categories(
 
 
 @router.get("/categories/{category_id}")
-async def get_category(
+def get_category(
     category_id: int,
     db: Session = Depends(get_db),
 ):
@@ -100,7 +100,7 @@ async def get_category(
 
 
 @router.get("/types")
-async def get_types(
+def get_types(
     category_id: int = Query(None, description="Filter by category ID"),
     category_code: str = Query(None, description="Filter by category code"),
     active_only: bool = Query(True, description="Only return active types"),
@@ -147,7 +147,7 @@ async def get_types(
 
 
 @router.get("/types/{type_id}")
-async def get_type(
+def get_type(
     type_id: int,
     db: Session = Depends(get_db),
 ):
@@ -181,7 +181,7 @@ async def get_type(
 
 
 @router.get("/options")
-async def get_options(
+def get_options(
     option_type: str = Query(None, description="Filter by option type (e.g., vc_stage, pe_deal_type)"),
     active_only: bool = Query(True, description="Only return active options"),
     db: Session = Depends(get_db),
@@ -227,7 +227,7 @@ async def get_options(
 
 
 @router.get("/options/grouped")
-async def get_options_grouped(
+def get_options_grouped(
     active_only: bool = Query(True, description="Only return active options"),
     db: Session = Depends(get_db),
 ):
@@ -267,7 +267,7 @@ async def get_options_grouped(
 
 
 @router.get("/organization-form-data")
-async def get_organization_form_data(
+def get_organization_form_data(
     db: Session = Depends(get_db),
 ):
     """
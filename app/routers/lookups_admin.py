@@ -126,7 +126,7 @@ def _get_all_options(db: Session, option_type: Optional[str] = None):
 
 
 @router.post("/categories", response_class=HTMLResponse)
-async def create_category(
+def create_category(
     request: Request,
     code: str = Form(...),
     name: str = Form(...),
@@ -169,7 +169,7 @@ async def create_category(
 
 
 @router.put("/categories/{category_id}", response_class=HTMLResponse)
-async def update_category(
+def update_category(
     request: Request,
     category_id: int,
     code: str = Form(...),
@@ -221,7 +221,7 @@ async def update_category(
 
 
 @router.delete("/categories/{category_id}", response_class=HTMLResponse)
-async def delete_category(
+def delete_category(
     request: Request,
     category_id: int,
     force: bool = Query(False, description="Force delete even if types exist"),
@@ -262,7 +262,7 @@ async def delete_category(
 
 
 @router.post("/categories/reorder")
-async def reorder_categories(
+def reorder_categories(
     data: ReorderRequest,
     db: Session = Depends(get_db),
 ):
@@ -282,7 +282,7 @@ async def reorder_categories(
 
 
 @router.post("/types", response_class=HTMLResponse)
-async def create_type(
+def create_type(
     request: Request,
     category_id: int = Form(...),
     code: str = Form(...),
@@ -339,7 +339,7 @@ async def create_type(
 
 
 @router.put("/types/{type_id}", response_class=HTMLResponse)
-async def update_type(
+def update_type(
     request: Request,
     type_id: int,
     category_id: int = Form(...),
@@ -405,7 +405,7 @@ async def update_type(
 
 
 @router.delete("/types/{type_id}", response_class=HTMLResponse)
-async def delete_type(
+def delete_type(
     request: Request,
     type_id: int,
     force: bool = Query(False, description="Force delete even if organizations use this type"),
@@ -441,7 +441,7 @@ async def delete_type(
 
 
 @router.post("/types/reorder")
-async def reorder_types(
+def reorder_types(
     category_id: int,
     data: ReorderRequest,
     db: Session = Depends(get_db),
@@ -463,7 +463,7 @@ async def reorder_types(
 
 
 @router.post("/options", response_class=HTMLResponse)
-async def create_option(
+def create_option(
     request: Request,
     option_type: str = Form(...),
     code: str = Form(...),
@@ -506,7 +506,7 @@ async def create_option(
 
 
 @router.put("/options/{option_id}", response_class=HTMLResponse)
-async def update_option(
+def update_option(
     request: Request,
     option_id: int,
     option_type: str = Form(...),
@@ -557,7 +557,7 @@ async def update_option(
 
 
 @router.delete("/options/{option_id}", response_class=HTMLResponse)
-async def delete_option(
+def delete_option(
     request: Request,
     option_id: int,
     db: Session = Depends(get_db),
@@ -580,7 +580,7 @@ async def delete_option(
 
 
 @router.post("/options/reorder")
-async def reorder_options(
+def reorder_options(
     option_type: str,
     data: ReorderRequest,
     db: Session = Depends(get_db),
@@ -602,7 +602,7 @@ async def reorder_options(
 
 
 @router.get("/validate-type-category")
-async def validate_type_category(
+def validate_type_category(
     type_id: int,
     category_id: int,
     db: Session = Depends(get_db),
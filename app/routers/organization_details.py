@@ -79,7 +79,7 @@ def delete_logo_file(file_path: str | None) -> None:
 
 
 @router.get("/{org_id}/offices", response_model=List[OrganizationOfficeResponse])
-async def list_offices(
+def list_offices(
     org_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -95,7 +95,7 @@ async def list_offices(
 
 
 @router.post("/{org_id}/offices", response_model=OrganizationOfficeResponse)
-async def create_office(
+def create_office(
     org_id: UUID,
     office_data: OrganizationOfficeCreate,
     db: Session = Depends(get_db),
@@ -121,7 +121,7 @@ async def create_office(
 
 
 @router.put("/{org_id}/offices/{office_id}", response_model=OrganizationOfficeResponse)
-async def update_office(
+def update_office(
     org_id: UUID,
     office_id: UUID,
     office_data: OrganizationOfficeUpdate,
@@ -157,7 +157,7 @@ async def update_office(
 
 
 @router.delete("/{org_id}/offices/{office_id}")
-async def delete_office(
+def delete_office(
     org_id: UUID,
     office_id: UUID,
     db: Session = Depends(get_db),
@@ -185,7 +185,7 @@ async def delete_office(
 
 
 @router.get("/{org_id}/relationship-status", response_model=OrganizationRelationshipStatusResponse | None)
-async def get_relationship_status(
+def get_relationship_status(
     org_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -204,7 +204,7 @@ async def get_relationship_status(
 
 
 @router.put("/{org_id}/relationship-status", response_model=OrganizationRelationshipStatusResponse)
-async def update_relationship_status(
+def update_relationship_status(
     org_id: UUID,
     status_data: OrganizationRelationshipStatusUpdate,
     db: Session = Depends(get_db),
@@ -254,7 +254,7 @@ async def update_relationship_status(
 
 
 @router.get("/{org_id}/interactions")
-async def get_org_interactions(
+def get_org_interactions(
     org_id: UUID,
     limit: int = Query(default=20, le=100),
     offset: int = Query(default=0, ge=0),
@@ -356,7 +356,7 @@ async def get_org_interactions(
 
 
 @router.post("/{org_id}/logo")
-async def upload_logo(
+def upload_logo(
     org_id: UUID,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
@@ -373,7 +373,7 @@ async def upload_logo(
         )
 
     # Read file and check size
-    contents = await file.read()
+    contents = file.file.read()
     if len(contents) > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=400,
@@ -401,7 +401,7 @@ async def upload_logo(
 
 
 @router.delete("/{org_id}/logo")
-async def delete_logo(
+def delete_logo(
     org_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -422,7 +422,7 @@ async def delete_logo(
 
 
 @router.get("/lookup/relationship-types")
-async def get_relationship_types():
+def get_relationship_types():
     """Get all organization relationship types."""
     results = []
     for rt in OrgRelationshipType:
@@ -436,7 +436,7 @@ async def get_relationship_types():
 
 
 @router.get("/lookup/investment-stages")
-async def get_investment_stages():
+def get_investment_stages():
     """Get all investment stages."""
     stages = [
         {"value": "pre_seed", "display": "Pre-Seed"},
@@ -454,7 +454,7 @@ async def get_investment_stages():
 
 
 @router.get("/lookup/investment-sectors")
-async def get_investment_sectors():
+def get_investment_sectors():
     """Get all investment sectors."""
     sectors = [
         {"value": "saas", "display": "SaaS"},
@@ -478,7 +478,7 @@ async def get_investment_sectors():
 
 
 @router.get("/lookup/warmth-levels")
-async def get_warmth_levels():
+def get_warmth_levels():
     """Get all relationship warmth levels."""
     levels = [
         {"value": "hot", "display": "Hot", "emoji": "🔥", "description": "Active deal/discussion"},
@@ -98,7 +98,7 @@ def get_people_by_type(db: Session, org_id: UUID) -> dict:
 # =============================================================================
 
 @router.get("/{org_id}/sections/description/edit", response_class=HTMLResponse)
-async def get_description_edit(
+def get_description_edit(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -112,7 +112,7 @@ async def get_description_edit(
 
 
 @router.get("/{org_id}/sections/description/view", response_class=HTMLResponse)
-async def get_description_view(
+def get_description_view(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -126,7 +126,7 @@ async def get_description_view(
 
 
 @router.put("/{org_id}/sections/description", response_class=HTMLResponse)
-async def update_description(
+def update_description(
     request: Request,
     org_id: UUID,
     description: str = Form(None),
@@ -148,7 +148,7 @@ async def update_description(
 # =============================================================================
 
 @router.get("/{org_id}/sections/notes/edit", response_class=HTMLResponse)
-async def get_notes_edit(
+def get_notes_edit(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -162,7 +162,7 @@ async def get_notes_edit(
 
 
 @router.get("/{org_id}/sections/notes/view", response_class=HTMLResponse)
-async def get_notes_view(
+def get_notes_view(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -176,7 +176,7 @@ async def get_notes_view(
 
 
 @router.put("/{org_id}/sections/notes", response_class=HTMLResponse)
-async def update_notes(
+def update_notes(
     request: Request,
     org_id: UUID,
     notes: str = Form(None),
@@ -198,7 +198,7 @@ async def update_notes(
 # =============================================================================
 
 @router.get("/{org_id}/sections/links/edit", response_class=HTMLResponse)
-async def get_links_edit(
+def get_links_edit(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -212,7 +212,7 @@ async def get_links_edit(
 
 
 @router.get("/{org_id}/sections/links/view", response_class=HTMLResponse)
-async def get_links_view(
+def get_links_view(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -226,7 +226,7 @@ async def get_links_view(
 
 
 @router.put("/{org_id}/sections/links", response_class=HTMLResponse)
-async def update_links(
+def update_links(
     request: Request,
     org_id: UUID,
     website: str = Form(None),
@@ -262,7 +262,7 @@ async def update_links(
 # =============================================================================
 
 @router.get("/{org_id}/sections/people/edit", response_class=HTMLResponse)
-async def get_people_edit(
+def get_people_edit(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -277,7 +277,7 @@ async def get_people_edit(
 
 
 @router.get("/{org_id}/sections/people/view", response_class=HTMLResponse)
-async def get_people_view(
+def get_people_view(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -296,7 +296,7 @@ async def get_people_view(
 # =============================================================================
 
 @router.get("/{org_id}/sections/related-orgs/edit", response_class=HTMLResponse)
-async def get_related_orgs_edit(
+def get_related_orgs_edit(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -319,7 +319,7 @@ async def get_related_orgs_edit(
 
 
 @router.get("/{org_id}/sections/related-orgs/view", response_class=HTMLResponse)
-async def get_related_orgs_view(
+def get_related_orgs_view(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -343,7 +343,7 @@ async def get_related_orgs_view(
 # =============================================================================
 
 @router.get("/{org_id}/sections/investment-profile/edit", response_class=HTMLResponse)
-async def get_investment_profile_edit(
+def get_investment_profile_edit(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -357,7 +357,7 @@ async def get_investment_profile_edit(
 
 
 @router.get("/{org_id}/sections/investment-profile/view", response_class=HTMLResponse)
-async def get_investment_profile_view(
+def get_investment_profile_view(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -371,7 +371,7 @@ async def get_investment_profile_view(
 
 
 @router.put("/{org_id}/sections/investment-profile", response_class=HTMLResponse)
-async def update_investment_profile(
+def update_investment_profile(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -411,7 +411,7 @@ async def update_investment_profile(
 # =============================================================================
 
 @router.get("/{org_id}/sections/relationship-status/edit", response_class=HTMLResponse)
-async def get_relationship_status_edit(
+def get_relationship_status_edit(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -440,7 +440,7 @@ async def get_relationship_status_edit(
 
 
 @router.get("/{org_id}/sections/relationship-status/view", response_class=HTMLResponse)
-async def get_relationship_status_view(
+def get_relationship_status_view(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -489,7 +489,7 @@ async def get_relationship_status_view(
 
 
 @router.put("/{org_id}/sections/relationship-status", response_class=HTMLResponse)
-async def update_relationship_status(
+def update_relationship_status(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -569,7 +569,7 @@ async def update_relationship_status(
 # =============================================================================
 
 @router.get("/{org_id}/sections/offices/edit", response_class=HTMLResponse)
-async def get_offices_edit(
+def get_offices_edit(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -591,7 +591,7 @@ async def get_offices_edit(
 
 
 @router.get("/{org_id}/sections/offices/view", response_class=HTMLResponse)
-async def get_offices_view(
+def get_offices_view(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -613,7 +613,7 @@ async def get_offices_view(
 
 
 @router.post("/{org_id}/offices", response_class=HTMLResponse)
-async def add_office(
+def add_office(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -681,7 +681,7 @@ async def add_office(
 
 
 @router.delete("/{org_id}/offices/{office_id}", response_class=HTMLResponse)
-async def delete_office(
+def delete_office(
     org_id: UUID,
     office_id: UUID,
     db: Session = Depends(get_db),
@@ -712,7 +712,7 @@ async def delete_office(
 # =============================================================================
 
 @router.get("/{org_id}/sections/classification/edit", response_class=HTMLResponse)
-async def get_classification_edit(
+def get_classification_edit(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -772,7 +772,7 @@ async def get_classification_edit(
 
 
 @router.get("/{org_id}/sections/classification/view", response_class=HTMLResponse)
-async def get_classification_view(
+def get_classification_view(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -797,7 +797,7 @@ async def get_classification_view(
 
 
 @router.put("/{org_id}/sections/classification", response_class=HTMLResponse)
-async def update_classification(
+def update_classification(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
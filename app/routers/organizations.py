@@ -14,13 +14,22 @@ from pathlib import Path
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 from sqlalchemy import func, or_, desc, asc
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.database import get_db
 from app.models import Organization, OrgType, Tag, PersonOrganization
 from app.models import OrganizationCategory, OrganizationType
 from app.models.tag import OrganizationTag
 from app.models.org_relationship import OrganizationRelationship, OrgRelationshipType
+from app.utils.pagination import (
+    InvalidCursorError,
+    approximate_count,
+    count_rows,
+    cursor_url,
+    paginate_by_cursor,
+    paginate_by_ids,
+)
+from app.utils.query_profiler import query_budget
 
 
 class BatchDeleteRequest(BaseModel):
@@ -48,7 +57,8 @@ def validate_type_belongs_to_category(db: Session, type_id: int, category_id: in
 
 
 @router.get("", response_class=HTMLResponse)
-async def list_organizations(
+@query_budget(12)
+def list_organizations(
     request: Request,
     db: Session = Depends(get_db),
     page: int = Query(1, ge=1),
@@ -139,13 +149,13 @@ async def list_organizations(
         sort_order=sort_order,
     )
 
-    # Get total count for pagination
-    total_count = query_result.count()
-    total_pages = (total_count + per_page - 1) // per_page
-
-    # Apply pagination
-    offset = (page - 1) * per_page
-    organizations = query_result.offset(offset).limit(per_page).all()
+    # Page ids first, then batch-load only what the table renders
+    result = paginate_by_ids(
+        db, query_result, Organization, page, per_page, _organization_list_load_options()
+    )
+    organizations = result.items
+    total_count = result.total_count
+    total_pages = result.total_pages
 
     # Build list of selected tag ID strings for template
     selected_tag_ids = [str(tid) for tid in tag_uuids]
@@ -178,7 +188,8 @@ async def list_organizations(
 
 
 @router.get("/table", response_class=HTMLResponse)
-async def list_organizations_table(
+@query_budget(10)
+def list_organizations_table(
     request: Request,
     db: Session = Depends(get_db),
     page: int = Query(1, ge=1),
@@ -193,11 +204,17 @@ async def list_organizations_table(
     letter: Optional[str] = Query(None, description="Filter by first letter of name"),
     sort_by: str = Query("name", description="Sort column"),
     sort_order: str = Query("asc", description="Sort order: asc or desc"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor; pass empty to start infinite scroll"),
+    count: str = Query("exact", description="Footer count: 'exact' or 'approx'"),
 ):
     """
     HTMX partial - returns just the table body for dynamic updates.
     Supports both legacy org_type filter and new category_id/type_id filters.
     Multi-tag filter with AND/OR logic.
+
+    Passing `cursor` switches to keyset pagination: an empty cursor renders
+    the table with an infinite-scroll sentinel, and a cursor from a previous
+    response renders only the next rows.
     """
     # Convert category_id and type_id from string to int (handle empty strings)
     category_id_int = int(category_id) if category_id and category_id.strip() else None
@@ -233,13 +250,52 @@ async def list_organizations_table(
         sort_order=sort_order,
     )
 
-    # Get total count for pagination
-    total_count = query_result.count()
-    total_pages = (total_count + per_page - 1) // per_page
+    next_url = None
+    cursor_mode = cursor is not None
+    if cursor_mode:
+        try:
+            cursor_page = paginate_by_cursor(
+                db,
+                query_result,
+                Organization,
+                _get_sort_column(sort_by),
+                sort_order.lower() == "desc",
+                cursor,
+                per_page,
+                _organization_list_load_options(),
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        organizations = cursor_page.items
+        if cursor_page.has_more:
+            next_url = cursor_url(request, cursor_page.next_cursor)
+
+        # Follow-up scroll requests only need the next rows
+        if cursor:
+            return templates.TemplateResponse(
+                "organizations/_rows.html",
+                {"request": request, "organizations": organizations, "next_url": next_url},
+            )
 
-    # Apply pagination
-    offset = (page - 1) * per_page
-    organizations = query_result.offset(offset).limit(per_page).all()
+        if count == "approx":
+            total_count = approximate_count(db, query_result, Organization)
+        else:
+            total_count = count_rows(query_result, Organization.id)
+        total_pages = 1
+    else:
+        # Page ids first, then batch-load only what the table renders
+        result = paginate_by_ids(
+            db,
+            query_result,
+            Organization,
+            page,
+            per_page,
+            _organization_list_load_options(),
+            approximate=count == "approx",
+        )
+        organizations = result.items
+        total_count = result.total_count
+        total_pages = result.total_pages
 
     return templates.TemplateResponse(
         "organizations/_table.html",
@@ -250,6 +306,9 @@ async def list_organizations_table(
             "per_page": per_page,
             "total_count": total_count,
             "total_pages": total_pages,
+            "cursor_mode": cursor_mode,
+            "count_is_approx": count == "approx",
+            "next_url": next_url,
             "q": q or "",
             "org_type": org_type or "",
             "category_id": category_id or "",
@@ -268,7 +327,7 @@ async def list_organizations_table(
 
 
 @router.post("/batch/delete", response_class=JSONResponse)
-async def batch_delete_organizations(
+def batch_delete_organizations(
     request: BatchDeleteRequest,
     db: Session = Depends(get_db),
 ):
@@ -292,7 +351,7 @@ async def batch_delete_organizations(
 
 
 @router.get("/merge", response_class=HTMLResponse)
-async def batch_merge_page(
+def batch_merge_page(
     request: Request,
     ids: str = Query(..., description="Comma-separated list of organization IDs to merge"),
     db: Session = Depends(get_db),
@@ -336,7 +395,7 @@ async def batch_merge_page(
 
 
 @router.post("/merge/execute", response_class=JSONResponse)
-async def execute_batch_merge(
+def execute_batch_merge(
     request: Request,
     keep_id: str = Form(...),
     merge_ids: List[str] = Form(...),
@@ -489,12 +548,11 @@ def _build_organization_query(
 
     Supports both old org_type enum filter and new category_id/type_id lookup filters.
     Multi-tag filter with AND/OR logic.
+
+    No eager loads are attached: callers page ids with paginate_by_ids()
+    and load collections for the visible rows only.
     """
-    # Start with base query, eager load tags and affiliated persons
-    query = db.query(Organization).options(
-        joinedload(Organization.tags),
-        joinedload(Organization.affiliated_persons).joinedload(PersonOrganization.person),
-    )
+    query = db.query(Organization)
 
     # Apply text search filter
     if q:
@@ -540,16 +598,24 @@ def _build_organization_query(
         letter_upper = letter.upper()
         query = query.filter(func.upper(func.left(Organization.name, 1)) == letter_upper)
 
-    # Apply sorting
+    # Apply sorting (Organization.id is the final tiebreaker so pages are stable)
     sort_column = _get_sort_column(sort_by)
     if sort_order.lower() == "desc":
-        query = query.order_by(desc(sort_column))
+        query = query.order_by(desc(sort_column), desc(Organization.id))
     else:
-        query = query.order_by(asc(sort_column))
+        query = query.order_by(asc(sort_column), asc(Organization.id))
 
     return query
 
 
+def _organization_list_load_options():
+    """Loader options for the collections organizations/_row.html renders."""
+    return [
+        selectinload(Organization.tags),
+        selectinload(Organization.affiliated_persons).joinedload(PersonOrganization.person),
+    ]
+
+
 def _get_sort_column(sort_by: str):
     """Map sort_by parameter to SQLAlchemy column."""
     column_map = {
@@ -564,7 +630,7 @@ def _get_sort_column(sort_by: str):
 
 
 @router.get("/new", response_class=HTMLResponse)
-async def new_organization_form(request: Request, db: Session = Depends(get_db)):
+def new_organization_form(request: Request, db: Session = Depends(get_db)):
     """
     Display the new organization form.
     """
@@ -597,7 +663,7 @@ async def new_organization_form(request: Request, db: Session = Depends(get_db))
 
 
 @router.post("", response_class=HTMLResponse)
-async def create_organization(
+def create_organization(
     request: Request,
     db: Session = Depends(get_db),
     name: str = Form(...),
@@ -649,7 +715,7 @@ async def create_organization(
 
 
 @router.get("/{org_id}/edit", response_class=HTMLResponse)
-async def edit_organization_form(
+def edit_organization_form(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -727,7 +793,7 @@ async def edit_organization_form(
 
 
 @router.put("/{org_id}", response_class=HTMLResponse)
-async def update_organization(
+def update_organization(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -782,7 +848,7 @@ async def update_organization(
 
 
 @router.delete("/{org_id}", response_class=HTMLResponse)
-async def delete_organization(
+def delete_organization(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -803,7 +869,7 @@ async def delete_organization(
 
 
 @router.get("/{org_id}", response_class=HTMLResponse)
-async def get_organization_detail(
+def get_organization_detail(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -923,7 +989,7 @@ async def get_organization_detail(
 
 
 @router.post("/{org_id}/affiliations", response_class=HTMLResponse)
-async def add_person_affiliation(
+def add_person_affiliation(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -1019,7 +1085,7 @@ async def add_person_affiliation(
 
 
 @router.put("/{org_id}/affiliations/{affiliation_id}", response_class=HTMLResponse)
-async def update_person_affiliation(
+def update_person_affiliation(
     request: Request,
     org_id: UUID,
     affiliation_id: UUID,
@@ -1084,7 +1150,7 @@ async def update_person_affiliation(
 
 
 @router.delete("/{org_id}/affiliations/{affiliation_id}", response_class=HTMLResponse)
-async def delete_person_affiliation(
+def delete_person_affiliation(
     request: Request,
     org_id: UUID,
     affiliation_id: UUID,
@@ -1141,7 +1207,7 @@ async def delete_person_affiliation(
 
 
 @router.post("/{org_id}/tags/{tag_id}", response_class=HTMLResponse)
-async def add_tag_to_organization(
+def add_tag_to_organization(
     request: Request,
     org_id: UUID,
     tag_id: UUID,
@@ -1195,7 +1261,7 @@ async def add_tag_to_organization(
 
 
 @router.delete("/{org_id}/tags/{tag_id}", response_class=HTMLResponse)
-async def remove_tag_from_organization(
+def remove_tag_from_organization(
     request: Request,
     org_id: UUID,
     tag_id: UUID,
@@ -1254,7 +1320,7 @@ async def remove_tag_from_organization(
 
 
 @router.post("/{org_id}/logo", response_class=HTMLResponse)
-async def upload_organization_logo(
+def upload_organization_logo(
     request: Request,
     org_id: UUID,
     file: UploadFile = File(...),
@@ -1274,7 +1340,7 @@ async def upload_organization_logo(
         )
 
     # Read file and validate size
-    contents = await file.read()
+    contents = file.file.read()
     if len(contents) > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=400,
@@ -1314,7 +1380,7 @@ async def upload_organization_logo(
 
 
 @router.delete("/{org_id}/logo", response_class=HTMLResponse)
-async def delete_organization_logo(
+def delete_organization_logo(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -1405,7 +1471,7 @@ def _get_org_relationships_context(db: Session, organization: Organization):
 
 
 @router.post("/{org_id}/org-relationships", response_class=HTMLResponse)
-async def add_org_relationship(
+def add_org_relationship(
     request: Request,
     org_id: UUID,
     db: Session = Depends(get_db),
@@ -1470,7 +1536,7 @@ async def add_org_relationship(
 
 
 @router.put("/{org_id}/org-relationships/{rel_id}", response_class=HTMLResponse)
-async def update_org_relationship(
+def update_org_relationship(
     request: Request,
     org_id: UUID,
     rel_id: UUID,
@@ -1518,7 +1584,7 @@ async def update_org_relationship(
 
 
 @router.delete("/{org_id}/org-relationships/{rel_id}", response_class=HTMLResponse)
-async def delete_org_relationship(
+def delete_org_relationship(
     request: Request,
     org_id: UUID,
     rel_id: UUID,
@@ -25,7 +25,7 @@ templates = Jinja2Templates(directory="app/templates")
 
 
 @router.get("", response_class=HTMLResponse)
-async def list_pending_contacts(
+def list_pending_contacts(
     request: Request,
     status: str | None = None,
     db: Session = Depends(get_db),
@@ -64,7 +64,7 @@ async def list_pending_contacts(
 
 
 @router.get("/api")
-async def api_list_pending_contacts(
+def api_list_pending_contacts(
     status: str | None = None,
     db: Session = Depends(get_db),
 ):
@@ -108,7 +108,7 @@ async def api_list_pending_contacts(
 
 
 @router.get("/widget", response_class=HTMLResponse)
-async def pending_contacts_widget(
+def pending_contacts_widget(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -145,7 +145,7 @@ async def pending_contacts_widget(
 
 
 @router.get("/{contact_id}", response_class=HTMLResponse)
-async def get_pending_contact_detail(
+def get_pending_contact_detail(
     request: Request,
     contact_id: UUID,
     db: Session = Depends(get_db),
@@ -181,7 +181,7 @@ async def get_pending_contact_detail(
 
 
 @router.post("/{contact_id}/create")
-async def create_person_from_pending(
+def create_person_from_pending(
     contact_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -243,7 +243,7 @@ async def create_person_from_pending(
 
 
 @router.post("/{contact_id}/ignore")
-async def ignore_pending_contact(
+def ignore_pending_contact(
     contact_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -272,7 +272,7 @@ async def ignore_pending_contact(
 
 
 @router.post("/{contact_id}/merge/{person_id}")
-async def merge_pending_with_person(
+def merge_pending_with_person(
     contact_id: UUID,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -327,7 +327,7 @@ async def merge_pending_with_person(
 
 
 @router.delete("/{contact_id}")
-async def delete_pending_contact(
+def delete_pending_contact(
     contact_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -114,7 +114,7 @@ def delete_profile_picture_file(file_path: str | None) -> None:
 
 
 @router.post("/people/{person_id}/profile-picture")
-async def upload_profile_picture(
+def upload_profile_picture(
     request: Request,
     person_id: UUID,
     file: UploadFile = File(...),
@@ -137,7 +137,7 @@ async def upload_profile_picture(
         )
 
     # Read file and validate size
-    contents = await file.read()
+    contents = file.file.read()
     if len(contents) > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=400,
@@ -178,7 +178,7 @@ async def upload_profile_picture(
 
 
 @router.delete("/people/{person_id}/profile-picture")
-async def delete_profile_picture(
+def delete_profile_picture(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -213,7 +213,7 @@ async def delete_profile_picture(
 
 
 @router.get("/people/{person_id}/websites", response_model=List[PersonWebsiteResponse])
-async def list_person_websites(
+def list_person_websites(
     person_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -229,7 +229,7 @@ async def list_person_websites(
 
 
 @router.post("/people/{person_id}/websites", response_model=PersonWebsiteResponse, status_code=201)
-async def create_person_website(
+def create_person_website(
     person_id: UUID,
     data: PersonWebsiteCreate,
     db: Session = Depends(get_db),
@@ -254,7 +254,7 @@ async def create_person_website(
 
 
 @router.put("/people/{person_id}/websites/{website_id}", response_model=PersonWebsiteResponse)
-async def update_person_website(
+def update_person_website(
     person_id: UUID,
     website_id: UUID,
     data: PersonWebsiteUpdate,
@@ -280,7 +280,7 @@ async def update_person_website(
 
 
 @router.delete("/people/{person_id}/websites/{website_id}", status_code=204)
-async def delete_person_website(
+def delete_person_website(
     person_id: UUID,
     website_id: UUID,
     db: Session = Depends(get_db),
@@ -305,7 +305,7 @@ async def delete_person_website(
 
 
 @router.get("/people/{person_id}/addresses", response_model=List[PersonAddressResponse])
-async def list_person_addresses(
+def list_person_addresses(
     person_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -321,7 +321,7 @@ async def list_person_addresses(
 
 
 @router.post("/people/{person_id}/addresses", response_model=PersonAddressResponse, status_code=201)
-async def create_person_address(
+def create_person_address(
     person_id: UUID,
     data: PersonAddressCreate,
     db: Session = Depends(get_db),
@@ -362,7 +362,7 @@ async def create_person_address(
 
 
 @router.put("/people/{person_id}/addresses/{address_id}", response_model=PersonAddressResponse)
-async def update_person_address(
+def update_person_address(
     person_id: UUID,
     address_id: UUID,
     data: PersonAddressUpdate,
@@ -412,7 +412,7 @@ async def update_person_address(
 
 
 @router.delete("/people/{person_id}/addresses/{address_id}", status_code=204)
-async def delete_person_address(
+def delete_person_address(
     person_id: UUID,
     address_id: UUID,
     db: Session = Depends(get_db),
@@ -437,7 +437,7 @@ async def delete_person_address(
 
 
 @router.get("/people/{person_id}/education", response_model=List[PersonEducationResponse])
-async def list_person_education(
+def list_person_education(
     person_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -453,7 +453,7 @@ async def list_person_education(
 
 
 @router.post("/people/{person_id}/education", response_model=PersonEducationResponse, status_code=201)
-async def create_person_education(
+def create_person_education(
     person_id: UUID,
     data: PersonEducationCreate,
     db: Session = Depends(get_db),
@@ -480,7 +480,7 @@ async def create_person_education(
 
 
 @router.put("/people/{person_id}/education/{education_id}", response_model=PersonEducationResponse)
-async def update_person_education(
+def update_person_education(
     person_id: UUID,
     education_id: UUID,
     data: PersonEducationUpdate,
@@ -510,7 +510,7 @@ async def update_person_education(
 
 
 @router.delete("/people/{person_id}/education/{education_id}", status_code=204)
-async def delete_person_education(
+def delete_person_education(
     person_id: UUID,
     education_id: UUID,
     db: Session = Depends(get_db),
@@ -535,7 +535,7 @@ async def delete_person_education(
 
 
 @router.get("/people/{person_id}/employment", response_model=List[PersonEmploymentResponse])
-async def list_person_employment(
+def list_person_employment(
     person_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -555,7 +555,7 @@ async def list_person_employment(
 
 
 @router.post("/people/{person_id}/employment", response_model=PersonEmploymentResponse, status_code=201)
-async def create_person_employment(
+def create_person_employment(
     person_id: UUID,
     data: PersonEmploymentCreate,
     db: Session = Depends(get_db),
@@ -593,7 +593,7 @@ async def create_person_employment(
 
 
 @router.put("/people/{person_id}/employment/{employment_id}", response_model=PersonEmploymentResponse)
-async def update_person_employment(
+def update_person_employment(
     person_id: UUID,
     employment_id: UUID,
     data: PersonEmploymentUpdate,
@@ -635,7 +635,7 @@ async def update_person_employment(
 
 
 @router.delete("/people/{person_id}/employment/{employment_id}", status_code=204)
-async def delete_person_employment(
+def delete_person_employment(
     person_id: UUID,
     employment_id: UUID,
     db: Session = Depends(get_db),
@@ -660,7 +660,7 @@ async def delete_person_employment(
 
 
 @router.get("/people/{person_id}/relationships", response_model=List[PersonRelationshipResponse])
-async def list_person_relationships(
+def list_person_relationships(
     person_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -681,7 +681,7 @@ async def list_person_relationships(
 
 
 @router.post("/people/{person_id}/relationships", response_model=PersonRelationshipResponse, status_code=201)
-async def create_person_relationship(
+def create_person_relationship(
     person_id: UUID,
     data: PersonRelationshipCreate,
     db: Session = Depends(get_db),
@@ -777,7 +777,7 @@ async def create_person_relationship(
 
 
 @router.put("/people/{person_id}/relationships/{relationship_id}", response_model=PersonRelationshipResponse)
-async def update_person_relationship(
+def update_person_relationship(
     person_id: UUID,
     relationship_id: UUID,
     data: PersonRelationshipUpdate,
@@ -816,7 +816,7 @@ async def update_person_relationship(
 
 
 @router.delete("/people/{person_id}/relationships/{relationship_id}", status_code=204)
-async def delete_person_relationship(
+def delete_person_relationship(
     person_id: UUID,
     relationship_id: UUID,
     delete_inverse: bool = Query(True, description="Also delete inverse relationship"),
@@ -863,7 +863,7 @@ async def delete_person_relationship(
 
 
 @router.get("/affiliation-types", response_model=List[AffiliationTypeResponse])
-async def list_affiliation_types(
+def list_affiliation_types(
     db: Session = Depends(get_db),
 ):
     """Get all affiliation types (system + custom)."""
@@ -876,7 +876,7 @@ async def list_affiliation_types(
 
 
 @router.post("/affiliation-types", response_model=AffiliationTypeResponse, status_code=201)
-async def create_affiliation_type(
+def create_affiliation_type(
     data: AffiliationTypeCreate,
     db: Session = Depends(get_db),
 ):
@@ -897,7 +897,7 @@ async def create_affiliation_type(
 
 
 @router.get("/relationship-types", response_model=List[RelationshipTypeResponse])
-async def list_relationship_types(
+def list_relationship_types(
     db: Session = Depends(get_db),
 ):
     """Get all relationship types."""
@@ -915,7 +915,7 @@ async def list_relationship_types(
 
 
 @router.get("/people/{person_id}/organizations", response_model=List[PersonOrganizationResponse])
-async def list_person_organizations(
+def list_person_organizations(
     person_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -932,7 +932,7 @@ async def list_person_organizations(
 
 
 @router.post("/people/{person_id}/organizations", response_model=PersonOrganizationResponse, status_code=201)
-async def create_person_organization(
+def create_person_organization(
     person_id: UUID,
     data: PersonOrganizationCreate,
     db: Session = Depends(get_db),
@@ -980,7 +980,7 @@ async def create_person_organization(
 
 
 @router.put("/people/{person_id}/organizations/{link_id}", response_model=PersonOrganizationResponse)
-async def update_person_organization(
+def update_person_organization(
     person_id: UUID,
     link_id: UUID,
     data: PersonOrganizationUpdate,
@@ -1017,7 +1017,7 @@ async def update_person_organization(
 
 
 @router.delete("/people/{person_id}/organizations/{link_id}", status_code=204)
-async def delete_person_organization(
+def delete_person_organization(
     person_id: UUID,
     link_id: UUID,
     db: Session = Depends(get_db),
@@ -1037,13 +1037,13 @@ async def delete_person_organization(
 
 
 @router.get("/org-relationship-types")
-async def list_org_relationship_types():
+def list_org_relationship_types():
     """Get all organization relationship types."""
     return [{"value": rt.value, "label": rt.value.replace("_", " ").title()} for rt in OrgRelationshipType]
 
 
 @router.get("/organizations/search")
-async def search_organizations(
+def search_organizations(
     q: str = Query(..., min_length=1, description="Search query"),
     limit: int = Query(10, ge=1, le=50),
     db: Session = Depends(get_db),
@@ -1062,7 +1062,7 @@ async def search_organizations(
 
 
 @router.post("/organizations/quick-create")
-async def quick_create_organization(
+def quick_create_organization(
     name: str = Form(...),
     org_type: str = Form("company"),
     db: Session = Depends(get_db),
@@ -1105,7 +1105,7 @@ async def quick_create_organization(
 
 
 @router.post("/persons/quick-create")
-async def quick_create_person(
+def quick_create_person(
     name: str = Form(...),
     db: Session = Depends(get_db),
 ):
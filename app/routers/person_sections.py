@@ -29,6 +29,7 @@ from app.models.affiliation_type import AffiliationType
 from app.models.relationship_type import RelationshipType
 from app.models.interaction import Interaction, InteractionMedium, InteractionSource
 from app.models.google_account import GoogleAccount
+from app.services.contact_stats import refresh_contact_stats
 
 
 router = APIRouter(prefix="/api/people", tags=["person-sections"])
@@ -62,7 +63,7 @@ def get_person_or_404(db: Session, person_id: UUID) -> Person:
 # =============================================================================
 
 @router.get("/{person_id}/sections/notes/edit", response_class=HTMLResponse)
-async def get_notes_edit(
+def get_notes_edit(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -76,7 +77,7 @@ async def get_notes_edit(
 
 
 @router.get("/{person_id}/sections/notes/view", response_class=HTMLResponse)
-async def get_notes_view(
+def get_notes_view(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -90,7 +91,7 @@ async def get_notes_view(
 
 
 @router.put("/{person_id}/sections/notes", response_class=HTMLResponse)
-async def update_notes(
+def update_notes(
     request: Request,
     person_id: UUID,
     notes: str = Form(None),
@@ -112,7 +113,7 @@ async def update_notes(
 # =============================================================================
 
 @router.get("/{person_id}/sections/header/edit", response_class=HTMLResponse)
-async def get_header_edit(
+def get_header_edit(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -126,7 +127,7 @@ async def get_header_edit(
 
 
 @router.get("/{person_id}/sections/header/view", response_class=HTMLResponse)
-async def get_header_view(
+def get_header_view(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -140,7 +141,7 @@ async def get_header_view(
 
 
 @router.post("/{person_id}/sections/header/form", response_class=HTMLResponse)
-async def update_header_form(
+def update_header_form(
     request: Request,
     person_id: UUID,
     first_name: str = Form(...),
@@ -188,7 +189,7 @@ MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 
 
 @router.post("/{person_id}/profile-picture", response_class=HTMLResponse)
-async def upload_profile_picture(
+def upload_profile_picture(
     request: Request,
     person_id: UUID,
     file: UploadFile = File(...),
@@ -207,7 +208,7 @@ async def upload_profile_picture(
         )
 
     # Read file and check size
-    contents = await file.read()
+    contents = file.file.read()
     if len(contents) > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=400,
@@ -246,7 +247,7 @@ async def upload_profile_picture(
 
 
 @router.delete("/{person_id}/profile-picture", response_class=HTMLResponse)
-async def delete_profile_picture(
+def delete_profile_picture(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -282,7 +283,7 @@ from fastapi.responses import JSONResponse
 
 
 @router.post("/upload/temp-profile-picture", response_class=JSONResponse)
-async def upload_temp_profile_picture(
+def upload_temp_profile_picture(
     file: UploadFile = File(...),
 ):
     """
@@ -299,7 +300,7 @@ async def upload_temp_profile_picture(
         )
 
     # Read file and check size
-    contents = await file.read()
+    contents = file.file.read()
     if len(contents) > MAX_FILE_SIZE:
         raise HTTPException(
             status_code=400,
@@ -327,7 +328,7 @@ async def upload_temp_profile_picture(
 # =============================================================================
 
 @router.get("/{person_id}/sections/social/edit", response_class=HTMLResponse)
-async def get_social_edit(
+def get_social_edit(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -341,7 +342,7 @@ async def get_social_edit(
 
 
 @router.get("/{person_id}/sections/social/view", response_class=HTMLResponse)
-async def get_social_view(
+def get_social_view(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -355,7 +356,7 @@ async def get_social_view(
 
 
 @router.put("/{person_id}/sections/social", response_class=HTMLResponse)
-async def update_social(
+def update_social(
     request: Request,
     person_id: UUID,
     linkedin: str = Form(None),
@@ -383,7 +384,7 @@ async def update_social(
 # =============================================================================
 
 @router.get("/{person_id}/sections/contact/edit", response_class=HTMLResponse)
-async def get_contact_edit(
+def get_contact_edit(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -397,7 +398,7 @@ async def get_contact_edit(
 
 
 @router.get("/{person_id}/sections/contact/view", response_class=HTMLResponse)
-async def get_contact_view(
+def get_contact_view(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -411,7 +412,7 @@ async def get_contact_view(
 
 
 @router.put("/{person_id}/sections/contact", response_class=HTMLResponse)
-async def update_contact(
+def update_contact(
     request: Request,
     person_id: UUID,
     birthday: str = Form(None),
@@ -445,7 +446,7 @@ async def update_contact(
 # =============================================================================
 
 @router.post("/{person_id}/emails", response_class=HTMLResponse)
-async def add_email(
+def add_email(
     request: Request,
     person_id: UUID,
     email: str = Form(...),
@@ -479,7 +480,7 @@ async def add_email(
 
 
 @router.delete("/{person_id}/emails/{email_id}", response_class=HTMLResponse)
-async def delete_email(
+def delete_email(
     request: Request,
     person_id: UUID,
     email_id: UUID,
@@ -517,7 +518,7 @@ async def delete_email(
 # =============================================================================
 
 @router.post("/{person_id}/phones", response_class=HTMLResponse)
-async def add_phone(
+def add_phone(
     request: Request,
     person_id: UUID,
     phone: str = Form(...),
@@ -551,7 +552,7 @@ async def add_phone(
 
 
 @router.delete("/{person_id}/phones/{phone_id}", response_class=HTMLResponse)
-async def delete_phone(
+def delete_phone(
     request: Request,
     person_id: UUID,
     phone_id: UUID,
@@ -589,7 +590,7 @@ async def delete_phone(
 # =============================================================================
 
 @router.post("/{person_id}/websites/form", response_class=HTMLResponse)
-async def add_website_form(
+def add_website_form(
     request: Request,
     person_id: UUID,
     url: str = Form(...),
@@ -624,7 +625,7 @@ async def add_website_form(
 
 
 @router.delete("/{person_id}/websites/{website_id}/inline", response_class=HTMLResponse)
-async def delete_website_inline(
+def delete_website_inline(
     request: Request,
     person_id: UUID,
     website_id: UUID,
@@ -654,7 +655,7 @@ async def delete_website_inline(
 # =============================================================================
 
 @router.post("/{person_id}/addresses/form", response_class=HTMLResponse)
-async def add_address_form(
+def add_address_form(
     request: Request,
     person_id: UUID,
     address_type: str = Form(...),
@@ -700,7 +701,7 @@ async def add_address_form(
 
 
 @router.delete("/{person_id}/addresses/{address_id}/inline", response_class=HTMLResponse)
-async def delete_address_inline(
+def delete_address_inline(
     request: Request,
     person_id: UUID,
     address_id: UUID,
@@ -730,7 +731,7 @@ async def delete_address_inline(
 # =============================================================================
 
 @router.get("/{person_id}/sections/investment/edit", response_class=HTMLResponse)
-async def get_investment_edit(
+def get_investment_edit(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -744,7 +745,7 @@ async def get_investment_edit(
 
 
 @router.get("/{person_id}/sections/investment/view", response_class=HTMLResponse)
-async def get_investment_view(
+def get_investment_view(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -758,7 +759,7 @@ async def get_investment_view(
 
 
 @router.put("/{person_id}/sections/investment", response_class=HTMLResponse)
-async def update_investment(
+def update_investment(
     request: Request,
     person_id: UUID,
     investment_type: str = Form(None),
@@ -789,7 +790,7 @@ def get_affiliation_types(db: Session) -> list:
 
 
 @router.get("/{person_id}/sections/employment/edit", response_class=HTMLResponse)
-async def get_employment_edit(
+def get_employment_edit(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -804,7 +805,7 @@ async def get_employment_edit(
 
 
 @router.get("/{person_id}/sections/employment/view", response_class=HTMLResponse)
-async def get_employment_view(
+def get_employment_view(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -818,7 +819,7 @@ async def get_employment_view(
 
 
 @router.post("/{person_id}/employment/form", response_class=HTMLResponse)
-async def add_employment_form(
+def add_employment_form(
     request: Request,
     person_id: UUID,
     organization_name: str = Form(...),
@@ -854,7 +855,7 @@ async def add_employment_form(
 
 
 @router.delete("/{person_id}/employment/{employment_id}/inline", response_class=HTMLResponse)
-async def delete_employment_inline(
+def delete_employment_inline(
     request: Request,
     person_id: UUID,
     employment_id: UUID,
@@ -885,7 +886,7 @@ async def delete_employment_inline(
 # =============================================================================
 
 @router.get("/{person_id}/sections/education/edit", response_class=HTMLResponse)
-async def get_education_edit(
+def get_education_edit(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -899,7 +900,7 @@ async def get_education_edit(
 
 
 @router.get("/{person_id}/sections/education/view", response_class=HTMLResponse)
-async def get_education_view(
+def get_education_view(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -913,7 +914,7 @@ async def get_education_view(
 
 
 @router.post("/{person_id}/education/form", response_class=HTMLResponse)
-async def add_education_form(
+def add_education_form(
     request: Request,
     person_id: UUID,
     school_name: str = Form(...),
@@ -955,7 +956,7 @@ async def add_education_form(
 
 
 @router.delete("/{person_id}/education/{education_id}/inline", response_class=HTMLResponse)
-async def delete_education_inline(
+def delete_education_inline(
     request: Request,
     person_id: UUID,
     education_id: UUID,
@@ -998,7 +999,7 @@ def get_all_persons_for_dropdown(db: Session) -> list:
 
 
 @router.get("/{person_id}/sections/relationships/edit", response_class=HTMLResponse)
-async def get_relationships_edit(
+def get_relationships_edit(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -1019,7 +1020,7 @@ async def get_relationships_edit(
 
 
 @router.get("/{person_id}/sections/relationships/view", response_class=HTMLResponse)
-async def get_relationships_view(
+def get_relationships_view(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -1033,7 +1034,7 @@ async def get_relationships_view(
 
 
 @router.post("/{person_id}/relationships/form", response_class=HTMLResponse)
-async def add_relationship_form(
+def add_relationship_form(
     request: Request,
     person_id: UUID,
     related_person_id: str = Form(...),
@@ -1104,7 +1105,7 @@ async def add_relationship_form(
 
 
 @router.delete("/{person_id}/relationships/{relationship_id}/inline", response_class=HTMLResponse)
-async def delete_relationship_inline(
+def delete_relationship_inline(
     request: Request,
     person_id: UUID,
     relationship_id: UUID,
@@ -1155,7 +1156,7 @@ async def delete_relationship_inline(
 
 
 @router.post("/{person_id}/my-relationship", response_class=HTMLResponse)
-async def update_my_relationship(
+def update_my_relationship(
     request: Request,
     person_id: UUID,
     my_relationship_type_id: str = Form(""),
@@ -1196,7 +1197,7 @@ async def update_my_relationship(
 # =============================================================================
 
 @router.post("/{person_id}/interactions/form", response_class=HTMLResponse)
-async def add_interaction_form(
+def add_interaction_form(
     request: Request,
     person_id: UUID,
     medium: str = Form(...),
@@ -1326,6 +1327,7 @@ async def add_interaction_form(
             print(f"Failed to create calendar event: {e}")
             print(traceback.format_exc())
 
+    refresh_contact_stats(db, [person_id])
     db.commit()
 
     # Get updated interactions list (most recent first)
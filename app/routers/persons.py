@@ -3,8 +3,8 @@ Person routes for Perun's BlackBook.
 Handles person listing, searching, filtering, and HTMX partials.
 """
 
-from datetime import date
-from typing import Optional, List
+from datetime import date, datetime, time, timezone
+from typing import Any, Optional, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Request, HTTPException, Form, Body
@@ -12,7 +12,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 from sqlalchemy import func, or_, desc, asc
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.database import get_db
 from app.models import Person, Tag, PersonOrganization, Interaction, PersonEmail, GoogleAccount, PersonGoogleLink
@@ -25,6 +25,7 @@ from app.models.person_employment import PersonEmployment
 from app.models.person_relationship import PersonRelationship
 from app.models.affiliation_type import AffiliationType
 from app.models.relationship_type import RelationshipType
+from app.services.person_search import person_search_filter, person_search_rank
 from app.services.person_merge import (
     merge_persons,
     find_potential_duplicates,
@@ -32,7 +33,17 @@ from app.services.person_merge import (
     PersonNotFoundError,
     SamePersonError,
 )
+from app.utils.concurrency import get_json_body
 from app.utils.gmail_compose import build_gmail_compose_url_with_chooser
+from app.utils.pagination import (
+    InvalidCursorError,
+    approximate_count,
+    count_rows,
+    cursor_url,
+    paginate_by_cursor,
+    paginate_by_ids,
+)
+from app.utils.query_profiler import query_budget
 
 router = APIRouter(prefix="/people", tags=["people"])
 templates = Jinja2Templates(directory="app/templates")
@@ -42,7 +53,8 @@ DEFAULT_PAGE_SIZE = 20
 
 
 @router.get("", response_class=HTMLResponse)
-async def list_people(
+@query_budget(10)
+def list_people(
     request: Request,
     db: Session = Depends(get_db),
     page: int = Query(1, ge=1),
@@ -53,6 +65,8 @@ async def list_people(
     selected_tags: Optional[str] = Query(None, alias="tag_ids", description="Filter by multiple tags (comma-separated)"),
     tag_logic: str = Query("or", description="Logic for multiple tags: 'and' or 'or'"),
     letter: Optional[str] = Query(None, description="Filter by first letter of last name"),
+    contacted_after: Optional[date] = Query(None, description="Only people contacted on/after this date"),
+    not_contacted_since: Optional[date] = Query(None, description="Only people not contacted since this date"),
     sort_by: str = Query("full_name", description="Sort column"),
     sort_order: str = Query("asc", description="Sort order: asc or desc"),
 ):
@@ -94,17 +108,19 @@ async def list_people(
         tag_ids=tag_uuids,
         tag_logic=tag_logic,
         letter=letter,
+        contacted_after=contacted_after,
+        not_contacted_since=not_contacted_since,
         sort_by=sort_by,
         sort_order=sort_order,
     )
 
-    # Get total count for pagination
-    total_count = query_result.count()
-    total_pages = (total_count + per_page - 1) // per_page
-
-    # Apply pagination
-    offset = (page - 1) * per_page
-    persons = query_result.offset(offset).limit(per_page).all()
+    # Page ids first, then batch-load only what the table renders
+    result = paginate_by_ids(
+        db, query_result, Person, page, per_page, _person_list_load_options()
+    )
+    persons = result.items
+    total_count = result.total_count
+    total_pages = result.total_pages
 
     # Build list of selected tag ID strings for template
     selected_tag_ids = [str(tid) for tid in tag_uuids]
@@ -133,7 +149,8 @@ async def list_people(
 
 
 @router.get("/table", response_class=HTMLResponse)
-async def list_people_table(
+@query_budget(10)
+def list_people_table(
     request: Request,
     db: Session = Depends(get_db),
     page: int = Query(1, ge=1),
@@ -144,12 +161,20 @@ async def list_people_table(
     selected_tags: Optional[str] = Query(None, alias="tag_ids", description="Filter by multiple tags (comma-separated)"),
     tag_logic: str = Query("or", description="Logic for multiple tags: 'and' or 'or'"),
     letter: Optional[str] = Query(None, description="Filter by first letter of last name"),
+    contacted_after: Optional[date] = Query(None, description="Only people contacted on/after this date"),
+    not_contacted_since: Optional[date] = Query(None, description="Only people not contacted since this date"),
     sort_by: str = Query("full_name", description="Sort column"),
     sort_order: str = Query("asc", description="Sort order: asc or desc"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor; pass empty to start infinite scroll"),
+    count: str = Query("exact", description="Footer count: 'exact' or 'approx'"),
 ):
     """
     HTMX partial - returns just the table body for dynamic updates.
     Supports multi-tag filter with AND/OR logic.
+
+    Passing `cursor` switches to keyset pagination: an empty cursor renders
+    the table with an infinite-scroll sentinel, and a cursor from a previous
+    response renders only the next rows.
     """
     # Parse multiple tag IDs (or fall back to single tag_id for backwards compatibility)
     tag_uuids = []
@@ -167,6 +192,11 @@ async def list_people_table(
         except ValueError:
             pass
 
+    # Computed relevance has no keyset, so cursor mode sorts search hits by name
+    cursor_mode = cursor is not None
+    if cursor_mode and sort_by == "relevance":
+        sort_by = "full_name"
+
     # Build the query with filters applied
     query_result = _build_person_query(
         db=db,
@@ -175,17 +205,57 @@ async def list_people_table(
         tag_ids=tag_uuids,
         tag_logic=tag_logic,
         letter=letter,
+        contacted_after=contacted_after,
+        not_contacted_since=not_contacted_since,
         sort_by=sort_by,
         sort_order=sort_order,
     )
 
-    # Get total count for pagination
-    total_count = query_result.count()
-    total_pages = (total_count + per_page - 1) // per_page
+    next_url = None
+    if cursor_mode:
+        try:
+            cursor_page = paginate_by_cursor(
+                db,
+                query_result,
+                Person,
+                _get_sort_column(sort_by),
+                sort_order.lower() == "desc",
+                cursor,
+                per_page,
+                _person_list_load_options(),
+            )
+        except InvalidCursorError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        persons = cursor_page.items
+        if cursor_page.has_more:
+            next_url = cursor_url(request, cursor_page.next_cursor)
+
+        # Follow-up scroll requests only need the next rows
+        if cursor:
+            return templates.TemplateResponse(
+                "persons/_rows.html",
+                {"request": request, "persons": persons, "next_url": next_url},
+            )
 
-    # Apply pagination
-    offset = (page - 1) * per_page
-    persons = query_result.offset(offset).limit(per_page).all()
+        if count == "approx":
+            total_count = approximate_count(db, query_result, Person)
+        else:
+            total_count = count_rows(query_result, Person.id)
+        total_pages = 1
+    else:
+        # Page ids first, then batch-load only what the table renders
+        result = paginate_by_ids(
+            db,
+            query_result,
+            Person,
+            page,
+            per_page,
+            _person_list_load_options(),
+            approximate=count == "approx",
+        )
+        persons = result.items
+        total_count = result.total_count
+        total_pages = result.total_pages
 
     return templates.TemplateResponse(
         "persons/_table.html",
@@ -196,6 +266,9 @@ async def list_people_table(
             "per_page": per_page,
             "total_count": total_count,
             "total_pages": total_pages,
+            "cursor_mode": cursor_mode,
+            "count_is_approx": count == "approx",
+            "next_url": next_url,
             "q": q or "",
             "status": status or "",
             "tag_id": str(tag_id) if tag_id else "",
@@ -214,6 +287,8 @@ def _build_person_query(
     tag_ids: Optional[List[UUID]] = None,
     tag_logic: str = "or",
     letter: Optional[str] = None,
+    contacted_after: Optional[date] = None,
+    not_contacted_since: Optional[date] = None,
     sort_by: str = "full_name",
     sort_order: str = "asc",
 ):
@@ -221,27 +296,18 @@ def _build_person_query(
     Build the person query with all filters and sorting applied.
     Returns the query object (not executed) for further processing.
     Supports multi-tag filter with AND/OR logic.
+
+    The "last contacted" filters and sort read the denormalized
+    Person.last_contact_at column (indexed), not the interactions table.
+
+    No eager loads are attached: callers page ids with paginate_by_ids()
+    and load collections for the visible rows only.
     """
-    # Start with base query, eager load tags, organizations, and interactions
-    query = db.query(Person).options(
-        joinedload(Person.tags),
-        joinedload(Person.organizations).joinedload(PersonOrganization.organization),
-        joinedload(Person.interactions),
-    )
+    query = db.query(Person)
 
-    # Apply text search filter
-    if q:
-        search_term = f"%{q}%"
-        query = query.filter(
-            or_(
-                Person.full_name.ilike(search_term),
-                Person.first_name.ilike(search_term),
-                Person.last_name.ilike(search_term),
-                Person.title.ilike(search_term),
-                Person.email.ilike(search_term),
-                Person.notes.ilike(search_term),
-            )
-        )
+    # Apply text search filter (full-text + trigram indexes, see person_search)
+    if q and q.strip():
+        query = query.filter(person_search_filter(q))
 
     # Status filter removed - status column no longer exists
 
@@ -268,18 +334,48 @@ def _build_person_query(
             )
         )
 
-    # Apply sorting
+    # Apply last-contact filters (never-contacted people count as not contacted)
+    if contacted_after:
+        query = query.filter(Person.last_contact_at >= _start_of_day_utc(contacted_after))
+    if not_contacted_since:
+        query = query.filter(
+            or_(
+                Person.last_contact_at.is_(None),
+                Person.last_contact_at < _start_of_day_utc(not_contacted_since),
+            )
+        )
+
+    # Apply sorting ("relevance" ranks search hits, falls back to name without a query)
+    # Person.id is the final tiebreaker so pages are stable
+    if sort_by == "relevance" and q and q.strip():
+        query = query.order_by(*person_search_rank(q), asc(Person.full_name), asc(Person.id))
+        return query
+
     sort_column = _get_sort_column(sort_by)
     if sort_order.lower() == "desc":
-        query = query.order_by(desc(sort_column))
+        query = query.order_by(desc(sort_column), desc(Person.id))
     else:
-        query = query.order_by(asc(sort_column))
+        query = query.order_by(asc(sort_column), asc(Person.id))
 
     return query
 
 
+def _person_list_load_options():
+    """Loader options for the collections persons/_row.html renders."""
+    return [
+        selectinload(Person.tags),
+        selectinload(Person.organizations).joinedload(PersonOrganization.organization),
+        selectinload(Person.emails),
+    ]
+
+
+def _start_of_day_utc(day: date) -> datetime:
+    """Midnight UTC at the start of the given date."""
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
 def _get_sort_column(sort_by: str):
-    """Map sort_by parameter to SQLAlchemy column."""
+    """Map sort_by parameter to SQLAlchemy column (unknown values sort by name)."""
     column_map = {
         "full_name": Person.full_name,
         "first_name": Person.first_name,
@@ -287,12 +383,14 @@ def _get_sort_column(sort_by: str):
         "title": Person.title,
         "created_at": Person.created_at,
         "updated_at": Person.updated_at,
+        "last_contact": Person.last_contact_at,
+        "interaction_count": Person.interaction_count,
     }
     return column_map.get(sort_by, Person.full_name)
 
 
 @router.get("/new", response_class=HTMLResponse)
-async def new_person_form(request: Request, db: Session = Depends(get_db)):
+def new_person_form(request: Request, db: Session = Depends(get_db)):
     """
     Display the new person form.
     """
@@ -322,7 +420,7 @@ async def new_person_form(request: Request, db: Session = Depends(get_db)):
 
 
 @router.post("", response_class=HTMLResponse)
-async def create_person(
+def create_person(
     request: Request,
     db: Session = Depends(get_db),
     full_name: str = Form(...),
@@ -429,7 +527,7 @@ class BatchAddTagsRequest(BaseModel):
 
 
 @router.get("/batch/tags/modal", response_class=HTMLResponse)
-async def get_batch_tags_modal(
+def get_batch_tags_modal(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -453,46 +551,63 @@ async def get_batch_tags_modal(
 
 
 @router.post("/batch/tags", response_class=JSONResponse)
-async def batch_add_tags(
+@query_budget(5)
+def batch_add_tags(
     request: BatchAddTagsRequest,
     db: Session = Depends(get_db),
 ):
     """
     Add tags to multiple persons at once.
+
+    Runs a fixed number of queries regardless of how many persons/tags are
+    selected: existing persons, existing tags, and existing links.
     """
-    added_count = 0
-    for person_id_str in request.person_ids:
-        try:
-            person_id = UUID(person_id_str)
-            # Verify person exists
-            person = db.query(Person).filter(Person.id == person_id).first()
-            if not person:
-                continue
+    person_ids = _parse_uuids(request.person_ids)
+    tag_ids = _parse_uuids(request.tag_ids)
+    if not person_ids or not tag_ids:
+        return {"success": True, "added_count": 0}
+
+    # Verify persons and tags exist
+    person_ids = [pid for (pid,) in db.query(Person.id).filter(Person.id.in_(person_ids))]
+    tag_ids = [tid for (tid,) in db.query(Tag.id).filter(Tag.id.in_(tag_ids))]
+
+    # Skip links that already exist
+    existing = set(
+        db.query(PersonTag.person_id, PersonTag.tag_id)
+        .filter(PersonTag.person_id.in_(person_ids), PersonTag.tag_id.in_(tag_ids))
+        .all()
+    )
 
-            for tag_id_str in request.tag_ids:
-                try:
-                    tag_id = UUID(tag_id_str)
-                    # Check if already exists
-                    existing = db.query(PersonTag).filter_by(
-                        person_id=person_id, tag_id=tag_id
-                    ).first()
-                    if not existing:
-                        new_pt = PersonTag(person_id=person_id, tag_id=tag_id)
-                        db.add(new_pt)
-                        added_count += 1
-                except ValueError:
-                    continue
-        except ValueError:
-            continue
+    added_count = 0
+    for person_id in person_ids:
+        for tag_id in tag_ids:
+            if (person_id, tag_id) not in existing:
+                db.add(PersonTag(person_id=person_id, tag_id=tag_id))
+                added_count += 1
 
     db.commit()
     return {"success": True, "added_count": added_count}
 
 
+def _parse_uuids(values: List[str]) -> List[UUID]:
+    """Parse UUID strings, skipping invalid ones and duplicates (order kept)."""
+    parsed = []
+    for value in values:
+        try:
+            uuid_value = UUID(value)
+        except (ValueError, TypeError, AttributeError):
+            continue
+        if uuid_value not in parsed:
+            parsed.append(uuid_value)
+    return parsed
+
+
 @router.post("/batch/delete/modal", response_class=HTMLResponse)
-async def get_batch_delete_modal(
+@query_budget(3)
+def get_batch_delete_modal(
     request: Request,
     db: Session = Depends(get_db),
+    body: Any = Depends(get_json_body),
 ):
     """
     Return the batch delete confirmation modal.
@@ -500,7 +615,6 @@ async def get_batch_delete_modal(
     """
     # Try to get IDs from JSON body
     try:
-        body = await request.json()
         ids = body.get("ids", [])
     except Exception:
         ids = []
@@ -508,15 +622,18 @@ async def get_batch_delete_modal(
     total_count = len(ids)
     google_linked_count = 0
 
-    # Count how many persons have google_resource_name
-    for id_str in ids:
-        try:
-            person_id = UUID(id_str)
-            person = db.query(Person).filter(Person.id == person_id).first()
-            if person and person.google_resource_name:
-                google_linked_count += 1
-        except ValueError:
-            continue
+    # Count how many persons have google_resource_name (one query)
+    person_ids = _parse_uuids(ids)
+    if person_ids:
+        google_linked_count = (
+            db.query(func.count(Person.id))
+            .filter(
+                Person.id.in_(person_ids),
+                Person.google_resource_name.isnot(None),
+                Person.google_resource_name != "",
+            )
+            .scalar()
+        )
 
     return templates.TemplateResponse(
         "persons/_batch_delete_modal.html",
@@ -529,7 +646,7 @@ async def get_batch_delete_modal(
 
 
 @router.get("/batch/delete/modal", response_class=HTMLResponse)
-async def get_batch_delete_modal_simple(
+def get_batch_delete_modal_simple(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -548,7 +665,7 @@ async def get_batch_delete_modal_simple(
 
 
 @router.post("/batch/delete", response_class=JSONResponse)
-async def batch_delete_persons(
+def batch_delete_persons(
     request: BatchDeleteRequest,
     db: Session = Depends(get_db),
 ):
@@ -592,7 +709,7 @@ async def batch_delete_persons(
 
 
 @router.get("/merge", response_class=HTMLResponse)
-async def batch_merge_page(
+def batch_merge_page(
     request: Request,
     ids: List[str] = Query(..., description="List of person IDs to merge"),
     db: Session = Depends(get_db),
@@ -646,7 +763,7 @@ async def batch_merge_page(
 
 
 @router.post("/merge/execute", response_class=JSONResponse)
-async def execute_batch_merge(
+def execute_batch_merge(
     request: Request,
     keep_id: str = Form(...),
     merge_ids: List[str] = Form(...),
@@ -769,7 +886,7 @@ async def execute_batch_merge(
 
 
 @router.get("/{person_id}/edit", response_class=HTMLResponse)
-async def edit_person_form(
+def edit_person_form(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -828,7 +945,7 @@ async def edit_person_form(
 
 
 @router.put("/{person_id}", response_class=HTMLResponse)
-async def update_person(
+def update_person(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -903,7 +1020,7 @@ async def update_person(
 
 
 @router.get("/{person_id}/delete/modal", response_class=HTMLResponse)
-async def get_delete_modal(
+def get_delete_modal(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -927,7 +1044,7 @@ async def get_delete_modal(
 
 
 @router.delete("/{person_id}", response_class=JSONResponse)
-async def delete_person(
+def delete_person(
     request: Request,
     person_id: UUID,
     scope: str = Query("both", regex="^(blackbook_only|google_only|both)$"),
@@ -972,7 +1089,7 @@ async def delete_person(
 
 
 @router.get("/{person_id}", response_class=HTMLResponse)
-async def get_person_detail(
+def get_person_detail(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -986,7 +1103,7 @@ async def get_person_detail(
         .options(
             joinedload(Person.tags),
             joinedload(Person.organizations).joinedload(PersonOrganization.organization),
-            joinedload(Person.interactions),
+            selectinload(Person.interactions),
             joinedload(Person.emails),
             joinedload(Person.phones),
             joinedload(Person.websites),
@@ -1040,7 +1157,7 @@ async def get_person_detail(
 
 
 @router.get("/{person_id}/emails/manage", response_class=HTMLResponse)
-async def get_email_manage_modal(
+def get_email_manage_modal(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -1068,7 +1185,7 @@ async def get_email_manage_modal(
 
 
 @router.post("/{person_id}/emails", response_class=HTMLResponse)
-async def add_person_email(
+def add_person_email(
     request: Request,
     person_id: UUID,
     email: str = Form(...),
@@ -1135,7 +1252,7 @@ async def add_person_email(
 
 
 @router.delete("/{person_id}/emails/{email_id}", response_class=HTMLResponse)
-async def delete_person_email(
+def delete_person_email(
     request: Request,
     person_id: UUID,
     email_id: UUID,
@@ -1174,7 +1291,7 @@ async def delete_person_email(
 
 
 @router.post("/{person_id}/emails/{email_id}/primary", response_class=HTMLResponse)
-async def set_primary_email(
+def set_primary_email(
     request: Request,
     person_id: UUID,
     email_id: UUID,
@@ -1216,7 +1333,7 @@ async def set_primary_email(
 
 
 @router.get("/{person_id}/merge", response_class=HTMLResponse)
-async def get_merge_page(
+def get_merge_page(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -1243,7 +1360,7 @@ async def get_merge_page(
 
 
 @router.get("/{person_id}/merge/search", response_class=HTMLResponse)
-async def search_persons_for_merge(
+def search_persons_for_merge(
     request: Request,
     person_id: UUID,
     q: str = Query(..., min_length=2),
@@ -1284,7 +1401,7 @@ async def search_persons_for_merge(
 
 
 @router.post("/{person_id}/merge/{target_id}")
-async def perform_merge(
+def perform_merge(
     person_id: UUID,
     target_id: UUID,
     db: Session = Depends(get_db),
@@ -1318,7 +1435,7 @@ async def perform_merge(
 
 
 @router.get("/{person_id}/duplicates", response_class=HTMLResponse)
-async def get_duplicates_widget(
+def get_duplicates_widget(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -1344,7 +1461,7 @@ async def get_duplicates_widget(
 
 
 @router.get("/{person_id}/tags/manage", response_class=HTMLResponse)
-async def get_tag_manage_widget(
+def get_tag_manage_widget(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
@@ -1400,7 +1517,7 @@ async def get_tag_manage_widget(
 
 
 @router.post("/{person_id}/tags/{tag_id}", response_class=HTMLResponse)
-async def add_tag_to_person(
+def add_tag_to_person(
     request: Request,
     person_id: UUID,
     tag_id: UUID,
@@ -1466,7 +1583,7 @@ async def add_tag_to_person(
 
 
 @router.delete("/{person_id}/tags/{tag_id}", response_class=HTMLResponse)
-async def remove_tag_from_person(
+def remove_tag_from_person(
     request: Request,
     person_id: UUID,
     tag_id: UUID,
@@ -1527,7 +1644,7 @@ async def remove_tag_from_person(
 
 
 @router.get("/{person_id}/interactions/modal", response_class=HTMLResponse)
-async def get_interactions_modal(
+def get_interactions_modal(
     request: Request,
     person_id: UUID,
     db: Session = Depends(get_db),
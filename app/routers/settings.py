@@ -9,6 +9,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
+from starlette.datastructures import FormData
 from sqlalchemy import func, desc
 from sqlalchemy.orm import Session
 
@@ -25,6 +26,7 @@ from app.models.tag import PersonTag, OrganizationTag
 from app.services.duplicate_service import get_duplicate_service
 from app.services.ai.suggestion_service import SuggestionService
 from app.services.ai.chat_service import ChatService
+from app.utils.concurrency import get_form_data
 from sqlalchemy.orm import joinedload
 
 router = APIRouter(prefix="/settings", tags=["settings"])
@@ -33,7 +35,7 @@ templates = Jinja2Templates(directory="app/templates")
 
 @router.get("", response_class=HTMLResponse)
 @router.get("/", response_class=HTMLResponse)
-async def settings_page(
+def settings_page(
     request: Request,
     tab: str = Query("syncing", description="Active tab"),
     pending_status: str = Query("pending", description="Pending contacts status filter"),
@@ -415,7 +417,7 @@ async def settings_page(
 
 
 @router.get("/tags/subcategories", response_class=HTMLResponse)
-async def get_subcategories_list(
+def get_subcategories_list(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -446,7 +448,7 @@ async def get_subcategories_list(
 
 
 @router.get("/patterns", response_class=HTMLResponse)
-async def get_patterns_list(
+def get_patterns_list(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -468,7 +470,7 @@ async def get_patterns_list(
 
 
 @router.post("/patterns", response_class=HTMLResponse)
-async def add_pattern(
+def add_pattern(
     request: Request,
     pattern: str = Form(...),
     pattern_type: str = Form(...),
@@ -504,7 +506,7 @@ async def add_pattern(
 
 
 @router.delete("/patterns/{pattern_id}", response_class=HTMLResponse)
-async def delete_pattern(
+def delete_pattern(
     request: Request,
     pattern_id: UUID,
     db: Session = Depends(get_db),
@@ -538,7 +540,7 @@ async def delete_pattern(
 
 
 @router.get("/accounts", response_class=HTMLResponse)
-async def get_accounts_list(
+def get_accounts_list(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -557,7 +559,7 @@ async def get_accounts_list(
 
 
 @router.post("/accounts/{account_id}/toggle", response_class=HTMLResponse)
-async def toggle_account_status(
+def toggle_account_status(
     request: Request,
     account_id: UUID,
     db: Session = Depends(get_db),
@@ -588,7 +590,7 @@ async def toggle_account_status(
 
 
 @router.get("/duplicates", response_class=HTMLResponse)
-async def duplicates_page(
+def duplicates_page(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -613,7 +615,7 @@ async def duplicates_page(
 
 
 @router.get("/duplicates/merge", response_class=HTMLResponse)
-async def merge_page(
+def merge_page(
     request: Request,
     name: str = Query(..., description="Full name of duplicate group"),
     db: Session = Depends(get_db),
@@ -639,17 +641,17 @@ async def merge_page(
 
 
 @router.post("/duplicates/merge", response_class=HTMLResponse)
-async def execute_merge(
+def execute_merge(
     request: Request,
     keep_id: UUID = Form(...),
     full_name: str = Form(...),
     db: Session = Depends(get_db),
+    form_data: FormData = Depends(get_form_data),
 ):
     """
     Execute the merge operation for a duplicate group.
     Supports field-level selection for which values to keep.
     """
-    form_data = await request.form()
     
     service = get_duplicate_service(db)
     group = service.get_duplicate_group(full_name)
@@ -721,7 +723,7 @@ async def execute_merge(
 
 
 @router.post("/duplicates/merge-all", response_class=HTMLResponse)
-async def execute_merge_all(
+def execute_merge_all(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -750,7 +752,7 @@ async def execute_merge_all(
 
 
 @router.get("/duplicates/fuzzy", response_class=HTMLResponse)
-async def fuzzy_duplicates_page(
+def fuzzy_duplicates_page(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -773,7 +775,7 @@ async def fuzzy_duplicates_page(
 
 
 @router.get("/duplicates/fuzzy/merge", response_class=HTMLResponse)
-async def fuzzy_merge_page(
+def fuzzy_merge_page(
     request: Request,
     ids: str = Query(..., description="Comma-separated person IDs"),
     db: Session = Depends(get_db),
@@ -807,17 +809,17 @@ async def fuzzy_merge_page(
 
 
 @router.post("/duplicates/fuzzy/merge", response_class=HTMLResponse)
-async def execute_fuzzy_merge(
+def execute_fuzzy_merge(
     request: Request,
     keep_id: UUID = Form(...),
     db: Session = Depends(get_db),
+    form_data: FormData = Depends(get_form_data),
 ):
     """
     Execute the merge operation for a fuzzy duplicate group.
     Supports selective merging (user can uncheck records that are different people).
     Supports field-level selection for which values to keep.
     """
-    form_data = await request.form()
     
     # Get the selected IDs (records user wants to merge)
     selected_ids = form_data.getlist('selected_ids')
@@ -940,15 +942,15 @@ async def execute_fuzzy_merge(
 
 
 @router.post("/duplicates/fuzzy/not-duplicates", response_class=HTMLResponse)
-async def mark_not_duplicates(
+def mark_not_duplicates(
     request: Request,
     db: Session = Depends(get_db),
+    form_data: FormData = Depends(get_form_data),
 ):
     """
     Mark a group of persons as NOT duplicates.
     They will be excluded from future duplicate detection.
     """
-    form_data = await request.form()
     
     # Get all person IDs from the group
     all_person_ids = form_data.get('all_person_ids', '')
@@ -981,7 +983,7 @@ async def mark_not_duplicates(
 
 
 @router.get("/duplicates/exclusions", response_class=HTMLResponse)
-async def exclusions_page(
+def exclusions_page(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -1004,7 +1006,7 @@ async def exclusions_page(
 
 
 @router.get("/duplicates/exclusions/list", response_class=HTMLResponse)
-async def get_exclusions_list(
+def get_exclusions_list(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -1024,7 +1026,7 @@ async def get_exclusions_list(
 
 
 @router.delete("/duplicates/exclusions/{exclusion_id}", response_class=HTMLResponse)
-async def remove_exclusion(
+def remove_exclusion(
     request: Request,
     exclusion_id: UUID,
     db: Session = Depends(get_db),
@@ -1056,7 +1058,7 @@ async def remove_exclusion(
 
 
 @router.post("/ai/keys", response_class=HTMLResponse)
-async def save_api_key(
+def save_api_key(
     request: Request,
     provider_id: UUID = Form(...),
     api_key: str = Form(...),
@@ -1165,7 +1167,7 @@ async def test_api_key(
 
 
 @router.post("/ai/provider/{provider_id}/toggle", response_class=HTMLResponse)
-async def toggle_provider_status(
+def toggle_provider_status(
     request: Request,
     provider_id: UUID,
     db: Session = Depends(get_db),
@@ -1200,14 +1202,14 @@ async def toggle_provider_status(
 
 
 @router.put("/ai/access", response_class=HTMLResponse)
-async def update_data_access(
+def update_data_access(
     request: Request,
     db: Session = Depends(get_db),
+    form_data: FormData = Depends(get_form_data),
 ):
     """
     Update AI data access settings.
     """
-    form_data = await request.form()
 
     settings = AIDataAccessSettings.get_settings(db)
 
@@ -1225,7 +1227,7 @@ async def update_data_access(
 
 
 @router.delete("/ai/keys/{key_id}", response_class=HTMLResponse)
-async def delete_api_key(
+def delete_api_key(
     request: Request,
     key_id: UUID,
     db: Session = Depends(get_db),
@@ -1261,7 +1263,7 @@ async def delete_api_key(
 
 
 @router.get("/ai/prompts", response_class=HTMLResponse)
-async def get_quick_prompts_list(
+def get_quick_prompts_list(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -1281,7 +1283,7 @@ async def get_quick_prompts_list(
 
 
 @router.post("/ai/prompts", response_class=HTMLResponse)
-async def add_quick_prompt(
+def add_quick_prompt(
     request: Request,
     label: str = Form(...),
     prompt_text: str = Form(...),
@@ -1318,15 +1320,15 @@ async def add_quick_prompt(
 
 
 @router.put("/ai/prompts/{prompt_id}", response_class=HTMLResponse)
-async def update_quick_prompt(
+def update_quick_prompt(
     request: Request,
     prompt_id: UUID,
     db: Session = Depends(get_db),
+    form_data: FormData = Depends(get_form_data),
 ):
     """
     Update an existing quick prompt.
     """
-    form_data = await request.form()
 
     prompt = db.query(AIQuickPrompt).filter_by(id=prompt_id).first()
     if not prompt:
@@ -1355,7 +1357,7 @@ async def update_quick_prompt(
 
 
 @router.post("/ai/prompts/{prompt_id}/toggle", response_class=HTMLResponse)
-async def toggle_quick_prompt(
+def toggle_quick_prompt(
     request: Request,
     prompt_id: UUID,
     db: Session = Depends(get_db),
@@ -1382,7 +1384,7 @@ async def toggle_quick_prompt(
 
 
 @router.delete("/ai/prompts/{prompt_id}", response_class=HTMLResponse)
-async def delete_quick_prompt(
+def delete_quick_prompt(
     request: Request,
     prompt_id: UUID,
     db: Session = Depends(get_db),
@@ -1409,14 +1411,14 @@ async def delete_quick_prompt(
 
 
 @router.post("/ai/prompts/reorder", response_class=HTMLResponse)
-async def reorder_quick_prompts(
+def reorder_quick_prompts(
     request: Request,
     db: Session = Depends(get_db),
+    form_data: FormData = Depends(get_form_data),
 ):
     """
     Reorder quick prompts based on order array.
     """
-    form_data = await request.form()
     order_str = form_data.get("order", "")
 
     if order_str:
@@ -1447,7 +1449,7 @@ async def reorder_quick_prompts(
 
 
 @router.post("/calendar/timezone", response_class=HTMLResponse)
-async def update_calendar_timezone(
+def update_calendar_timezone(
     request: Request,
     timezone: str = Form(...),
     db: Session = Depends(get_db),
@@ -1479,7 +1481,7 @@ async def update_calendar_timezone(
 
 
 @router.get("/organization-types/categories-list", response_class=HTMLResponse)
-async def get_categories_list(
+def get_categories_list(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -1500,7 +1502,7 @@ async def get_categories_list(
 
 
 @router.get("/organization-types/types-list", response_class=HTMLResponse)
-async def get_types_list(
+def get_types_list(
     request: Request,
     category_id: int = Query(None, description="Filter by category ID"),
     db: Session = Depends(get_db),
@@ -1527,7 +1529,7 @@ async def get_types_list(
 
 
 @router.get("/organization-types/options-list", response_class=HTMLResponse)
-async def get_options_list(
+def get_options_list(
     request: Request,
     option_type: str = Query(None, description="Filter by option type"),
     db: Session = Depends(get_db),
@@ -1560,7 +1562,7 @@ async def get_options_list(
 
 
 @router.get("/sync/log", response_class=HTMLResponse)
-async def sync_log_page(
+def sync_log_page(
     request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     status: str = Query(None, description="Filter by status"),
@@ -1630,7 +1632,7 @@ async def sync_log_page(
 
 
 @router.get("/sync/review", response_class=HTMLResponse)
-async def sync_review_page(
+def sync_review_page(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -1652,7 +1654,7 @@ async def sync_review_page(
 
 
 @router.post("/sync/resolve/{conflict_id}", response_class=HTMLResponse)
-async def resolve_sync_conflict(
+def resolve_sync_conflict(
     request: Request,
     conflict_id: UUID,
     action: str = Form(...),
@@ -1672,7 +1674,7 @@ async def resolve_sync_conflict(
 
 
 @router.get("/sync/archive", response_class=HTMLResponse)
-async def sync_archive_page(
+def sync_archive_page(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -1694,7 +1696,7 @@ async def sync_archive_page(
 
 
 @router.post("/sync/archive/{contact_id}/restore", response_class=HTMLResponse)
-async def restore_archived_contact(
+def restore_archived_contact(
     request: Request,
     contact_id: UUID,
     db: Session = Depends(get_db),
@@ -1711,7 +1713,7 @@ async def restore_archived_contact(
 
 
 @router.delete("/sync/archive/{contact_id}", response_class=HTMLResponse)
-async def delete_archived_contact(
+def delete_archived_contact(
     request: Request,
     contact_id: UUID,
     db: Session = Depends(get_db),
@@ -1724,7 +1726,7 @@ async def delete_archived_contact(
 
 
 @router.post("/sync/archive/restore-all", response_class=HTMLResponse)
-async def restore_all_archived_contacts(
+def restore_all_archived_contacts(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -1736,7 +1738,7 @@ async def restore_all_archived_contacts(
 
 
 @router.delete("/sync/archive/delete-all", response_class=HTMLResponse)
-async def delete_all_archived_contacts(
+def delete_all_archived_contacts(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -1748,14 +1750,14 @@ async def delete_all_archived_contacts(
 
 
 @router.put("/contacts-sync/settings", response_class=HTMLResponse)
-async def update_contacts_sync_settings(
+def update_contacts_sync_settings(
     request: Request,
     db: Session = Depends(get_db),
+    form_data: FormData = Depends(get_form_data),
 ):
     """
     Update contacts sync settings.
     """
-    form_data = await request.form()
 
     # Note: This would need a ContactsSyncSettings model
     # For now, just return success response
@@ -4,7 +4,7 @@ Handles creating, listing, editing, and deleting tags.
 Also handles tag subcategory management with default colors.
 """
 
-from typing import Optional, List
+from typing import Any, Optional, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Request, HTTPException, Form
@@ -16,13 +16,14 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import Tag, TagSubcategory, DEFAULT_SUBCATEGORY_COLORS
 from app.models.tag import PersonTag, OrganizationTag
+from app.utils.concurrency import get_json_body
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 templates = Jinja2Templates(directory="app/templates")
 
 
 @router.get("", response_class=HTMLResponse)
-async def list_tags(
+def list_tags(
     request: Request,
     db: Session = Depends(get_db),
     q: Optional[str] = Query(None, description="Search tag names"),
@@ -125,7 +126,7 @@ async def list_tags(
 
 
 @router.get("/new", response_class=HTMLResponse)
-async def new_tag_form(
+def new_tag_form(
     request: Request,
     db: Session = Depends(get_db),
     category: Optional[str] = Query(None, description="Pre-select category for the tag"),
@@ -168,7 +169,7 @@ async def new_tag_form(
 
 
 @router.post("", response_class=HTMLResponse)
-async def create_tag(
+def create_tag(
     request: Request,
     db: Session = Depends(get_db),
     name: str = Form(...),
@@ -236,7 +237,7 @@ async def create_tag(
 
 
 @router.post("/apply-taxonomy-mapping", response_class=JSONResponse)
-async def apply_taxonomy_mapping(
+def apply_taxonomy_mapping(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -425,7 +426,7 @@ async def apply_taxonomy_mapping(
 
 
 @router.get("/{tag_id}", response_class=HTMLResponse)
-async def tag_detail(
+def tag_detail(
     request: Request,
     tag_id: UUID,
     db: Session = Depends(get_db),
@@ -455,7 +456,7 @@ async def tag_detail(
 
 
 @router.get("/{tag_id}/edit", response_class=HTMLResponse)
-async def edit_tag_form(
+def edit_tag_form(
     request: Request,
     tag_id: UUID,
     db: Session = Depends(get_db),
@@ -493,7 +494,7 @@ async def edit_tag_form(
 
 
 @router.post("/{tag_id}", response_class=HTMLResponse)
-async def update_tag(
+def update_tag(
     request: Request,
     tag_id: UUID,
     db: Session = Depends(get_db),
@@ -549,7 +550,7 @@ async def update_tag(
 
 
 @router.delete("/{tag_id}", response_class=HTMLResponse)
-async def delete_tag(
+def delete_tag(
     request: Request,
     tag_id: UUID,
     db: Session = Depends(get_db),
@@ -574,7 +575,7 @@ async def delete_tag(
 
 
 @router.get("/subcategories/list", response_class=HTMLResponse)
-async def list_subcategories(
+def list_subcategories(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -600,7 +601,7 @@ async def list_subcategories(
 
 
 @router.get("/subcategories/json", response_class=JSONResponse)
-async def get_subcategories_json(
+def get_subcategories_json(
     db: Session = Depends(get_db),
 ):
     """
@@ -619,7 +620,7 @@ async def get_subcategories_json(
 
 
 @router.post("/subcategories", response_class=JSONResponse)
-async def create_subcategory(
+def create_subcategory(
     request: Request,
     db: Session = Depends(get_db),
     name: str = Form(...),
@@ -655,7 +656,7 @@ async def create_subcategory(
 
 
 @router.put("/subcategories/{subcat_id}", response_class=JSONResponse)
-async def update_subcategory(
+def update_subcategory(
     subcat_id: UUID,
     db: Session = Depends(get_db),
     name: Optional[str] = Form(None),
@@ -706,7 +707,7 @@ async def update_subcategory(
 
 
 @router.delete("/subcategories/{subcat_id}", response_class=JSONResponse)
-async def delete_subcategory(
+def delete_subcategory(
     subcat_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -727,7 +728,7 @@ async def delete_subcategory(
 
 
 @router.post("/subcategories/{subcat_id}/apply-color", response_class=JSONResponse)
-async def apply_subcategory_color_to_all_tags(
+def apply_subcategory_color_to_all_tags(
     subcat_id: UUID,
     db: Session = Depends(get_db),
 ):
@@ -755,15 +756,15 @@ async def apply_subcategory_color_to_all_tags(
 
 
 @router.post("/subcategories/reorder", response_class=JSONResponse)
-async def reorder_subcategories(
+def reorder_subcategories(
     request: Request,
     db: Session = Depends(get_db),
+    data: Any = Depends(get_json_body),
 ):
     """
     Reorder subcategories based on a list of IDs.
     Expects JSON body: {"order": ["uuid1", "uuid2", ...]}
     """
-    data = await request.json()
     order_list = data.get("order", [])
     
     if not order_list:
@@ -785,16 +786,16 @@ async def reorder_subcategories(
 
 
 @router.post("/bulk-assign-subcategory", response_class=JSONResponse)
-async def bulk_assign_subcategory(
+def bulk_assign_subcategory(
     request: Request,
     db: Session = Depends(get_db),
+    data: Any = Depends(get_json_body),
 ):
     """
     Assign a subcategory to multiple tags at once.
     Expects JSON body: {"tag_ids": ["uuid1", "uuid2", ...], "subcategory": "Subcategory Name"}
     Optionally accepts "apply_color": true to also update tag colors.
     """
-    data = await request.json()
     tag_ids = data.get("tag_ids", [])
     subcategory_name = data.get("subcategory", "").strip()
     apply_color = data.get("apply_color", False)
@@ -844,7 +845,7 @@ async def bulk_assign_subcategory(
 
 
 @router.put("/categories", response_class=JSONResponse)
-async def update_category(
+def update_category(
     db: Session = Depends(get_db),
     old_name: str = Form(...),
     new_name: str = Form(...),
@@ -889,15 +890,15 @@ async def update_category(
 
 
 @router.post("/categories/apply-color", response_class=JSONResponse)
-async def apply_category_color(
+def apply_category_color(
     request: Request,
     db: Session = Depends(get_db),
+    data: Any = Depends(get_json_body),
 ):
     """
     Apply a color to all tags in a specific category.
     Expects JSON body: {"category": "Firm Category", "color": "#687280"}
     """
-    data = await request.json()
     category_name = data.get("category", "").strip()
     color = data.get("color", "").strip()
 
@@ -927,7 +928,7 @@ async def apply_category_color(
 
 
 @router.post("/categories/delete", response_class=JSONResponse)
-async def delete_category(
+def delete_category(
     db: Session = Depends(get_db),
     category: str = Form(...),
 ):
@@ -47,7 +47,7 @@ class TaskMove(BaseModel):
 
 
 @router.post("/sync", response_class=HTMLResponse)
-async def sync_tasks(
+def sync_tasks(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -100,7 +100,7 @@ async def sync_tasks(
 
 
 @router.patch("/{list_id}/{task_id}")
-async def update_task(
+def update_task(
     list_id: str,
     task_id: str,
     task_update: TaskUpdate,
@@ -143,7 +143,7 @@ async def update_task(
 
 
 @router.post("/{list_id}/{task_id}/toggle")
-async def toggle_task(
+def toggle_task(
     list_id: str,
     task_id: str,
     db: Session = Depends(get_db),
@@ -177,7 +177,7 @@ async def toggle_task(
 
 
 @router.post("/{list_id}")
-async def create_task(
+def create_task(
     list_id: str,
     task_create: TaskCreate,
     db: Session = Depends(get_db),
@@ -218,7 +218,7 @@ async def create_task(
 
 
 @router.post("/reorder-lists")
-async def reorder_task_lists(
+def reorder_task_lists(
     order_update: ListOrderUpdate,
     db: Session = Depends(get_db),
 ):
@@ -262,7 +262,7 @@ async def reorder_task_lists(
 
 
 @router.post("/{list_id}/{task_id}/move")
-async def move_task(
+def move_task(
     list_id: str,
     task_id: str,
     task_move: TaskMove,
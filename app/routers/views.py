@@ -20,7 +20,7 @@ templates = Jinja2Templates(directory="app/templates")
 
 
 @router.get("", response_class=HTMLResponse)
-async def list_views(
+def list_views(
     request: Request,
     db: Session = Depends(get_db),
     entity_type: Optional[str] = Query(None, description="Filter by entity type"),
@@ -53,7 +53,7 @@ async def list_views(
 
 
 @router.get("/sidebar", response_class=HTMLResponse)
-async def get_sidebar_views(
+def get_sidebar_views(
     request: Request,
     db: Session = Depends(get_db),
     entity_type: Optional[str] = Query(None, description="Filter by entity type"),
@@ -79,7 +79,7 @@ async def get_sidebar_views(
 
 
 @router.get("/new", response_class=HTMLResponse)
-async def new_view_form(
+def new_view_form(
     request: Request,
     entity_type: str = Query(..., description="Entity type: person or organization"),
     q: Optional[str] = Query(None),
@@ -117,7 +117,7 @@ async def new_view_form(
 
 
 @router.post("", response_class=HTMLResponse)
-async def create_view(
+def create_view(
     request: Request,
     db: Session = Depends(get_db),
     name: str = Form(...),
@@ -173,7 +173,7 @@ async def create_view(
 
 
 @router.get("/{view_id}", response_class=HTMLResponse)
-async def apply_view(
+def apply_view(
     request: Request,
     view_id: UUID,
     db: Session = Depends(get_db),
@@ -210,7 +210,7 @@ async def apply_view(
 
 
 @router.get("/{view_id}/edit", response_class=HTMLResponse)
-async def edit_view_form(
+def edit_view_form(
     request: Request,
     view_id: UUID,
     db: Session = Depends(get_db),
@@ -234,7 +234,7 @@ async def edit_view_form(
 
 
 @router.put("/{view_id}", response_class=HTMLResponse)
-async def update_view(
+def update_view(
     request: Request,
     view_id: UUID,
     db: Session = Depends(get_db),
@@ -287,7 +287,7 @@ async def update_view(
 
 
 @router.delete("/{view_id}", response_class=HTMLResponse)
-async def delete_view(
+def delete_view(
     request: Request,
     view_id: UUID,
     db: Session = Depends(get_db),
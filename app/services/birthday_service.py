@@ -0,0 +1,231 @@
+"""
+Birthday lookups for the dashboard widgets.
+
+Birthdays are matched on an indexed month/day key (MMDD as an integer, see
+ix_persons_birthday_md) so a widget only reads the persons whose birthday
+falls in the requested window, including windows that wrap past New Year.
+Rows carry just the fields the templates render.
+
+Results are cached briefly and shared by the today, birthdays, compact and
+mini-calendar widgets; committed changes to the displayed person fields
+or person emails drop the cache.
+"""
+
+import calendar
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import Integer, and_, cast, event, extract, or_, select
+from sqlalchemy.orm import Session
+
+from app.models import Person, PersonEmail
+from app.utils.cache import TTLCache
+from app.utils.write_tracking import bulk_write_touches, flush_touches
+
+# Upcoming lists are computed for at least this many days and sliced, so
+# the today widget (0 days) and 30-day lists share one query
+UPCOMING_WINDOW_DAYS = 30
+
+BIRTHDAY_CACHE_TTL_SECONDS = 300
+_birthday_cache = TTLCache(ttl_seconds=BIRTHDAY_CACHE_TTL_SECONDS, max_entries=64)
+
+# Person columns the widgets read (any PersonEmail change counts: primary email)
+BIRTHDAY_PERSON_COLUMNS = ("birthday", "first_name", "last_name", "full_name", "email")
+
+# session.info key: birthday data changed in this transaction
+_CHANGED_KEY = "birthday_cache_changed"
+
+# Month/day key matching the ix_persons_birthday_md expression index
+birthday_md = cast(extract("month", Person.birthday) * 100 + extract("day", Person.birthday), Integer)
+
+FEB_29_MD = 229
+
+
+@dataclass(frozen=True)
+class BirthdayPerson:
+    """The person fields the birthday widgets display."""
+
+    id: UUID
+    first_name: Optional[str]
+    last_name: Optional[str]
+    full_name: str
+    email: Optional[str]
+    birthday: date
+
+
+def _md(day: date) -> int:
+    return day.month * 100 + day.day
+
+
+def _observed_birthday(birthday: date, year: int) -> date:
+    """The birthday in a given year; Feb 29 falls on Feb 28 in non-leap years."""
+    if birthday.month == 2 and birthday.day == 29 and not calendar.isleap(year):
+        return date(year, 2, 28)
+    return birthday.replace(year=year)
+
+
+def _window_filter(start: date, end: date):
+    """Match month/day keys between start and end (inclusive), across New Year."""
+    if (end - start).days >= 365:
+        return Person.birthday.isnot(None)
+
+    start_md, end_md = _md(start), _md(end)
+    if start_md <= end_md:
+        condition = birthday_md.between(start_md, end_md)
+    else:
+        condition = or_(birthday_md >= start_md, birthday_md <= end_md)
+
+    # Feb 29 birthdays are observed on Feb 28 in non-leap years
+    if any(
+        not calendar.isleap(year) and start <= date(year, 2, 28) <= end
+        for year in {start.year, end.year}
+    ):
+        condition = or_(condition, birthday_md == FEB_29_MD)
+    return and_(Person.birthday.isnot(None), condition)
+
+
+def _fetch(db: Session, condition) -> list[BirthdayPerson]:
+    primary_email = (
+        select(PersonEmail.email)
+        .where(PersonEmail.person_id == Person.id)
+        .order_by(PersonEmail.is_primary.desc(), PersonEmail.created_at)
+        .limit(1)
+        .scalar_subquery()
+    )
+    rows = db.execute(
+        select(
+            Person.id,
+            Person.first_name,
+            Person.last_name,
+            Person.full_name,
+            primary_email.label("primary_email"),
+            Person.email,
+            Person.birthday,
+        ).where(condition)
+    )
+    return [
+        BirthdayPerson(
+            id=row.id,
+            first_name=row.first_name,
+            last_name=row.last_name,
+            full_name=row.full_name,
+            email=row.primary_email or row.email,
+            birthday=row.birthday,
+        )
+        for row in rows
+    ]
+
+
+def _compute_upcoming(db: Session, today: date, days: int) -> list[dict]:
+    upcoming = []
+    for person in _fetch(db, _window_filter(today, today + timedelta(days=days))):
+        next_birthday = _observed_birthday(person.birthday, today.year)
+        if next_birthday < today:
+            next_birthday = _observed_birthday(person.birthday, today.year + 1)
+
+        days_until = (next_birthday - today).days
+        if days_until > days:
+            continue
+        upcoming.append({
+            "person": person,
+            "birthday_date": next_birthday,
+            "days_until": days_until,
+            "age": next_birthday.year - person.birthday.year,
+            "is_today": days_until == 0,
+            "is_tomorrow": days_until == 1,
+            "is_this_week": days_until <= 7,
+        })
+
+    upcoming.sort(key=lambda x: (x["days_until"], x["person"].full_name))
+    return upcoming
+
+
+def get_upcoming_birthdays(db: Session, days: int = 30, today: Optional[date] = None) -> list[dict]:
+    """
+    Upcoming birthdays within the next N days, sorted by days until birthday.
+
+    Each item has the BirthdayPerson, the birthday_date, days_until, the age
+    being turned and is_today/is_tomorrow/is_this_week flags.
+    """
+    today = today or date.today()
+    window = max(days, UPCOMING_WINDOW_DAYS)
+    upcoming = _birthday_cache.get_or_set(
+        ("upcoming", today, window),
+        lambda: _compute_upcoming(db, today, window),
+    )
+    return [item for item in upcoming if item["days_until"] <= days]
+
+
+def get_todays_birthdays(db: Session, today: Optional[date] = None) -> list[dict]:
+    """Birthdays falling today (from the shared upcoming list)."""
+    return get_upcoming_birthdays(db, days=0, today=today)
+
+
+def _compute_month(db: Session, year: int, month: int) -> dict[int, list[dict]]:
+    first_md = month * 100 + 1
+    condition = and_(Person.birthday.isnot(None), birthday_md.between(first_md, first_md + 30))
+
+    birthdays_by_day: dict[int, list[dict]] = {}
+    for person in sorted(_fetch(db, condition), key=lambda p: p.full_name):
+        day = _observed_birthday(person.birthday, year).day
+        birthdays_by_day.setdefault(day, []).append({
+            "person": person,
+            "age": year - person.birthday.year,
+        })
+    return birthdays_by_day
+
+
+def get_birthdays_for_month(db: Session, year: int, month: int) -> dict[int, list[dict]]:
+    """
+    Birthdays within a month, keyed by day of month.
+
+    Each item has the BirthdayPerson and the age turned that year.
+    """
+    return _birthday_cache.get_or_set(("month", year, month), lambda: _compute_month(db, year, month))
+
+
+def invalidate_birthday_cache() -> None:
+    """Drop every cached birthday lookup."""
+    _birthday_cache.clear()
+
+
+def _touches_birthdays(session: Session, obj) -> bool:
+    if isinstance(obj, Person):
+        return flush_touches(session, obj, BIRTHDAY_PERSON_COLUMNS)
+    return isinstance(obj, PersonEmail) and flush_touches(session, obj)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context) -> None:
+    """Note a flush that changed birthday rows; the cache is dropped on commit."""
+    if session.info.get(_CHANGED_KEY):
+        return
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if _touches_birthdays(session, obj):
+            session.info[_CHANGED_KEY] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_write(orm_execute_state) -> None:
+    """Note bulk query.update()/delete() of persons or their emails (no flush events)."""
+    if (
+        bulk_write_touches(orm_execute_state, (Person,), BIRTHDAY_PERSON_COLUMNS)
+        or bulk_write_touches(orm_execute_state, (PersonEmail,))
+    ):
+        orm_execute_state.session.info[_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session) -> None:
+    if session.info.pop(_CHANGED_KEY, False):
+        invalidate_birthday_cache()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _invalidate_on_rollback(session, previous_transaction) -> None:
+    # A lookup through this session may have cached the rolled-back rows
+    if session.info.pop(_CHANGED_KEY, False):
+        invalidate_birthday_cache()
@@ -3,25 +3,28 @@ Calendar service for interacting with Google Calendar API.
 
 Handles fetching events, matching attendees to persons, and syncing calendar data.
 Supports timezone-aware date calculations for accurate "today" queries.
+
+The event views (today, range, upcoming) read calendar_events only; the
+background sync in app.services.calendar_sync_service keeps it current.
 """
 
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 from zoneinfo import ZoneInfo
 
 from google.oauth2.credentials import Credentials
 
 logger = logging.getLogger(__name__)
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.models import (
     GoogleAccount,
     Person,
-    PersonEmail,
     CalendarEvent,
     PendingContact,
     PendingContactStatus,
@@ -29,8 +32,20 @@ from app.models import (
     InteractionMedium,
     InteractionSource,
 )
+from app.services.contact_stats import refresh_contact_stats
 from app.services.google_auth import CALENDAR_SCOPES
+from app.services.google_clients import get_credentials, service_for
+from app.services.google_executor import execute, get_google_executor
+from app.services.person_email_index import get_email_person_index
+
 
+# Columns refreshed when a cached event is upserted again
+UPSERT_COLUMNS = (
+    "summary", "description", "start_time", "end_time", "location", "attendees",
+    "is_recurring", "recurring_event_id", "organizer_email", "html_link", "calendar_color",
+)
+# Rows per INSERT ... ON CONFLICT statement (stays well under the bind-parameter limit)
+UPSERT_BATCH_SIZE = 500
 
 # Google Calendar colorId mapping (from Google Calendar API)
 # See: https://developers.google.com/calendar/api/v3/reference/colors
@@ -67,6 +82,33 @@ class CalendarAPIError(CalendarServiceError):
     pass
 
 
+def _list_events(
+    credentials: Credentials,
+    time_min: datetime,
+    time_max: datetime,
+    max_results: int,
+) -> list[dict[str, Any]]:
+    """
+    List primary-calendar events in a time range (API only, no database).
+
+    Raises:
+        CalendarAPIError: If API call fails
+    """
+    try:
+        service = service_for(credentials, "calendar", "v3")
+        events_result = execute(service.events().list(
+            calendarId="primary",
+            timeMin=time_min.isoformat(),
+            timeMax=time_max.isoformat(),
+            maxResults=max_results,
+            singleEvents=True,
+            orderBy="startTime",
+        ))
+        return events_result.get("items", [])
+    except HttpError as e:
+        raise CalendarAPIError(f"Calendar API error: {e}")
+
+
 class CalendarService:
     """
     Service for interacting with Google Calendar API.
@@ -81,7 +123,6 @@ class CalendarService:
             db: Database session for querying accounts and storing events
         """
         self.db = db
-        self._email_to_person_cache: dict[str, UUID | None] | None = None
 
     def fetch_events(
         self,
@@ -117,33 +158,10 @@ class CalendarService:
         if time_max is None:
             time_max = time_min + timedelta(days=7)
 
-        try:
-            credentials = self._get_credentials(account)
-            service = build("calendar", "v3", credentials=credentials)
-
-            events_result = service.events().list(
-                calendarId="primary",
-                timeMin=time_min.isoformat(),
-                timeMax=time_max.isoformat(),
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy="startTime",
-            ).execute()
-
-            events_data = events_result.get("items", [])
-
-            # Cache events in database
-            cached_events = []
-            for event_data in events_data:
-                cached_event = self._cache_event(account, event_data)
-                if cached_event:
-                    cached_events.append(cached_event)
-
-            self.db.commit()
-            return cached_events
-
-        except HttpError as e:
-            raise CalendarAPIError(f"Calendar API error: {e}")
+        events_data = _list_events(self._get_credentials(account), time_min, time_max, max_results)
+        cached_events = self._cache_events(account, events_data)
+        self.db.commit()
+        return cached_events
 
     def get_todays_events(
         self,
@@ -153,6 +171,8 @@ class CalendarService:
         """
         Get today's calendar events, optionally filtered by account.
 
+        Reads the local table only; app.tasks.calendar_sync keeps it current.
+
         Args:
             local_tz: Local timezone to determine "today". If None, uses UTC.
             account_id: Optional UUID to filter events to a specific Google account.
@@ -174,33 +194,6 @@ class CalendarService:
             today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
             today_end = today_start + timedelta(days=1)
 
-        # Fetch fresh events from accounts
-        if account_id:
-            # Fetch only from specific account
-            account = self.db.query(GoogleAccount).filter_by(id=account_id, is_active=True).first()
-            if account:
-                try:
-                    self.fetch_events(
-                        account_id=account.id,
-                        time_min=today_start,
-                        time_max=today_end,
-                    )
-                except (CalendarAuthError, CalendarAPIError):
-                    pass
-        else:
-            # Fetch from all active accounts
-            accounts = self.db.query(GoogleAccount).filter_by(is_active=True).all()
-            for account in accounts:
-                try:
-                    self.fetch_events(
-                        account_id=account.id,
-                        time_min=today_start,
-                        time_max=today_end,
-                    )
-                except (CalendarAuthError, CalendarAPIError):
-                    # Continue with other accounts if one fails
-                    continue
-
         # Query cached events for today
         query = (
             self.db.query(CalendarEvent)
@@ -226,16 +219,18 @@ class CalendarService:
         start_date: datetime,
         end_date: datetime,
         account_id: UUID | None = None,
-        fetch_fresh: bool = True,
     ) -> list[CalendarEvent]:
         """
-        Get calendar events for a specific date range.
+        Get calendar events for a specific date range from the local table.
+
+        Parts of the range outside the synced window are fetched from Google
+        in the background (see CalendarSyncService.ensure_range) and show up
+        on a later call.
 
         Args:
             start_date: Start of date range (timezone-aware)
             end_date: End of date range (timezone-aware)
             account_id: Optional UUID to filter events to a specific Google account.
-            fetch_fresh: Whether to fetch fresh events from Google API (default True)
 
         Returns:
             List of CalendarEvent objects, sorted by start time
@@ -251,32 +246,9 @@ class CalendarService:
         else:
             end_utc = end_date.replace(tzinfo=timezone.utc)
 
-        # Fetch fresh events from accounts if requested
-        if fetch_fresh:
-            if account_id:
-                # Fetch only from specific account
-                account = self.db.query(GoogleAccount).filter_by(id=account_id, is_active=True).first()
-                if account:
-                    try:
-                        self.fetch_events(
-                            account_id=account.id,
-                            time_min=start_utc,
-                            time_max=end_utc,
-                        )
-                    except (CalendarAuthError, CalendarAPIError):
-                        pass
-            else:
-                # Fetch from all active accounts
-                accounts = self.db.query(GoogleAccount).filter_by(is_active=True).all()
-                for account in accounts:
-                    try:
-                        self.fetch_events(
-                            account_id=account.id,
-                            time_min=start_utc,
-                            time_max=end_utc,
-                        )
-                    except (CalendarAuthError, CalendarAPIError):
-                        continue
+        # Queue a background fetch of any part outside the synced window
+        from app.services.calendar_sync_service import CalendarSyncService
+        CalendarSyncService(self.db).ensure_range(start_utc, end_utc, account_id)
 
         # Query cached events for the range (using UTC times)
         query = (
@@ -305,7 +277,7 @@ class CalendarService:
         account_id: UUID | None = None,
     ) -> list[CalendarEvent]:
         """
-        Get upcoming calendar events, optionally filtered by account.
+        Get upcoming calendar events from the local table, optionally filtered by account.
 
         Args:
             days: Number of days to look ahead (default 7)
@@ -319,32 +291,6 @@ class CalendarService:
         time_min = now + timedelta(days=offset)
         time_max = time_min + timedelta(days=days)
 
-        # Fetch fresh events from accounts
-        if account_id:
-            # Fetch only from specific account
-            account = self.db.query(GoogleAccount).filter_by(id=account_id, is_active=True).first()
-            if account:
-                try:
-                    self.fetch_events(
-                        account_id=account.id,
-                        time_min=time_min,
-                        time_max=time_max,
-                    )
-                except (CalendarAuthError, CalendarAPIError):
-                    pass
-        else:
-            # Fetch from all active accounts
-            accounts = self.db.query(GoogleAccount).filter_by(is_active=True).all()
-            for account in accounts:
-                try:
-                    self.fetch_events(
-                        account_id=account.id,
-                        time_min=time_min,
-                        time_max=time_max,
-                    )
-                except (CalendarAuthError, CalendarAPIError):
-                    continue
-
         # Query cached events
         query = (
             self.db.query(CalendarEvent)
@@ -506,7 +452,7 @@ class CalendarService:
 
         try:
             credentials = self._get_credentials(account)
-            service = build("calendar", "v3", credentials=credentials)
+            service = service_for(credentials, "calendar", "v3")
 
             # If adding video conferencing, we need conferenceDataVersion=1
             conference_version = 1 if add_video_conferencing else 0
@@ -556,7 +502,7 @@ class CalendarService:
 
         try:
             credentials = self._get_credentials(account)
-            service = build("calendar", "v3", credentials=credentials)
+            service = service_for(credentials, "calendar", "v3")
 
             service.events().delete(
                 calendarId="primary",
@@ -620,7 +566,7 @@ class CalendarService:
 
         try:
             credentials = self._get_credentials(account)
-            service = build("calendar", "v3", credentials=credentials)
+            service = service_for(credentials, "calendar", "v3")
 
             # First, get the existing event to preserve fields we're not updating
             existing_event = service.events().get(
@@ -739,7 +685,7 @@ class CalendarService:
 
         try:
             credentials = self._get_credentials(account)
-            service = build("calendar", "v3", credentials=credentials)
+            service = service_for(credentials, "calendar", "v3")
 
             event = service.events().get(
                 calendarId="primary",
@@ -807,24 +753,35 @@ class CalendarService:
         events_synced = 0
         pending_created = 0
 
-        # Fetch past events from all accounts
-        accounts = self.db.query(GoogleAccount).filter_by(is_active=True).all()
-        for account in accounts:
+        # Credentials are read up front: the fetches run in executor workers
+        account_credentials = []
+        for account in self.db.query(GoogleAccount).filter_by(is_active=True).all():
             try:
-                events = self.fetch_events(
-                    account_id=account.id,
-                    time_min=time_min,
-                    time_max=now,
-                    max_results=250,
-                )
-                events_synced += len(events)
+                account_credentials.append((account, self._get_credentials(account)))
+            except CalendarAuthError:
+                continue
 
-                # Process attendees for pending contacts
-                for event in events:
-                    pending_created += self._process_attendees_for_pending(event)
+        # Fetch past events from all accounts concurrently
+        fetched = get_google_executor().map(
+            lambda job: _list_events(job[1], time_min, now, 250),
+            account_credentials,
+            account_key=lambda job: job[0].id,
+        )
 
-            except (CalendarAuthError, CalendarAPIError):
-                continue
+        # Cache and create pending contacts serially: accounts share attendees
+        for outcome in fetched:
+            if not outcome.ok:
+                if isinstance(outcome.error, CalendarAPIError):
+                    continue
+                raise outcome.error
+
+            account = outcome.item[0]
+            events = self._cache_events(account, outcome.value)
+            events_synced += len(events)
+
+            # Process attendees for pending contacts
+            for event in events:
+                pending_created += self._process_attendees_for_pending(event)
 
         self.db.commit()
         return {
@@ -864,24 +821,32 @@ class CalendarService:
 
         events_processed = 0
         interactions_created = 0
+        touched_person_ids: set[UUID] = set()
 
         for event in events:
             events_processed += 1
-            created = self._create_interactions_for_event(event)
+            created = self._create_interactions_for_event(event, touched_person_ids)
             interactions_created += created
 
+        refresh_contact_stats(self.db, touched_person_ids)
         self.db.commit()
         return {
             "events_processed": events_processed,
             "interactions_created": interactions_created,
         }
 
-    def _create_interactions_for_event(self, event: CalendarEvent) -> int:
+    def _create_interactions_for_event(
+        self,
+        event: CalendarEvent,
+        touched_person_ids: set[UUID] | None = None,
+    ) -> int:
         """
         Create interactions for all known attendees of an event.
 
         Args:
             event: CalendarEvent to process
+            touched_person_ids: Optional set collecting persons that received
+                new interactions (for a batched contact stats refresh)
 
         Returns:
             Number of interactions created
@@ -930,6 +895,8 @@ class CalendarService:
             )
             self.db.add(interaction)
             created += 1
+            if touched_person_ids is not None:
+                touched_person_ids.add(person_id)
 
         return created
 
@@ -960,15 +927,7 @@ class CalendarService:
     def _get_credentials(self, account: GoogleAccount) -> Credentials:
         """Get OAuth credentials for a Google account."""
         try:
-            creds_dict = account.get_credentials()
-            return Credentials(
-                token=creds_dict.get("token"),
-                refresh_token=creds_dict.get("refresh_token"),
-                token_uri=creds_dict.get("token_uri", "https://oauth2.googleapis.com/token"),
-                client_id=creds_dict.get("client_id"),
-                client_secret=creds_dict.get("client_secret"),
-                scopes=creds_dict.get("scopes", CALENDAR_SCOPES),
-            )
+            return get_credentials(account, CALENDAR_SCOPES)
         except Exception as e:
             raise CalendarAuthError(f"Failed to get credentials: {e}")
 
@@ -978,6 +937,62 @@ class CalendarService:
         event_data: dict[str, Any],
     ) -> CalendarEvent | None:
         """Cache a calendar event in the database (upsert)."""
+        cached = self._cache_events(account, [event_data])
+        return cached[0] if cached else None
+
+    def _cache_events(
+        self,
+        account: GoogleAccount,
+        events_data: list[dict[str, Any]],
+    ) -> list[CalendarEvent]:
+        """
+        Cache a page of calendar events (upsert), returning the cached rows.
+
+        One INSERT ... ON CONFLICT (google_account_id, google_event_id)
+        DO UPDATE per UPSERT_BATCH_SIZE events instead of a SELECT per event.
+        Events without an ID or parseable times are skipped.
+        """
+        # A page may repeat an event; ON CONFLICT cannot touch a row twice
+        rows_by_id: dict[str, dict[str, Any]] = {}
+        for event_data in events_data:
+            row = self._event_row(account, event_data)
+            if row:
+                rows_by_id[row["google_event_id"]] = row
+        rows = list(rows_by_id.values())
+
+        cached_events: list[CalendarEvent] = []
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = pg_insert(CalendarEvent).values(rows[start:start + UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[CalendarEvent.google_account_id, CalendarEvent.google_event_id],
+                set_={
+                    **{column: stmt.excluded[column] for column in UPSERT_COLUMNS},
+                    # Column onupdate defaults do not apply to ON CONFLICT
+                    "updated_at": func.now(),
+                },
+            ).returning(CalendarEvent)
+            cached_events.extend(
+                self.db.scalars(stmt, execution_options={"populate_existing": True})
+            )
+        return cached_events
+
+    def _delete_events(self, account: GoogleAccount, google_event_ids: list[str]) -> int:
+        """Delete cached events by Google ID in one statement."""
+        if not google_event_ids:
+            return 0
+        return self.db.execute(
+            delete(CalendarEvent)
+            .where(CalendarEvent.google_account_id == account.id)
+            .where(CalendarEvent.google_event_id.in_(google_event_ids)),
+            execution_options={"synchronize_session": False},
+        ).rowcount
+
+    def _event_row(
+        self,
+        account: GoogleAccount,
+        event_data: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """Map a Calendar API event to calendar_events column values."""
         google_event_id = event_data.get("id")
         if not google_event_id:
             return None
@@ -1005,62 +1020,27 @@ class CalendarService:
 
         # Get organizer email
         organizer = event_data.get("organizer", {})
-        organizer_email = organizer.get("email")
-
-        # Check for recurring event
-        is_recurring = "recurringEventId" in event_data
-        recurring_event_id = event_data.get("recurringEventId")
-
-        # Upsert event
-        existing = (
-            self.db.query(CalendarEvent)
-            .filter_by(
-                google_account_id=account.id,
-                google_event_id=google_event_id,
-            )
-            .first()
-        )
-
-        # Get the direct link to view in Google Calendar
-        html_link = event_data.get("htmlLink")
 
         # Get event color (convert Google's colorId to our color name)
         color_id = event_data.get("colorId")
-        calendar_color = GOOGLE_COLOR_ID_TO_NAME.get(color_id) if color_id else None
-
-        if existing:
-            # Update existing event
-            existing.summary = event_data.get("summary")
-            existing.description = event_data.get("description")
-            existing.start_time = start_time
-            existing.end_time = end_time
-            existing.location = event_data.get("location")
-            existing.attendees = attendees if attendees else None
-            existing.is_recurring = is_recurring
-            existing.recurring_event_id = recurring_event_id
-            existing.organizer_email = organizer_email
-            existing.html_link = html_link
-            existing.calendar_color = calendar_color
-            return existing
-        else:
-            # Create new event
-            event = CalendarEvent(
-                google_account_id=account.id,
-                google_event_id=google_event_id,
-                summary=event_data.get("summary"),
-                description=event_data.get("description"),
-                start_time=start_time,
-                end_time=end_time,
-                location=event_data.get("location"),
-                attendees=attendees if attendees else None,
-                is_recurring=is_recurring,
-                recurring_event_id=recurring_event_id,
-                organizer_email=organizer_email,
-                html_link=html_link,
-                calendar_color=calendar_color,
-            )
-            self.db.add(event)
-            return event
+
+        return {
+            "id": uuid4(),
+            "google_account_id": account.id,
+            "google_event_id": google_event_id,
+            "summary": event_data.get("summary"),
+            "description": event_data.get("description"),
+            "start_time": start_time,
+            "end_time": end_time,
+            "location": event_data.get("location"),
+            "attendees": attendees if attendees else None,
+            "is_recurring": "recurringEventId" in event_data,
+            "recurring_event_id": event_data.get("recurringEventId"),
+            "organizer_email": organizer.get("email"),
+            # Direct link to view in Google Calendar
+            "html_link": event_data.get("htmlLink"),
+            "calendar_color": GOOGLE_COLOR_ID_TO_NAME.get(color_id) if color_id else None,
+        }
 
     def _parse_event_time(self, time_data: dict[str, str]) -> datetime | None:
         """Parse event start/end time from Google Calendar API response."""
@@ -1081,23 +1061,8 @@ class CalendarService:
         return None
 
     def _find_person_by_email(self, email: str) -> UUID | None:
-        """Find a person by email address (cached lookup)."""
-        email_lower = email.lower()
-
-        # Build cache on first lookup
-        if self._email_to_person_cache is None:
-            self._email_to_person_cache = {}
-            person_emails = self.db.query(PersonEmail).all()
-            for pe in person_emails:
-                self._email_to_person_cache[pe.email.lower()] = pe.person_id
-
-            # Also check legacy email field
-            persons = self.db.query(Person).filter(Person.email.isnot(None)).all()
-            for p in persons:
-                if p.email and p.email.lower() not in self._email_to_person_cache:
-                    self._email_to_person_cache[p.email.lower()] = p.id
-
-        return self._email_to_person_cache.get(email_lower)
+        """Find a person by email address (shared email -> person index)."""
+        return get_email_person_index(self.db).get(email.lower())
 
     def _process_attendees_for_pending(self, event: CalendarEvent) -> int:
         """
@@ -0,0 +1,429 @@
+"""
+Calendar Sync Service for keeping calendar_events current.
+
+Handles full sync and incremental sync using Calendar API sync tokens, so
+calendar views can read only the local table instead of calling Google on
+every render. Run periodically by app.tasks.calendar_sync and on demand
+from the calendar "refresh" action.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from googleapiclient.errors import HttpError
+from sqlalchemy.orm import Session
+
+from app.models import CalendarEvent, CalendarSyncState, GoogleAccount
+from app.services.calendar_service import CalendarService
+from app.services.google_clients import service_for
+from app.services.google_executor import execute, get_google_executor
+
+logger = logging.getLogger(__name__)
+
+# Window fetched by a full sync; later changes to any event arrive via the
+# sync token regardless of window
+FULL_SYNC_PAST_DAYS = 90
+FULL_SYNC_FUTURE_DAYS = 365
+
+PAGE_SIZE = 250
+
+# One sync at a time per process (scheduled job vs. refresh button)
+_sync_lock = threading.Lock()
+
+# Out-of-window ranges requested by views, fetched one at a time in the
+# background so renders never wait for Google or for a running sync
+_range_fetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calendar-range")
+_pending_ranges: set[tuple] = set()
+_pending_lock = threading.Lock()
+
+
+class SyncTokenExpiredError(Exception):
+    """Raised when Google rejects a sync token with 410 Gone."""
+    pass
+
+
+@dataclass
+class CalendarSyncResult:
+    """Result of a calendar sync operation."""
+    success: bool
+    events_synced: int = 0
+    events_deleted: int = 0
+    full_sync: bool = False
+    errors: list[str] = field(default_factory=list)
+
+
+class CalendarSyncService:
+    """
+    Service for syncing Google Calendar events to the local database.
+
+    Supports:
+    - Full sync: all events in a window around today, then stores the sync token
+    - Incremental sync: only events changed or cancelled since the last token
+    - 410 Gone recovery: drops the expired token and re-runs a full sync
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        # Reuses the event parsing/upsert of the on-demand calendar service
+        self._calendar = CalendarService(db)
+
+    def sync_account(self, account: GoogleAccount) -> CalendarSyncResult:
+        """
+        Sync one account, incrementally when a sync token is stored.
+
+        Args:
+            account: Google account to sync
+
+        Returns:
+            CalendarSyncResult with sync statistics
+        """
+        sync_state = self._get_or_create_sync_state(account)
+        if sync_state.needs_full_sync:
+            return self.full_sync(account)
+        return self.incremental_sync(account)
+
+    def full_sync(self, account: GoogleAccount) -> CalendarSyncResult:
+        """
+        Fetch every event in the sync window and store the new sync token.
+
+        Local events in the window that Google no longer returns are deleted,
+        which is the "wipe and resync" Google asks for after 410 Gone.
+
+        Args:
+            account: Google account to sync
+
+        Returns:
+            CalendarSyncResult with sync statistics
+        """
+        sync_state = self._get_or_create_sync_state(account)
+        sync_state.start_sync()
+        self.db.commit()
+
+        now = datetime.now(timezone.utc)
+        window_start = now - timedelta(days=FULL_SYNC_PAST_DAYS)
+        window_end = now + timedelta(days=FULL_SYNC_FUTURE_DAYS)
+
+        try:
+            service = service_for(self._calendar._get_credentials(account), "calendar", "v3")
+            events_synced, events_deleted, sync_token = self._sync_range(
+                account, service, window_start, window_end
+            )
+
+            sync_state.window_start = window_start
+            sync_state.window_end = window_end
+            sync_state.complete_sync(sync_token=sync_token, events_synced=events_synced, is_full_sync=True)
+            self.db.commit()
+
+            return CalendarSyncResult(
+                success=True,
+                events_synced=events_synced,
+                events_deleted=events_deleted,
+                full_sync=True,
+            )
+
+        except Exception as e:
+            return self._fail(sync_state, e, full_sync=True)
+
+    def incremental_sync(self, account: GoogleAccount) -> CalendarSyncResult:
+        """
+        Apply changes since the stored sync token.
+
+        Falls back to a full sync when there is no token or Google reports
+        the token expired (410 Gone).
+
+        Args:
+            account: Google account to sync
+
+        Returns:
+            CalendarSyncResult with sync statistics
+        """
+        sync_state = self._get_or_create_sync_state(account)
+        if sync_state.needs_full_sync:
+            return self.full_sync(account)
+
+        sync_state.start_sync()
+        self.db.commit()
+
+        try:
+            service = service_for(self._calendar._get_credentials(account), "calendar", "v3")
+            token = sync_state.sync_token
+            events_synced, events_deleted, sync_token = self._apply_pages(
+                account,
+                lambda page_token: execute(service.events().list(
+                    calendarId="primary",
+                    syncToken=token,
+                    singleEvents=True,
+                    maxResults=PAGE_SIZE,
+                    pageToken=page_token,
+                )),
+            )
+
+            sync_state.complete_sync(sync_token=sync_token, events_synced=events_synced, is_full_sync=False)
+            self.db.commit()
+
+            return CalendarSyncResult(
+                success=True,
+                events_synced=events_synced,
+                events_deleted=events_deleted,
+            )
+
+        except SyncTokenExpiredError:
+            self.db.rollback()
+            logger.info(f"Calendar sync token expired for {account.email}, running full sync")
+            sync_state.reset_sync_token()
+            self.db.commit()
+            return self.full_sync(account)
+
+        except Exception as e:
+            return self._fail(sync_state, e, full_sync=False)
+
+    def sync_all_accounts(self, session_factory: Callable[[], Session] | None = None) -> dict[str, CalendarSyncResult]:
+        """
+        Sync all active Google accounts concurrently.
+
+        Each account syncs in a Google executor worker with its own session
+        (sessions are not thread-safe); accounts never share event rows.
+
+        Args:
+            session_factory: Creates the per-account sessions (defaults to SessionLocal)
+
+        Returns:
+            Dictionary mapping account email to CalendarSyncResult
+        """
+        if session_factory is None:
+            from app.database import SessionLocal
+            session_factory = SessionLocal
+
+        results = {}
+        with _sync_lock:
+            accounts = self.db.query(GoogleAccount.id, GoogleAccount.email).filter_by(is_active=True).all()
+            outcomes = get_google_executor().map(
+                lambda account: _sync_account_in_session(session_factory, account.id),
+                accounts,
+                account_key=lambda account: account.id,
+            )
+            for outcome in outcomes:
+                if outcome.ok:
+                    results[outcome.item.email] = outcome.value
+                else:
+                    results[outcome.item.email] = CalendarSyncResult(success=False, errors=[str(outcome.error)])
+        return results
+
+    def refresh(self, account_id=None) -> dict[str, CalendarSyncResult]:
+        """
+        Sync now, for the explicit "refresh" action.
+
+        Args:
+            account_id: Optional UUID to sync only one account
+
+        Returns:
+            Dictionary mapping account email to CalendarSyncResult
+        """
+        if account_id is None:
+            return self.sync_all_accounts()
+
+        with _sync_lock:
+            account = self.db.query(GoogleAccount).filter_by(id=account_id, is_active=True).first()
+            if not account:
+                return {}
+            return {account.email: self.sync_account(account)}
+
+    def ensure_range(
+        self,
+        start: datetime,
+        end: datetime,
+        account_id=None,
+        session_factory: Callable[[], Session] | None = None,
+    ) -> list[Future]:
+        """
+        Queue fetches of [start, end) for synced accounts whose range lacks it.
+
+        Views read only the local table, while a full sync covers
+        FULL_SYNC_PAST_DAYS back and FULL_SYNC_FUTURE_DAYS ahead. For an
+        account whose synced range does not cover the request, fetching the
+        missing part is queued (see fetch_range) and the view renders the
+        local rows now; the next render shows the fetched events. Accounts
+        never synced are left to the background sync.
+
+        Args:
+            start: Start of the range (timezone-aware)
+            end: End of the range (timezone-aware)
+            account_id: Optional UUID to check only one account
+            session_factory: Creates the fetch session (defaults to SessionLocal)
+
+        Returns:
+            Futures of the fetches queued by this call
+        """
+        states = (
+            self.db.query(CalendarSyncState)
+            .join(GoogleAccount, GoogleAccount.id == CalendarSyncState.google_account_id)
+            .filter(GoogleAccount.is_active.is_(True))
+            .filter(CalendarSyncState.window_start.isnot(None))
+            .filter(CalendarSyncState.window_end.isnot(None))
+        )
+        if account_id:
+            states = states.filter(CalendarSyncState.google_account_id == account_id)
+        missing = [state.google_account_id for state in states if not state.covers(start, end)]
+        if not missing:
+            return []
+
+        if session_factory is None:
+            from app.database import SessionLocal
+            session_factory = SessionLocal
+
+        futures = []
+        for missing_account_id in missing:
+            key = (missing_account_id, start, end)
+            with _pending_lock:
+                # Re-renders of the same view while its fetch is queued
+                if key in _pending_ranges:
+                    continue
+                _pending_ranges.add(key)
+            futures.append(_range_fetcher.submit(_fetch_range_in_session, session_factory, *key))
+        return futures
+
+    def fetch_range(self, account_id, start: datetime, end: datetime) -> None:
+        """
+        Fetch the part of [start, end) outside an account's synced range and widen it.
+
+        Only the edges are fetched, so the widened range stays contiguous;
+        the sync token then keeps it current. Errors are logged and the
+        range left unchanged.
+        """
+        sync_state = self.db.query(CalendarSyncState).filter_by(google_account_id=account_id).first()
+        if sync_state is None or sync_state.window_start is None or sync_state.window_end is None:
+            return
+        account = sync_state.google_account
+        try:
+            service = service_for(self._calendar._get_credentials(account), "calendar", "v3")
+            if start < sync_state.window_start:
+                self._sync_range(account, service, start, sync_state.window_start)
+                sync_state.window_start = start
+            if end > sync_state.window_end:
+                self._sync_range(account, service, sync_state.window_end, end)
+                sync_state.window_end = end
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"Failed to fetch calendar range for {account.email}: {e}")
+
+    def _sync_range(self, account: GoogleAccount, service, start: datetime, end: datetime):
+        """
+        Store every event in [start, end) and delete local ones Google no longer returns.
+
+        Returns:
+            (events upserted, events deleted, nextSyncToken)
+        """
+        seen_ids: set[str] = set()
+        events_synced, events_deleted, sync_token = self._apply_pages(
+            account,
+            lambda page_token: execute(service.events().list(
+                calendarId="primary",
+                timeMin=start.isoformat(),
+                timeMax=end.isoformat(),
+                singleEvents=True,
+                maxResults=PAGE_SIZE,
+                pageToken=page_token,
+            )),
+            seen_ids,
+        )
+
+        stale = (
+            self.db.query(CalendarEvent)
+            .filter(CalendarEvent.google_account_id == account.id)
+            .filter(CalendarEvent.start_time >= start)
+            .filter(CalendarEvent.start_time < end)
+        )
+        if seen_ids:
+            stale = stale.filter(CalendarEvent.google_event_id.notin_(seen_ids))
+        events_deleted += stale.delete(synchronize_session=False)
+        return events_synced, events_deleted, sync_token
+
+    def _apply_pages(self, account: GoogleAccount, fetch_page, seen_ids: set[str] | None = None):
+        """
+        Apply every page of an events.list feed to calendar_events.
+
+        Returns:
+            (events upserted, events deleted, nextSyncToken from the last page)
+
+        Raises:
+            SyncTokenExpiredError: If Google answers 410 Gone
+        """
+        events_synced = 0
+        events_deleted = 0
+        page_token = None
+        while True:
+            try:
+                response = fetch_page(page_token)
+            except HttpError as e:
+                if e.resp.status == 410:
+                    raise SyncTokenExpiredError(str(e))
+                raise
+
+            # Latest state per event on this page
+            page = {item["id"]: item for item in response.get("items", []) if item.get("id")}
+            cancelled = [event_id for event_id, item in page.items() if item.get("status") == "cancelled"]
+            live = [item for item in page.values() if item.get("status") != "cancelled"]
+
+            # One DELETE and one upsert per page instead of a query per event
+            events_deleted += self._calendar._delete_events(account, cancelled)
+            cached = self._calendar._cache_events(account, live)
+            events_synced += len(cached)
+            if seen_ids is not None:
+                seen_ids.update(event.google_event_id for event in cached)
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return events_synced, events_deleted, response.get("nextSyncToken")
+
+    def _fail(self, sync_state: CalendarSyncState, error: Exception, full_sync: bool) -> CalendarSyncResult:
+        self.db.rollback()
+        sync_state.fail_sync(str(error))
+        self.db.commit()
+        return CalendarSyncResult(success=False, full_sync=full_sync, errors=[str(error)])
+
+    def _get_or_create_sync_state(self, account: GoogleAccount) -> CalendarSyncState:
+        """Get or create sync state for an account."""
+        sync_state = self.db.query(CalendarSyncState).filter_by(
+            google_account_id=account.id
+        ).first()
+
+        if not sync_state:
+            sync_state = CalendarSyncState(google_account_id=account.id)
+            self.db.add(sync_state)
+            self.db.flush()
+
+        return sync_state
+
+
+def _sync_account_in_session(session_factory: Callable[[], Session], account_id) -> CalendarSyncResult:
+    """Sync one account in a fresh session (runs in a Google executor worker)."""
+    with session_factory() as db:
+        account = db.get(GoogleAccount, account_id)
+        return CalendarSyncService(db).sync_account(account)
+
+
+def _fetch_range_in_session(
+    session_factory: Callable[[], Session],
+    account_id,
+    start: datetime,
+    end: datetime,
+) -> None:
+    """Fetch a queued range in a fresh session, after any running sync."""
+    try:
+        with _sync_lock, session_factory() as db:
+            CalendarSyncService(db).fetch_range(account_id, start, end)
+    except Exception as e:
+        logger.warning(f"Queued calendar range fetch failed for account {account_id}: {e}")
+    finally:
+        with _pending_lock:
+            _pending_ranges.discard((account_id, start, end))
+
+
+def get_calendar_sync_service(db: Session) -> CalendarSyncService:
+    """Get a Calendar sync service instance."""
+    return CalendarSyncService(db)
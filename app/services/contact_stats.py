@@ -0,0 +1,85 @@
+"""
+Denormalized contact statistics on persons.
+
+`persons.last_contact_at` and `persons.interaction_count` mirror the
+interactions table so list pages can show, sort and filter by "last
+contacted" from an index instead of loading every interaction row.
+
+Every code path that creates, edits, re-assigns or deletes interactions
+calls refresh_contact_stats() for the affected persons before committing.
+"""
+
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import DateTime, cast, func, select, update
+from sqlalchemy.orm import Session
+
+from app.models import Interaction, Person
+
+
+def _last_contact_expr():
+    """Interaction date (as midnight UTC) falling back to when it was logged."""
+    return func.coalesce(
+        func.timezone("UTC", cast(Interaction.interaction_date, DateTime)),
+        Interaction.created_at,
+    )
+
+
+def _stats_values() -> dict:
+    """Correlated subqueries recomputing both columns for each updated person."""
+    return {
+        "interaction_count": (
+            select(func.count(Interaction.id))
+            .where(Interaction.person_id == Person.id)
+            .scalar_subquery()
+        ),
+        "last_contact_at": (
+            select(func.max(_last_contact_expr()))
+            .where(Interaction.person_id == Person.id)
+            .scalar_subquery()
+        ),
+    }
+
+
+def refresh_contact_stats(db: Session, person_ids: Iterable[UUID | None]) -> None:
+    """
+    Recompute last_contact_at/interaction_count for the given persons.
+
+    Pending changes are flushed first so new, edited and deleted interactions
+    are all reflected. Only the listed persons are touched, each via the
+    interactions.person_id index, in a single UPDATE.
+
+    Args:
+        db: Database session (caller commits)
+        person_ids: Persons whose interactions changed; None entries are ignored
+    """
+    ids = {pid for pid in person_ids if pid}
+    if not ids:
+        return
+
+    db.flush()
+    db.execute(
+        update(Person)
+        .where(Person.id.in_(ids))
+        .values(**_stats_values())
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+def backfill_contact_stats(db: Session) -> int:
+    """
+    Recompute contact statistics for every person.
+
+    Used after bulk imports or to repair drift. Does not commit.
+
+    Returns:
+        Number of persons updated
+    """
+    db.flush()
+    result = db.execute(
+        update(Person)
+        .values(**_stats_values())
+        .execution_options(synchronize_session="fetch")
+    )
+    return result.rowcount
@@ -11,7 +11,6 @@ from typing import Any
 from uuid import UUID
 
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from sqlalchemy.orm import Session, selectinload
 
@@ -104,6 +103,8 @@ from app.models.tag_subcategory import (
     GOOGLE_LABEL_TO_SUBCATEGORY,
 )
 from app.services.google_auth import CONTACTS_SCOPES
+from app.services.google_clients import get_credentials, service_for
+from app.services.google_executor import execute, get_google_executor
 
 
 class ContactsServiceError(Exception):
@@ -220,8 +221,6 @@ class ContactsService:
         self._persons_by_email: dict[str, list[Person]] = {}
         self._persons_by_phone: dict[str, list[Person]] = {}
         self._persons_by_linkedin: dict[str, list[Person]] = {}
-        # Legacy cache for backwards compatibility
-        self._email_to_person_cache: dict[str, UUID] | None = None
 
     def _fetch_contact_groups(self, service: Any) -> dict[str, str]:
         """
@@ -237,10 +236,10 @@ class ContactsService:
         try:
             page_token = None
             while True:
-                results = service.contactGroups().list(
+                results = execute(service.contactGroups().list(
                     pageSize=200,
                     pageToken=page_token,
-                ).execute()
+                ))
 
                 for group in results.get("contactGroups", []):
                     resource_name = group.get("resourceName", "")
@@ -285,10 +284,11 @@ class ContactsService:
         """
         try:
             credentials = self._get_credentials(account)
-            service = build("people", "v1", credentials=credentials)
+            service = service_for(credentials, "people", "v1")
 
-            # First, fetch contact groups to map IDs to names
-            self._contact_groups_cache = self._fetch_contact_groups(service)
+            # First, fetch contact groups to map IDs to names (kept local:
+            # several accounts may be fetched concurrently)
+            contact_groups = self._fetch_contact_groups(service)
 
             contacts: list[GoogleContact] = []
             saved_count = 0
@@ -299,16 +299,16 @@ class ContactsService:
             # ========================================
             page_token = None
             while True:
-                results = service.people().connections().list(
+                results = execute(service.people().connections().list(
                     resourceName="people/me",
                     pageSize=1000,
                     personFields="names,nicknames,emailAddresses,phoneNumbers,photos,organizations,metadata,birthdays,biographies,addresses,memberships,urls",
                     pageToken=page_token,
-                ).execute()
+                ))
 
                 connections = results.get("connections", [])
                 for person_data in connections:
-                    contact = self._parse_contact(person_data)
+                    contact = self._parse_contact(person_data, contact_groups=contact_groups)
                     if contact:
                         contacts.append(contact)
                         saved_count += 1
@@ -334,15 +334,17 @@ class ContactsService:
                 while True:
                     try:
                         # Note: otherContacts has limited fields available
-                        results = service.otherContacts().list(
+                        results = execute(service.otherContacts().list(
                             pageSize=1000,
                             readMask="names,emailAddresses,phoneNumbers,photos,metadata",
                             pageToken=page_token,
-                        ).execute()
+                        ))
 
                         other_contacts_data = results.get("otherContacts", [])
                         for person_data in other_contacts_data:
-                            contact = self._parse_contact(person_data, is_other_contact=True)
+                            contact = self._parse_contact(
+                                person_data, is_other_contact=True, contact_groups=contact_groups
+                            )
                             if contact:
                                 # Skip if we already have this email from saved contacts
                                 primary_email = contact.primary_email
@@ -376,6 +378,7 @@ class ContactsService:
         self, 
         account_id: UUID,
         include_other_contacts: bool = True,
+        prefetched: tuple[list[GoogleContact], int, int] | None = None,
     ) -> SyncResult:
         """
         Sync contacts from a Google account into BlackBook.
@@ -390,6 +393,7 @@ class ContactsService:
         Args:
             account_id: UUID of the Google account to sync
             include_other_contacts: Whether to include "Other contacts" (default True)
+            prefetched: fetch_contacts() result to merge instead of fetching again
 
         Returns:
             SyncResult with sync statistics
@@ -405,10 +409,12 @@ class ContactsService:
         self._build_person_indexes()
 
         # Fetch contacts from Google (both saved and other contacts)
-        contacts, saved_count, other_count = self.fetch_contacts(
-            account, 
-            include_other_contacts=include_other_contacts
-        )
+        if prefetched is None:
+            prefetched = self.fetch_contacts(
+                account, 
+                include_other_contacts=include_other_contacts
+            )
+        contacts, saved_count, other_count = prefetched
 
         result = SyncResult(
             contacts_fetched=len(contacts),
@@ -450,15 +456,27 @@ class ContactsService:
         """
         Sync contacts from all active Google accounts.
 
+        Contacts of all accounts are fetched concurrently, then merged one
+        account at a time: merging matches and creates persons, so accounts
+        sharing a contact must not race to create it twice.
+
         Returns:
             Dict mapping account email to SyncResult
         """
         accounts = self.db.query(GoogleAccount).filter_by(is_active=True).all()
         results = {}
 
-        for account in accounts:
+        fetched = get_google_executor().map(
+            self.fetch_contacts,
+            accounts,
+            account_key=lambda account: account.id,
+        )
+
+        for account, outcome in zip(accounts, fetched):
             try:
-                result = self.sync_contacts(account.id)
+                if not outcome.ok:
+                    raise outcome.error
+                result = self.sync_contacts(account.id, prefetched=outcome.value)
                 results[account.email] = result
             except (ContactsAuthError, ContactsAPIError) as e:
                 # Log error but continue with other accounts
@@ -475,15 +493,7 @@ class ContactsService:
     def _get_credentials(self, account: GoogleAccount) -> Credentials:
         """Get OAuth credentials for a Google account."""
         try:
-            creds_dict = account.get_credentials()
-            return Credentials(
-                token=creds_dict.get("token"),
-                refresh_token=creds_dict.get("refresh_token"),
-                token_uri=creds_dict.get("token_uri", "https://oauth2.googleapis.com/token"),
-                client_id=creds_dict.get("client_id"),
-                client_secret=creds_dict.get("client_secret"),
-                scopes=creds_dict.get("scopes", CONTACTS_SCOPES),
-            )
+            return get_credentials(account, CONTACTS_SCOPES)
         except Exception as e:
             raise ContactsAuthError(f"Failed to get credentials: {e}")
 
@@ -491,13 +501,18 @@ class ContactsService:
         self, 
         person_data: dict[str, Any],
         is_other_contact: bool = False,
+        contact_groups: dict[str, str] | None = None,
     ) -> GoogleContact | None:
         """Parse Google People API response into GoogleContact.
         
         Args:
             person_data: Raw data from Google People API
             is_other_contact: True if this is from otherContacts (limited fields)
+            contact_groups: Group resourceName -> name (defaults to the cached groups)
         """
+        if contact_groups is None:
+            contact_groups = self._contact_groups_cache
+
         resource_name = person_data.get("resourceName")
         if not resource_name:
             return None
@@ -558,8 +573,8 @@ class ContactsService:
             contact_group = membership.get("contactGroupMembership", {})
             group_resource = contact_group.get("contactGroupResourceName", "")
             # Look up the group display name in our cache
-            if group_resource and self._contact_groups_cache:
-                group_display_name = self._contact_groups_cache.get(group_resource)
+            if group_resource and contact_groups:
+                group_display_name = contact_groups.get(group_resource)
                 if group_display_name:
                     labels.append(group_display_name)
 
@@ -598,24 +613,6 @@ class ContactsService:
             nickname=nickname,
         )
 
-    def _build_email_cache(self) -> None:
-        """Build cache mapping emails to person IDs."""
-        self._email_to_person_cache = {}
-
-        # Get all PersonEmail records
-        person_emails = self.db.query(PersonEmail).all()
-        for pe in person_emails:
-            self._email_to_person_cache[pe.email.lower()] = pe.person_id
-
-        # Also check legacy email field
-        persons = self.db.query(Person).filter(Person.email.isnot(None)).all()
-        for p in persons:
-            if p.email:
-                for email in p.email.split(","):
-                    email = email.strip().lower()
-                    if email and email not in self._email_to_person_cache:
-                        self._email_to_person_cache[email] = p.id
-
     def _build_person_indexes(self) -> None:
         """
         Build comprehensive in-memory indexes for fast contact matching.
@@ -719,13 +716,6 @@ class ContactsService:
 
         self._indexes_built = True
 
-        # Also populate legacy cache for backwards compatibility
-        self._email_to_person_cache = {
-            email: persons[0].id
-            for email, persons in self._persons_by_email.items()
-            if persons
-        }
-
     def _add_person_to_indexes(self, person: Person, emails: list[str] | None = None) -> None:
         """
         Add a newly created person to all in-memory indexes.
@@ -766,9 +756,6 @@ class ContactsService:
                     self._persons_by_email[email_lower] = []
                 if person not in self._persons_by_email[email_lower]:
                     self._persons_by_email[email_lower].append(person)
-                # Also update legacy cache
-                if self._email_to_person_cache is not None:
-                    self._email_to_person_cache[email_lower] = person.id
 
         # Index by phone
         if person.phone:
@@ -1148,10 +1135,6 @@ class ContactsService:
             self.db.add(person_email)
             self.db.flush()  # Flush each email immediately to catch duplicates early
 
-            # Update cache
-            if self._email_to_person_cache is not None:
-                self._email_to_person_cache[email_lower] = person.id
-
         # Assign Google labels as tags
         if contact.labels:
             self._assign_tags_to_person(person, contact.labels)
@@ -1317,8 +1300,6 @@ class ContactsService:
 
                 # Update caches/indexes
                 email_lower = email.lower()
-                if self._email_to_person_cache is not None:
-                    self._email_to_person_cache[email_lower] = person.id
                 if self._indexes_built:
                     if email_lower not in self._persons_by_email:
                         self._persons_by_email[email_lower] = []
@@ -1462,7 +1443,7 @@ class ContactsService:
 
         try:
             credentials = self._get_credentials(account)
-            service = build("people", "v1", credentials=credentials)
+            service = service_for(credentials, "people", "v1")
 
             contact_body: dict[str, Any] = {
                 "names": [{"givenName": person.first_name or "", "familyName": person.last_name or ""}]
@@ -1558,7 +1539,7 @@ class ContactsService:
         for account in accounts:
             try:
                 credentials = self._get_credentials(account)
-                service = build("people", "v1", credentials=credentials)
+                service = service_for(credentials, "people", "v1")
 
                 # Delete the contact - use appropriate API based on resource type
                 if resource_name.startswith("otherContacts/"):
@@ -1569,7 +1550,7 @@ class ContactsService:
                     return True
                 else:
                     # Regular contacts use people.deleteContact() API
-                    service.people().deleteContact(resourceName=resource_name).execute()
+                    execute(service.people().deleteContact(resourceName=resource_name))
 
                 return True
 
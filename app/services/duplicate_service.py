@@ -14,6 +14,7 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models import Person, PersonEmail, PersonPhone, PersonOrganization, Tag, Interaction, DuplicateExclusion
+from app.services.contact_stats import refresh_contact_stats
 
 
 # Comprehensive nickname/abbreviation mappings
@@ -573,6 +574,7 @@ class DuplicateService:
             # Delete the merged person
             self.db.delete(merge_person)
 
+        refresh_contact_stats(self.db, [keep_id])
         self.db.commit()
         return result
 
@@ -0,0 +1,138 @@
+"""
+Process-wide compiled matcher for the email ignore list.
+
+GmailService used to load EmailIgnoreList rows per instance and test every
+participant against every pattern with string logic. The list is now
+compiled once into an IgnoreMatcher and shared by the live Gmail search,
+local email history and the Gmail sync pipeline:
+
+- Exact email patterns go into a set of addresses.
+- Domain patterns go into a set of domains (the part after "@").
+- Wildcard email patterns ("noreply@*", "*@domain.com") are combined into
+  one regex.
+
+The matcher is rebuilt on the next lookup after any EmailIgnoreList row is
+added, changed or deleted through a session (settings page, tests), and
+after MATCHER_MAX_AGE_SECONDS for writes made outside this process.
+"""
+
+import re
+import threading
+import time
+from typing import Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models import EmailIgnoreList, IgnorePatternType
+
+MATCHER_MAX_AGE_SECONDS = 600
+
+# session.info key: ignore list changed in this transaction
+_CHANGED_KEY = "email_ignore_matcher_changed"
+
+_lock = threading.Lock()
+_version = 0
+_matcher: "IgnoreMatcher | None" = None
+_matcher_version = -1
+_built_at = 0.0
+
+
+def wildcard_regex(pattern: str) -> str:
+    """Regex source for an email pattern with * wildcards (e.g. "noreply@.*")."""
+    return ".*".join(re.escape(part) for part in pattern.split("*"))
+
+
+class IgnoreMatcher:
+    """Compiled ignore patterns; matches lowercase or mixed-case addresses."""
+
+    def __init__(self, patterns: Iterable[tuple[str, str]]):
+        self.emails: set[str] = set()
+        self.domains: set[str] = set()
+        wildcards: list[str] = []
+        for pattern, pattern_type in patterns:
+            pattern = pattern.strip().lower()
+            if not pattern:
+                continue
+            if pattern_type == IgnorePatternType.domain.value:
+                self.domains.add(pattern.lstrip("@"))
+            elif "*" in pattern:
+                wildcards.append(wildcard_regex(pattern))
+            else:
+                self.emails.add(pattern)
+        self.wildcard = re.compile("|".join(wildcards)) if wildcards else None
+
+    def __bool__(self) -> bool:
+        return bool(self.emails or self.domains or self.wildcard)
+
+    def matches(self, email: str | None) -> bool:
+        """Whether an address is on the ignore list."""
+        if not email:
+            return False
+        email = email.strip().lower()
+        if email in self.emails:
+            return True
+        if self.domains and "@" in email and email.rpartition("@")[2] in self.domains:
+            return True
+        return self.wildcard is not None and self.wildcard.fullmatch(email) is not None
+
+    def matches_any(self, emails: Iterable[str | None]) -> bool:
+        """Whether any of the addresses is on the ignore list."""
+        return any(self.matches(email) for email in emails)
+
+
+def build_ignore_matcher(db: Session) -> IgnoreMatcher:
+    """Compile the current ignore list with one column-only query."""
+    rows = db.query(EmailIgnoreList.pattern, EmailIgnoreList.pattern_type)
+    return IgnoreMatcher((pattern, pattern_type.value) for pattern, pattern_type in rows)
+
+
+def get_ignore_matcher(db: Session) -> IgnoreMatcher:
+    """The shared matcher, rebuilt with db on first use after an invalidation."""
+    global _matcher, _matcher_version, _built_at
+    with _lock:
+        if (
+            _matcher is not None
+            and _matcher_version == _version
+            and time.monotonic() - _built_at < MATCHER_MAX_AGE_SECONDS
+        ):
+            return _matcher
+        version = _version
+
+    matcher = build_ignore_matcher(db)
+    with _lock:
+        # An invalidation during the build may have missed a pattern
+        if version == _version:
+            _matcher, _matcher_version, _built_at = matcher, version, time.monotonic()
+    return matcher
+
+
+def invalidate_ignore_matcher() -> None:
+    """Bump the version; the next lookup recompiles the ignore list."""
+    global _version
+    with _lock:
+        _version += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context) -> None:
+    """Invalidate as soon as ignore patterns are flushed (visible to this session)."""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, EmailIgnoreList):
+            session.info[_CHANGED_KEY] = True
+            invalidate_ignore_matcher()
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session) -> None:
+    # Other sessions may have rebuilt between the flush and this commit
+    if session.info.pop(_CHANGED_KEY, False):
+        invalidate_ignore_matcher()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _invalidate_on_rollback(session, previous_transaction) -> None:
+    # A rebuild through this session may have seen the rolled-back patterns
+    if session.info.pop(_CHANGED_KEY, False):
+        invalidate_ignore_matcher()
@@ -0,0 +1,189 @@
+"""
+Inbox search service.
+
+Parses Gmail-style search input ("from:alice has:attachment after:2025/01/01
+budget") into predicates on `email_messages` that indexes can serve:
+
+- free text matches the `search_vector` full-text column (prefix matching,
+  ranked: subject > sender > recipients > snippet)
+- from:/to: with a full address match `from_email` (btree) or `to_emails`
+  (GIN containment); a name or fragment matches the sender or recipient
+  weight of `search_vector` only
+- before:/after: bound `internal_date`; has:attachment filters on
+  `has_attachments`
+
+This replaces OR-ing ILIKE '%q%' scans over subject, snippet and sender.
+"""
+
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone
+
+from sqlalchemy import func
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models import EmailMessage
+
+
+# Postgres text search configuration used by email_messages.search_vector
+SEARCH_CONFIG = "simple"
+
+# search_vector weights of the sender and recipient fields
+FROM_WEIGHT = "B"
+TO_WEIGHT = "C"
+
+# operator:value, operator:"quoted value", "quoted phrase" or a bare word
+_TERM_RE = re.compile(r'(\w+):(?:"([^"]*)"|(\S+))|"([^"]*)"|(\S+)', re.UNICODE)
+
+# Tokens are restricted to word characters so user input can never
+# inject tsquery operators (&, |, !, :, parentheses)
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_ADDRESS_RE = re.compile(r"^[\w.+-]+@[\w-]+(\.[\w-]+)+$", re.UNICODE)
+
+_DATE_FORMATS = ("%Y/%m/%d", "%Y-%m-%d")
+
+
+@dataclass
+class EmailSearch:
+    """Parsed inbox search input."""
+
+    words: list[str] = field(default_factory=list)
+    phrases: list[list[str]] = field(default_factory=list)
+    from_values: list[str] = field(default_factory=list)
+    to_values: list[str] = field(default_factory=list)
+    has_attachment: bool = False
+    before: date | None = None
+    after: date | None = None
+
+
+def _parse_date(value: str) -> date | None:
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_email_search(q: str | None) -> EmailSearch:
+    """
+    Split search input into operators and free text.
+
+    Supported operators: from:, to:, has:attachment, before:, after:
+    (dates as YYYY/MM/DD or YYYY-MM-DD). Unknown operators and operators
+    with invalid values are searched as plain text.
+    """
+    search = EmailSearch()
+    if not q:
+        return search
+
+    for match in _TERM_RE.finditer(q):
+        operator, quoted_value, value, phrase, word = match.groups()
+        if operator:
+            operator = operator.lower()
+            value = (quoted_value if quoted_value is not None else value).strip()
+            if operator == "from" and value:
+                search.from_values.append(value.lower())
+                continue
+            if operator == "to" and value:
+                search.to_values.append(value.lower())
+                continue
+            if operator == "has" and value.lower() in ("attachment", "attachments"):
+                search.has_attachment = True
+                continue
+            if operator in ("before", "after") and _parse_date(value):
+                setattr(search, operator, _parse_date(value))
+                continue
+            word = match.group(0)
+        elif phrase is not None:
+            tokens = _TOKEN_RE.findall(phrase.lower())
+            if len(tokens) > 1:
+                search.phrases.append(tokens)
+                continue
+            word = phrase
+
+        search.words.extend(_TOKEN_RE.findall(word.lower()))
+
+    return search
+
+
+def _prefix_terms(tokens: list[str], weight: str = "") -> list[str]:
+    """Prefix-match tsquery operands, optionally restricted to a weight."""
+    return [f"{token}:*{weight}" for token in tokens]
+
+
+def build_text_tsquery(search: EmailSearch) -> str | None:
+    """
+    tsquery text for the free-text part of a search.
+
+    Every word must match as a prefix; a quoted phrase must match in order,
+    its last word as a prefix: 'q3 "board deck"' -> "q3:* & (board <-> deck:*)".
+    """
+    operands = _prefix_terms(search.words)
+    for tokens in search.phrases:
+        operands.append("(" + " <-> ".join([*tokens[:-1], f"{tokens[-1]}:*"]) + ")")
+    return " & ".join(operands) or None
+
+
+def _matches(tsquery_text: str) -> ColumnElement[bool]:
+    return EmailMessage.search_vector.op("@@")(func.to_tsquery(SEARCH_CONFIG, tsquery_text))
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def email_search_filters(search: EmailSearch) -> list[ColumnElement[bool]]:
+    """
+    WHERE clauses for a parsed search (all must hold).
+
+    Weighted operands (from:/to: fragments) are folded into the same tsquery
+    as the free text, so one GIN index scan serves them together.
+    """
+    clauses: list[ColumnElement[bool]] = []
+    operands: list[str] = []
+
+    text_query = build_text_tsquery(search)
+    if text_query:
+        operands.append(text_query)
+
+    for value in search.from_values:
+        if _ADDRESS_RE.match(value):
+            clauses.append(EmailMessage.from_email == value)
+        else:
+            operands.extend(_prefix_terms(_TOKEN_RE.findall(value), FROM_WEIGHT))
+
+    for value in search.to_values:
+        if _ADDRESS_RE.match(value):
+            clauses.append(EmailMessage.to_emails.contains([{"email": value}]))
+        else:
+            operands.extend(_prefix_terms(_TOKEN_RE.findall(value), TO_WEIGHT))
+
+    if operands:
+        clauses.append(_matches(" & ".join(operands)))
+
+    if search.has_attachment:
+        clauses.append(EmailMessage.has_attachments.is_(True))
+    if search.after:
+        clauses.append(EmailMessage.internal_date >= _day_start(search.after))
+    if search.before:
+        clauses.append(EmailMessage.internal_date < _day_start(search.before))
+
+    return clauses
+
+
+def email_search_rank(search: EmailSearch) -> ColumnElement | None:
+    """
+    ORDER BY expression ranking free-text matches (subject hits first).
+
+    Returns None when the search has no free text: operator-only searches
+    keep the newest-first listing order.
+    """
+    text_query = build_text_tsquery(search)
+    if not text_query:
+        return None
+    return func.ts_rank_cd(
+        EmailMessage.search_vector,
+        func.to_tsquery(SEARCH_CONFIG, text_query),
+    ).desc()
@@ -0,0 +1,311 @@
+"""
+Read-through cache of Gmail thread lookups in the email_cache table.
+
+Person email searches (GmailService.search_emails_for_person) and thread
+details (GmailService.get_thread_details) are served from email_cache rows:
+
+- Fresh rows (younger than email_cache_ttl_minutes) are returned without
+  API calls.
+- Stale rows (up to email_cache_max_age_hours) are still returned, and the
+  caller schedules refresh_person_threads() to re-run the search in the
+  background (stale-while-revalidate).
+- Older rows are ignored and deleted by the periodic cleanup job
+  (app.tasks.email_cache_cleanup).
+
+Searches that find nothing have no rows to store, so they are remembered in
+memory for the TTL instead. Hit/miss counters are exposed by
+email_cache_stats() for GET /emails/cache/stats.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+from uuid import UUID, uuid4
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import EmailCache, GoogleAccount
+from app.services.gmail_service import EmailThread, GmailService
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "evicted": 0}
+
+# Persons whose last Gmail search found no threads
+_empty_searches = TTLCache(ttl_seconds=get_settings().email_cache_ttl_minutes * 60, max_entries=1024)
+
+# Persons with a background refresh queued or running
+_refreshing: set[UUID] = set()
+_refreshing_lock = threading.Lock()
+
+
+def _count(counter: str, amount: int = 1) -> None:
+    with _stats_lock:
+        _stats[counter] += amount
+
+
+def email_cache_stats() -> dict[str, int]:
+    """Return the cache hit/miss counters since startup."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+@dataclass
+class CachedThreads:
+    """Threads for a person and where they came from."""
+
+    threads: list[EmailThread]
+    from_cache: bool
+    stale: bool = False
+
+
+def _thread_from_row(row: EmailCache, account_email: str) -> EmailThread:
+    return EmailThread(
+        thread_id=row.gmail_thread_id,
+        account_id=row.google_account_id,
+        account_email=account_email,
+        subject=row.subject or "",
+        snippet=row.snippet or "",
+        participants=row.participants or [],
+        last_message_date=row.last_message_date,
+        message_count=row.message_count or 0,
+    )
+
+
+def _row_values(person_id: UUID | None, thread: EmailThread, cached_at: datetime) -> dict:
+    return {
+        "id": uuid4(),
+        "person_id": person_id,
+        "google_account_id": thread.account_id,
+        "gmail_thread_id": thread.thread_id,
+        "subject": (thread.subject or "")[:500],
+        "snippet": thread.snippet,
+        "participants": thread.participants,
+        "last_message_date": thread.last_message_date,
+        "message_count": thread.message_count,
+        "cached_at": cached_at,
+    }
+
+
+class EmailThreadCache:
+    """Read-through email_cache layer over a GmailService."""
+
+    def __init__(self, db: Session, gmail_service: GmailService | None = None):
+        self.db = db
+        self.gmail = gmail_service or GmailService(db)
+        settings = get_settings()
+        self.ttl = timedelta(minutes=settings.email_cache_ttl_minutes)
+        self.max_age = timedelta(hours=settings.email_cache_max_age_hours)
+
+    def person_threads(
+        self,
+        person_id: UUID,
+        max_results: int = 50,
+        account_id: UUID | None = None,
+        refresh: bool = False,
+        fetch: bool = True,
+    ) -> CachedThreads | None:
+        """
+        Gmail threads for a person (history older than the sync), cached.
+
+        Args:
+            person_id: Person to search for
+            max_results: Maximum threads per account, on a Gmail search
+            account_id: Only return threads of this account
+            refresh: Skip the cache and search Gmail
+            fetch: Search Gmail on a miss (else return None)
+
+        Returns:
+            CachedThreads (newest first), or None on a miss when fetch is False
+
+        Raises:
+            GmailServiceError: If the Gmail search fails on a miss
+        """
+        if not refresh:
+            cached = self._cached_person_threads(person_id, account_id)
+            if cached is not None:
+                _count("stale_hits" if cached.stale else "hits")
+                return cached
+            _count("misses")
+            if not fetch:
+                return None
+
+        threads = self.gmail.search_emails_for_person(person_id, max_results, older_than_sync=True)
+        self._store_person_threads(person_id, threads)
+        if account_id:
+            threads = [t for t in threads if t.account_id == account_id]
+        return CachedThreads(threads=threads, from_cache=False)
+
+    def thread_details(self, thread_id: str, account_id: UUID) -> EmailThread | None:
+        """
+        Details of one thread, from a fresh cached row or the Gmail API.
+
+        A fetched thread refreshes rows already cached for it. No rows are
+        added: a person's rows stand for a complete search result.
+
+        Raises:
+            GmailAPIError: If the Gmail API call fails on a miss
+        """
+        row = (
+            self.db.query(EmailCache)
+            .filter(
+                EmailCache.google_account_id == account_id,
+                EmailCache.gmail_thread_id == thread_id,
+                EmailCache.cached_at >= datetime.now(timezone.utc) - self.ttl,
+            )
+            .order_by(EmailCache.cached_at.desc())
+            .first()
+        )
+        if row is not None:
+            _count("hits")
+            account_email = self.db.query(GoogleAccount.email).filter_by(id=account_id).scalar() or ""
+            return _thread_from_row(row, account_email)
+
+        _count("misses")
+        thread = self.gmail.get_thread_details(thread_id, account_id)
+        if thread is None:
+            return None
+
+        values = _row_values(None, thread, datetime.now(timezone.utc))
+        updated = (
+            self.db.query(EmailCache)
+            .filter(EmailCache.google_account_id == account_id, EmailCache.gmail_thread_id == thread_id)
+            .update(
+                {
+                    column: values[column]
+                    for column in values
+                    if column not in ("id", "person_id", "google_account_id")
+                },
+                synchronize_session=False,
+            )
+        )
+        if updated:
+            self.db.commit()
+        return thread
+
+    def _cached_person_threads(self, person_id: UUID, account_id: UUID | None) -> CachedThreads | None:
+        """The person's cached threads, or None if there are none younger than max_age."""
+        now = datetime.now(timezone.utc)
+        rows = (
+            self.db.query(EmailCache, GoogleAccount.email)
+            .join(GoogleAccount, GoogleAccount.id == EmailCache.google_account_id)
+            .filter(
+                EmailCache.person_id == person_id,
+                EmailCache.cached_at >= now - self.max_age,
+            )
+            .order_by(EmailCache.last_message_date.desc().nulls_last())
+            .all()
+        )
+        if not rows:
+            if _empty_searches.get(person_id):
+                return CachedThreads(threads=[], from_cache=True)
+            return None
+
+        # A search stores all of its rows together; the oldest decides
+        oldest = min(row.cached_at for row, _ in rows)
+        threads = [
+            _thread_from_row(row, account_email)
+            for row, account_email in rows
+            if account_id is None or row.google_account_id == account_id
+        ]
+        return CachedThreads(threads=threads, from_cache=True, stale=now - oldest >= self.ttl)
+
+    def _store_person_threads(self, person_id: UUID, threads: list[EmailThread]) -> None:
+        """Replace the person's cached threads with a new search result."""
+        now = datetime.now(timezone.utc)
+        # Thread ids are unique per person in email_cache; keep the first
+        rows = {}
+        for thread in threads:
+            rows.setdefault(thread.thread_id, _row_values(person_id, thread, now))
+
+        # Upsert, so a concurrent refresh of the same person cannot hit
+        # uq_email_cache_person_thread, then drop threads no longer found
+        if rows:
+            stmt = pg_insert(EmailCache).values(list(rows.values()))
+            self.db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["person_id", "gmail_thread_id"],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in next(iter(rows.values()))
+                        if column not in ("id", "person_id", "gmail_thread_id")
+                    },
+                )
+            )
+        stale = self.db.query(EmailCache).filter(EmailCache.person_id == person_id)
+        if rows:
+            stale = stale.filter(EmailCache.gmail_thread_id.notin_(rows))
+        stale.delete(synchronize_session=False)
+
+        if rows:
+            _empty_searches.invalidate(person_id)
+        else:
+            _empty_searches.set(person_id, True)
+        self.db.commit()
+
+
+def clear_person_threads(db: Session, person_id: UUID) -> int:
+    """Drop a person's cached threads (rows and empty-search marker)."""
+    deleted = db.query(EmailCache).filter(EmailCache.person_id == person_id).delete(synchronize_session=False)
+    db.commit()
+    _empty_searches.invalidate(person_id)
+    return deleted
+
+
+def evict_expired(db: Session, max_age_hours: int | None = None) -> int:
+    """
+    Delete cache rows older than max_age_hours (default email_cache_max_age_hours).
+
+    Returns:
+        Number of rows deleted
+    """
+    if max_age_hours is None:
+        max_age_hours = get_settings().email_cache_max_age_hours
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
+    deleted = db.query(EmailCache).filter(EmailCache.cached_at < cutoff).delete(synchronize_session=False)
+    db.commit()
+    _count("evicted", deleted)
+    return deleted
+
+
+def cached_row_count(db: Session) -> int:
+    """Number of rows currently in email_cache."""
+    return db.query(func.count(EmailCache.id)).scalar() or 0
+
+
+def refresh_person_threads(
+    person_id: UUID,
+    max_results: int = 50,
+    session_factory: Callable[[], Session] | None = None,
+) -> None:
+    """
+    Re-run a stale person search and store it, in its own session.
+
+    Meant for BackgroundTasks; concurrent refreshes of one person collapse
+    into one, and errors are logged rather than raised.
+    """
+    with _refreshing_lock:
+        if person_id in _refreshing:
+            return
+        _refreshing.add(person_id)
+
+    if session_factory is None:
+        from app.database import SessionLocal
+        session_factory = SessionLocal
+
+    try:
+        with session_factory() as db:
+            EmailThreadCache(db).person_threads(person_id, max_results, refresh=True)
+        _count("refreshes")
+    except Exception as e:
+        logger.warning(f"Email cache refresh failed for person {person_id}: {e}")
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(person_id)
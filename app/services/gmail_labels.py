@@ -0,0 +1,113 @@
+"""
+Gmail label sidebar for the email inbox.
+
+Each account's label list (label ID -> name) is stored on its
+EmailSyncState and refreshed by GmailSyncService when older than
+email_labels_ttl_minutes, so inbox renders no longer call labels().list for
+every account. The display hierarchy is built from the stored lists in one
+pass and cached until any of them is refreshed.
+"""
+
+from typing import Iterable
+
+from app.models import EmailSyncState
+from app.utils.cache import TTLCache
+
+# Internal Gmail labels never shown in the sidebar (matched by ID or name)
+SYSTEM_LABELS = frozenset({
+    "UNREAD", "STARRED", "IMPORTANT", "CHAT", "SPAM", "TRASH",
+    "CATEGORY_PERSONAL", "CATEGORY_SOCIAL", "CATEGORY_PROMOTIONS",
+    "CATEGORY_UPDATES", "CATEGORY_FORUMS",
+})
+
+# Standard folders, already shown as tabs
+STANDARD_FOLDERS = frozenset({"INBOX", "SENT", "DRAFT", "DRAFTS"})
+
+# Additional system/internal labels by name
+EXCLUDED_LABEL_NAMES = frozenset({
+    # Star colors (Gmail internal)
+    "BLUE_STAR", "GREEN_STAR", "RED_STAR", "YELLOW_STAR", "ORANGE_STAR", "PURPLE_STAR",
+    "BLUE_INFO", "GREEN_CHECK", "YELLOW_BANG", "RED_BANG",
+    "BLUE_CIRCLE", "GREEN_CIRCLE", "RED_CIRCLE", "YELLOW_CIRCLE", "ORANGE_CIRCLE", "PURPLE_CIRCLE",
+    # Other system labels
+    "Junk E-mail",
+    "Snoozed", "Important",
+})
+
+
+def _normalized(name: str) -> str:
+    return name.replace("_", " ").upper()
+
+
+# Excluded names compared without case or underscores ("Blue star", "blue_star")
+_EXCLUDED_NORMALIZED = frozenset(_normalized(name) for name in EXCLUDED_LABEL_NAMES)
+
+HIERARCHY_CACHE_TTL_SECONDS = 3600
+
+# Hierarchies keyed by the (account, labels_synced_at) pairs they were built from
+_hierarchies = TTLCache(ttl_seconds=HIERARCHY_CACHE_TTL_SECONDS, max_entries=64)
+
+
+def is_hidden_label(label_id: str, display_name: str) -> bool:
+    """Whether a label is a system label or standard folder (not listed in the sidebar)."""
+    return (
+        label_id in SYSTEM_LABELS
+        or display_name in STANDARD_FOLDERS
+        or display_name in SYSTEM_LABELS
+        or _normalized(display_name) in _EXCLUDED_NORMALIZED
+    )
+
+
+def build_label_hierarchy(label_names: dict[str, str]) -> list[dict]:
+    """
+    Sidebar entries for a label ID -> name mapping.
+
+    Gmail separates nested labels with "/" ("News/Bloomberg"). Parents with
+    children come first, then standalone labels, each sorted by name:
+    {"name": label ID or None, "display_name": ..., "children": [...]}.
+    """
+    labels = [
+        (label_id, display_name)
+        for label_id, display_name in label_names.items()
+        if not is_hidden_label(label_id, display_name)
+    ]
+
+    hierarchy: dict[str, dict] = {}
+    for label_id, display_name in labels:
+        if "/" in display_name:
+            parent_name, child_name = display_name.split("/", 1)
+            parent = hierarchy.setdefault(
+                parent_name,
+                # Parent may not have its own label ID
+                {"name": None, "display_name": parent_name, "children": []},
+            )
+            parent["children"].append({"name": label_id, "display_name": child_name})
+
+    standalone = []
+    for label_id, display_name in labels:
+        if "/" in display_name:
+            continue
+        if display_name in hierarchy:
+            hierarchy[display_name]["name"] = label_id
+        else:
+            standalone.append({"name": label_id, "display_name": display_name, "children": []})
+
+    parents = sorted(hierarchy.values(), key=lambda label: label["display_name"].lower())
+    for parent in parents:
+        parent["children"].sort(key=lambda child: child["display_name"].lower())
+    standalone.sort(key=lambda label: label["display_name"].lower())
+    return parents + standalone
+
+
+def inbox_label_hierarchy(states: Iterable[EmailSyncState]) -> list[dict]:
+    """Sidebar entries for the stored labels of the given accounts (merged), cached."""
+    states = [state for state in states if state.label_names is not None]
+    key = tuple(sorted((str(state.google_account_id), state.labels_synced_at) for state in states))
+
+    def build() -> list[dict]:
+        label_names: dict[str, str] = {}
+        for state in states:
+            label_names.update(state.label_names)
+        return build_label_hierarchy(label_names)
+
+    return _hierarchies.get_or_set(key, build)
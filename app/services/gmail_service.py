@@ -5,17 +5,28 @@ Handles Gmail API interactions for email history lookup.
 """
 
 import re
-from datetime import datetime, timezone
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from sqlalchemy.orm import Session
-
-from app.models import GoogleAccount, Person, PersonEmail, EmailIgnoreList
+from sqlalchemy import and_, func, tuple_
+from sqlalchemy.orm import Session, load_only
+
+from app.models import (
+    EmailMessage,
+    EmailPersonLink,
+    EmailSyncState,
+    GoogleAccount,
+    Person,
+    PersonEmail,
+)
+from app.services.email_ignore_matcher import get_ignore_matcher
 from app.services.google_auth import GMAIL_SCOPES
+from app.services.google_clients import get_credentials, service_for
+from app.services.google_executor import execute, get_google_executor
 
 
 class GmailServiceError(Exception):
@@ -93,7 +104,6 @@ class GmailService:
             db: Database session for querying accounts and ignore patterns
         """
         self.db = db
-        self._ignore_patterns: list[tuple[str, str]] | None = None
 
     def build_search_query(self, person: Person) -> str:
         """
@@ -136,10 +146,99 @@ class GmailService:
 
         return " OR ".join(queries)
 
+    def local_email_history(
+        self,
+        person_id: UUID,
+        max_results: int = 50,
+        account_id: UUID | None = None,
+    ) -> list[EmailThread]:
+        """
+        Email threads with a person, from synced messages (no Gmail API calls).
+
+        Threads are the person's linked email_messages grouped by
+        gmail_thread_id; each counts every synced message of the thread.
+
+        Args:
+            person_id: UUID of the person
+            max_results: Maximum number of threads to return
+            account_id: Only threads of this Google account
+
+        Returns:
+            List of EmailThread objects sorted by date (newest first)
+        """
+        accounts_query = self.db.query(GoogleAccount.id, GoogleAccount.email).filter_by(is_active=True)
+        if account_id:
+            accounts_query = accounts_query.filter(GoogleAccount.id == account_id)
+        account_emails = dict(accounts_query.all())
+        if not account_emails:
+            return []
+
+        # Threads with a message linked to the person
+        linked_threads = (
+            self.db.query(EmailMessage.google_account_id, EmailMessage.gmail_thread_id)
+            .join(EmailPersonLink, EmailPersonLink.email_message_id == EmailMessage.id)
+            .filter(
+                EmailPersonLink.person_id == person_id,
+                EmailMessage.google_account_id.in_(list(account_emails)),
+            )
+            .distinct()
+            .subquery()
+        )
+        # The newest of them by their latest message (linked or not), as displayed
+        thread_keys = [
+            tuple(key)
+            for key in self.db.query(EmailMessage.google_account_id, EmailMessage.gmail_thread_id)
+            .join(
+                linked_threads,
+                and_(
+                    EmailMessage.google_account_id == linked_threads.c.google_account_id,
+                    EmailMessage.gmail_thread_id == linked_threads.c.gmail_thread_id,
+                ),
+            )
+            .group_by(EmailMessage.google_account_id, EmailMessage.gmail_thread_id)
+            .order_by(func.max(EmailMessage.internal_date).desc().nulls_last())
+            .limit(max_results)
+        ]
+        if not thread_keys:
+            return []
+
+        messages_by_thread = defaultdict(list)
+        messages = (
+            self.db.query(EmailMessage)
+            .options(load_only(
+                EmailMessage.google_account_id,
+                EmailMessage.gmail_thread_id,
+                EmailMessage.subject,
+                EmailMessage.snippet,
+                EmailMessage.from_email,
+                EmailMessage.to_emails,
+                EmailMessage.internal_date,
+            ))
+            .filter(tuple_(EmailMessage.google_account_id, EmailMessage.gmail_thread_id).in_(thread_keys))
+            .order_by(EmailMessage.internal_date)
+        )
+        for message in messages:
+            messages_by_thread[(message.google_account_id, message.gmail_thread_id)].append(message)
+
+        threads = [
+            self._local_thread(key[1], key[0], account_emails[key[0]], messages_by_thread[key])
+            for key in thread_keys
+            if messages_by_thread[key]
+        ]
+        return self._filter_ignored_threads(threads)
+
+    def has_unsynced_history(self, account_id: UUID | None = None) -> bool:
+        """Whether any active account may have email older than what is synced locally."""
+        query = self.db.query(GoogleAccount.id).filter_by(is_active=True)
+        if account_id:
+            query = query.filter(GoogleAccount.id == account_id)
+        return bool(self._sync_horizons([row.id for row in query]))
+
     def search_emails_for_person(
         self,
         person_id: UUID,
         max_results: int = 50,
+        older_than_sync: bool = False,
     ) -> list[EmailThread]:
         """
         Search all connected Google accounts for emails related to a person.
@@ -147,6 +246,9 @@ class GmailService:
         Args:
             person_id: UUID of the person to search for
             max_results: Maximum number of threads to return per account
+            older_than_sync: Only search each account's history before its
+                sync horizon (see _sync_horizons); newer threads are served
+                by local_email_history()
 
         Returns:
             List of EmailThread objects sorted by date (newest first)
@@ -168,19 +270,27 @@ class GmailService:
         if not accounts:
             return []
 
+        horizons = dict.fromkeys(account.id for account in accounts)
+        if older_than_sync:
+            horizons = self._sync_horizons(list(horizons))
+            accounts = [account for account in accounts if account.id in horizons]
+
         all_threads: list[EmailThread] = []
 
-        # Search each account
-        for account in accounts:
-            try:
-                threads = self._search_account(account, query, max_results)
-                all_threads.extend(threads)
-            except GmailAuthError:
-                # Skip accounts with auth issues
-                continue
-            except GmailAPIError:
-                # Skip accounts with API issues
-                continue
+        # Search all accounts concurrently; workers only read the loaded accounts
+        outcomes = get_google_executor().map(
+            lambda account: self._search_account(
+                account, self._before_query(query, horizons[account.id]), max_results
+            ),
+            accounts,
+            account_key=lambda account: account.id,
+        )
+        for outcome in outcomes:
+            if outcome.ok:
+                all_threads.extend(outcome.value)
+            elif not isinstance(outcome.error, (GmailAuthError, GmailAPIError)):
+                # Skip accounts with auth or API issues, surface anything else
+                raise outcome.error
 
         # Filter out ignored emails
         filtered_threads = self._filter_ignored_threads(all_threads)
@@ -214,7 +324,7 @@ class GmailService:
 
         try:
             credentials = self._get_credentials(account)
-            service = build("gmail", "v1", credentials=credentials)
+            service = service_for(credentials, "gmail", "v1")
 
             thread = service.users().threads().get(
                 userId="me",
@@ -228,6 +338,86 @@ class GmailService:
         except HttpError as e:
             raise GmailAPIError(f"Failed to get thread details: {e}")
 
+    def _sync_horizons(self, account_ids: list[UUID]) -> dict[UUID, date | None]:
+        """
+        Per account, the date before which synced messages may be incomplete.
+
+        The horizon is the window the backfill has reached, else the oldest
+        synced day (searched again, as it may be partial). None means nothing
+        is synced yet: all of Gmail must be searched. Accounts whose backfill
+        reached the oldest message are left out.
+        """
+        states = {
+            state.google_account_id: state
+            for state in self.db.query(EmailSyncState).filter(
+                EmailSyncState.google_account_id.in_(account_ids)
+            )
+        }
+
+        horizons: dict[UUID, date | None] = {}
+        unbackfilled = []
+        for account_id in account_ids:
+            state = states.get(account_id)
+            if state is None or state.needs_full_sync:
+                horizons[account_id] = None
+            elif state.backfill_completed_at:
+                continue
+            elif state.backfill_before:
+                horizons[account_id] = state.backfill_before
+            else:
+                unbackfilled.append(account_id)
+
+        if unbackfilled:
+            oldest = dict(
+                self.db.query(EmailMessage.google_account_id, func.min(EmailMessage.internal_date))
+                .filter(EmailMessage.google_account_id.in_(unbackfilled))
+                .group_by(EmailMessage.google_account_id)
+                .all()
+            )
+            for account_id in unbackfilled:
+                first = oldest.get(account_id)
+                horizons[account_id] = first.date() + timedelta(days=1) if first else None
+
+        return horizons
+
+    def _before_query(self, query: str, horizon: date | None) -> str:
+        """Restrict a search query to messages before the horizon (if any)."""
+        if horizon is None:
+            return query
+        return f"({query}) before:{horizon:%Y/%m/%d}"
+
+    def _local_thread(
+        self,
+        thread_id: str,
+        account_id: UUID,
+        account_email: str,
+        messages: list[EmailMessage],
+    ) -> EmailThread:
+        """Build an EmailThread from a thread's synced messages (oldest first)."""
+        participants = set()
+        for message in messages:
+            if message.from_email:
+                participants.add(message.from_email.lower())
+            for recipient in message.to_emails or []:
+                if isinstance(recipient, dict) and recipient.get("email"):
+                    participants.add(recipient["email"].lower())
+
+        latest = max(
+            messages,
+            key=lambda m: m.internal_date or datetime.min.replace(tzinfo=timezone.utc),
+        )
+
+        return EmailThread(
+            thread_id=thread_id,
+            account_id=account_id,
+            account_email=account_email,
+            subject=next((message.subject for message in messages if message.subject), ""),
+            snippet=latest.snippet or "",
+            participants=sorted(participants),
+            last_message_date=latest.internal_date,
+            message_count=len(messages),
+        )
+
     def _search_account(
         self,
         account: GoogleAccount,
@@ -237,14 +427,14 @@ class GmailService:
         """Search a single Google account for matching threads."""
         try:
             credentials = self._get_credentials(account)
-            service = build("gmail", "v1", credentials=credentials)
+            service = service_for(credentials, "gmail", "v1")
 
             # Search for threads
-            response = service.users().threads().list(
+            response = execute(service.users().threads().list(
                 userId="me",
                 q=query,
                 maxResults=max_results,
-            ).execute()
+            ))
 
             threads_data = response.get("threads", [])
             if not threads_data:
@@ -255,12 +445,12 @@ class GmailService:
             for thread_data in threads_data:
                 thread_id = thread_data["id"]
                 try:
-                    thread_detail = service.users().threads().get(
+                    thread_detail = execute(service.users().threads().get(
                         userId="me",
                         id=thread_id,
                         format="metadata",
                         metadataHeaders=["Subject", "From", "To", "Date"],
-                    ).execute()
+                    ))
                     parsed = self._parse_thread(thread_detail, account)
                     if parsed:
                         threads.append(parsed)
@@ -276,15 +466,7 @@ class GmailService:
     def _get_credentials(self, account: GoogleAccount) -> Credentials:
         """Get OAuth credentials for a Google account."""
         try:
-            creds_dict = account.get_credentials()
-            return Credentials(
-                token=creds_dict.get("token"),
-                refresh_token=creds_dict.get("refresh_token"),
-                token_uri=creds_dict.get("token_uri", "https://oauth2.googleapis.com/token"),
-                client_id=creds_dict.get("client_id"),
-                client_secret=creds_dict.get("client_secret"),
-                scopes=creds_dict.get("scopes", GMAIL_SCOPES),
-            )
+            return get_credentials(account, GMAIL_SCOPES)
         except Exception as e:
             raise GmailAuthError(f"Failed to get credentials: {e}")
 
@@ -358,56 +540,13 @@ class GmailService:
 
         raise ValueError(f"Unable to parse date: {date_str}")
 
-    def _get_ignore_patterns(self) -> list[tuple[str, str]]:
-        """Get cached ignore patterns from database."""
-        if self._ignore_patterns is None:
-            patterns = self.db.query(EmailIgnoreList).all()
-            self._ignore_patterns = [(p.pattern, p.pattern_type.value) for p in patterns]
-        return self._ignore_patterns
-
     def _filter_ignored_threads(self, threads: list[EmailThread]) -> list[EmailThread]:
-        """Filter out threads matching ignore patterns."""
-        patterns = self._get_ignore_patterns()
-        if not patterns:
+        """Filter out threads with any participant matching an ignore pattern."""
+        matcher = get_ignore_matcher(self.db)
+        if not matcher:
             return threads
 
-        filtered = []
-        for thread in threads:
-            if not self._should_ignore_thread(thread, patterns):
-                filtered.append(thread)
-
-        return filtered
-
-    def _should_ignore_thread(
-        self,
-        thread: EmailThread,
-        patterns: list[tuple[str, str]],
-    ) -> bool:
-        """Check if a thread should be ignored based on participants."""
-        for participant in thread.participants:
-            participant_lower = participant.lower()
-
-            for pattern, pattern_type in patterns:
-                if pattern_type == "domain":
-                    # Domain match: check if email ends with @domain
-                    if participant_lower.endswith(f"@{pattern.lower()}"):
-                        return True
-                elif pattern_type == "email":
-                    # Email pattern match (supports wildcards with *)
-                    if self._matches_email_pattern(participant_lower, pattern.lower()):
-                        return True
-
-        return False
-
-    def _matches_email_pattern(self, email: str, pattern: str) -> bool:
-        """Check if email matches pattern (supports * wildcards)."""
-        if "*" not in pattern:
-            return email == pattern
-
-        # Convert pattern to regex
-        # e.g., "noreply@*" becomes "noreply@.*"
-        regex_pattern = pattern.replace(".", r"\.").replace("*", ".*")
-        return bool(re.match(f"^{regex_pattern}$", email))
+        return [thread for thread in threads if not matcher.matches_any(thread.participants)]
 
 
 def get_gmail_service(db: Session) -> GmailService:
@@ -1,23 +1,29 @@
 """
 Gmail Sync Service for syncing emails to local database.
 
-Handles full sync and incremental sync using Gmail History API.
+Handles full sync and incremental sync using Gmail History API, and a
+resumable backfill of older history that runs in bounded chunks. Message
+metadata is fetched through the Gmail batch endpoint, one HTTP round trip per
+DEFAULT_BATCH_SIZE messages instead of one per message.
 """
 
+import logging
 import re
-from datetime import datetime, timezone
+import time
+from datetime import date, datetime, timedelta, timezone
 from dataclasses import dataclass
-from typing import Callable
-from uuid import UUID
+from typing import Callable, Mapping
+from uuid import UUID, uuid4
 
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.models import (
     GoogleAccount,
-    PersonEmail,
     EmailMessage,
     EmailPersonLink,
     EmailSyncState,
@@ -25,7 +31,23 @@ from app.models import (
     EmailLinkType,
     EmailLinkSource,
 )
+from app.services.email_ignore_matcher import IgnoreMatcher, get_ignore_matcher
 from app.services.google_auth import GMAIL_SCOPES
+from app.services.google_clients import get_credentials, service_for
+from app.services.google_executor import execute, execute_batch, get_google_executor
+from app.services.person_email_index import get_email_person_index
+
+logger = logging.getLogger(__name__)
+
+METADATA_HEADERS = ["Subject", "From", "To", "Cc", "Bcc", "Date"]
+
+# Columns refreshed when a stored message is synced again
+UPSERT_COLUMNS = ("subject", "snippet", "is_read", "is_starred", "labels", "synced_at")
+# Filled in when missing (rows stored before internalDate was parsed) but
+# never cleared by a response without internalDate
+UPSERT_FILL_COLUMNS = ("internal_date", "received_at")
+# Rows per INSERT ... ON CONFLICT statement (stays well under the bind-parameter limit)
+UPSERT_BATCH_SIZE = 500
 
 
 class GmailSyncError(Exception):
@@ -40,6 +62,14 @@ class SyncResult:
     messages_synced: int
     errors: list[str]
     history_id: int | None = None
+    duration_seconds: float = 0.0
+
+    @property
+    def messages_per_second(self) -> float:
+        """Sync throughput (0 when nothing was timed)."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.messages_synced / self.duration_seconds
 
 
 class GmailSyncService:
@@ -49,13 +79,12 @@ class GmailSyncService:
     Supports:
     - Full sync: Initial sync of all messages (paginated)
     - Incremental sync: Using Gmail History API for changes since last sync
+    - Backfill: Older history, one date window at a time, checkpointed per page
     - Auto-linking: Matches emails to CRM contacts by email address
     """
 
     def __init__(self, db: Session):
         self.db = db
-        # Cache person emails for fast lookup during linking
-        self._email_to_person: dict[str, UUID] | None = None
 
     def full_sync(
         self,
@@ -77,6 +106,7 @@ class GmailSyncService:
         Returns:
             SyncResult with sync statistics
         """
+        started = time.perf_counter()
         errors = []
         messages_synced = 0
         history_id = None
@@ -88,10 +118,10 @@ class GmailSyncService:
 
         try:
             credentials = self._get_credentials(account)
-            service = build("gmail", "v1", credentials=credentials)
+            service = service_for(credentials, "gmail", "v1")
 
             # Get profile for history ID
-            profile = service.users().getProfile(userId="me").execute()
+            profile = execute(service.users().getProfile(userId="me"))
             history_id = int(profile.get("historyId", 0))
 
             # List messages with pagination
@@ -101,38 +131,24 @@ class GmailSyncService:
             while total_fetched < max_results:
                 batch_size = min(100, max_results - total_fetched)  # Gmail API max is 100
 
-                response = service.users().messages().list(
+                response = execute(service.users().messages().list(
                     userId="me",
                     maxResults=batch_size,
                     pageToken=page_token,
-                ).execute()
+                ))
 
                 messages_data = response.get("messages", [])
                 if not messages_data:
                     break
 
-                # Process each message
-                for msg_ref in messages_data:
-                    try:
-                        # Get full message metadata
-                        msg = service.users().messages().get(
-                            userId="me",
-                            id=msg_ref["id"],
-                            format="metadata",
-                            metadataHeaders=[
-                                "Subject", "From", "To", "Cc", "Bcc", "Date"
-                            ],
-                        ).execute()
-
-                        # Parse and save message
-                        email_msg = self._parse_message(msg, account)
-                        if email_msg:
-                            self._save_message(email_msg)
-                            messages_synced += 1
-
-                    except HttpError as e:
-                        errors.append(f"Error fetching message {msg_ref['id']}: {e}")
-                        continue
+                # Fetch the page's metadata in batches, then save
+                messages, fetch_errors = self._fetch_messages(
+                    service, [msg_ref["id"] for msg_ref in messages_data]
+                )
+                errors.extend(fetch_errors)
+                messages_synced += self._store_messages(messages, account)
+                # Commit per page: a later failure keeps what was stored
+                self.db.commit()
 
                 total_fetched += len(messages_data)
 
@@ -145,10 +161,9 @@ class GmailSyncService:
                 if not page_token:
                     break
 
-            # Commit all changes
-            self.db.commit()
-
             # Update sync state
+            self._refresh_labels(service, sync_state)
+            self._refresh_unread_counts(account, sync_state)
             sync_state.complete_sync(
                 history_id=history_id,
                 messages_synced=messages_synced,
@@ -161,6 +176,7 @@ class GmailSyncService:
                 messages_synced=messages_synced,
                 errors=errors,
                 history_id=history_id,
+                duration_seconds=time.perf_counter() - started,
             )
 
         except Exception as e:
@@ -171,6 +187,7 @@ class GmailSyncService:
                 success=False,
                 messages_synced=messages_synced,
                 errors=[str(e)] + errors,
+                duration_seconds=time.perf_counter() - started,
             )
 
     def sync_folder(
@@ -190,12 +207,13 @@ class GmailSyncService:
         Returns:
             SyncResult with sync statistics
         """
+        started = time.perf_counter()
         errors = []
         messages_synced = 0
 
         try:
             credentials = self._get_credentials(account)
-            service = build("gmail", "v1", credentials=credentials)
+            service = service_for(credentials, "gmail", "v1")
 
             # List messages with label filter
             page_token = None
@@ -204,39 +222,25 @@ class GmailSyncService:
             while total_fetched < max_results:
                 batch_size = min(100, max_results - total_fetched)
 
-                response = service.users().messages().list(
+                response = execute(service.users().messages().list(
                     userId="me",
                     labelIds=[label_id],
                     maxResults=batch_size,
                     pageToken=page_token,
-                ).execute()
+                ))
 
                 messages_data = response.get("messages", [])
                 if not messages_data:
                     break
 
-                # Process each message
-                for msg_ref in messages_data:
-                    try:
-                        # Get full message metadata
-                        msg = service.users().messages().get(
-                            userId="me",
-                            id=msg_ref["id"],
-                            format="metadata",
-                            metadataHeaders=[
-                                "Subject", "From", "To", "Cc", "Bcc", "Date"
-                            ],
-                        ).execute()
-
-                        # Parse and save message
-                        email_msg = self._parse_message(msg, account)
-                        if email_msg:
-                            self._save_message(email_msg)
-                            messages_synced += 1
-
-                    except HttpError as e:
-                        errors.append(f"Error fetching message {msg_ref['id']}: {e}")
-                        continue
+                # Fetch the page's metadata in batches, then save
+                messages, fetch_errors = self._fetch_messages(
+                    service, [msg_ref["id"] for msg_ref in messages_data]
+                )
+                errors.extend(fetch_errors)
+                messages_synced += self._store_messages(messages, account)
+                # Commit per page: a later failure keeps what was stored
+                self.db.commit()
 
                 total_fetched += len(messages_data)
 
@@ -245,13 +249,14 @@ class GmailSyncService:
                 if not page_token:
                     break
 
-            # Commit all changes
+            self._refresh_unread_counts(account, self._get_or_create_sync_state(account))
             self.db.commit()
 
             return SyncResult(
                 success=True,
                 messages_synced=messages_synced,
                 errors=errors,
+                duration_seconds=time.perf_counter() - started,
             )
 
         except Exception as e:
@@ -260,6 +265,7 @@ class GmailSyncService:
                 success=False,
                 messages_synced=messages_synced,
                 errors=[str(e)] + errors,
+                duration_seconds=time.perf_counter() - started,
             )
 
     def incremental_sync(self, account: GoogleAccount) -> SyncResult:
@@ -275,6 +281,7 @@ class GmailSyncService:
         Returns:
             SyncResult with sync statistics
         """
+        started = time.perf_counter()
         errors = []
         messages_synced = 0
 
@@ -289,7 +296,7 @@ class GmailSyncService:
 
         try:
             credentials = self._get_credentials(account)
-            service = build("gmail", "v1", credentials=credentials)
+            service = service_for(credentials, "gmail", "v1")
 
             # Get history since last sync
             history_id = sync_state.last_history_id
@@ -298,12 +305,12 @@ class GmailSyncService:
             page_token = None
             while True:
                 try:
-                    response = service.users().history().list(
+                    response = execute(service.users().history().list(
                         userId="me",
                         startHistoryId=history_id,
                         pageToken=page_token,
                         historyTypes=["messageAdded", "labelAdded", "labelRemoved"],
-                    ).execute()
+                    ))
                 except HttpError as e:
                     if e.resp.status == 404:
                         # History ID expired, need full sync
@@ -315,48 +322,42 @@ class GmailSyncService:
                 # Update history ID
                 new_history_id = int(response.get("historyId", history_id))
 
-                # Process history records
-                for history_record in response.get("history", []):
-                    # Handle new messages
-                    for msg_added in history_record.get("messagesAdded", []):
-                        msg_ref = msg_added.get("message", {})
-                        msg_id = msg_ref.get("id")
-                        if msg_id:
-                            try:
-                                msg = service.users().messages().get(
-                                    userId="me",
-                                    id=msg_id,
-                                    format="metadata",
-                                    metadataHeaders=[
-                                        "Subject", "From", "To", "Cc", "Bcc", "Date"
-                                    ],
-                                ).execute()
-
-                                email_msg = self._parse_message(msg, account)
-                                if email_msg:
-                                    self._save_message(email_msg)
-                                    messages_synced += 1
-                            except HttpError:
-                                continue
-
-                    # Handle label changes (update existing messages)
+                history = response.get("history", [])
+
+                # Handle new messages: fetch the page's additions in batches
+                added_ids = [
+                    msg_added.get("message", {}).get("id")
+                    for history_record in history
+                    for msg_added in history_record.get("messagesAdded", [])
+                ]
+                messages, fetch_errors = self._fetch_messages(service, [i for i in added_ids if i])
+                errors.extend(fetch_errors)
+                messages_synced += self._store_messages(messages, account)
+
+                # Handle label changes (update existing messages); records
+                # are oldest first, so a message's last change wins
+                label_updates = {}
+                for history_record in history:
                     for label_change in (
                         history_record.get("labelsAdded", []) +
                         history_record.get("labelsRemoved", [])
                     ):
                         msg_ref = label_change.get("message", {})
                         msg_id = msg_ref.get("id")
-                        labels = msg_ref.get("labelIds", [])
                         if msg_id:
-                            self._update_message_labels(account.id, msg_id, labels)
+                            label_updates[msg_id] = msg_ref.get("labelIds", [])
+                self._update_message_labels(account.id, label_updates)
+
+                # Commit per page: a later failure keeps what was stored
+                self.db.commit()
 
                 # Get next page
                 page_token = response.get("nextPageToken")
                 if not page_token:
                     break
 
-            self.db.commit()
-
+            self._refresh_labels(service, sync_state)
+            self._refresh_unread_counts(account, sync_state)
             sync_state.complete_sync(
                 history_id=new_history_id,
                 messages_synced=messages_synced,
@@ -369,6 +370,7 @@ class GmailSyncService:
                 messages_synced=messages_synced,
                 errors=errors,
                 history_id=new_history_id,
+                duration_seconds=time.perf_counter() - started,
             )
 
         except Exception as e:
@@ -379,28 +381,244 @@ class GmailSyncService:
                 success=False,
                 messages_synced=messages_synced,
                 errors=[str(e)] + errors,
+                duration_seconds=time.perf_counter() - started,
             )
 
-    def sync_all_accounts(self) -> dict[str, SyncResult]:
+    def sync_all_accounts(self, session_factory: Callable[[], Session] | None = None) -> dict[str, SyncResult]:
         """
-        Sync all active Google accounts.
+        Sync all active Google accounts concurrently.
+
+        Each account syncs in a Google executor worker with its own session
+        (sessions are not thread-safe); accounts never share message rows.
+
+        Args:
+            session_factory: Creates the per-account sessions (defaults to SessionLocal)
 
         Returns:
             Dictionary mapping account email to SyncResult
         """
-        results = {}
-        accounts = self.db.query(GoogleAccount).filter_by(is_active=True).all()
+        if session_factory is None:
+            from app.database import SessionLocal
+            session_factory = SessionLocal
 
-        for account in accounts:
-            sync_state = self._get_or_create_sync_state(account)
+        accounts = self.db.query(GoogleAccount.id, GoogleAccount.email).filter_by(is_active=True).all()
 
-            if sync_state.needs_full_sync:
-                results[account.email] = self.full_sync(account)
+        outcomes = get_google_executor().map(
+            lambda account: _sync_account_in_session(session_factory, account.id),
+            accounts,
+            account_key=lambda account: account.id,
+        )
+
+        results = {}
+        for outcome in outcomes:
+            if outcome.ok:
+                results[outcome.item.email] = outcome.value
             else:
-                results[account.email] = self.incremental_sync(account)
+                results[outcome.item.email] = SyncResult(
+                    success=False,
+                    messages_synced=0,
+                    errors=[f"Sync failed: {outcome.error}"],
+                )
+        return results
+
+    def sync_account(self, account: GoogleAccount) -> SyncResult:
+        """Sync one account, incrementally when a history ID is stored."""
+        sync_state = self._get_or_create_sync_state(account)
+        if sync_state.needs_full_sync:
+            return self.full_sync(account)
+        return self.incremental_sync(account)
+
+    def backfill(
+        self,
+        account: GoogleAccount,
+        max_pages: int | None = None,
+        depth_days: int | None = None,
+        window_days: int | None = None,
+    ) -> SyncResult:
+        """
+        Store older messages, resuming from the last checkpoint.
+
+        Walks the mailbox backwards one date window (q=after:... before:...)
+        at a time, at most max_pages list pages per call. The window and page
+        token are committed with each page's messages, so an interrupted
+        backfill resumes where it stopped. It is complete at the oldest
+        message, or at depth_days when that is set. Waits for the initial
+        full sync; sync_status is left to the full/incremental syncs, which
+        run independently.
 
+        Args:
+            account: Google account to backfill
+            max_pages: List pages (up to 100 messages each) to store in this call
+            depth_days: How far back to go (0: down to the oldest message)
+            window_days: Days covered by each date window
+
+        Returns:
+            SyncResult for this chunk
+        """
+        settings = get_settings()
+        max_pages = max_pages or settings.email_backfill_pages_per_run
+        depth_days = settings.email_backfill_days if depth_days is None else depth_days
+        window_days = window_days or settings.email_backfill_window_days
+
+        started = time.perf_counter()
+        errors = []
+        messages_synced = 0
+
+        sync_state = self._get_or_create_sync_state(account)
+        if sync_state.needs_full_sync or sync_state.backfill_completed_at:
+            return SyncResult(success=True, messages_synced=0, errors=[])
+
+        today = datetime.now(timezone.utc).date()
+        oldest = today - timedelta(days=depth_days) if depth_days else None
+        if sync_state.backfill_before is None:
+            sync_state.backfill_before = today + timedelta(days=1)
+
+        try:
+            credentials = self._get_credentials(account)
+            service = service_for(credentials, "gmail", "v1")
+
+            for _ in range(max_pages):
+                before = sync_state.backfill_before
+                if oldest and before <= oldest:
+                    # Stopped at the depth limit by an earlier run
+                    sync_state.backfill_completed_at = datetime.now(timezone.utc)
+                    self.db.commit()
+                    break
+                after = before - timedelta(days=window_days)
+                if oldest:
+                    after = max(after, oldest)
+
+                response = execute(service.users().messages().list(
+                    userId="me",
+                    q=f"after:{after:%Y/%m/%d} before:{before:%Y/%m/%d}",
+                    maxResults=100,
+                    pageToken=sync_state.backfill_page_token,
+                ))
+                message_ids = [msg_ref["id"] for msg_ref in response.get("messages", [])]
+
+                messages, fetch_errors = self._fetch_messages(service, message_ids)
+                errors.extend(fetch_errors)
+                stored = self._store_messages(messages, account)
+                messages_synced += stored
+                sync_state.backfill_messages = (sync_state.backfill_messages or 0) + stored
+
+                # Advance the checkpoint: next page, else the next older window
+                sync_state.backfill_page_token = response.get("nextPageToken")
+                if not sync_state.backfill_page_token:
+                    sync_state.backfill_before = after
+                    if oldest:
+                        # The configured depth is reached; older history stays in Gmail
+                        if after <= oldest:
+                            sync_state.backfill_completed_at = datetime.now(timezone.utc)
+                    elif not message_ids and not self._has_messages_before(service, after):
+                        sync_state.backfill_completed_at = datetime.now(timezone.utc)
+
+                # Commit the page with its checkpoint
+                self.db.commit()
+                if sync_state.backfill_completed_at:
+                    break
+
+            if messages_synced:
+                self._refresh_unread_counts(account, sync_state)
+                self.db.commit()
+
+            return SyncResult(
+                success=True,
+                messages_synced=messages_synced,
+                errors=errors,
+                duration_seconds=time.perf_counter() - started,
+            )
+
+        except Exception as e:
+            # Pages already committed stay; the checkpoint points past them
+            self.db.rollback()
+            return SyncResult(
+                success=False,
+                messages_synced=messages_synced,
+                errors=[str(e)] + errors,
+                duration_seconds=time.perf_counter() - started,
+            )
+
+    def backfill_all_accounts(self, session_factory: Callable[[], Session] | None = None) -> dict[str, SyncResult]:
+        """
+        Run one backfill chunk for every active account concurrently.
+
+        Args:
+            session_factory: Creates the per-account sessions (defaults to SessionLocal)
+
+        Returns:
+            Dictionary mapping account email to SyncResult
+        """
+        if session_factory is None:
+            from app.database import SessionLocal
+            session_factory = SessionLocal
+
+        accounts = self.db.query(GoogleAccount.id, GoogleAccount.email).filter_by(is_active=True).all()
+
+        outcomes = get_google_executor().map(
+            lambda account: _backfill_account_in_session(session_factory, account.id),
+            accounts,
+            account_key=lambda account: account.id,
+        )
+
+        results = {}
+        for outcome in outcomes:
+            if outcome.ok:
+                results[outcome.item.email] = outcome.value
+            else:
+                results[outcome.item.email] = SyncResult(
+                    success=False,
+                    messages_synced=0,
+                    errors=[f"Backfill failed: {outcome.error}"],
+                )
         return results
 
+    def _refresh_unread_counts(self, account: GoogleAccount, sync_state: EmailSyncState) -> None:
+        """Recount the account's unread messages per label (one grouped query)."""
+        label = func.jsonb_array_elements_text(EmailMessage.labels).column_valued("label")
+        sync_state.unread_counts = dict(self.db.execute(
+            select(label, func.count())
+            # The table first: the function's argument refers to it (implicit LATERAL)
+            .select_from(EmailMessage)
+            .where(
+                EmailMessage.google_account_id == account.id,
+                EmailMessage.is_read.is_(False),
+            )
+            .group_by(label)
+        ).all())
+
+    def refresh_labels(self, account: GoogleAccount) -> None:
+        """Fetch and store the account's label list now (e.g. before its first sync)."""
+        service = service_for(self._get_credentials(account), "gmail", "v1")
+        self._refresh_labels(service, self._get_or_create_sync_state(account), force=True)
+        self.db.commit()
+
+    def _refresh_labels(self, service, sync_state: EmailSyncState, force: bool = False) -> None:
+        """Store the label list on the sync state when older than email_labels_ttl_minutes."""
+        ttl = timedelta(minutes=get_settings().email_labels_ttl_minutes)
+        if (
+            not force
+            and sync_state.labels_synced_at is not None
+            and datetime.now(timezone.utc) - sync_state.labels_synced_at < ttl
+        ):
+            return
+        try:
+            sync_state.label_names = fetch_label_names(service)
+        except HttpError as e:
+            # Keep the stored labels; the next sync tries again
+            logger.warning("Failed to refresh Gmail labels for %s: %s", sync_state.google_account_id, e)
+            return
+        sync_state.labels_synced_at = datetime.now(timezone.utc)
+
+    def _has_messages_before(self, service, day: date) -> bool:
+        """Check whether the mailbox holds any message older than day."""
+        response = execute(service.users().messages().list(
+            userId="me",
+            q=f"before:{day:%Y/%m/%d}",
+            maxResults=1,
+        ))
+        return bool(response.get("messages"))
+
     def _get_or_create_sync_state(self, account: GoogleAccount) -> EmailSyncState:
         """Get or create sync state for an account."""
         sync_state = self.db.query(EmailSyncState).filter_by(
@@ -416,22 +634,91 @@ class GmailSyncService:
 
     def _get_credentials(self, account: GoogleAccount) -> Credentials:
         """Get OAuth credentials for a Google account."""
-        creds_dict = account.get_credentials()
-        return Credentials(
-            token=creds_dict.get("token"),
-            refresh_token=creds_dict.get("refresh_token"),
-            token_uri=creds_dict.get("token_uri", "https://oauth2.googleapis.com/token"),
-            client_id=creds_dict.get("client_id"),
-            client_secret=creds_dict.get("client_secret"),
-            scopes=creds_dict.get("scopes", GMAIL_SCOPES),
+        return get_credentials(account, GMAIL_SCOPES)
+
+    def _fetch_messages(self, service, message_ids: list[str]) -> tuple[list[dict], list[str]]:
+        """
+        Fetch message metadata through the Gmail batch endpoint.
+
+        Calls rejected with 429/5xx inside a batch are retried with backoff;
+        other per-message failures (e.g. deleted since listing) are reported.
+
+        Returns:
+            (message resources in message_ids order, error strings)
+        """
+        responses, failures = execute_batch(
+            service,
+            message_ids,
+            lambda msg_id: service.users().messages().get(
+                userId="me",
+                id=msg_id,
+                format="metadata",
+                metadataHeaders=METADATA_HEADERS,
+            ),
         )
+        errors = [f"Error fetching message {msg_id}: {e}" for msg_id, e in failures.items()]
+        return [responses[msg_id] for msg_id in dict.fromkeys(message_ids) if msg_id in responses], errors
+
+    def _store_messages(self, messages: list[dict], account: GoogleAccount) -> int:
+        """
+        Store fetched messages and their person links, returning how many were stored.
+
+        One INSERT ... ON CONFLICT (google_account_id, gmail_message_id)
+        DO UPDATE per UPSERT_BATCH_SIZE messages, returning their ids, then one
+        INSERT ... ON CONFLICT DO NOTHING for the links, instead of a SELECT
+        per message and per linked address.
+        """
+        # A page may repeat a message; ON CONFLICT cannot touch a row twice.
+        # Messages from ignored senders are neither stored nor linked.
+        ignore = get_ignore_matcher(self.db)
+        rows_by_id: dict[str, dict] = {}
+        for msg in messages:
+            row = self._message_row(msg, account)
+            if row and not ignore.matches(row["from_email"]):
+                rows_by_id[row["gmail_message_id"]] = row
+        rows = list(rows_by_id.values())
+        email_index = get_email_person_index(self.db)
+
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            chunk = rows[start:start + UPSERT_BATCH_SIZE]
+            stmt = pg_insert(EmailMessage).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[EmailMessage.google_account_id, EmailMessage.gmail_message_id],
+                set_={
+                    **{column: stmt.excluded[column] for column in UPSERT_COLUMNS},
+                    **{
+                        column: func.coalesce(stmt.excluded[column], getattr(EmailMessage, column))
+                        for column in UPSERT_FILL_COLUMNS
+                    },
+                    # Column onupdate defaults do not apply to ON CONFLICT
+                    "updated_at": func.now(),
+                },
+            ).returning(EmailMessage.gmail_message_id, EmailMessage.id)
+            message_ids = dict(self.db.execute(stmt).all())
+
+            links = [
+                link
+                for row in chunk
+                for link in self._link_rows(message_ids[row["gmail_message_id"]], row, email_index, ignore)
+            ]
+            if links:
+                self.db.execute(
+                    pg_insert(EmailPersonLink).values(links).on_conflict_do_nothing(
+                        index_elements=[
+                            EmailPersonLink.email_message_id,
+                            EmailPersonLink.person_id,
+                            EmailPersonLink.link_type,
+                        ],
+                    )
+                )
+        return len(rows)
 
-    def _parse_message(
+    def _message_row(
         self,
         message_data: dict,
         account: GoogleAccount,
-    ) -> EmailMessage | None:
-        """Parse Gmail API message response into EmailMessage model."""
+    ) -> dict | None:
+        """Map a Gmail API message resource to email_messages column values."""
         msg_id = message_data.get("id")
         thread_id = message_data.get("threadId")
 
@@ -454,8 +741,8 @@ class GmailSyncService:
 
         # Parse date
         internal_date = None
-        if "internaldate" in message_data:
-            timestamp_ms = int(message_data["internaldate"])
+        if "internalDate" in message_data:
+            timestamp_ms = int(message_data["internalDate"])
             internal_date = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
 
         # Parse labels
@@ -470,28 +757,30 @@ class GmailSyncService:
                 has_attachments = True
                 attachment_count += 1
 
-        return EmailMessage(
-            google_account_id=account.id,
-            gmail_message_id=msg_id,
-            gmail_thread_id=thread_id,
-            subject=headers.get("subject", ""),
-            snippet=message_data.get("snippet", ""),
-            from_email=from_email,
-            from_name=from_name,
-            to_emails=to_emails,
-            cc_emails=cc_emails,
-            bcc_emails=bcc_emails,
-            is_read="UNREAD" not in labels,
-            is_starred="STARRED" in labels,
-            is_draft="DRAFT" in labels,
-            is_sent="SENT" in labels,
-            labels=labels,
-            internal_date=internal_date,
-            received_at=internal_date,
-            has_attachments=has_attachments,
-            attachment_count=attachment_count,
-            history_id=int(message_data.get("historyId", 0)) or None,
-        )
+        return {
+            "id": uuid4(),
+            "google_account_id": account.id,
+            "gmail_message_id": msg_id,
+            "gmail_thread_id": thread_id,
+            "subject": headers.get("subject", ""),
+            "snippet": message_data.get("snippet", ""),
+            "from_email": from_email,
+            "from_name": from_name,
+            "to_emails": to_emails,
+            "cc_emails": cc_emails,
+            "bcc_emails": bcc_emails,
+            "is_read": "UNREAD" not in labels,
+            "is_starred": "STARRED" in labels,
+            "is_draft": "DRAFT" in labels,
+            "is_sent": "SENT" in labels,
+            "labels": labels,
+            "internal_date": internal_date,
+            "received_at": internal_date,
+            "has_attachments": has_attachments,
+            "attachment_count": attachment_count,
+            "history_id": int(message_data.get("historyId", 0)) or None,
+            "synced_at": datetime.now(timezone.utc),
+        }
 
     def _parse_email_header(self, header: str) -> tuple[str | None, str | None]:
         """Parse email header like 'Name <email@example.com>' into (email, name)."""
@@ -528,129 +817,93 @@ class GmailSyncService:
 
         return recipients
 
-    def _save_message(self, email_msg: EmailMessage) -> None:
-        """Save or update an email message and create person links."""
-        # Check if message already exists
-        existing = self.db.query(EmailMessage).filter_by(
-            google_account_id=email_msg.google_account_id,
-            gmail_message_id=email_msg.gmail_message_id,
-        ).first()
-
-        if existing:
-            # Update existing message
-            existing.subject = email_msg.subject
-            existing.snippet = email_msg.snippet
-            existing.is_read = email_msg.is_read
-            existing.is_starred = email_msg.is_starred
-            existing.labels = email_msg.labels
-            existing.synced_at = datetime.now(timezone.utc)
-            email_msg = existing
-        else:
-            # Add new message
-            self.db.add(email_msg)
-            self.db.flush()  # Get the ID
-
-        # Auto-link to persons
-        self._auto_link_to_persons(email_msg)
-
     def _update_message_labels(
         self,
         account_id: UUID,
-        gmail_message_id: str,
-        labels: list[str],
+        labels_by_id: dict[str, list[str]],
     ) -> None:
-        """Update labels for an existing message."""
-        msg = self.db.query(EmailMessage).filter_by(
-            google_account_id=account_id,
-            gmail_message_id=gmail_message_id,
-        ).first()
-
-        if msg:
+        """Update labels of existing messages, loading them in one query."""
+        if not labels_by_id:
+            return
+        messages = self.db.scalars(
+            select(EmailMessage).where(
+                EmailMessage.google_account_id == account_id,
+                EmailMessage.gmail_message_id.in_(labels_by_id),
+            )
+        )
+        for msg in messages:
+            labels = labels_by_id[msg.gmail_message_id]
             msg.labels = labels
             msg.is_read = "UNREAD" not in labels
             msg.is_starred = "STARRED" in labels
 
-    def _auto_link_to_persons(self, email_msg: EmailMessage) -> None:
-        """Auto-link email to CRM persons based on email addresses."""
-        # Build email-to-person cache if not exists
-        if self._email_to_person is None:
-            self._email_to_person = {}
-            person_emails = self.db.query(PersonEmail).all()
-            for pe in person_emails:
-                self._email_to_person[pe.email.lower()] = pe.person_id
-
+    def _link_rows(
+        self,
+        email_message_id: UUID,
+        row: dict,
+        email_index: Mapping[str, UUID],
+        ignore: IgnoreMatcher | None = None,
+    ) -> list[dict]:
+        """Auto-link rows connecting a stored message to CRM persons by (non-ignored) address."""
         # Collect all email addresses and their link types
         addresses_to_link = []
 
-        if email_msg.from_email:
-            addresses_to_link.append((email_msg.from_email, EmailLinkType.FROM.value))
+        if row["from_email"]:
+            addresses_to_link.append((row["from_email"], EmailLinkType.FROM.value))
 
-        for recipient in email_msg.to_emails or []:
+        for recipient in row["to_emails"] or []:
             if isinstance(recipient, dict) and recipient.get("email"):
                 addresses_to_link.append((recipient["email"], EmailLinkType.TO.value))
 
-        for recipient in email_msg.cc_emails or []:
+        for recipient in row["cc_emails"] or []:
             if isinstance(recipient, dict) and recipient.get("email"):
                 addresses_to_link.append((recipient["email"], EmailLinkType.CC.value))
 
-        # Create links for matching persons
+        # One link per (person, link type); existing links are kept by ON CONFLICT
+        links = {}
         for email_addr, link_type in addresses_to_link:
-            person_id = self._email_to_person.get(email_addr.lower())
+            if ignore is not None and ignore.matches(email_addr):
+                continue
+            person_id = email_index.get(email_addr.lower())
             if person_id:
-                # Check if link already exists
-                existing = self.db.query(EmailPersonLink).filter_by(
-                    email_message_id=email_msg.id,
-                    person_id=person_id,
-                    link_type=link_type,
-                ).first()
-
-                if not existing:
-                    link = EmailPersonLink(
-                        email_message_id=email_msg.id,
-                        person_id=person_id,
-                        link_type=link_type,
-                        linked_by=EmailLinkSource.AUTO.value,
-                    )
-                    self.db.add(link)
+                links[(person_id, link_type)] = {
+                    "id": uuid4(),
+                    "email_message_id": email_message_id,
+                    "person_id": person_id,
+                    "link_type": link_type,
+                    "linked_by": EmailLinkSource.AUTO.value,
+                    "linked_at": datetime.now(timezone.utc),
+                }
+        return list(links.values())
 
 
-def get_gmail_sync_service(db: Session) -> GmailSyncService:
-    """Get a Gmail sync service instance."""
-    return GmailSyncService(db)
-
+def _sync_account_in_session(session_factory: Callable[[], Session], account_id: UUID) -> SyncResult:
+    """Sync one account in a fresh session (runs in a Google executor worker)."""
+    with session_factory() as db:
+        account = db.get(GoogleAccount, account_id)
+        return GmailSyncService(db).sync_account(account)
 
-def get_gmail_labels(account: GoogleAccount) -> dict[str, str]:
-    """
-    Fetch all Gmail labels for an account and return mapping of ID to name.
 
-    Args:
-        account: Google account to fetch labels for
+def _backfill_account_in_session(session_factory: Callable[[], Session], account_id: UUID) -> SyncResult:
+    """Backfill one account in a fresh session (runs in a Google executor worker)."""
+    with session_factory() as db:
+        account = db.get(GoogleAccount, account_id)
+        return GmailSyncService(db).backfill(account)
 
-    Returns:
-        Dictionary mapping label ID to human-readable name
-    """
-    try:
-        creds_dict = account.get_credentials()
-        credentials = Credentials(
-            token=creds_dict.get("token"),
-            refresh_token=creds_dict.get("refresh_token"),
-            token_uri=creds_dict.get("token_uri", "https://oauth2.googleapis.com/token"),
-            client_id=creds_dict.get("client_id"),
-            client_secret=creds_dict.get("client_secret"),
-            scopes=creds_dict.get("scopes", GMAIL_SCOPES),
-        )
 
-        service = build("gmail", "v1", credentials=credentials)
-        response = service.users().labels().list(userId="me").execute()
+def get_gmail_sync_service(db: Session) -> GmailSyncService:
+    """Get a Gmail sync service instance."""
+    return GmailSyncService(db)
 
-        labels = {}
-        for label in response.get("labels", []):
-            label_id = label.get("id")
-            label_name = label.get("name")
-            if label_id and label_name:
-                labels[label_id] = label_name
 
-        return labels
+def fetch_label_names(service) -> dict[str, str]:
+    """Fetch all Gmail labels of a built service, as label ID -> human-readable name."""
+    response = execute(service.users().labels().list(userId="me"))
 
-    except Exception:
-        return {}
+    labels = {}
+    for label in response.get("labels", []):
+        label_id = label.get("id")
+        label_name = label.get("name")
+        if label_id and label_name:
+            labels[label_id] = label_name
+    return labels
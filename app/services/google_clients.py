@@ -0,0 +1,185 @@
+"""
+Per-account Google credentials and API client cache.
+
+Every Gmail, Calendar, Tasks and Contacts call used to decrypt
+GoogleAccount.credentials_encrypted, build a fresh Credentials object and
+call googleapiclient.discovery.build() - and access tokens refreshed during
+a call were thrown away, so the next call refreshed again. Services now go
+through this module:
+
+- get_credentials() decrypts an account's credentials once and returns the
+  same Credentials object until the account is re-connected (its
+  credentials_encrypted changes to a value not written here).
+- When google-auth refreshes that object's access token, the new token and
+  expiry are written back to the account in a separate session, so other
+  workers and restarts reuse it.
+- get_service() / service_for() keep built API clients per thread (httplib2
+  connections are not thread-safe), built from the discovery documents
+  bundled with google-api-python-client instead of fetched ones.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
+
+from app.models import GoogleAccount
+
+logger = logging.getLogger(__name__)
+
+TOKEN_URI = "https://oauth2.googleapis.com/token"
+
+# Built clients kept per thread (accounts x APIs in practice)
+MAX_SERVICES_PER_THREAD = 64
+
+_lock = threading.Lock()
+_local = threading.local()
+
+
+@dataclass
+class _CachedCredentials:
+    """An account's credentials and the ciphertexts they are current for."""
+
+    credentials: "PersistingCredentials"
+    ciphertexts: set[str] = field(default_factory=set)
+
+
+_credentials: dict[UUID, _CachedCredentials] = {}
+
+
+class PersistingCredentials(Credentials):
+    """Credentials that store refreshed access tokens on their GoogleAccount."""
+
+    def __init__(self, *args, account_id: UUID | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.account_id = account_id
+        self._refresh_lock = threading.Lock()
+
+    def refresh(self, request) -> None:
+        token = self.token
+        with self._refresh_lock:
+            # Another thread sharing these credentials refreshed meanwhile
+            if self.token != token and self.valid:
+                return
+            super().refresh(request)
+        if self.account_id is not None:
+            _persist_token(self.account_id, self)
+
+
+def _parse_expiry(value: str | None) -> datetime | None:
+    """Stored ISO expiry as the naive UTC datetime google-auth compares against."""
+    if not value:
+        return None
+    try:
+        expiry = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if expiry.tzinfo is not None:
+        expiry = expiry.astimezone(timezone.utc).replace(tzinfo=None)
+    return expiry
+
+
+def _from_dict(account_id: UUID, creds_dict: dict[str, Any], default_scopes: list[str]) -> PersistingCredentials:
+    return PersistingCredentials(
+        token=creds_dict.get("token"),
+        refresh_token=creds_dict.get("refresh_token"),
+        token_uri=creds_dict.get("token_uri", TOKEN_URI),
+        client_id=creds_dict.get("client_id"),
+        client_secret=creds_dict.get("client_secret"),
+        scopes=creds_dict.get("scopes", default_scopes),
+        expiry=_parse_expiry(creds_dict.get("expiry")),
+        account_id=account_id,
+    )
+
+
+def get_credentials(account: GoogleAccount, default_scopes: list[str]) -> Credentials:
+    """
+    The account's shared OAuth credentials, decrypted on first use.
+
+    Args:
+        account: Google account (only id and credentials_encrypted are read)
+        default_scopes: Scopes to request on refresh if none are stored
+
+    Raises:
+        DecryptionError: If the stored credentials cannot be decrypted
+    """
+    ciphertext = account.credentials_encrypted
+    with _lock:
+        cached = _credentials.get(account.id)
+        if cached is not None and ciphertext in cached.ciphertexts:
+            return cached.credentials
+
+    credentials = _from_dict(account.id, account.get_credentials(), default_scopes)
+    with _lock:
+        _credentials[account.id] = _CachedCredentials(credentials, {ciphertext})
+    return credentials
+
+
+def service_for(credentials: Credentials, api: str, version: str) -> Any:
+    """A built API client for credentials, reused by this thread."""
+    services = getattr(_local, "services", None)
+    if services is None:
+        services = _local.services = {}
+    key = (id(credentials), api, version)
+    entry = services.get(key)
+    if entry is None or entry[0] is not credentials:
+        if len(services) >= MAX_SERVICES_PER_THREAD:
+            # Only re-connected accounts leave entries behind
+            services.clear()
+        service = build(
+            api,
+            version,
+            credentials=credentials,
+            static_discovery=True,
+            cache_discovery=False,
+        )
+        entry = services[key] = (credentials, service)
+    return entry[1]
+
+
+def get_service(account: GoogleAccount, api: str, version: str, default_scopes: list[str]) -> Any:
+    """A built API client for the account, reused by this thread."""
+    return service_for(get_credentials(account, default_scopes), api, version)
+
+
+def clear_google_clients(account_id: UUID | None = None) -> None:
+    """Forget cached credentials (of one account, or all) and this thread's clients."""
+    with _lock:
+        if account_id is None:
+            _credentials.clear()
+        else:
+            _credentials.pop(account_id, None)
+    _local.services = None
+
+
+def _persist_token(account_id: UUID, credentials: Credentials) -> None:
+    """Write a refreshed access token (and expiry) back to the account."""
+    from app.database import SessionLocal
+
+    try:
+        with SessionLocal() as db:
+            account = db.get(GoogleAccount, account_id)
+            if account is None:
+                return
+            creds_dict = account.get_credentials()
+            creds_dict["token"] = credentials.token
+            creds_dict["expiry"] = credentials.expiry.isoformat() if credentials.expiry else None
+            if credentials.refresh_token:
+                creds_dict["refresh_token"] = credentials.refresh_token
+            account.set_credentials(creds_dict)
+            ciphertext = account.credentials_encrypted
+            db.commit()
+    except Exception:
+        # The refreshed token still works in memory; the next refresh retries
+        logger.exception("Failed to store refreshed credentials for account %s", account_id)
+        return
+
+    with _lock:
+        cached = _credentials.get(account_id)
+        if cached is not None and cached.credentials is credentials:
+            cached.ciphertexts.add(ciphertext)
@@ -0,0 +1,282 @@
+"""
+Shared concurrent executor for Google API calls.
+
+Google API calls are slow, blocking HTTP requests. Services that talk to
+several accounts (or several task lists, calendars, ...) fan the calls out
+over one bounded thread pool instead of running them back to back, so a
+page waits for the slowest call rather than the sum of all of them.
+
+- Per-account concurrency is capped (Google quotas are per user). Calls
+  over an account's limit wait in a per-account queue rather than in a
+  worker, so one busy account does not hold every worker.
+- execute() retries rate-limit and transient errors with exponential
+  backoff and jitter; execute_batch() sends many calls per HTTP request
+  through the API's batch endpoint and retries the calls that failed.
+
+Workers must not use the caller's SQLAlchemy session (sessions are not
+thread-safe): read what the call needs (credentials, ids) up front, or open
+a separate session per worker. Workers must not submit to the executor and
+wait on the result, which can exhaust the pool.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import zip_longest
+from typing import Any, Callable, Hashable, Iterable, TypeVar
+
+from googleapiclient.errors import HttpError
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying; 403 only with a rate-limit reason
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BASE_DELAY = 1.0
+MAX_DELAY = 32.0
+
+# Calls per batch request: Google allows 100, but Gmail answers large
+# batches with per-call 429s, so stay at its recommended 50
+DEFAULT_BATCH_SIZE = 50
+
+
+def _is_retryable(error: HttpError) -> bool:
+    status = getattr(error.resp, "status", None)
+    if status in RETRYABLE_STATUSES:
+        return True
+    if status == 403:
+        return any(reason in str(error) for reason in RATE_LIMIT_REASONS)
+    return False
+
+
+def _backoff_delay(attempt: int, base_delay: float) -> float:
+    delay = min(base_delay * (2 ** attempt), MAX_DELAY)
+    return delay + random.uniform(0, delay / 2)
+
+
+def execute(
+    request: Any,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    base_delay: float = DEFAULT_BASE_DELAY,
+) -> Any:
+    """
+    Run request.execute(), retrying rate-limit and transient errors.
+
+    Sleeps base_delay * 2^attempt (plus jitter, capped at MAX_DELAY) between
+    attempts; other errors, and the last failure, propagate unchanged.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return request.execute()
+        except HttpError as e:
+            if attempt == max_retries or not _is_retryable(e):
+                raise
+            delay = _backoff_delay(attempt, base_delay)
+            logger.info(f"Google API rate limited/unavailable ({e.resp.status}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+def execute_batch(
+    service: Any,
+    keys: Iterable[Hashable],
+    make_request: Callable[[Hashable], Any],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    base_delay: float = DEFAULT_BASE_DELAY,
+) -> tuple[dict[Hashable, Any], dict[Hashable, Exception]]:
+    """
+    Run one API call per key through the batch endpoint.
+
+    Calls go batch_size per HTTP request. Calls that fail with a rate-limit
+    or transient error are batched again after a backoff; a failure of the
+    whole batch request is retried by execute() and then propagates.
+
+    Args:
+        service: Discovery service object (provides new_batch_http_request)
+        keys: One call per distinct key, e.g. message IDs
+        make_request: Builds the (unexecuted) request for a key; called
+            again for retries, as executed requests cannot be re-added
+
+    Returns:
+        (responses by key, errors by key for calls that finally failed)
+    """
+    responses: dict[Hashable, Any] = {}
+    errors: dict[Hashable, Exception] = {}
+    pending = list(dict.fromkeys(keys))
+
+    for attempt in range(max_retries + 1):
+        retry: list[Hashable] = []
+
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+
+            def callback(request_id, response, exception, chunk=chunk):
+                key = chunk[int(request_id)]
+                if exception is None:
+                    responses[key] = response
+                elif isinstance(exception, HttpError) and _is_retryable(exception) and attempt < max_retries:
+                    retry.append(key)
+                else:
+                    errors[key] = exception
+
+            batch = service.new_batch_http_request(callback=callback)
+            for index, key in enumerate(chunk):
+                batch.add(make_request(key), request_id=str(index))
+            execute(batch, max_retries=max_retries, base_delay=base_delay)
+
+        if not retry:
+            break
+        delay = _backoff_delay(attempt, base_delay)
+        logger.info(f"Google API batch: {len(retry)} calls rate limited/unavailable, retrying in {delay:.1f}s")
+        time.sleep(delay)
+        pending = retry
+
+    return responses, errors
+
+
+@dataclass
+class Outcome:
+    """Result of one fanned-out call: value on success, error otherwise."""
+
+    item: Any
+    value: Any = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class GoogleExecutor:
+    """Bounded thread pool with per-account concurrency limits."""
+
+    def __init__(self, max_workers: int = 8, per_account_limit: int = 4):
+        self.max_workers = max_workers
+        self.per_account_limit = per_account_limit
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="google-api")
+        # Calls over an account's limit wait here, not in a pool thread
+        self._account_running: dict[Hashable, int] = defaultdict(int)
+        self._account_queues: dict[Hashable, deque] = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def _submit(self, account_key: Hashable, fn: Callable, args: tuple) -> Future:
+        """Run fn(*args) in the pool now, or queue it while its account is at the limit."""
+        if account_key is None:
+            return self._pool.submit(fn, *args)
+        future: Future = Future()
+        with self._lock:
+            if self._account_running[account_key] >= self.per_account_limit:
+                self._account_queues[account_key].append((future, fn, args))
+                return future
+            self._account_running[account_key] += 1
+        self._pool.submit(self._run_limited, account_key, future, fn, args)
+        return future
+
+    def _run_limited(self, account_key: Hashable, future: Future, fn: Callable, args: tuple) -> None:
+        """Run one account's call, then pass its slot to the account's next queued call."""
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+        with self._lock:
+            queue = self._account_queues[account_key]
+            if not queue:
+                self._account_running[account_key] -= 1
+                return
+            next_call = queue.popleft()
+        # Back through the pool queue, behind other accounts' waiting calls
+        try:
+            self._pool.submit(self._run_limited, account_key, *next_call)
+        except RuntimeError:  # pool shut down
+            next_call[0].cancel()
+
+    def map(
+        self,
+        fn: Callable[[T], Any],
+        items: Iterable[T],
+        account_key: Callable[[T], Hashable] | None = None,
+    ) -> list[Outcome]:
+        """
+        Call fn(item) for every item concurrently and wait for all of them.
+
+        Args:
+            fn: Blocking function to run in a worker
+            items: Inputs, one call each
+            account_key: Maps an item to its account, for per-account limits
+
+        Returns:
+            One Outcome per item, in input order; exceptions are captured
+        """
+        items = list(items)
+        if not items:
+            return []
+        if len(items) == 1:
+            return [self._call_inline(fn, items[0])]
+
+        # Interleave accounts so their calls spread over the workers
+        by_account: dict[Hashable, list[int]] = defaultdict(list)
+        for index, item in enumerate(items):
+            by_account[account_key(item) if account_key else None].append(index)
+        order = [
+            index
+            for batch in zip_longest(*by_account.values())
+            for index in batch
+            if index is not None
+        ]
+
+        futures = {}
+        for index in order:
+            key = account_key(items[index]) if account_key else None
+            futures[index] = self._submit(key, fn, (items[index],))
+
+        outcomes = []
+        for index, item in enumerate(items):
+            try:
+                outcomes.append(Outcome(item, value=futures[index].result()))
+            except Exception as e:
+                outcomes.append(Outcome(item, error=e))
+        return outcomes
+
+    def _call_inline(self, fn: Callable[[T], Any], item: T) -> Outcome:
+        """A single call runs on the calling thread (no hand-off cost)."""
+        try:
+            return Outcome(item, value=fn(item))
+        except Exception as e:
+            return Outcome(item, error=e)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            queued = [call for queue in self._account_queues.values() for call in queue]
+            self._account_queues.clear()
+        for future, _, _ in queued:
+            future.cancel()
+
+
+@lru_cache
+def get_google_executor() -> GoogleExecutor:
+    """The process-wide executor, sized from settings."""
+    settings = get_settings()
+    return GoogleExecutor(
+        max_workers=settings.google_api_max_workers,
+        per_account_limit=settings.google_api_per_account_concurrency,
+    )
+
+
+def shutdown_google_executor() -> None:
+    """Stop the shared executor (application shutdown)."""
+    if get_google_executor.cache_info().currsize:
+        get_google_executor().shutdown()
+        get_google_executor.cache_clear()
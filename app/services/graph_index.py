@@ -0,0 +1,367 @@
+"""
+In-memory graph engine for neighborhood and intro-path queries.
+
+GraphIndex loads every person, organization and relationship edge once
+(person-org affiliations, employment history, person-person and org-org
+relationships) into an undirected adjacency map keyed by vis.js node id
+("person_<uuid>" / "org_<uuid>"). k-hop neighborhoods and shortest paths are
+then plain BFS over dicts, with no database round trips.
+
+The index is cached alongside the /graph/data payloads and dropped by the
+same write hooks (graph_service.invalidate_graph_caches).
+
+compute_layout() runs a Fruchterman-Reingold force layout in NumPy so the
+browser can draw a stable layout with physics disabled. NumPy is optional:
+without it layouts are skipped and the client falls back to vis.js physics.
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import Organization, Person
+from app.models.org_relationship import OrganizationRelationship
+from app.models.person import PersonOrganization
+from app.models.person_employment import PersonEmployment
+from app.models.person_relationship import PersonRelationship
+from app.models.relationship_type import RelationshipType as PersonRelationshipType
+from app.services import graph_service
+
+try:
+    import numpy as np
+except ImportError:  # Layouts are skipped without NumPy
+    np = None
+
+
+# Above this many nodes the O(n^2) layout is skipped (client physics instead)
+LAYOUT_MAX_NODES = 1500
+
+# Edge kinds, used for styling and to prefer person links in intro paths
+EDGE_KIND_AFFILIATION = "affiliation"
+EDGE_KIND_EMPLOYMENT = "employment"
+EDGE_KIND_PERSON = "person_relationship"
+EDGE_KIND_ORG = "org_relationship"
+
+EDGE_KIND_COLORS = {
+    EDGE_KIND_AFFILIATION: "#6B7280",  # Gray
+    EDGE_KIND_EMPLOYMENT: "#8B5CF6",  # Purple
+    EDGE_KIND_PERSON: "#3B82F6",  # Blue
+    EDGE_KIND_ORG: "#F59E0B",  # Gold
+}
+
+
+class GraphNodeNotFoundError(ValueError):
+    """Raised when a node id is not in the graph."""
+    pass
+
+
+@dataclass
+class GraphIndex:
+    """Adjacency index over persons and organizations."""
+
+    # node id -> (label, person title or OrgType)
+    nodes: dict[str, tuple] = field(default_factory=dict)
+    # node id -> {neighbor id: (edge kind, edge label)}
+    adjacency: dict[str, dict[str, tuple[str, str]]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, db: Session) -> "GraphIndex":
+        """Load the whole graph with six column-only queries."""
+        index = cls()
+
+        for person_id, full_name, title in db.query(Person.id, Person.full_name, Person.title):
+            index.nodes[f"person_{person_id}"] = (full_name, title)
+
+        for org_id, name, org_type in db.query(Organization.id, Organization.name, Organization.org_type):
+            index.nodes[f"org_{org_id}"] = (name, org_type)
+
+        for person_id, org_id, relationship in db.query(
+            PersonOrganization.person_id, PersonOrganization.organization_id, PersonOrganization.relationship
+        ).filter(PersonOrganization.person_id.isnot(None)):
+            label = relationship.value.replace("_", " ").title()
+            index.add_edge(f"person_{person_id}", f"org_{org_id}", EDGE_KIND_AFFILIATION, label)
+
+        for person_id, org_id, title in db.query(
+            PersonEmployment.person_id, PersonEmployment.organization_id, PersonEmployment.title
+        ).filter(PersonEmployment.organization_id.isnot(None)):
+            index.add_edge(f"person_{person_id}", f"org_{org_id}", EDGE_KIND_EMPLOYMENT, title or "Employment")
+
+        for person_id, related_id, type_name in (
+            db.query(PersonRelationship.person_id, PersonRelationship.related_person_id, PersonRelationshipType.name)
+            .outerjoin(PersonRelationshipType, PersonRelationship.relationship_type_id == PersonRelationshipType.id)
+        ):
+            index.add_edge(f"person_{person_id}", f"person_{related_id}", EDGE_KIND_PERSON, type_name or "Knows")
+
+        for from_id, to_id, rel_type in db.query(
+            OrganizationRelationship.from_organization_id,
+            OrganizationRelationship.to_organization_id,
+            OrganizationRelationship.relationship_type,
+        ):
+            rel_type_str = rel_type.value if hasattr(rel_type, "value") else rel_type
+            index.add_edge(f"org_{from_id}", f"org_{to_id}", EDGE_KIND_ORG, rel_type_str.replace("_", " ").title())
+
+        return index
+
+    def add_edge(self, a: str, b: str, kind: str, label: str) -> None:
+        """Add an undirected edge; the first edge between two nodes wins."""
+        if a == b or a not in self.nodes or b not in self.nodes:
+            return
+        self.adjacency.setdefault(a, {}).setdefault(b, (kind, label))
+        self.adjacency.setdefault(b, {}).setdefault(a, (kind, label))
+
+    def neighbors(self, node_id: str) -> dict[str, tuple[str, str]]:
+        return self.adjacency.get(node_id, {})
+
+    def _require(self, node_id: str) -> None:
+        if node_id not in self.nodes:
+            raise GraphNodeNotFoundError(f"Unknown graph node: {node_id}")
+
+    def neighborhood(self, center: str, depth: int, max_nodes: int) -> dict[str, int]:
+        """
+        Nodes within `depth` hops of center, mapped to their hop distance.
+
+        BFS stops adding nodes once max_nodes is reached, so the nearest
+        rings are always complete before farther ones are truncated.
+
+        Raises:
+            GraphNodeNotFoundError: If center is not in the graph
+        """
+        self._require(center)
+        distances = {center: 0}
+        queue = deque([center])
+        while queue and len(distances) < max_nodes:
+            node = queue.popleft()
+            if distances[node] >= depth:
+                continue
+            for neighbor in self.neighbors(node):
+                if neighbor not in distances:
+                    distances[neighbor] = distances[node] + 1
+                    queue.append(neighbor)
+                    if len(distances) >= max_nodes:
+                        break
+        return distances
+
+    def shortest_path(self, source: str, target: str, max_depth: int) -> list[str] | None:
+        """
+        Shortest path from source to target (inclusive), or None.
+
+        Paths may pass through organizations (shared employer or affiliation)
+        as well as direct person-to-person relationships.
+
+        Raises:
+            GraphNodeNotFoundError: If either node is not in the graph
+        """
+        self._require(source)
+        self._require(target)
+        if source == target:
+            return [source]
+
+        parents: dict[str, str | None] = {source: None}
+        frontier = [source]
+        for _ in range(max_depth):
+            next_frontier = []
+            for node in frontier:
+                for neighbor in self.neighbors(node):
+                    if neighbor in parents:
+                        continue
+                    parents[neighbor] = node
+                    if neighbor == target:
+                        path = [target]
+                        while parents[path[-1]] is not None:
+                            path.append(parents[path[-1]])
+                        return path[::-1]
+                    next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return None
+
+    def edges_among(self, node_ids) -> list[tuple[str, str, str, str]]:
+        """Edges (a, b, kind, label) with both endpoints in node_ids, each once."""
+        members = set(node_ids)
+        edges = []
+        for a in members:
+            for b, (kind, label) in self.neighbors(a).items():
+                if b in members and a < b:
+                    edges.append((a, b, kind, label))
+        return edges
+
+
+def get_graph_index(db: Session) -> GraphIndex:
+    """The cached GraphIndex, built on first use after an invalidation."""
+    return graph_service.index_cache.get_or_set("index", lambda: GraphIndex.build(db))
+
+
+def compute_layout(
+    node_ids: list[str],
+    edges: list[tuple[str, str, str, str]],
+    center: Optional[str] = None,
+    iterations: int = 150,
+    scale: float = 1000.0,
+    seed: int = 42,
+) -> dict[str, tuple[float, float]]:
+    """
+    Fruchterman-Reingold force layout, vectorized with NumPy.
+
+    Deterministic for a given graph (seeded start positions), so reloading a
+    neighborhood draws the same picture. Returns {} when NumPy is missing or
+    the graph exceeds LAYOUT_MAX_NODES.
+    """
+    n = len(node_ids)
+    if np is None or n == 0 or n > LAYOUT_MAX_NODES:
+        return {}
+    if n == 1:
+        return {node_ids[0]: (0.0, 0.0)}
+
+    position_of = {node_id: i for i, node_id in enumerate(node_ids)}
+    src = np.array([position_of[a] for a, b, _, _ in edges], dtype=np.intp)
+    dst = np.array([position_of[b] for a, b, _, _ in edges], dtype=np.intp)
+
+    rng = np.random.default_rng(seed)
+    pos = rng.uniform(-1.0, 1.0, size=(n, 2)).astype(np.float32)
+    k = math.sqrt(4.0 / n)  # ideal edge length for a 2x2 area
+    temperature = 0.2
+    cooling = temperature / (iterations + 1)
+
+    for _ in range(iterations):
+        # Repulsion between every pair: k^2 / d
+        delta = pos[:, None, :] - pos[None, :, :]
+        distance = np.sqrt((delta ** 2).sum(axis=-1))
+        np.fill_diagonal(distance, 1.0)
+        np.maximum(distance, 0.01, out=distance)
+        displacement = (delta * ((k * k) / distance ** 2)[:, :, None]).sum(axis=1)
+
+        # Attraction along edges: d^2 / k
+        if len(src):
+            edge_delta = pos[src] - pos[dst]
+            edge_distance = np.maximum(np.sqrt((edge_delta ** 2).sum(axis=-1)), 0.01)
+            force = edge_delta * (edge_distance / k)[:, None]
+            np.subtract.at(displacement, src, force)
+            np.add.at(displacement, dst, force)
+
+        # Move each node at most `temperature`
+        length = np.maximum(np.sqrt((displacement ** 2).sum(axis=-1)), 0.01)
+        pos += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+
+    if center in position_of:
+        pos -= pos[position_of[center]]
+    else:
+        pos -= pos.mean(axis=0)
+    extent = float(np.abs(pos).max()) or 1.0
+    pos *= scale / extent
+
+    return {node_id: (round(float(x), 1), round(float(y), 1)) for node_id, (x, y) in zip(node_ids, pos)}
+
+
+def _vis_node(index: GraphIndex, node_id: str, distance: Optional[int] = None) -> dict:
+    label, subtitle = index.nodes[node_id]
+    kind, raw_id = node_id.split("_", 1)
+    if kind == "person":
+        node = graph_service.person_node(raw_id, label, subtitle)
+    else:
+        node = graph_service.org_node(raw_id, label, subtitle)
+    if distance is not None:
+        node["level"] = distance
+    return node
+
+
+def _vis_edge(a: str, b: str, kind: str, label: str, highlight: bool = False) -> dict:
+    color = EDGE_KIND_COLORS.get(kind, "#6B7280")
+    return {
+        "from": a,
+        "to": b,
+        "label": label,
+        "title": label,
+        "color": {"color": color, "highlight": color},
+        "width": 4 if highlight else 1.5,
+        "smooth": False,
+    }
+
+
+def build_neighborhood_payload(
+    db: Session,
+    center: str,
+    depth: int = 2,
+    max_nodes: int = 300,
+    layout: bool = True,
+) -> dict:
+    """
+    vis.js payload for the k-hop neighborhood of center.
+
+    With layout=True each node carries precomputed x/y and "layout" is true,
+    telling the client to render with physics off.
+
+    Raises:
+        GraphNodeNotFoundError: If center is not in the graph
+    """
+    index = get_graph_index(db)
+    distances = index.neighborhood(center, depth, max_nodes)
+    node_ids = sorted(distances, key=lambda node_id: (distances[node_id], node_id))
+    edges = index.edges_among(node_ids)
+
+    positions = compute_layout(node_ids, edges, center=center) if layout else {}
+
+    nodes = []
+    for node_id in node_ids:
+        node = _vis_node(index, node_id, distances[node_id])
+        if node_id in positions:
+            node["x"], node["y"] = positions[node_id]
+        if node_id == center:
+            node["size"] = node["size"] * 1.5
+        nodes.append(node)
+
+    return {
+        "nodes": nodes,
+        "edges": [_vis_edge(*edge) for edge in edges],
+        "layout": bool(positions),
+        "stats": {
+            "person_count": sum(1 for n in node_ids if n.startswith("person_")),
+            "org_count": sum(1 for n in node_ids if n.startswith("org_")),
+            "edge_count": len(edges),
+        },
+    }
+
+
+def get_neighborhood_json(
+    db: Session,
+    center: str,
+    depth: int = 2,
+    max_nodes: int = 300,
+    layout: bool = True,
+) -> bytes:
+    """Encoded neighborhood payload, cached until the graph changes."""
+    key = (center, depth, max_nodes, layout)
+    return graph_service.neighborhood_cache.get_or_set(
+        key,
+        lambda: graph_service.encode_json(build_neighborhood_payload(db, center, depth, max_nodes, layout)),
+    )
+
+
+def build_path_payload(db: Session, source: str, target: str, max_depth: int = 6) -> dict:
+    """
+    vis.js payload for the shortest intro path between two nodes.
+
+    Raises:
+        GraphNodeNotFoundError: If either node is not in the graph
+    """
+    index = get_graph_index(db)
+    path = index.shortest_path(source, target, max_depth)
+    if path is None:
+        return {"found": False, "path": [], "nodes": [], "edges": []}
+
+    edges = []
+    for a, b in zip(path, path[1:]):
+        kind, label = index.neighbors(a)[b]
+        edges.append(_vis_edge(a, b, kind, label, highlight=True))
+
+    return {
+        "found": True,
+        "path": [{"id": node_id, "label": index.nodes[node_id][0]} for node_id in path],
+        "hops": len(path) - 1,
+        "nodes": [_vis_node(index, node_id, i) for i, node_id in enumerate(path)],
+        "edges": edges,
+    }
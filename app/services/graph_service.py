@@ -0,0 +1,352 @@
+"""
+Social graph payloads for the /graph views.
+
+Builds the vis.js nodes/edges for person-organization and
+organization-organization relationships with a fixed number of queries:
+links first, then all referenced persons and organizations in bulk.
+
+Encoded payloads are cached per filter combination, so repeat loads of the
+graph page skip the database and JSON encoding entirely. They are dropped
+when a transaction commits that changed relationships or the person and
+organization fields the graph shows (see invalidate_graph_caches).
+"""
+
+import json
+import logging
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import event, or_
+from sqlalchemy.orm import Session
+
+from app.models import Organization, Person
+from app.models.org_relationship import OrganizationRelationship
+from app.models.organization import RelationshipType
+from app.models.person import PersonOrganization
+from app.models.person_employment import PersonEmployment
+from app.models.person_relationship import PersonRelationship
+from app.utils.cache import TTLCache
+from app.utils.write_tracking import bulk_write_touches, flush_touches
+
+try:
+    import orjson
+except ImportError:  # Falls back to the stdlib encoder
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Encoded payloads; writes invalidate, the TTL only bounds staleness from
+# changes made outside this process (imports, psql)
+GRAPH_CACHE_TTL_SECONDS = 600
+_payload_cache = TTLCache(ttl_seconds=GRAPH_CACHE_TTL_SECONDS, max_entries=128)
+
+# The in-memory adjacency index (see graph_index), alone in its cache so
+# neighborhood entries never evict it, and the neighborhood payloads
+# derived from it; both are invalidated together with the payloads above
+index_cache = TTLCache(ttl_seconds=GRAPH_CACHE_TTL_SECONDS, max_entries=1)
+neighborhood_cache = TTLCache(ttl_seconds=GRAPH_CACHE_TTL_SECONDS, max_entries=128)
+
+# Models whose writes change the graph, with the columns the graph reads
+# (None: any column, e.g. edge labels and tooltips)
+GRAPH_COLUMNS = {
+    Person: ("full_name", "title"),
+    Organization: ("name", "org_type"),
+    PersonOrganization: None,
+    PersonEmployment: None,
+    OrganizationRelationship: None,
+    PersonRelationship: None,
+}
+GRAPH_MODELS = tuple(GRAPH_COLUMNS)
+
+# session.info key: graph changed in this transaction
+_CHANGED_KEY = "graph_caches_changed"
+
+# Color scheme for node types
+NODE_COLORS = {
+    "person": "#3B82F6",  # Blue
+    "organization": "#10B981",  # Green
+}
+
+# Color scheme for relationship types (person-org)
+EDGE_COLORS = {
+    "affiliated_with": "#6B7280",  # Gray
+    "peer_history": "#8B5CF6",  # Purple
+    "key_person": "#EF4444",  # Red
+    "connection": "#F59E0B",  # Amber
+    "contact_at": "#06B6D4",  # Cyan
+}
+
+# Color scheme for org-to-org relationship types
+ORG_EDGE_COLORS = {
+    "invested_in": "#F59E0B",  # Gold - Investment relationships
+    "subsidiary_of": "#8B5CF6",  # Purple
+    "parent_company": "#8B5CF6",  # Purple
+    "partner": "#14B8A6",  # Teal
+    "acquired": "#EF4444",  # Red
+    "acquired_by": "#EF4444",  # Red
+    "spun_off_from": "#EC4899",  # Pink
+}
+
+
+def encode_json(payload: Any) -> bytes:
+    """Encode a payload as JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _parse_uuid(value: Optional[str]) -> UUID | None:
+    if not value:
+        return None
+    try:
+        return UUID(value)
+    except ValueError:
+        return None
+
+
+def person_node(person_id: str, full_name: str, title: str | None) -> dict:
+    """vis.js node for a person."""
+    return {
+        "id": f"person_{person_id}",
+        "label": full_name,
+        "group": "person",
+        "title": f"{full_name}\n{title or ''}\nClick to view profile",
+        "shape": "dot",
+        "size": 15,
+        "color": {
+            "background": NODE_COLORS["person"],
+            "border": "#1E40AF",
+            "highlight": {"background": "#60A5FA", "border": "#1E40AF"},
+        },
+        "font": {"color": "#1F2937"},
+        "url": f"/people/{person_id}",
+    }
+
+
+def org_node(org_id: str, name: str, org_type) -> dict:
+    """vis.js node for an organization."""
+    return {
+        "id": f"org_{org_id}",
+        "label": name,
+        "group": "organization",
+        "title": f"{name}\n{org_type.value.replace('_', ' ').title()}\nClick to view profile",
+        "shape": "square",
+        "size": 20,
+        "color": {
+            "background": NODE_COLORS["organization"],
+            "border": "#065F46",
+            "highlight": {"background": "#34D399", "border": "#065F46"},
+        },
+        "font": {"color": "#1F2937"},
+        "url": f"/organizations/{org_id}",
+    }
+
+
+def _person_org_edge(link: PersonOrganization) -> dict:
+    edge_color = EDGE_COLORS.get(link.relationship.value, "#6B7280")
+    edge_label = link.relationship.value.replace("_", " ").title()
+    if link.role:
+        edge_label = f"{edge_label} ({link.role})"
+
+    return {
+        "from": f"person_{link.person_id}",
+        "to": f"org_{link.organization_id}",
+        "label": edge_label,
+        "color": {"color": edge_color, "highlight": edge_color},
+        "arrows": {"to": {"enabled": True, "scaleFactor": 0.5}},
+        "smooth": {"type": "curvedCW", "roundness": 0.1},
+        "title": f"{link.relationship.value.replace('_', ' ').title()}" +
+                 (f"\nRole: {link.role}" if link.role else "") +
+                 (f"\n{'Current' if link.is_current else 'Past'}" if hasattr(link, 'is_current') else ""),
+    }
+
+
+def _org_org_edge(org_rel: OrganizationRelationship) -> dict:
+    # relationship_type is stored as string in DB
+    rel_type_str = org_rel.relationship_type.value if hasattr(org_rel.relationship_type, 'value') else org_rel.relationship_type
+    org_edge_color = ORG_EDGE_COLORS.get(rel_type_str, "#6B7280")
+    org_edge_label = rel_type_str.replace("_", " ").title()
+    if org_rel.year:
+        org_edge_label = f"{org_edge_label} ({org_rel.year})"
+
+    return {
+        "from": f"org_{org_rel.from_organization_id}",
+        "to": f"org_{org_rel.to_organization_id}",
+        "label": org_edge_label,
+        "color": {"color": org_edge_color, "highlight": org_edge_color},
+        "arrows": {"to": {"enabled": True, "scaleFactor": 0.5}},
+        "smooth": {"type": "curvedCW", "roundness": 0.2},
+        "width": 2,
+        "dashes": False,
+        "title": f"{rel_type_str.replace('_', ' ').title()}" +
+                 (f"\nYear: {org_rel.year}" if org_rel.year else "") +
+                 (f"\nNotes: {org_rel.notes}" if org_rel.notes else ""),
+    }
+
+
+def build_graph_payload(
+    db: Session,
+    relationship_type: Optional[str] = None,
+    focus_person: Optional[str] = None,
+    focus_org: Optional[str] = None,
+    limit: int = 500,
+) -> dict:
+    """
+    Build the vis.js graph for the given filters.
+
+    Issues four queries: person-org links, org-org links, then the persons
+    and organizations they reference (name/title columns only).
+    """
+    # Build relationship type filter
+    rel_filter = None
+    if relationship_type:
+        try:
+            rel_filter = RelationshipType(relationship_type)
+        except ValueError:
+            pass
+
+    # Focus mode: show only connections for specific entity
+    focus_person_uuid = _parse_uuid(focus_person)
+    focus_org_uuid = _parse_uuid(focus_org)
+
+    # Query PersonOrganization relationships (person -> org)
+    po_query = db.query(PersonOrganization)
+    if rel_filter:
+        po_query = po_query.filter(PersonOrganization.relationship == rel_filter)
+    if focus_person_uuid:
+        po_query = po_query.filter(PersonOrganization.person_id == focus_person_uuid)
+    if focus_org_uuid:
+        po_query = po_query.filter(PersonOrganization.organization_id == focus_org_uuid)
+    person_org_links = po_query.limit(limit).all()
+
+    # Query Organization-to-Organization relationships
+    org_rel_query = db.query(OrganizationRelationship)
+    if focus_org_uuid:
+        org_rel_query = org_rel_query.filter(
+            or_(
+                OrganizationRelationship.from_organization_id == focus_org_uuid,
+                OrganizationRelationship.to_organization_id == focus_org_uuid,
+            )
+        )
+    org_relationships = org_rel_query.limit(limit).all()
+
+    # Bulk-load every referenced node
+    person_ids = {link.person_id for link in person_org_links if link.person_id}
+    org_ids = {link.organization_id for link in person_org_links}
+    for org_rel in org_relationships:
+        org_ids.add(org_rel.from_organization_id)
+        org_ids.add(org_rel.to_organization_id)
+
+    persons = {}
+    if person_ids:
+        persons = {
+            row.id: row
+            for row in db.query(Person.id, Person.full_name, Person.title).filter(Person.id.in_(person_ids))
+        }
+    orgs = {}
+    if org_ids:
+        orgs = {
+            row.id: row
+            for row in db.query(Organization.id, Organization.name, Organization.org_type)
+            .filter(Organization.id.in_(org_ids))
+        }
+
+    nodes = []
+    edges = []
+    seen_persons = set()
+    seen_orgs = set()
+
+    def add_org(org_id: UUID) -> None:
+        if org_id not in seen_orgs and org_id in orgs:
+            seen_orgs.add(org_id)
+            org = orgs[org_id]
+            nodes.append(org_node(str(org_id), org.name, org.org_type))
+
+    # Process PersonOrganization links (unified table)
+    for link in person_org_links:
+        if link.person_id not in seen_persons and link.person_id in persons:
+            seen_persons.add(link.person_id)
+            person = persons[link.person_id]
+            nodes.append(person_node(str(person.id), person.full_name, person.title))
+        add_org(link.organization_id)
+        edges.append(_person_org_edge(link))
+
+    # Process Org-to-Org links
+    for org_rel in org_relationships:
+        add_org(org_rel.from_organization_id)
+        add_org(org_rel.to_organization_id)
+        edges.append(_org_org_edge(org_rel))
+
+    return {
+        "nodes": nodes,
+        "edges": edges,
+        "stats": {
+            "person_count": len(seen_persons),
+            "org_count": len(seen_orgs),
+            "edge_count": len(edges),
+        },
+    }
+
+
+def get_graph_json(
+    db: Session,
+    relationship_type: Optional[str] = None,
+    focus_person: Optional[str] = None,
+    focus_org: Optional[str] = None,
+    limit: int = 500,
+) -> bytes:
+    """Encoded graph payload for the filters, served from cache when possible."""
+    key = (relationship_type or "", focus_person or "", focus_org or "", limit)
+    return _payload_cache.get_or_set(
+        key,
+        lambda: encode_json(build_graph_payload(db, relationship_type, focus_person, focus_org, limit)),
+    )
+
+
+def invalidate_graph_caches() -> None:
+    """Drop every cached graph payload and the adjacency index."""
+    _payload_cache.clear()
+    index_cache.clear()
+    neighborhood_cache.clear()
+
+
+def _touches_graph(session: Session, obj) -> bool:
+    for model, columns in GRAPH_COLUMNS.items():
+        if isinstance(obj, model):
+            return flush_touches(session, obj, columns)
+    return False
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context) -> None:
+    """Note a flush that changed graph rows; caches are dropped on commit."""
+    if session.info.get(_CHANGED_KEY):
+        return
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if _touches_graph(session, obj):
+            session.info[_CHANGED_KEY] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_write(orm_execute_state) -> None:
+    """Note bulk query.update()/delete() of graph rows (no flush events)."""
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or not issubclass(mapper.class_, GRAPH_MODELS):
+        return
+    columns = next(cols for model, cols in GRAPH_COLUMNS.items() if issubclass(mapper.class_, model))
+    if bulk_write_touches(orm_execute_state, GRAPH_MODELS, columns):
+        orm_execute_state.session.info[_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session) -> None:
+    if session.info.pop(_CHANGED_KEY, False):
+        invalidate_graph_caches()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _invalidate_on_rollback(session, previous_transaction) -> None:
+    # A rebuild through this session may have seen the rolled-back rows
+    if session.info.pop(_CHANGED_KEY, False):
+        invalidate_graph_caches()
@@ -18,6 +18,7 @@ logger = logging.getLogger(__name__)
 
 from app.models import Person, PersonEmail, Organization, PersonOrganization
 from app.models.person_email import EmailLabel
+from app.services.person_email_index import get_email_person_index
 
 
 class LinkedInImportError(Exception):
@@ -258,22 +259,13 @@ class LinkedInImportService:
         return None
 
     def _build_email_cache(self) -> None:
-        """Build cache mapping emails to person IDs."""
-        self._email_to_person_cache = {}
-
-        # Get all PersonEmail records
-        person_emails = self.db.query(PersonEmail).all()
-        for pe in person_emails:
-            self._email_to_person_cache[pe.email.lower()] = pe.person_id
+        """
+        Start the cache of emails added by this import.
 
-        # Also check legacy email field
-        persons = self.db.query(Person).filter(Person.email.isnot(None)).all()
-        for p in persons:
-            if p.email:
-                for email in p.email.split(","):
-                    email = email.strip().lower()
-                    if email and email not in self._email_to_person_cache:
-                        self._email_to_person_cache[email] = p.id
+        Existing addresses come from the shared email -> person index, which
+        only sees this import's additions once they are committed.
+        """
+        self._email_to_person_cache = {}
 
     def _build_company_cache(self) -> None:
         """Build cache mapping company names to organization IDs."""
@@ -311,8 +303,11 @@ class LinkedInImportService:
         # First try email matching (most reliable)
         if contact.email:
             email_lower = contact.email.lower()
-            if email_lower in self._email_to_person_cache:
-                person_id = self._email_to_person_cache[email_lower]
+            person_id = (
+                self._email_to_person_cache.get(email_lower)
+                or get_email_person_index(self.db).get(email_lower)
+            )
+            if person_id:
                 return self.db.query(Person).filter_by(id=person_id).first()
 
         # Fall back to name matching
@@ -0,0 +1,177 @@
+"""
+Process-wide email address -> person index.
+
+Gmail message linking, calendar attendee matching and the LinkedIn import
+used to load every PersonEmail (and legacy Person.email) row into a dict of
+their own, per service instance and per run. They now share this index,
+built with two column-only queries on first use and kept until person
+emails change:
+
+- New PersonEmail rows (and new persons with a legacy email) are added in
+  place when their transaction commits.
+- Any other change to an address - an edited or deleted PersonEmail, an
+  edited legacy email, a deleted (e.g. merged) person, a bulk write of
+  addresses - bumps the index version, and the next lookup rebuilds it.
+
+INDEX_MAX_AGE_SECONDS bounds staleness from writes made outside this process
+(scripts, psql). Uncommitted additions are not visible: services that create
+persons while matching keep their own overlay for those.
+"""
+
+import threading
+import time
+from typing import Mapping
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.models import Person, PersonEmail
+from app.utils.write_tracking import bulk_write_touches
+
+INDEX_MAX_AGE_SECONDS = 600
+
+# session.info keys: additions waiting for commit, and "rebuild on commit"
+_ADDITIONS_KEY = "email_person_index_additions"
+_CHANGED_KEY = "email_person_index_changed"
+
+_lock = threading.Lock()
+# Serializes rebuilds, so concurrent sync workers wait for one build
+_build_lock = threading.Lock()
+_version = 0
+_index: dict[str, UUID] | None = None
+_index_version = -1
+_built_at = 0.0
+
+
+def _legacy_emails(value: str | None) -> list[str]:
+    """Addresses of a legacy (comma-separated) Person.email value."""
+    if not value:
+        return []
+    return [email.strip().lower() for email in value.split(",") if email.strip()]
+
+
+def build_email_person_index(db: Session) -> dict[str, UUID]:
+    """Map every known address (lowercase) to its person; PersonEmail wins over Person.email."""
+    index: dict[str, UUID] = {}
+    for email, person_id in db.query(PersonEmail.email, PersonEmail.person_id):
+        if email:
+            index[email.lower()] = person_id
+    for person_id, legacy in db.query(Person.id, Person.email).filter(Person.email.isnot(None)):
+        for email in _legacy_emails(legacy):
+            index.setdefault(email, person_id)
+    return index
+
+
+def _current() -> dict[str, UUID] | None:
+    """The stored index if still valid (call with _lock held)."""
+    if _index is None or _index_version != _version:
+        return None
+    if time.monotonic() - _built_at >= INDEX_MAX_AGE_SECONDS:
+        return None
+    return _index
+
+
+def get_email_person_index(db: Session) -> Mapping[str, UUID]:
+    """
+    The shared index, rebuilt with db on first use after an invalidation.
+
+    Callers must treat the mapping as read-only.
+    """
+    global _index, _index_version, _built_at
+    with _lock:
+        index = _current()
+    if index is not None:
+        return index
+
+    with _build_lock:
+        with _lock:
+            index = _current()
+            version = _version
+        if index is not None:
+            return index
+        index = build_email_person_index(db)
+        with _lock:
+            # An invalidation during the build may have missed these rows
+            if version == _version:
+                _index, _index_version, _built_at = index, version, time.monotonic()
+    return index
+
+
+def invalidate_email_person_index() -> None:
+    """Bump the version; the next lookup rebuilds the index."""
+    global _version
+    with _lock:
+        _version += 1
+
+
+def _apply_additions(additions: list[tuple[str, UUID, bool]]) -> None:
+    """Add committed addresses to a valid index (else force a rebuild)."""
+    global _version
+    with _lock:
+        index = _current()
+        if index is None:
+            # A rebuild may be running on data from before this commit
+            _version += 1
+            return
+        for email, person_id, from_person_email in additions:
+            if from_person_email:
+                index[email] = person_id
+            else:
+                index.setdefault(email, person_id)
+
+
+def _changes_addresses(session: Session, obj) -> bool:
+    if isinstance(obj, PersonEmail):
+        return True
+    if isinstance(obj, Person):
+        return obj in session.deleted or inspect(obj).attrs.email.history.has_changes()
+    return False
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context) -> None:
+    """Collect new addresses for commit; invalidate on any other address change."""
+    additions = []
+    for obj in session.new:
+        if isinstance(obj, PersonEmail) and obj.email:
+            additions.append((obj.email.lower(), obj.person_id, True))
+        elif isinstance(obj, Person):
+            additions.extend((email, obj.id, False) for email in _legacy_emails(obj.email))
+    if additions:
+        session.info.setdefault(_ADDITIONS_KEY, []).extend(additions)
+
+    for obj in (*session.dirty, *session.deleted):
+        if _changes_addresses(session, obj):
+            session.info[_CHANGED_KEY] = True
+            invalidate_email_person_index()
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_on_bulk_write(orm_execute_state) -> None:
+    """Invalidate on bulk writes of addresses (no flush events), not of other person columns."""
+    if (
+        bulk_write_touches(orm_execute_state, (Person,), ("email",))
+        or bulk_write_touches(orm_execute_state, (PersonEmail,), ("email", "person_id"))
+    ):
+        orm_execute_state.session.info[_CHANGED_KEY] = True
+        invalidate_email_person_index()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_on_commit(session) -> None:
+    additions = session.info.pop(_ADDITIONS_KEY, None)
+    if session.info.pop(_CHANGED_KEY, False):
+        # Rebuild again: one may have run between the flush and this commit
+        invalidate_email_person_index()
+    elif additions:
+        _apply_additions(additions)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_on_rollback(session, previous_transaction) -> None:
+    # A rebuild through this session may have seen the rolled-back rows
+    had_additions = session.info.pop(_ADDITIONS_KEY, None)
+    if session.info.pop(_CHANGED_KEY, False) or had_additions:
+        invalidate_email_person_index()
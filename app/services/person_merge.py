@@ -7,7 +7,7 @@ Handles merging all related data from source person to target person.
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.models import (
     Person,
@@ -24,6 +24,7 @@ from app.models.person_employment import PersonEmployment
 from app.models.person_education import PersonEducation
 from app.models.person_address import PersonAddress
 from app.models.person_website import PersonWebsite
+from app.services.contact_stats import refresh_contact_stats
 
 
 class PersonMergeError(Exception):
@@ -156,6 +157,9 @@ def merge_persons(
     db.delete(source)
     db.flush()
 
+    # 13. Recompute denormalized contact stats for the merged person
+    refresh_contact_stats(db, [target_id])
+
     return stats
 
 
@@ -402,6 +406,7 @@ def find_potential_duplicates(
     if email_addresses:
         matches = (
             db.query(PersonEmail)
+            .options(joinedload(PersonEmail.person))
             .filter(PersonEmail.email.in_(email_addresses))
             .filter(PersonEmail.person_id != person_id)
             .all()
@@ -409,7 +414,7 @@ def find_potential_duplicates(
         for match in matches:
             if match.person_id not in seen_ids:
                 seen_ids.add(match.person_id)
-                p = db.query(Person).filter_by(id=match.person_id).first()
+                p = match.person
                 if p:
                     potential_duplicates.append({
                         "person": p,
@@ -440,6 +445,7 @@ def find_potential_duplicates(
         for domain in domains:
             domain_matches = (
                 db.query(PersonEmail)
+                .options(joinedload(PersonEmail.person))
                 .filter(PersonEmail.email.like(f"%@{domain}"))
                 .filter(PersonEmail.person_id != person_id)
                 .filter(PersonEmail.person_id.notin_(seen_ids))
@@ -449,7 +455,7 @@ def find_potential_duplicates(
             for match in domain_matches:
                 if match.person_id not in seen_ids:
                     seen_ids.add(match.person_id)
-                    p = db.query(Person).filter_by(id=match.person_id).first()
+                    p = match.person
                     if p:
                         potential_duplicates.append({
                             "person": p,
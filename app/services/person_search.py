@@ -0,0 +1,95 @@
+"""
+People search service.
+
+Backs the People list search box with the `persons.search_vector`
+full-text column (prefix matching, ranked) plus pg_trgm indexes on
+`full_name` and `email` for substring matches, instead of OR-ing
+ILIKE scans across every text column.
+"""
+
+import re
+
+from sqlalchemy import func, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models import Person
+
+
+# Postgres text search configuration used by persons.search_vector
+SEARCH_CONFIG = "simple"
+
+# Tokens are restricted to word characters so user input can never
+# inject tsquery operators (&, |, !, :, parentheses)
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_prefix_tsquery(q: str | None) -> str | None:
+    """
+    Convert free-text search input into a prefix-matching tsquery string.
+
+    Every token must match (AND), and each token matches as a prefix so
+    results narrow as the user types: "jo sm" -> "jo:* & sm:*".
+
+    Args:
+        q: Raw search input
+
+    Returns:
+        tsquery text for to_tsquery(), or None if q has no searchable tokens
+    """
+    if not q:
+        return None
+    tokens = _TOKEN_RE.findall(q.lower())
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*" for token in tokens)
+
+
+def _like_pattern(q: str) -> str:
+    """Build an escaped '%q%' pattern for trigram-indexed ILIKE."""
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def person_search_filter(q: str) -> ColumnElement[bool]:
+    """
+    Build the WHERE clause for a People search.
+
+    Matches the full-text document by token prefix, or the name/email by
+    substring (e.g. a domain fragment like "acme.co"). Each branch is
+    served by its own GIN index, so Postgres can combine them with a
+    BitmapOr instead of scanning the table.
+    """
+    q = q.strip()
+    pattern = _like_pattern(q)
+    clauses = [
+        Person.full_name.ilike(pattern, escape="\\"),
+        Person.email.ilike(pattern, escape="\\"),
+    ]
+    tsquery_text = build_prefix_tsquery(q)
+    if tsquery_text:
+        clauses.insert(
+            0,
+            Person.search_vector.op("@@")(func.to_tsquery(SEARCH_CONFIG, tsquery_text)),
+        )
+    return or_(*clauses)
+
+
+def person_search_rank(q: str) -> list[ColumnElement]:
+    """
+    Build ORDER BY expressions ranking People search results.
+
+    Ranks by weighted full-text relevance first (name hits beat title,
+    email and notes hits), then by trigram similarity of the name.
+    """
+    q = q.strip()
+    order = []
+    tsquery_text = build_prefix_tsquery(q)
+    if tsquery_text:
+        order.append(
+            func.ts_rank_cd(
+                Person.search_vector,
+                func.to_tsquery(SEARCH_CONFIG, tsquery_text),
+            ).desc()
+        )
+    order.append(func.similarity(Person.full_name, q).desc())
+    return order
@@ -5,22 +5,51 @@ Provides integration with Google Tasks API for task management.
 """
 
 import logging
-from datetime import date, datetime, timezone
+from datetime import date, datetime, time, timezone
 from typing import Any
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from google.oauth2.credentials import Credentials
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
-from app.models import GoogleAccount
+from app.models import GoogleAccount, GoogleTask, GoogleTaskList
 from app.services.google_auth import TASKS_SCOPES
+from app.services.google_clients import get_credentials, service_for
 
 logger = logging.getLogger(__name__)
 
 
+# Timezone for timed due dates (matches the task forms)
+LOCAL_TZ = ZoneInfo("America/New_York")
+
+
+def _parse_rfc3339(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _parse_due(due: str | None) -> tuple[datetime | None, date | None, time | None]:
+    """
+    Split a Tasks API due timestamp into (raw, local date, local time).
+
+    Google stores date-only tasks as T00:00:00.000Z: those keep the UTC date
+    (to avoid a timezone day shift) and have no time.
+    """
+    due_dt = _parse_rfc3339(due)
+    if due_dt is None:
+        return None, None, None
+    if due_dt.hour == 0 and due_dt.minute == 0 and due_dt.second == 0:
+        return due_dt, due_dt.date(), None
+    due_local = due_dt.astimezone(LOCAL_TZ)
+    return due_dt, due_local.date(), due_local.time().replace(second=0, microsecond=0)
+
+
 class TasksServiceError(Exception):
     """Base exception for Tasks service errors."""
     pass
@@ -51,53 +80,27 @@ class TasksService:
 
     def _get_credentials(self, account: GoogleAccount) -> Credentials:
         """Get Google credentials for an account."""
-        creds_dict = account.get_credentials()
-
-        credentials = Credentials(
-            token=creds_dict.get("token"),
-            refresh_token=creds_dict.get("refresh_token"),
-            token_uri=creds_dict.get("token_uri", "https://oauth2.googleapis.com/token"),
-            client_id=creds_dict.get("client_id"),
-            client_secret=creds_dict.get("client_secret"),
-            scopes=creds_dict.get("scopes", TASKS_SCOPES),
-        )
-
-        return credentials
+        return get_credentials(account, TASKS_SCOPES)
 
     def get_all_task_lists(self) -> list[dict[str, Any]]:
         """
         Get all task lists from connected accounts (including empty lists).
 
+        Reads the local mirror; app.tasks.tasks_sync keeps it current.
+
         Returns:
             List of task list dictionaries, each containing:
             - list_id: Task list ID
             - list_name: Task list name
         """
-        all_lists = []
-        accounts = self.db.query(GoogleAccount).filter_by(is_active=True).all()
-        print(f"[DEBUG] get_all_task_lists: found {len(accounts)} active accounts")
-
-        for account in accounts:
-            try:
-                print(f"[DEBUG] Processing account {account.id} ({account.email})")
-                credentials = self._get_credentials(account)
-                service = build("tasks", "v1", credentials=credentials)
-
-                task_lists_result = service.tasklists().list().execute()
-                task_lists = task_lists_result.get("items", [])
-                print(f"[DEBUG] Account {account.email} has {len(task_lists)} task lists")
-
-                for task_list in task_lists:
-                    all_lists.append({
-                        "list_id": task_list.get("id"),
-                        "list_name": task_list.get("title", "Untitled"),
-                    })
-
-            except Exception as e:
-                logger.error(f"Error getting task lists for account {account.id}: {e}")
-                continue
+        rows = (
+            self.db.query(GoogleTaskList.google_list_id, GoogleTaskList.title)
+            .join(GoogleAccount)
+            .filter(GoogleAccount.is_active.is_(True))
+            .all()
+        )
+        all_lists = [{"list_id": list_id, "list_name": title or "Untitled"} for list_id, title in rows]
 
-        logger.info(f"get_all_task_lists found {len(all_lists)} lists from {len(accounts)} accounts")
         # Sort by name
         all_lists.sort(key=lambda x: x["list_name"].lower())
         return all_lists
@@ -106,6 +109,9 @@ class TasksService:
         """
         Get all tasks grouped by task list from connected accounts.
 
+        Reads the local mirror; app.tasks.tasks_sync keeps it current and the
+        write operations below update it in place.
+
         Args:
             account_id: Optional UUID to filter tasks to a specific Google account.
                        If None, returns tasks from all active accounts.
@@ -123,158 +129,196 @@ class TasksService:
                 - is_priority: Whether task is high priority (due today or overdue)
                 - is_overdue: Whether task is overdue
         """
-        all_task_lists = []
         today = date.today()
 
-        # Get accounts based on filter
+        query = (
+            self.db.query(GoogleTaskList)
+            .join(GoogleAccount)
+            .filter(GoogleAccount.is_active.is_(True))
+            .options(selectinload(GoogleTaskList.tasks))
+        )
         if account_id:
-            account = self.db.query(GoogleAccount).filter_by(id=account_id, is_active=True).first()
-            accounts = [account] if account else []
-        else:
-            accounts = self.db.query(GoogleAccount).filter_by(is_active=True).all()
-        print(f"Tasks: Found {len(accounts)} active Google accounts (filter: {account_id})")
+            query = query.filter(GoogleTaskList.google_account_id == account_id)
 
-        for account in accounts:
-            try:
-                print(f"Tasks: Fetching tasks for account {account.email}")
-                credentials = self._get_credentials(account)
-                service = build("tasks", "v1", credentials=credentials)
-
-                # Get all task lists
-                task_lists_result = service.tasklists().list().execute()
-                print(f"Tasks: Found {len(task_lists_result.get('items', []))} task lists for {account.email}")
-                task_lists = task_lists_result.get("items", [])
-
-                for task_list in task_lists:
-                    list_data = {
-                        "list_id": task_list.get("id"),
-                        "list_name": task_list.get("title", "Untitled"),
-                        "tasks": [],
-                        "priority_tasks": [],  # Tasks with due dates (overdue or due soon)
-                        "other_tasks": [],  # Tasks with no due date
-                    }
-
-                    # Get tasks from each list
-                    tasks_result = service.tasks().list(
-                        tasklist=task_list["id"],
-                        showCompleted=False,
-                        showHidden=False,
-                    ).execute()
+        all_task_lists = []
+        for task_list in query.all():
+            list_data = self._build_list_data(task_list, today)
 
-                    tasks = tasks_result.get("items", [])
-
-                    for task in tasks:
-                        # Skip tasks without a title (usually empty tasks)
-                        if not task.get("title", "").strip():
-                            continue
-
-                        task_data = {
-                            "id": task.get("id"),
-                            "title": task.get("title", "Untitled"),
-                            "notes": task.get("notes", ""),
-                            "completed": task.get("status") == "completed",
-                            "is_priority": False,
-                            "is_overdue": False,
-                            "due_date": None,
-                            "due_date_display": None,
-                            "due_time": None,
-                            "due_time_display": None,
-                            "parent_id": task.get("parent"),  # Parent task ID for subtasks
-                            "is_subtask": bool(task.get("parent")),
-                            "subtasks": [],  # Will be populated after processing all tasks
-                        }
-
-                        # Parse due date if present
-                        due = task.get("due")
-                        if due:
-                            try:
-                                # Google Tasks uses RFC 3339 format
-                                due_dt = datetime.fromisoformat(due.replace("Z", "+00:00"))
-                                local_tz = ZoneInfo("America/New_York")
-
-                                # Check if this is a date-only task (midnight UTC)
-                                # Google stores date-only tasks as T00:00:00.000Z
-                                is_date_only = (due_dt.hour == 0 and due_dt.minute == 0 and due_dt.second == 0)
-
-                                if is_date_only:
-                                    # For date-only tasks, extract the date directly from UTC
-                                    # to avoid timezone shift issues
-                                    due_date = due_dt.date()
-                                    task_data["due_date"] = due_date.strftime("%Y-%m-%d")
-                                    task_data["due_date_display"] = due_date.strftime("%b %d, %Y")
-                                    # No time for date-only tasks
-                                else:
-                                    # Task has a specific time - convert to local timezone
-                                    due_local = due_dt.astimezone(local_tz)
-                                    due_date = due_local.date()
-                                    task_data["due_date"] = due_date.strftime("%Y-%m-%d")
-                                    task_data["due_date_display"] = due_date.strftime("%b %d, %Y")
-                                    task_data["due_time"] = due_local.strftime("%H:%M")
-                                    task_data["due_time_display"] = due_local.strftime("%I:%M %p").lstrip("0")
-
-                                # Check if overdue or due today
-                                if due_date < today:
-                                    task_data["is_overdue"] = True
-                                    task_data["is_priority"] = True
-                                elif due_date == today:
-                                    task_data["is_priority"] = True
-                                    task_data["due_date_display"] = "Today"
-                                elif due_date == today.replace(day=today.day + 1) if today.day < 28 else today:
-                                    task_data["due_date_display"] = "Tomorrow"
-                            except (ValueError, AttributeError):
-                                pass
-
-                        list_data["tasks"].append(task_data)
-
-                    # Build hierarchical structure: nest subtasks under parents
-                    tasks_by_id = {t["id"]: t for t in list_data["tasks"]}
-                    top_level_tasks = []
-
-                    for task_data in list_data["tasks"]:
-                        if task_data["is_subtask"] and task_data["parent_id"] in tasks_by_id:
-                            # Add as subtask of parent
-                            parent = tasks_by_id[task_data["parent_id"]]
-                            parent["subtasks"].append(task_data)
-                        else:
-                            # Top-level task (or orphaned subtask)
-                            top_level_tasks.append(task_data)
-
-                    # Sort subtasks within each parent by position (Google's default order)
-                    for task_data in top_level_tasks:
-                        if task_data["subtasks"]:
-                            # Keep original order from API
-                            pass
-
-                    # Separate into priority and other (only top-level tasks)
-                    for task_data in top_level_tasks:
-                        if task_data["due_date"]:
-                            list_data["priority_tasks"].append(task_data)
-                        else:
-                            list_data["other_tasks"].append(task_data)
+            # Only add lists that have tasks
+            if list_data["tasks"]:
+                all_task_lists.append(list_data)
 
-                    # Sort priority tasks by due date (overdue first)
-                    list_data["priority_tasks"].sort(
-                        key=lambda x: (not x["is_overdue"], x["due_date"] or "9999-99-99")
-                    )
+        # Sort lists by name by default
+        all_task_lists.sort(key=lambda x: x["list_name"].lower())
 
-                    # Only add lists that have tasks
-                    if list_data["tasks"]:
-                        all_task_lists.append(list_data)
+        return all_task_lists
 
-            except HttpError as e:
-                print(f"Tasks: HttpError for {account.email}: {e}")
-                continue
-            except Exception as e:
-                print(f"Tasks: Exception for {account.email}: {e}")
-                import traceback
-                traceback.print_exc()
+    def _build_list_data(self, task_list: GoogleTaskList, today: date) -> dict[str, Any]:
+        """Shape one mirrored task list and its tasks for the templates."""
+        list_data = {
+            "list_id": task_list.google_list_id,
+            "list_name": task_list.title or "Untitled",
+            "tasks": [],
+            "priority_tasks": [],  # Tasks with due dates (overdue or due soon)
+            "other_tasks": [],  # Tasks with no due date
+        }
+
+        # Mirrored tasks are already in Google's position order
+        for task in task_list.tasks:
+            # Skip tasks without a title (usually empty tasks)
+            if not (task.title or "").strip():
                 continue
 
-        print(f"Tasks: Returning {len(all_task_lists)} task lists with tasks")
-        # Sort lists by name by default
-        all_task_lists.sort(key=lambda x: x["list_name"].lower())
+            task_data = {
+                "id": task.google_task_id,
+                "title": task.title or "Untitled",
+                "notes": task.notes or "",
+                "completed": task.status == "completed",
+                "is_priority": False,
+                "is_overdue": False,
+                "due_date": None,
+                "due_date_display": None,
+                "due_time": None,
+                "due_time_display": None,
+                "parent_id": task.parent_id,  # Parent task ID for subtasks
+                "is_subtask": task.is_subtask,
+                "subtasks": [],  # Will be populated after processing all tasks
+            }
 
-        return all_task_lists
+            due_date = task.due_date
+            if due_date:
+                task_data["due_date"] = due_date.strftime("%Y-%m-%d")
+                task_data["due_date_display"] = due_date.strftime("%b %d, %Y")
+                if task.due_time:
+                    task_data["due_time"] = task.due_time.strftime("%H:%M")
+                    task_data["due_time_display"] = task.due_time.strftime("%I:%M %p").lstrip("0")
+
+                # Check if overdue or due today
+                if due_date < today:
+                    task_data["is_overdue"] = True
+                    task_data["is_priority"] = True
+                elif due_date == today:
+                    task_data["is_priority"] = True
+                    task_data["due_date_display"] = "Today"
+                elif due_date == today.replace(day=today.day + 1) if today.day < 28 else today:
+                    task_data["due_date_display"] = "Tomorrow"
+
+            list_data["tasks"].append(task_data)
+
+        # Build hierarchical structure: nest subtasks under parents
+        tasks_by_id = {t["id"]: t for t in list_data["tasks"]}
+        top_level_tasks = []
+
+        for task_data in list_data["tasks"]:
+            if task_data["is_subtask"] and task_data["parent_id"] in tasks_by_id:
+                # Add as subtask of parent
+                parent = tasks_by_id[task_data["parent_id"]]
+                parent["subtasks"].append(task_data)
+            else:
+                # Top-level task (or orphaned subtask)
+                top_level_tasks.append(task_data)
+
+        # Separate into priority and other (only top-level tasks)
+        for task_data in top_level_tasks:
+            if task_data["due_date"]:
+                list_data["priority_tasks"].append(task_data)
+            else:
+                list_data["other_tasks"].append(task_data)
+
+        # Sort priority tasks by due date (overdue first)
+        list_data["priority_tasks"].sort(
+            key=lambda x: (not x["is_overdue"], x["due_date"] or "9999-99-99")
+        )
+
+        return list_data
+
+    def _store_task(
+        self,
+        task_list: GoogleTaskList,
+        data: dict[str, Any],
+        known: dict[str, GoogleTask] | None = None,
+    ) -> bool:
+        """
+        Apply one Tasks API task resource to the mirror.
+
+        Open tasks are inserted or updated; completed, hidden and deleted
+        tasks are removed.
+
+        Args:
+            task_list: Mirrored list the task belongs to
+            data: Task resource from the API
+            known: Mirrored tasks of the list by Google ID (looked up if None)
+
+        Returns:
+            True if the task is stored, False if it was removed or skipped
+        """
+        google_task_id = data.get("id")
+        if not google_task_id:
+            return False
+        if known is None:
+            known = {t.google_task_id: t for t in task_list.tasks}
+        task = known.get(google_task_id)
+
+        if data.get("deleted") or data.get("hidden") or data.get("status") == "completed":
+            if task is not None:
+                task_list.tasks.remove(task)
+                del known[google_task_id]
+            return False
+
+        if task is None:
+            task = GoogleTask(google_task_id=google_task_id)
+            task_list.tasks.append(task)
+            known[google_task_id] = task
+
+        task.title = data.get("title", "")
+        task.notes = data.get("notes")
+        task.status = data.get("status", "needsAction")
+        task.parent_id = data.get("parent")
+        task.position = data.get("position")
+        task.due, task.due_date, task.due_time = _parse_due(data.get("due"))
+        task.google_updated_at = _parse_rfc3339(data.get("updated"))
+        return True
+
+    def _write_through(
+        self,
+        account: GoogleAccount,
+        list_id: str,
+        data: dict[str, Any] | None = None,
+        removed_task_id: str | None = None,
+    ) -> None:
+        """
+        Mirror a successful write so the widgets show it without a refetch.
+
+        Lists the mirror does not know yet are skipped (the next refresh
+        brings them in); a failure here only logs, the Google write stands.
+        """
+        try:
+            task_list = (
+                self.db.query(GoogleTaskList)
+                .filter_by(google_account_id=account.id, google_list_id=list_id)
+                .first()
+            )
+            if task_list is None:
+                return
+            if data is not None:
+                self._store_task(task_list, data)
+            if removed_task_id is not None:
+                self._store_task(task_list, {"id": removed_task_id, "deleted": True})
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(f"Tasks: could not update local mirror for list {list_id}: {e}")
+
+    def _accounts_for_list(self, list_id: str) -> list[GoogleAccount]:
+        """Active accounts, the mirrored owner of list_id first."""
+        accounts = self.db.query(GoogleAccount).filter_by(is_active=True).all()
+        owner_id = (
+            self.db.query(GoogleTaskList.google_account_id)
+            .filter_by(google_list_id=list_id)
+            .limit(1)
+            .scalar()
+        )
+        return sorted(accounts, key=lambda account: account.id != owner_id)
 
     def get_tasks_by_list_ordered(self, order: list[str] | None = None, account_id: UUID | None = None) -> list[dict[str, Any]]:
         """
@@ -327,7 +371,7 @@ class TasksService:
 
     def sync_tasks(self) -> dict[str, Any]:
         """
-        Sync tasks from Google Tasks API.
+        Refresh the local task mirror from Google Tasks API now.
 
         Returns:
             Dictionary with sync results:
@@ -336,7 +380,15 @@ class TasksService:
             - lists_count: Number of task lists
             - error: Error message if any
         """
+        from app.services.tasks_sync_service import TasksSyncService
+
         try:
+            results = TasksSyncService(self.db).sync_all_accounts()
+            errors = [error for result in results.values() for error in result.errors]
+            if errors and not any(result.success for result in results.values()):
+                raise TasksAPIError("; ".join(errors))
+
+            self.db.expire_all()
             task_lists = self.get_tasks_by_list()
             total_tasks = sum(len(tl["tasks"]) for tl in task_lists)
             return {
@@ -370,7 +422,7 @@ class TasksService:
         for account in accounts:
             try:
                 credentials = self._get_credentials(account)
-                service = build("tasks", "v1", credentials=credentials)
+                service = service_for(credentials, "tasks", "v1")
 
                 # Get the task
                 task = service.tasks().get(
@@ -448,12 +500,12 @@ class TasksService:
         Returns:
             Dictionary with success status and updated task data
         """
-        accounts = self.db.query(GoogleAccount).filter_by(is_active=True).all()
+        accounts = self._accounts_for_list(list_id)
 
         for account in accounts:
             try:
                 credentials = self._get_credentials(account)
-                service = build("tasks", "v1", credentials=credentials)
+                service = service_for(credentials, "tasks", "v1")
 
                 # Build update body
                 body = {}
@@ -492,6 +544,7 @@ class TasksService:
                     task=task_id,
                     body=body
                 ).execute()
+                self._write_through(account, list_id, result)
 
                 return {
                     "success": True,
@@ -523,12 +576,12 @@ class TasksService:
         Returns:
             Dictionary with success status and new completion state
         """
-        accounts = self.db.query(GoogleAccount).filter_by(is_active=True).all()
+        accounts = self._accounts_for_list(list_id)
 
         for account in accounts:
             try:
                 credentials = self._get_credentials(account)
-                service = build("tasks", "v1", credentials=credentials)
+                service = service_for(credentials, "tasks", "v1")
 
                 # First, get the current task to check its status
                 task = service.tasks().get(tasklist=list_id, task=task_id).execute()
@@ -543,6 +596,7 @@ class TasksService:
                     task=task_id,
                     body={"status": new_status}
                 ).execute()
+                self._write_through(account, list_id, result)
 
                 return {
                     "success": True,
@@ -573,12 +627,12 @@ class TasksService:
         Returns:
             Dictionary with success status and created task data
         """
-        accounts = self.db.query(GoogleAccount).filter_by(is_active=True).all()
+        accounts = self._accounts_for_list(list_id)
 
         for account in accounts:
             try:
                 credentials = self._get_credentials(account)
-                service = build("tasks", "v1", credentials=credentials)
+                service = service_for(credentials, "tasks", "v1")
 
                 # Verify the list exists for this account
                 try:
@@ -616,6 +670,7 @@ class TasksService:
                     insert_kwargs["parent"] = parent_task_id
 
                 result = service.tasks().insert(**insert_kwargs).execute()
+                self._write_through(account, list_id, result)
 
                 return {
                     "success": True,
@@ -656,12 +711,12 @@ class TasksService:
         Returns:
             Dictionary with success status
         """
-        accounts = self.db.query(GoogleAccount).filter_by(is_active=True).all()
+        accounts = self._accounts_for_list(source_list_id)
 
         for account in accounts:
             try:
                 credentials = self._get_credentials(account)
-                service = build("tasks", "v1", credentials=credentials)
+                service = service_for(credentials, "tasks", "v1")
 
                 # Get the task from source list
                 try:
@@ -682,6 +737,7 @@ class TasksService:
                         task=task_id,
                         previous=previous_task_id if previous_task_id else None,
                     ).execute()
+                    self._write_through(account, source_list_id, result)
                     return {"success": True, "task_id": result.get("id")}
 
                 # Moving to different list: create in target, delete from source
@@ -706,6 +762,9 @@ class TasksService:
                     task=task_id
                 ).execute()
 
+                self._write_through(account, target_list_id, created)
+                self._write_through(account, source_list_id, removed_task_id=task_id)
+
                 return {
                     "success": True,
                     "task_id": created.get("id"),
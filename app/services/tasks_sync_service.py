@@ -0,0 +1,214 @@
+"""
+Tasks Sync Service for keeping the local Google Tasks mirror current.
+
+The first refresh of a task list stores all of its open tasks; later
+refreshes ask Google only for tasks updated since the previous one
+(updatedMin), including completed, hidden and deleted tasks so they can be
+removed locally. Run periodically by app.tasks.tasks_sync and on demand from
+the tasks "sync" action.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.models import GoogleAccount, GoogleTaskList
+from app.services.google_clients import service_for
+from app.services.google_executor import execute, get_google_executor
+from app.services.tasks_service import TasksService
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 100  # Tasks API maximum
+
+# updatedMin is compared with Google's clock; look back a little further
+# than the previous refresh start (re-applying a task is harmless)
+CLOCK_SKEW = timedelta(minutes=2)
+
+# One sync at a time per process (scheduled job vs. sync button)
+_sync_lock = threading.Lock()
+
+
+@dataclass
+class TasksSyncResult:
+    """Result of a tasks sync operation."""
+    success: bool
+    lists_synced: int = 0
+    tasks_synced: int = 0
+    tasks_removed: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+class TasksSyncService:
+    """
+    Service for syncing Google Tasks to the local mirror tables.
+
+    Supports:
+    - Full refresh of lists never synced: all open tasks, stale rows removed
+    - Incremental refresh of the rest with updatedMin
+    - Lists deleted in Google are dropped with their tasks
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        # Reuses the credentials and task upsert of the tasks service
+        self._tasks = TasksService(db)
+
+    def sync_account(self, account: GoogleAccount) -> TasksSyncResult:
+        """
+        Refresh every task list of one account.
+
+        Args:
+            account: Google account to sync
+
+        Returns:
+            TasksSyncResult with sync statistics
+        """
+        result = TasksSyncResult(success=True)
+        try:
+            service = service_for(self._tasks._get_credentials(account), "tasks", "v1")
+
+            remote_lists = self._list_all(
+                lambda page_token: execute(service.tasklists().list(
+                    maxResults=PAGE_SIZE,
+                    pageToken=page_token,
+                ))
+            )
+            local_lists = {
+                task_list.google_list_id: task_list
+                for task_list in (
+                    self.db.query(GoogleTaskList)
+                    .filter_by(google_account_id=account.id)
+                    .options(selectinload(GoogleTaskList.tasks))
+                )
+            }
+
+            # Lists deleted in Google
+            remote_ids = {data["id"] for data in remote_lists if data.get("id")}
+            for google_list_id, task_list in local_lists.items():
+                if google_list_id not in remote_ids:
+                    self.db.delete(task_list)
+
+            for data in remote_lists:
+                if not data.get("id"):
+                    continue
+                task_list = local_lists.get(data["id"])
+                if task_list is None:
+                    task_list = GoogleTaskList(google_account_id=account.id, google_list_id=data["id"])
+                    self.db.add(task_list)
+                task_list.title = data.get("title", "Untitled")
+
+                synced, removed = self._sync_list(service, task_list)
+                result.lists_synced += 1
+                result.tasks_synced += synced
+                result.tasks_removed += removed
+
+            self.db.commit()
+            return result
+
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Tasks sync failed for {account.email}: {e}")
+            return TasksSyncResult(success=False, errors=[str(e)])
+
+    def sync_all_accounts(self, session_factory: Callable[[], Session] | None = None) -> dict[str, TasksSyncResult]:
+        """
+        Sync all active Google accounts concurrently.
+
+        Each account syncs in a Google executor worker with its own session
+        (sessions are not thread-safe); accounts never share task rows.
+
+        Args:
+            session_factory: Creates the per-account sessions (defaults to SessionLocal)
+
+        Returns:
+            Dictionary mapping account email to TasksSyncResult
+        """
+        if session_factory is None:
+            from app.database import SessionLocal
+            session_factory = SessionLocal
+
+        results = {}
+        with _sync_lock:
+            accounts = self.db.query(GoogleAccount.id, GoogleAccount.email).filter_by(is_active=True).all()
+            outcomes = get_google_executor().map(
+                lambda account: _sync_account_in_session(session_factory, account.id),
+                accounts,
+                account_key=lambda account: account.id,
+            )
+            for outcome in outcomes:
+                if outcome.ok:
+                    results[outcome.item.email] = outcome.value
+                else:
+                    results[outcome.item.email] = TasksSyncResult(success=False, errors=[str(outcome.error)])
+        return results
+
+    def _sync_list(self, service: Any, task_list: GoogleTaskList) -> tuple[int, int]:
+        """
+        Refresh one task list, fully on its first sync, else since tasks_synced_at.
+
+        Returns:
+            (tasks stored, tasks removed)
+        """
+        started_at = datetime.now(timezone.utc)
+        known = {task.google_task_id: task for task in task_list.tasks}
+        before_ids = set(known)
+
+        if task_list.tasks_synced_at is None:
+            items = self._list_all(
+                lambda page_token: execute(service.tasks().list(
+                    tasklist=task_list.google_list_id,
+                    showCompleted=False,
+                    showHidden=False,
+                    maxResults=PAGE_SIZE,
+                    pageToken=page_token,
+                ))
+            )
+            seen_ids = {data.get("id") for data in items}
+            for google_task_id in set(known) - seen_ids:
+                self._tasks._store_task(task_list, {"id": google_task_id, "deleted": True}, known)
+        else:
+            updated_min = task_list.tasks_synced_at - CLOCK_SKEW
+            items = self._list_all(
+                lambda page_token: execute(service.tasks().list(
+                    tasklist=task_list.google_list_id,
+                    updatedMin=updated_min.isoformat(),
+                    showCompleted=True,
+                    showHidden=True,
+                    showDeleted=True,
+                    maxResults=PAGE_SIZE,
+                    pageToken=page_token,
+                ))
+            )
+
+        stored = sum(self._tasks._store_task(task_list, data, known) for data in items)
+        task_list.tasks_synced_at = started_at
+        return stored, len(before_ids - set(known))
+
+    @staticmethod
+    def _list_all(fetch_page: Callable[[str | None], dict[str, Any]]) -> list[dict[str, Any]]:
+        """Collect the items of every page of a Tasks API list call."""
+        items = []
+        page_token = None
+        while True:
+            response = fetch_page(page_token)
+            items.extend(response.get("items", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return items
+
+
+def _sync_account_in_session(session_factory: Callable[[], Session], account_id) -> TasksSyncResult:
+    """Sync one account in a fresh session (runs in a Google executor worker)."""
+    with session_factory() as db:
+        account = db.get(GoogleAccount, account_id)
+        return TasksSyncService(db).sync_account(account)
+
+
+def get_tasks_sync_service(db: Session) -> TasksSyncService:
+    """Get a Tasks sync service instance."""
+    return TasksSyncService(db)
@@ -1,5 +1,9 @@
 """Background tasks for Perun's BlackBook."""
 
 from app.tasks.email_sync import scheduler, start_scheduler, stop_scheduler
+from app.tasks.email_backfill import start_email_backfill
+from app.tasks.email_cache_cleanup import start_email_cache_cleanup
+from app.tasks.calendar_sync import start_calendar_sync
+from app.tasks.tasks_sync import start_tasks_sync
 
-__all__ = ["scheduler", "start_scheduler", "stop_scheduler"]
+__all__ = ["scheduler", "start_scheduler", "stop_scheduler", "start_email_backfill", "start_email_cache_cleanup", "start_calendar_sync", "start_tasks_sync"]
@@ -0,0 +1,78 @@
+"""
+Background calendar sync task using APScheduler.
+
+Periodically applies Google Calendar changes (sync tokens) for all connected
+Google accounts, so calendar views read only the local calendar_events table.
+Shares the scheduler with the email sync task.
+"""
+
+import logging
+from datetime import datetime, timezone
+
+from apscheduler.triggers.interval import IntervalTrigger
+
+from app.config import get_settings
+from app.tasks.email_sync import scheduler
+from app.utils.concurrency import run_blocking
+
+logger = logging.getLogger(__name__)
+
+
+async def sync_calendars_task():
+    """
+    Background task to sync calendars from all connected Google accounts.
+
+    Uses the stored sync token for incremental sync, full sync otherwise.
+    Runs in the worker threadpool (Calendar API + database are blocking).
+    """
+    try:
+        await run_blocking(_sync_all_calendars)
+    except Exception as e:
+        logger.error(f"Calendar sync task failed: {e}")
+
+
+def _sync_all_calendars() -> None:
+    """Sync every active account and log the results (blocking)."""
+    from app.database import SessionLocal
+    from app.services.calendar_sync_service import get_calendar_sync_service
+
+    with SessionLocal() as db:
+        results = get_calendar_sync_service(db).sync_all_accounts()
+
+        for email, result in results.items():
+            if result.success:
+                logger.info(
+                    f"Calendar sync for {email}: {result.events_synced} updated, "
+                    f"{result.events_deleted} removed{' (full)' if result.full_sync else ''}"
+                )
+            else:
+                logger.error(f"Failed to sync calendar for {email}: {result.errors}")
+
+
+def start_calendar_sync():
+    """
+    Schedule the calendar sync job (starting the shared scheduler if needed).
+
+    Call this from FastAPI startup event.
+    """
+    settings = get_settings()
+
+    if not settings.calendar_sync_enabled:
+        logger.info("Calendar sync is disabled in settings")
+        return
+
+    scheduler.add_job(
+        sync_calendars_task,
+        trigger=IntervalTrigger(minutes=settings.calendar_sync_interval_minutes),
+        id="calendar_sync",
+        name="Sync calendar events from Google accounts",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.now(timezone.utc),  # Run immediately on startup
+    )
+
+    if not scheduler.running:
+        scheduler.start()
+    logger.info(f"Calendar sync scheduled (interval: {settings.calendar_sync_interval_minutes} minutes)")
+
@@ -0,0 +1,79 @@
+"""
+Background Gmail backfill using APScheduler.
+
+The initial email sync stores only the newest messages. This job then walks
+older history in bounded chunks (GmailSyncService.backfill) until it reaches
+the configured depth. Each chunk resumes from the checkpoint in
+email_sync_state, so restarts lose no progress. It runs as its own job, so
+it never delays the incremental sync. Shares the scheduler with the email
+sync task.
+"""
+
+import logging
+from datetime import datetime, timezone
+
+from apscheduler.triggers.interval import IntervalTrigger
+
+from app.config import get_settings
+from app.tasks.email_sync import scheduler
+from app.utils.concurrency import run_blocking
+
+logger = logging.getLogger(__name__)
+
+
+async def backfill_emails_task():
+    """
+    Background task to backfill one chunk of older email per account.
+
+    Runs in the worker threadpool (Gmail API + database are blocking).
+    """
+    try:
+        await run_blocking(_backfill_all_accounts)
+    except Exception as e:
+        logger.error(f"Email backfill task failed: {e}")
+
+
+def _backfill_all_accounts() -> None:
+    """Backfill a chunk for every active account and log the results (blocking)."""
+    from app.database import SessionLocal
+    from app.services.gmail_sync_service import get_gmail_sync_service
+
+    with SessionLocal() as db:
+        results = get_gmail_sync_service(db).backfill_all_accounts()
+
+        for email, result in results.items():
+            if not result.success:
+                logger.error(f"Failed to backfill {email}: {result.errors}")
+            elif result.messages_synced:
+                logger.info(
+                    f"Backfilled {result.messages_synced} messages from {email} "
+                    f"({result.messages_per_second:.1f} msg/s)"
+                )
+
+
+def start_email_backfill():
+    """
+    Schedule the email backfill job (starting the shared scheduler if needed).
+
+    Call this from FastAPI startup event.
+    """
+    settings = get_settings()
+
+    if not settings.email_backfill_enabled:
+        logger.info("Email backfill is disabled in settings")
+        return
+
+    scheduler.add_job(
+        backfill_emails_task,
+        trigger=IntervalTrigger(minutes=settings.email_backfill_interval_minutes),
+        id="email_backfill",
+        name="Backfill older email from Google accounts",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.now(timezone.utc),  # Run immediately on startup
+    )
+
+    if not scheduler.running:
+        scheduler.start()
+    logger.info(f"Email backfill scheduled (interval: {settings.email_backfill_interval_minutes} minutes)")
@@ -0,0 +1,68 @@
+"""
+Periodic eviction of expired email_cache rows using APScheduler.
+
+Person pages read Gmail searches through email_cache (see
+app.services.email_thread_cache), which only replaces a person's rows when
+they are searched again. This job deletes rows past email_cache_max_age_hours
+so the table stays bounded. Shares the scheduler with the email sync task.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+
+from apscheduler.triggers.interval import IntervalTrigger
+
+from app.config import get_settings
+from app.tasks.email_sync import scheduler
+from app.utils.concurrency import run_blocking
+
+logger = logging.getLogger(__name__)
+
+
+async def cleanup_email_cache_task():
+    """
+    Background task to delete expired email cache rows.
+
+    Runs in the worker threadpool (database access is blocking).
+    """
+    try:
+        await run_blocking(_evict_expired)
+    except Exception as e:
+        logger.error(f"Email cache cleanup task failed: {e}")
+
+
+def _evict_expired() -> None:
+    """Delete expired rows and log how many (blocking)."""
+    from app.database import SessionLocal
+    from app.services.email_thread_cache import evict_expired
+
+    with SessionLocal() as db:
+        deleted = evict_expired(db)
+        if deleted:
+            logger.info(f"Evicted {deleted} expired email cache entries")
+
+
+def start_email_cache_cleanup():
+    """
+    Schedule the email cache cleanup job (starting the shared scheduler if needed).
+
+    Call this from FastAPI startup event.
+    """
+    settings = get_settings()
+
+    scheduler.add_job(
+        cleanup_email_cache_task,
+        trigger=IntervalTrigger(minutes=settings.email_cache_cleanup_interval_minutes),
+        id="email_cache_cleanup",
+        name="Evict expired email cache entries",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.now(timezone.utc) + timedelta(minutes=1),
+    )
+
+    if not scheduler.running:
+        scheduler.start()
+    logger.info(
+        f"Email cache cleanup scheduled (interval: {settings.email_cache_cleanup_interval_minutes} minutes)"
+    )
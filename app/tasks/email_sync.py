@@ -11,6 +11,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.config import get_settings
+from app.utils.concurrency import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -26,40 +27,47 @@ async def sync_emails_task():
     Background task to sync emails from all connected Google accounts.
 
     Uses incremental sync for existing accounts, full sync for new ones.
+    The sync itself (Gmail API + database) is blocking, so it runs in the
+    worker threadpool instead of on the event loop.
     """
+    logger.info("Starting scheduled email sync...")
+
+    try:
+        await run_blocking(_sync_all_accounts)
+    except Exception as e:
+        logger.error(f"Email sync task failed: {e}")
+
+
+def _sync_all_accounts() -> None:
+    """Sync every active account and log the results (blocking)."""
     from app.database import SessionLocal
     from app.models import GoogleAccount
     from app.services.gmail_sync_service import get_gmail_sync_service
 
-    logger.info("Starting scheduled email sync...")
+    with SessionLocal() as db:
+        # Get all active accounts
+        accounts = db.query(GoogleAccount).filter_by(is_active=True).all()
 
-    try:
-        with SessionLocal() as db:
-            # Get all active accounts
-            accounts = db.query(GoogleAccount).filter_by(is_active=True).all()
-
-            if not accounts:
-                logger.info("No active Google accounts to sync")
-                return
-
-            sync_service = get_gmail_sync_service(db)
-            results = sync_service.sync_all_accounts()
-
-            # Log results
-            for email, result in results.items():
-                if result.success:
-                    logger.info(
-                        f"Synced {result.messages_synced} messages from {email}"
-                    )
-                else:
-                    logger.error(
-                        f"Failed to sync {email}: {result.errors}"
-                    )
-
-            logger.info(f"Email sync completed for {len(accounts)} accounts")
+        if not accounts:
+            logger.info("No active Google accounts to sync")
+            return
 
-    except Exception as e:
-        logger.error(f"Email sync task failed: {e}")
+        sync_service = get_gmail_sync_service(db)
+        results = sync_service.sync_all_accounts()
+
+        # Log results
+        for email, result in results.items():
+            if result.success:
+                logger.info(
+                    f"Synced {result.messages_synced} messages from {email} "
+                    f"in {result.duration_seconds:.1f}s ({result.messages_per_second:.1f} msg/s)"
+                )
+            else:
+                logger.error(
+                    f"Failed to sync {email}: {result.errors}"
+                )
+
+        logger.info(f"Email sync completed for {len(accounts)} accounts")
 
 
 def start_scheduler():
@@ -112,6 +120,11 @@ async def run_sync_now():
 
     Returns dict with results per account.
     """
+    return await run_blocking(_run_sync_now)
+
+
+def _run_sync_now():
+    """Sync every active account and return the results (blocking)."""
     from app.database import SessionLocal
     from app.services.gmail_sync_service import get_gmail_sync_service
 
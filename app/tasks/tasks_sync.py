@@ -0,0 +1,77 @@
+"""
+Background Google Tasks sync using APScheduler.
+
+Periodically refreshes the local task mirror (google_task_lists and
+google_tasks) for all connected Google accounts, so the tasks widgets read
+Postgres instead of listing every task from Google on each render.
+Shares the scheduler with the email sync task.
+"""
+
+import logging
+from datetime import datetime, timezone
+
+from apscheduler.triggers.interval import IntervalTrigger
+
+from app.config import get_settings
+from app.tasks.email_sync import scheduler
+from app.utils.concurrency import run_blocking
+
+logger = logging.getLogger(__name__)
+
+
+async def sync_tasks_task():
+    """
+    Background task to refresh Google Tasks from all connected accounts.
+
+    Runs in the worker threadpool (Tasks API + database are blocking).
+    """
+    try:
+        await run_blocking(_sync_all_tasks)
+    except Exception as e:
+        logger.error(f"Tasks sync task failed: {e}")
+
+
+def _sync_all_tasks() -> None:
+    """Sync every active account and log the results (blocking)."""
+    from app.database import SessionLocal
+    from app.services.tasks_sync_service import get_tasks_sync_service
+
+    with SessionLocal() as db:
+        results = get_tasks_sync_service(db).sync_all_accounts()
+
+        for email, result in results.items():
+            if result.success:
+                logger.info(
+                    f"Tasks sync for {email}: {result.lists_synced} lists, "
+                    f"{result.tasks_synced} tasks updated, {result.tasks_removed} removed"
+                )
+            else:
+                logger.error(f"Failed to sync tasks for {email}: {result.errors}")
+
+
+def start_tasks_sync():
+    """
+    Schedule the tasks sync job (starting the shared scheduler if needed).
+
+    Call this from FastAPI startup event.
+    """
+    settings = get_settings()
+
+    if not settings.tasks_sync_enabled:
+        logger.info("Tasks sync is disabled in settings")
+        return
+
+    scheduler.add_job(
+        sync_tasks_task,
+        trigger=IntervalTrigger(minutes=settings.tasks_sync_interval_minutes),
+        id="tasks_sync",
+        name="Sync Google Tasks from Google accounts",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.now(timezone.utc),  # Run immediately on startup
+    )
+
+    if not scheduler.running:
+        scheduler.start()
+    logger.info(f"Tasks sync scheduled (interval: {settings.tasks_sync_interval_minutes} minutes)")
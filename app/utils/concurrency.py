@@ -0,0 +1,63 @@
+"""
+Helpers for keeping blocking work off the event loop.
+
+Database access (sync SQLAlchemy) and the Google API clients are blocking,
+so route handlers that use them are plain `def` functions: FastAPI runs
+those in the AnyIO worker threadpool. The few handlers that must stay
+`async` (streaming AI responses, awaiting async providers) and background
+jobs on the asyncio scheduler hand blocking calls to run_blocking(), which
+shares the same bounded pool.
+
+Request bodies that can only be read with `await` are exposed as async
+dependencies (get_form_data / get_json_body), so handlers that need them
+can still be sync.
+"""
+
+import json
+import logging
+from typing import Any, Callable, TypeVar
+
+import anyio.to_thread
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import FormData
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def configure_threadpool(max_workers: int) -> None:
+    """
+    Set the size of the shared worker threadpool.
+
+    Must be called from the event loop (e.g. the startup event). Sync route
+    handlers, sync dependencies, background tasks and run_blocking() all
+    draw from this one limiter, so it also bounds how many requests can hold
+    a database connection at once.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max_workers
+    logger.info(f"Worker threadpool size set to {max_workers}")
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking callable in the shared threadpool and await its result.
+
+    Use from async code only; sync route handlers already run in the pool.
+    """
+    return await run_in_threadpool(func, *args, **kwargs)
+
+
+async def get_form_data(request: Request) -> FormData:
+    """Dependency: the parsed form body (cached by Starlette per request)."""
+    return await request.form()
+
+
+async def get_json_body(request: Request) -> Any:
+    """Dependency: the parsed JSON body, or None if it is missing or invalid."""
+    try:
+        return await request.json()
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
@@ -0,0 +1,316 @@
+"""
+Pagination helpers for list views.
+
+Pages primary keys first and only then loads the ORM objects for that page,
+so eager-loaded collections never multiply the rows that OFFSET/LIMIT and
+COUNT have to walk.
+
+Two modes are supported:
+- Page mode (paginate_by_ids): numbered pages via OFFSET/LIMIT
+- Cursor mode (paginate_by_cursor): opaque keyset cursors built from the
+  sort column + id, for infinite scroll without deep OFFSET scans
+"""
+
+import base64
+import enum
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Sequence
+from uuid import UUID
+
+from fastapi import Request
+from sqlalchemy import and_, func, or_, text
+from sqlalchemy.orm import Query, Session
+
+from app.utils.cache import TTLCache
+
+
+# Cached exact counts for filtered approximate-count requests
+APPROX_COUNT_TTL_SECONDS = 60
+_count_cache = TTLCache(ttl_seconds=APPROX_COUNT_TTL_SECONDS, max_entries=512)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+    pass
+
+
+@dataclass
+class PageResult:
+    """One page of a list view plus the totals the pagination footer needs."""
+
+    items: list[Any]
+    total_count: int
+    page: int
+    per_page: int
+    ids: list[Any] = field(default_factory=list)
+
+    @property
+    def total_pages(self) -> int:
+        """Number of pages for total_count at per_page rows each."""
+        return (self.total_count + self.per_page - 1) // self.per_page
+
+
+@dataclass
+class CursorPage:
+    """One keyset page plus the cursor for the page after it."""
+
+    items: list[Any]
+    per_page: int
+    next_cursor: str | None = None
+    ids: list[Any] = field(default_factory=list)
+
+    @property
+    def has_more(self) -> bool:
+        """True if another page follows this one."""
+        return self.next_cursor is not None
+
+
+def count_rows(query: Query, pk_column) -> int:
+    """
+    Count the rows matched by a filtered query.
+
+    Drops ORDER BY and selects only count(pk), so Postgres runs a plain
+    SELECT count(...) FROM <table> WHERE ... without joins or subqueries.
+    The query must not carry eager-load options.
+    """
+    return query.order_by(None).with_entities(func.count(pk_column)).scalar() or 0
+
+
+def approximate_count(db: Session, query: Query, model) -> int:
+    """
+    Cheap row count for list footers.
+
+    Unfiltered queries read the planner estimate from pg_class.reltuples
+    (no scan at all). Filtered queries fall back to an exact count that is
+    cached for APPROX_COUNT_TTL_SECONDS, keyed by the compiled SQL + params.
+    """
+    if query.whereclause is None:
+        estimate = db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": model.__tablename__},
+        ).scalar()
+        # reltuples is -1 (or 0) until the table has been analyzed
+        if estimate and estimate > 0:
+            return int(estimate)
+
+    compiled = query.order_by(None).statement.compile(dialect=db.get_bind().dialect)
+    key = f"{compiled}|{compiled.params!r}"
+    return _count_cache.get_or_set(key, lambda: count_rows(query, model.id))
+
+
+def load_by_ids(
+    db: Session,
+    model,
+    ids: Sequence[Any],
+    load_options: Sequence[Any] = (),
+) -> list[Any]:
+    """
+    Load model instances by primary key, preserving the order of ids.
+
+    Args:
+        db: Database session
+        model: Mapped class with an `id` primary key
+        ids: Primary keys in display order
+        load_options: Loader options (e.g. selectinload) for rendered collections
+
+    Returns:
+        Instances in the same order as ids (missing ids are skipped)
+    """
+    if not ids:
+        return []
+    rows = db.query(model).options(*load_options).filter(model.id.in_(ids)).all()
+    by_id = {row.id: row for row in rows}
+    return [by_id[pk] for pk in ids if pk in by_id]
+
+
+def paginate_by_ids(
+    db: Session,
+    query: Query,
+    model,
+    page: int,
+    per_page: int,
+    load_options: Sequence[Any] = (),
+    approximate: bool = False,
+) -> PageResult:
+    """
+    Paginate a filtered, ordered query by primary key.
+
+    1. count(*) over the filtered base table
+    2. SELECT id ... ORDER BY ... OFFSET/LIMIT (no joins)
+    3. Load just those rows with batched (selectin) collection loads
+
+    Args:
+        db: Database session
+        query: Filtered and ordered query over `model`, without eager loads.
+            The ORDER BY should end with the primary key so pages are stable.
+        model: Mapped class being listed
+        page: 1-based page number
+        per_page: Rows per page
+        load_options: Loader options for the collections the template renders
+        approximate: Use approximate_count() instead of an exact count
+
+    Returns:
+        PageResult with the ordered items for the requested page
+    """
+    if approximate:
+        total_count = approximate_count(db, query, model)
+    else:
+        total_count = count_rows(query, model.id)
+
+    offset = (page - 1) * per_page
+    ids = [row[0] for row in query.with_entities(model.id).offset(offset).limit(per_page).all()]
+    items = load_by_ids(db, model, ids, load_options)
+
+    return PageResult(
+        items=items,
+        total_count=total_count,
+        page=page,
+        per_page=per_page,
+        ids=ids,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Cursor (keyset) pagination
+# ---------------------------------------------------------------------------
+
+
+def _encode_value(value: Any) -> list:
+    """Encode a sort value as a [type, value] pair that survives JSON."""
+    if value is None:
+        return ["n", None]
+    if isinstance(value, enum.Enum):
+        return ["s", value.value]
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, UUID):
+        return ["u", str(value)]
+    if isinstance(value, (bool, int, float, str)):
+        return ["s" if isinstance(value, str) else "v", value]
+    raise TypeError(f"Unsupported cursor value type: {type(value).__name__}")
+
+
+def _decode_value(pair: list) -> Any:
+    """Inverse of _encode_value."""
+    kind, value = pair
+    if kind == "n":
+        return None
+    if kind == "dt":
+        return datetime.fromisoformat(value)
+    if kind == "d":
+        return date.fromisoformat(value)
+    if kind == "u":
+        return UUID(value)
+    if kind in ("s", "v"):
+        return value
+    raise ValueError(f"Unknown cursor value type: {kind}")
+
+
+def encode_cursor(sort_value: Any, pk: Any) -> str:
+    """Build an opaque cursor pointing just after (sort_value, pk)."""
+    payload = json.dumps([_encode_value(sort_value), _encode_value(pk)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, Any]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_pair, pk_pair = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return _decode_value(sort_pair), _decode_value(pk_pair)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+
+def keyset_condition(sort_column, pk_column, sort_value: Any, pk: Any, descending: bool):
+    """
+    WHERE clause selecting rows strictly after (sort_value, pk).
+
+    Mirrors Postgres default NULL ordering: NULLS LAST for ASC and
+    NULLS FIRST for DESC, with pk as the tiebreaker.
+    """
+    if descending:
+        if sort_value is None:
+            return or_(
+                and_(sort_column.is_(None), pk_column < pk),
+                sort_column.isnot(None),
+            )
+        return or_(
+            sort_column < sort_value,
+            and_(sort_column == sort_value, pk_column < pk),
+        )
+
+    if sort_value is None:
+        return and_(sort_column.is_(None), pk_column > pk)
+    return or_(
+        sort_column > sort_value,
+        and_(sort_column == sort_value, pk_column > pk),
+        sort_column.is_(None),
+    )
+
+
+def paginate_by_cursor(
+    db: Session,
+    query: Query,
+    model,
+    sort_column,
+    descending: bool,
+    cursor: str | None,
+    per_page: int,
+    load_options: Sequence[Any] = (),
+) -> CursorPage:
+    """
+    Keyset-paginate a filtered query ordered by (sort_column, model.id).
+
+    Cost is independent of how deep the user has scrolled, and no count
+    query is issued.
+
+    Args:
+        db: Database session
+        query: Filtered query ordered by sort_column then model.id, in the
+            direction given by `descending`, without eager loads
+        model: Mapped class being listed
+        sort_column: Column the query is ordered by
+        descending: Whether the query is ordered DESC
+        cursor: Cursor from a previous page, or None/"" for the first page
+        per_page: Rows per page
+        load_options: Loader options for the collections the template renders
+
+    Returns:
+        CursorPage with items and next_cursor (None on the last page)
+
+    Raises:
+        InvalidCursorError: If cursor is malformed
+    """
+    if cursor:
+        sort_value, pk = decode_cursor(cursor)
+        query = query.filter(keyset_condition(sort_column, model.id, sort_value, pk, descending))
+
+    rows = query.with_entities(model.id, sort_column).limit(per_page + 1).all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    ids = [row[0] for row in rows]
+    next_cursor = encode_cursor(rows[-1][1], rows[-1][0]) if has_more and rows else None
+
+    return CursorPage(
+        items=load_by_ids(db, model, ids, load_options),
+        per_page=per_page,
+        next_cursor=next_cursor,
+        ids=ids,
+    )
+
+
+def cursor_url(request: Request, next_cursor: str, **params) -> str:
+    """Relative URL for the next cursor page, keeping the current filters (plus params)."""
+    url = request.url.include_query_params(cursor=next_cursor, **params)
+    return f"{url.path}?{url.query}"
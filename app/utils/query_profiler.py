@@ -0,0 +1,231 @@
+"""
+Per-request SQL statement profiling.
+
+Engine events (before/after_cursor_execute) add every statement's count and
+duration to the QueryStats of the request being served. A context variable
+tracks the current request; because it holds a mutable QueryStats object, the
+worker threads that run sync handlers (which receive a copy of the context)
+record into the same object.
+
+Finished requests are aggregated per route in `profiler`, which backs the
+/debug/perf page. The same capture() context manager is used by the tests to
+count queries.
+
+Routes declare how many statements they may issue with @query_budget(n),
+placed under the @router decorator. Requests that exceed their budget, or
+repeat one statement many times (the N+1 pattern), are logged; the test
+suite asserts budgets via the X-DB-Query-Budget response header.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable)
+
+# Header names set on profiled responses
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+QUERY_BUDGET_HEADER = "X-DB-Query-Budget"
+
+# Longest statement text kept for the "most repeated" column
+_STATEMENT_PREVIEW_CHARS = 300
+
+_current_stats: ContextVar["QueryStats | None"] = ContextVar("query_stats", default=None)
+_enabled = False
+
+
+@dataclass
+class QueryStats:
+    """Statements executed while one request (or capture block) was active."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        """Add one executed statement."""
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            self.statements[statement] += 1
+
+    def most_repeated(self) -> tuple[str | None, int]:
+        """The statement executed most often and how many times (N+1 hint)."""
+        if not self.statements:
+            return None, 0
+        statement, times = self.statements.most_common(1)[0]
+        return statement, times
+
+
+@dataclass
+class RouteStats:
+    """Aggregated QueryStats for one route."""
+
+    route: str
+    requests: int = 0
+    total_queries: int = 0
+    max_queries: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    worst_repeat_count: int = 0
+    worst_repeat_statement: str | None = None
+
+    @property
+    def avg_queries(self) -> float:
+        return self.total_queries / self.requests if self.requests else 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.requests if self.requests else 0.0
+
+
+class QueryProfiler:
+    """Thread-safe per-route aggregation of request QueryStats."""
+
+    def __init__(self, max_routes: int = 500):
+        self.max_routes = max_routes
+        self._routes: dict[str, RouteStats] = {}
+        self._lock = threading.Lock()
+
+    def add(self, route: str, stats: QueryStats) -> None:
+        """Fold one finished request into its route's totals."""
+        statement, repeats = stats.most_repeated()
+        with self._lock:
+            entry = self._routes.get(route)
+            if entry is None:
+                if len(self._routes) >= self.max_routes:
+                    return
+                entry = self._routes[route] = RouteStats(route=route)
+            entry.requests += 1
+            entry.total_queries += stats.count
+            entry.max_queries = max(entry.max_queries, stats.count)
+            entry.total_ms += stats.total_ms
+            entry.max_ms = max(entry.max_ms, stats.total_ms)
+            if repeats > entry.worst_repeat_count:
+                entry.worst_repeat_count = repeats
+                entry.worst_repeat_statement = statement[:_STATEMENT_PREVIEW_CHARS]
+
+    def routes(self, sort_by: str = "total_ms") -> list[RouteStats]:
+        """Snapshot of all routes, most expensive first."""
+        with self._lock:
+            entries = list(self._routes.values())
+        return sorted(entries, key=lambda r: getattr(r, sort_by), reverse=True)
+
+    def reset(self) -> None:
+        """Drop all aggregated data."""
+        with self._lock:
+            self._routes.clear()
+
+
+profiler = QueryProfiler()
+
+
+def query_budget(max_queries: int) -> Callable[[F], F]:
+    """
+    Declare the maximum number of SQL statements a route may issue.
+
+    Usage (below the router decorator, so the router registers the
+    annotated function):
+        @router.get("/table")
+        @query_budget(10)
+        def list_people_table(...):
+    """
+    def decorator(func: F) -> F:
+        func.__query_budget__ = max_queries
+        return func
+    return decorator
+
+
+def get_query_budget(endpoint: Callable | None) -> int | None:
+    """Budget declared on a route endpoint with @query_budget, if any."""
+    return getattr(endpoint, "__query_budget__", None)
+
+
+def check_request(route_key: str, stats: QueryStats, budget: int | None, repeat_threshold: int) -> None:
+    """Log requests that exceed their query budget or look like an N+1."""
+    if budget is not None and stats.count > budget:
+        logger.warning(f"{route_key} issued {stats.count} queries (budget {budget})")
+
+    statement, repeats = stats.most_repeated()
+    if repeats >= repeat_threshold:
+        preview = " ".join(statement.split())[:_STATEMENT_PREVIEW_CHARS]
+        logger.warning(f"Possible N+1 in {route_key}: {repeats}x {preview}")
+
+
+def current_stats() -> QueryStats | None:
+    """QueryStats for the active request/capture block, if any."""
+    return _current_stats.get()
+
+
+@contextmanager
+def capture() -> Iterator[QueryStats]:
+    """
+    Record statements executed inside the block.
+
+    Usage:
+        with capture() as stats:
+            client.get("/people")
+        assert stats.count <= 10
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    start_times = conn.info.get("query_start_times")
+    if not start_times:
+        return
+    elapsed_ms = (time.perf_counter() - start_times.pop()) * 1000
+    stats.record(statement, elapsed_ms)
+
+
+def _handle_error(exception_context):
+    # Failed statements never reach after_cursor_execute; drop their start time
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_times"):
+        conn.info["query_start_times"].pop()
+
+
+def enable(engine: Engine | type[Engine]) -> None:
+    """
+    Attach the profiling listeners to an engine and turn on request profiling.
+
+    Idempotent. Pass the Engine class itself to profile every engine, e.g.
+    in tests that build their own engine.
+    """
+    global _enabled
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+    _enabled = True
+
+
+def is_enabled() -> bool:
+    """Whether enable() has been called in this process."""
+    return _enabled
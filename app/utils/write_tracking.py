@@ -0,0 +1,75 @@
+"""
+Helpers for cache invalidation hooks on session events.
+
+In-process caches (graph, birthdays, person email index) listen to flushes
+and bulk ORM writes. These helpers tell whether a write touched the
+columns a cache is built from, so unrelated edits (notes, timestamps, sync
+bookkeeping) keep the cache.
+"""
+
+from typing import Iterable
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+
+def _column_key(key) -> str | None:
+    if isinstance(key, str):
+        return key
+    return getattr(key, "key", None) or getattr(key, "name", None)
+
+
+def flush_touches(session: Session, obj, columns: Iterable[str] | None = None) -> bool:
+    """
+    Whether a flushed object changes the given columns (call from after_flush).
+
+    New and deleted objects always count; for updated ones only changes to
+    `columns` do (any change when columns is None).
+    """
+    if obj in session.new or obj in session.deleted:
+        return True
+    if columns is None:
+        return session.is_modified(obj)
+    attrs = inspect(obj).attrs
+    return any(attrs[column].history.has_changes() for column in columns)
+
+
+def bulk_write_columns(orm_execute_state) -> set[str] | None:
+    """
+    Columns set by a bulk ORM UPDATE, or None for inserts, deletes and
+    updates whose columns are not known (treat as touching every column).
+    """
+    if not orm_execute_state.is_update:
+        return None
+    statement = orm_execute_state.statement
+    values = dict(getattr(statement, "_ordered_values", None) or ()) or getattr(statement, "_values", None)
+    if values:
+        keys = list(values)
+    else:
+        # Bulk UPDATE by primary key: session.execute(update(Model), [rows])
+        parameters = orm_execute_state.parameters
+        if isinstance(parameters, (list, tuple)):
+            parameters = parameters[0] if parameters else None
+        if not parameters:
+            return None
+        keys = list(parameters)
+    columns = {_column_key(key) for key in keys}
+    if None in columns:
+        return None
+    return columns
+
+
+def bulk_write_touches(orm_execute_state, models: tuple, columns: Iterable[str] | None = None) -> bool:
+    """
+    Whether a bulk ORM insert/update/delete (do_orm_execute) writes one of
+    `models` and, for updates, one of `columns` (any column when None).
+    """
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return False
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or not issubclass(mapper.class_, models):
+        return False
+    if columns is None:
+        return True
+    written = bulk_write_columns(orm_execute_state)
+    return written is None or not written.isdisjoint(columns)
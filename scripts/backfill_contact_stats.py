@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Recompute denormalized contact statistics for every person.
+
+Sets persons.last_contact_at and persons.interaction_count from the
+interactions table. The g2j78k9l0m12 migration runs the same backfill once;
+use this after bulk imports or direct SQL edits to interactions.
+
+Usage:
+    python scripts/backfill_contact_stats.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.database import SessionLocal
+from app.services.contact_stats import backfill_contact_stats
+
+
+def main():
+    db = SessionLocal()
+    try:
+        updated = backfill_contact_stats(db)
+        db.commit()
+        print(f"Updated contact stats for {updated} persons")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
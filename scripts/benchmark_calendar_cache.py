@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark caching Calendar API events into calendar_events.
+
+Seeds a synthetic Google account inside a transaction (rolled back at the
+end, so the database is left untouched), then caches a synthetic calendar
+page by page, as the calendar sync does, with the legacy SELECT-per-event
+upsert ("before") and CalendarService._cache_events, one
+INSERT ... ON CONFLICT DO UPDATE per page ("after"). Each is measured on an
+empty cache (all inserts) and again on a full one (all updates). The final
+step deletes 10% of the events as cancelled, in one statement.
+
+Usage:
+    python scripts/benchmark_calendar_cache.py
+    python scripts/benchmark_calendar_cache.py --events 5000 --page-size 250
+"""
+
+import argparse
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, delete, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.config import get_settings
+from app.models import CalendarEvent, GoogleAccount
+from app.services.calendar_service import CalendarService
+
+
+SUMMARIES = ["1:1", "Standup", "Board meeting", "Coffee", "Intro call", "Pipeline review", "Lunch"]
+DOMAINS = ["acme.com", "example.org", "capital.vc", "fund.io"]
+
+
+def synthetic_events(count: int) -> list[dict]:
+    """Calendar API event resources spread over the calendar sync window."""
+    rng = random.Random(42)
+    start = datetime.now(timezone.utc) - timedelta(days=90)
+    events = []
+    for i in range(count):
+        begins = start + timedelta(minutes=30 * rng.randint(0, 455 * 48))
+        events.append({
+            "id": f"bench{i:06d}",
+            "summary": rng.choice(SUMMARIES),
+            "start": {"dateTime": begins.isoformat()},
+            "end": {"dateTime": (begins + timedelta(minutes=rng.choice([30, 60]))).isoformat()},
+            "attendees": [
+                {"email": f"guest{rng.randint(0, 999)}@{rng.choice(DOMAINS)}", "displayName": "Guest"}
+                for _ in range(rng.randint(0, 4))
+            ],
+            "organizer": {"email": "me@example.com"},
+        })
+    return events
+
+
+def legacy_cache_page(service: CalendarService, account: GoogleAccount, page: list[dict]) -> None:
+    """The original upsert: a SELECT per event, then update or add."""
+    for event_data in page:
+        row = service._event_row(account, event_data)
+        if not row:
+            continue
+        existing = (
+            service.db.query(CalendarEvent)
+            .filter_by(google_account_id=account.id, google_event_id=row["google_event_id"])
+            .first()
+        )
+        if existing:
+            for column, value in row.items():
+                if column != "id":
+                    setattr(existing, column, value)
+        else:
+            service.db.add(CalendarEvent(**row))
+    service.db.flush()
+
+
+def batched_cache_page(service: CalendarService, account: GoogleAccount, page: list[dict]) -> None:
+    service._cache_events(account, page)
+
+
+def run(label: str, cache_page, service, account, events, page_size, statements) -> None:
+    """Cache every page twice (insert pass, update pass) and report each."""
+    for phase in ("insert", "update"):
+        statements[0] = 0
+        start = time.perf_counter()
+        for offset in range(0, len(events), page_size):
+            cache_page(service, account, events[offset:offset + page_size])
+        elapsed = time.perf_counter() - start
+        print(f"{label:<8} {phase:<7} {elapsed * 1000:9.1f} ms  {statements[0]:6d} statements")
+        service.db.expunge_all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark calendar event caching")
+    parser.add_argument("--events", type=int, default=5000, help="Synthetic events to cache")
+    parser.add_argument("--page-size", type=int, default=250, help="Events per API page")
+    args = parser.parse_args()
+
+    engine = create_engine(get_settings().database_url)
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = sessionmaker(bind=connection)()
+
+    statements = [0]
+
+    @event.listens_for(connection, "before_cursor_execute")
+    def count_statement(*_):
+        statements[0] += 1
+
+    try:
+        account_id = uuid.uuid4()
+        connection.execute(insert(GoogleAccount.__table__), {
+            "id": account_id,
+            "email": f"calendar-bench-{account_id.hex[:8]}@example.com",
+            "credentials_encrypted": "benchmark",
+        })
+        account = session.get(GoogleAccount, account_id)
+        service = CalendarService(session)
+        events = synthetic_events(args.events)
+
+        print(f"Caching {args.events} events in pages of {args.page_size}\n")
+        run("before", legacy_cache_page, service, account, events, args.page_size, statements)
+        session.execute(delete(CalendarEvent).where(CalendarEvent.google_account_id == account_id))
+        run("after", batched_cache_page, service, account, events, args.page_size, statements)
+
+        cancelled = [e["id"] for e in events[: args.events // 10]]
+        statements[0] = 0
+        start = time.perf_counter()
+        deleted = service._delete_events(account, cancelled)
+        print(
+            f"\ncancel   {deleted} events {(time.perf_counter() - start) * 1000:9.1f} ms  "
+            f"{statements[0]:6d} statements"
+        )
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Benchmark People list search latency.
+
+Seeds synthetic persons inside a transaction (rolled back at the end, so
+the database is left untouched), then times GET /people/table?q=... with
+the legacy six-column ILIKE filter ("before") and the full-text/trigram
+search from app.services.person_search ("after").
+
+Usage:
+    python scripts/benchmark_people_search.py
+    python scripts/benchmark_people_search.py --persons 50000 --runs 30
+
+Requires the f1i67j8k9l01 migration (search_vector + pg_trgm indexes).
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert, or_, text
+from sqlalchemy.orm import sessionmaker
+
+from app.config import get_settings
+from app.database import get_db
+from app.main import app
+from app.models import Person
+from app.routers import persons as persons_router
+
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+    "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Charles", "Karen", "Christopher", "Lisa", "Daniel", "Nancy",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+    "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
+]
+TITLES = [
+    "Managing Director", "Partner", "Principal", "Associate", "CEO", "CFO",
+    "Founder", "Vice President", "Analyst", "General Counsel", "Head of Research",
+]
+DOMAINS = ["acme.com", "example.org", "capital.vc", "fund.io", "bank.co.uk"]
+NOTE_WORDS = [
+    "met", "conference", "intro", "fintech", "seed", "series", "portfolio", "coffee",
+    "follow", "up", "dinner", "board", "advisor", "healthcare", "infrastructure",
+]
+
+QUERIES = ["smith", "jo", "partner", "fintech", "acme.com", "martinez", "jennifer lee"]
+
+
+def legacy_search_filter(q: str):
+    """The original six-column ILIKE filter, for the "before" measurement."""
+    search_term = f"%{q}%"
+    return or_(
+        Person.full_name.ilike(search_term),
+        Person.first_name.ilike(search_term),
+        Person.last_name.ilike(search_term),
+        Person.title.ilike(search_term),
+        Person.email.ilike(search_term),
+        Person.notes.ilike(search_term),
+    )
+
+
+def seed_persons(connection, count: int) -> None:
+    """Bulk insert synthetic persons in batches."""
+    rng = random.Random(42)
+    batch = []
+    for i in range(count):
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        batch.append({
+            "id": uuid.uuid4(),
+            "first_name": first,
+            "last_name": last,
+            "full_name": f"{first} {last}",
+            "title": rng.choice(TITLES),
+            "email": f"{first.lower()}.{last.lower()}{i}@{rng.choice(DOMAINS)}",
+            "notes": " ".join(rng.choices(NOTE_WORDS, k=rng.randint(20, 120))),
+            "contacted": False,
+        })
+        if len(batch) >= 5000:
+            connection.execute(insert(Person.__table__), batch)
+            batch = []
+    if batch:
+        connection.execute(insert(Person.__table__), batch)
+    connection.execute(text("ANALYZE persons"))
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def time_queries(client: TestClient, runs: int, sort_by: str) -> list[float]:
+    """Time /people/table for each benchmark query, returning latencies in ms."""
+    latencies = []
+    for _ in range(runs):
+        for q in QUERIES:
+            start = time.perf_counter()
+            response = client.get("/people/table", params={"q": q, "sort_by": sort_by})
+            latencies.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+    return latencies
+
+
+def report(label: str, latencies: list[float]) -> None:
+    print(
+        f"{label:<8} n={len(latencies):<5} "
+        f"p50={statistics.median(latencies):8.1f} ms  "
+        f"p95={percentile(latencies, 95):8.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark People list search")
+    parser.add_argument("--persons", type=int, default=50000, help="Synthetic persons to seed")
+    parser.add_argument("--runs", type=int, default=20, help="Passes over the query set")
+    args = parser.parse_args()
+
+    engine = create_engine(get_settings().database_url)
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = sessionmaker(bind=connection)()
+
+    def override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        print(f"Seeding {args.persons} persons...")
+        seed_persons(connection, args.persons)
+        client = TestClient(app)
+
+        # Warm up caches and plans
+        time_queries(client, 1, "full_name")
+
+        original_filter = persons_router.person_search_filter
+        persons_router.person_search_filter = legacy_search_filter
+        try:
+            before = time_queries(client, args.runs, "full_name")
+        finally:
+            persons_router.person_search_filter = original_filter
+
+        after = time_queries(client, args.runs, "full_name")
+        ranked = time_queries(client, args.runs, "relevance")
+
+        print(f"\n/people/table?q=... over {args.persons} persons, queries: {', '.join(QUERIES)}")
+        report("before", before)
+        report("after", after)
+        report("ranked", ranked)
+    finally:
+        app.dependency_overrides.clear()
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
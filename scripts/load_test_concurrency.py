@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Concurrency load test for a running BlackBook server.
+
+Fires a mix of requests at the dashboard today widget and the People table
+from many concurrent clients, and reports throughput and per-endpoint
+latency. A /health probe runs alongside: when sync work blocks the event
+loop its latency tracks the slowest request; with blocking work in the
+threadpool it stays flat.
+
+Usage:
+    uvicorn app.main:app --port 8000          # in another terminal
+    python scripts/load_test_concurrency.py
+    python scripts/load_test_concurrency.py --url http://localhost:8000 --concurrency 32 --duration 30
+
+Run it against the same data before and after a change to compare.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import defaultdict
+
+import httpx
+
+
+ENDPOINTS = [
+    ("today-widget", "/dashboard/today-widget", {}),
+    ("people-table", "/people/table", {"sort_by": "full_name"}),
+    ("people-search", "/people/table", {"q": "smith", "sort_by": "relevance"}),
+]
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def worker(
+    client: httpx.AsyncClient,
+    worker_id: int,
+    deadline: float,
+    latencies: dict[str, list[float]],
+    errors: dict[str, int],
+) -> None:
+    """Cycle through ENDPOINTS until the deadline, recording latencies in ms."""
+    i = worker_id
+    while time.perf_counter() < deadline:
+        name, path, params = ENDPOINTS[i % len(ENDPOINTS)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            response = await client.get(path, params=params)
+            if response.status_code >= 400:
+                errors[name] += 1
+                continue
+        except httpx.HTTPError:
+            errors[name] += 1
+            continue
+        latencies[name].append((time.perf_counter() - start) * 1000)
+
+
+async def health_probe(
+    client: httpx.AsyncClient,
+    deadline: float,
+    latencies: dict[str, list[float]],
+    interval: float,
+) -> None:
+    """Poll /health on its own connection to measure event-loop responsiveness."""
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            await client.get("/health")
+            latencies["health-probe"].append((time.perf_counter() - start) * 1000)
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(interval)
+
+
+def report(latencies: dict[str, list[float]], errors: dict[str, int], elapsed: float) -> None:
+    total = sum(len(v) for k, v in latencies.items() if k != "health-probe")
+    print(f"\n{total} requests in {elapsed:.1f}s = {total / elapsed:.1f} req/s\n")
+    print(f"{'endpoint':<14} {'n':>6} {'err':>5} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for name in [e[0] for e in ENDPOINTS] + ["health-probe"]:
+        samples = latencies.get(name) or []
+        if not samples:
+            print(f"{name:<14} {0:>6} {errors.get(name, 0):>5}")
+            continue
+        print(
+            f"{name:<14} {len(samples):>6} {errors.get(name, 0):>5} "
+            f"{statistics.median(samples):>9.1f} {percentile(samples, 95):>9.1f} "
+            f"{max(samples):>9.1f}"
+        )
+
+
+async def run(url: str, concurrency: int, duration: float, probe_interval: float) -> None:
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client, \
+            httpx.AsyncClient(base_url=url, timeout=60) as probe_client:
+        # Warm up plans and caches
+        for _, path, params in ENDPOINTS:
+            await client.get(path, params=params)
+
+        print(f"{concurrency} clients for {duration:.0f}s against {url} ...")
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(
+            health_probe(probe_client, deadline, latencies, probe_interval),
+            *(worker(client, i, deadline, latencies, errors) for i in range(concurrency)),
+        )
+        elapsed = time.perf_counter() - start
+
+    report(latencies, errors, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrency load test")
+    parser.add_argument("--url", default="http://localhost:8000", help="Server base URL")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds to run")
+    parser.add_argument("--probe-interval", type=float, default=0.1, help="Seconds between /health probes")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.url, args.concurrency, args.duration, args.probe_interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,17 +2,24 @@
 Pytest configuration and fixtures for Perun's BlackBook tests.
 """
 
+import os
+
 import pytest
 import pytest_asyncio
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.config import get_settings
-from app.models import Base
+# app.main registers the query profiler middleware only when enabled;
+# budget_client reads its response headers. Set before settings are loaded.
+os.environ.setdefault("QUERY_PROFILER_ENABLED", "true")
+
+from app.config import get_settings  # noqa: E402
+from app.models import Base  # noqa: E402
 
 
-# Configure pytest-asyncio to use auto mode for async tests
-pytest_plugins = ('pytest_asyncio',)
+# Configure pytest-asyncio to use auto mode for async tests;
+# query_budget provides the SQL query budget fixtures
+pytest_plugins = ('pytest_asyncio', 'tests.query_budget')
 
 
 @pytest.fixture(scope="session")
@@ -49,6 +56,33 @@ def db_session(engine) -> Session:
     connection.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_email_person_index():
+    """Drop the process-wide email -> person index (test data is rolled back)."""
+    from app.services.person_email_index import invalidate_email_person_index
+
+    invalidate_email_person_index()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_ignore_matcher():
+    """Drop the process-wide compiled ignore list (test patterns are rolled back)."""
+    from app.services.email_ignore_matcher import invalidate_ignore_matcher
+
+    invalidate_ignore_matcher()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_google_clients():
+    """Drop cached Google credentials and API clients (tests patch build())."""
+    from app.services.google_clients import clear_google_clients
+
+    clear_google_clients()
+    yield
+
+
 @pytest.fixture
 def sample_person(db_session):
     """Create a sample person for testing relationships."""
@@ -0,0 +1,95 @@
+"""
+Pytest plugin for SQL query budgets.
+
+Registered from conftest.py. Provides:
+- assert_max_queries: context manager failing the test if the block runs
+  more than N statements (for services and helpers)
+- budget_client: TestClient on the test transaction that fails the test when
+  a response exceeds the route's @query_budget, or the route has none
+"""
+
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import Engine
+
+from app.utils import query_profiler
+from app.utils.query_profiler import QUERY_BUDGET_HEADER, QUERY_COUNT_HEADER, QueryStats
+
+
+def _describe(stats: QueryStats, limit: int = 5) -> str:
+    """The most repeated statements, for failure messages."""
+    lines = []
+    for statement, times in stats.statements.most_common(limit):
+        preview = " ".join(statement.split())[:200]
+        lines.append(f"  {times}x {preview}")
+    return "\n".join(lines)
+
+
+@pytest.fixture(scope="session")
+def query_profiling():
+    """Profile statements on every engine (including the test engine)."""
+    query_profiler.enable(Engine)
+
+
+@pytest.fixture
+def assert_max_queries(query_profiling):
+    """
+    Usage:
+        with assert_max_queries(3):
+            service.do_work()
+    """
+    @contextmanager
+    def _assert_max_queries(max_queries: int):
+        with query_profiler.capture() as stats:
+            yield stats
+        if stats.count > max_queries:
+            pytest.fail(
+                f"Expected at most {max_queries} queries, got {stats.count}:\n"
+                f"{_describe(stats)}"
+            )
+
+    return _assert_max_queries
+
+
+class BudgetClient:
+    """TestClient wrapper asserting each response against its route budget."""
+
+    def __init__(self, client: TestClient):
+        self.client = client
+
+    def request(self, method: str, url: str, **kwargs):
+        response = self.client.request(method, url, **kwargs)
+        if QUERY_COUNT_HEADER not in response.headers:
+            pytest.fail(f"{method} {url} was not profiled (status {response.status_code})")
+
+        count = int(response.headers[QUERY_COUNT_HEADER])
+        budget = response.headers.get(QUERY_BUDGET_HEADER)
+        if budget is None:
+            pytest.fail(f"{method} {url} has no @query_budget (issued {count} queries)")
+        if count > int(budget):
+            pytest.fail(f"{method} {url} issued {count} queries, budget is {budget}")
+        return response
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+@pytest.fixture
+def budget_client(db_session, query_profiling):
+    """Client whose requests fail the test if they exceed the route's query budget."""
+    from app.database import get_db
+    from app.main import app
+
+    def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        yield BudgetClient(TestClient(app))
+    finally:
+        app.dependency_overrides.pop(get_db, None)
@@ -0,0 +1,103 @@
+"""
+Tests for the dashboard birthday lookups.
+"""
+
+from datetime import date
+
+import pytest
+
+from app.models import Person
+from app.services.birthday_service import (
+    get_birthdays_for_month,
+    get_todays_birthdays,
+    get_upcoming_birthdays,
+    invalidate_birthday_cache,
+)
+
+
+@pytest.fixture
+def birthdays(db_session):
+    """Persons with birthdays around New Year and on Feb 29."""
+    invalidate_birthday_cache()
+    people = {
+        "dec31": Person(full_name="Bday Dec31", first_name="Dec", birthday=date(1980, 12, 31)),
+        "jan02": Person(full_name="Bday Jan02", first_name="Jan", birthday=date(1990, 1, 2)),
+        "feb29": Person(full_name="Bday Feb29", first_name="Leap", birthday=date(1992, 2, 29)),
+        "jul04": Person(full_name="Bday Jul04", first_name="Jul", birthday=date(1975, 7, 4)),
+    }
+    db_session.add_all(people.values())
+    db_session.flush()
+    return people
+
+
+def _names(items) -> list[str]:
+    return [item["person"].full_name for item in items if item["person"].full_name.startswith("Bday ")]
+
+
+class TestUpcomingBirthdays:
+    """Test windowed lookups."""
+
+    def test_wraps_past_new_year(self, db_session, birthdays):
+        """Test that a late-December window includes early-January birthdays."""
+        upcoming = get_upcoming_birthdays(db_session, days=7, today=date(2025, 12, 30))
+
+        assert _names(upcoming) == ["Bday Dec31", "Bday Jan02"]
+        jan = next(i for i in upcoming if i["person"].full_name == "Bday Jan02")
+        assert jan["birthday_date"] == date(2026, 1, 2)
+        assert jan["days_until"] == 3
+        assert jan["age"] == 36
+
+    def test_feb_29_in_non_leap_year(self, db_session, birthdays):
+        """Test that Feb 29 birthdays are observed on Feb 28 in non-leap years."""
+        today = get_todays_birthdays(db_session, today=date(2025, 2, 28))
+        assert _names(today) == ["Bday Feb29"]
+        assert today[0]["is_today"]
+
+    def test_outside_window_excluded(self, db_session, birthdays):
+        """Test that birthdays beyond the window are not returned."""
+        assert _names(get_upcoming_birthdays(db_session, days=30, today=date(2025, 3, 1))) == []
+
+    def test_shared_cache(self, db_session, birthdays, assert_max_queries):
+        """Test that the today widget reuses the cached 30-day list."""
+        day = date(2025, 12, 31)
+        with assert_max_queries(1):
+            get_upcoming_birthdays(db_session, days=30, today=day)
+        with assert_max_queries(0):
+            assert _names(get_todays_birthdays(db_session, today=day)) == ["Bday Dec31"]
+
+    def test_write_invalidates(self, db_session, birthdays):
+        """Test that editing a birthday drops cached results."""
+        day = date(2025, 7, 1)
+        assert _names(get_upcoming_birthdays(db_session, days=7, today=day)) == ["Bday Jul04"]
+
+        birthdays["jan02"].birthday = date(1990, 7, 2)
+        db_session.commit()
+
+        assert _names(get_upcoming_birthdays(db_session, days=7, today=day)) == ["Bday Jan02", "Bday Jul04"]
+
+    def test_unrelated_write_keeps_cache(self, db_session, birthdays, assert_max_queries):
+        """Test that edits to fields the widgets do not show keep cached results."""
+        db_session.commit()
+        day = date(2025, 7, 1)
+        get_upcoming_birthdays(db_session, days=7, today=day)
+
+        birthdays["jul04"].notes = "Likes fireworks"
+        db_session.commit()
+
+        with assert_max_queries(0):
+            assert _names(get_upcoming_birthdays(db_session, days=7, today=day)) == ["Bday Jul04"]
+
+
+class TestBirthdaysForMonth:
+    """Test month lookups for the calendar views."""
+
+    def test_grouped_by_day(self, db_session, birthdays):
+        """Test that birthdays are keyed by day with the age turned that year."""
+        by_day = get_birthdays_for_month(db_session, 2026, 1)
+        assert [b["person"].full_name for b in by_day[2] if b["person"].full_name.startswith("Bday ")] == ["Bday Jan02"]
+        assert by_day[2][0]["age"] == 36
+
+    def test_feb_29_moves_in_non_leap_year(self, db_session, birthdays):
+        """Test that Feb 29 shows on the 28th in non-leap years."""
+        assert any(b["person"].full_name == "Bday Feb29" for b in get_birthdays_for_month(db_session, 2025, 2)[28])
+        assert any(b["person"].full_name == "Bday Feb29" for b in get_birthdays_for_month(db_session, 2028, 2)[29])
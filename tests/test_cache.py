@@ -0,0 +1,72 @@
+"""
+Tests for the in-process TTL cache.
+"""
+
+import time
+
+from app.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache behaviour."""
+
+    def test_get_set(self):
+        """Test that stored values are returned and counted as hits."""
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_expiry(self):
+        """Test that entries expire after the TTL."""
+        cache = TTLCache(ttl_seconds=0.01)
+        cache.set("a", 1)
+        time.sleep(0.02)
+
+        assert cache.get("a", "gone") == "gone"
+        assert cache.stats()["size"] == 0
+
+    def test_get_or_set_calls_factory_once(self):
+        """Test that the factory only runs on a miss."""
+        cache = TTLCache(ttl_seconds=60)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_set("k", factory) == "value"
+        assert cache.get_or_set("k", factory) == "value"
+        assert len(calls) == 1
+
+    def test_caches_falsy_values(self):
+        """Test that None/0 results are cached rather than recomputed."""
+        cache = TTLCache(ttl_seconds=60)
+        calls = []
+        cache.get_or_set("k", lambda: calls.append(1) or 0)
+        cache.get_or_set("k", lambda: calls.append(1) or 0)
+        assert len(calls) == 1
+
+    def test_max_entries_evicts_oldest(self):
+        """Test that the oldest entry is evicted when full."""
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        time.sleep(0.001)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_invalidate_and_clear(self):
+        """Test explicit invalidation."""
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert cache.get("b") is None
@@ -88,7 +88,6 @@ class TestCalendarServiceInit:
         """Test service initializes correctly."""
         service = CalendarService(db_session)
         assert service.db is db_session
-        assert service._email_to_person_cache is None
 
 
 class TestCalendarServiceCaching:
@@ -152,6 +151,64 @@ class TestCalendarServiceCaching:
         ).count()
         assert count == 1
 
+    def test_cache_events_upserts_page_in_one_statement(
+        self, db_session, google_account, calendar_service, assert_max_queries
+    ):
+        """Test that a page is upserted with one statement, last duplicate winning."""
+        now = datetime.now(timezone.utc)
+        db_session.add(CalendarEvent(
+            google_account_id=google_account.id,
+            google_event_id="page_existing",
+            summary="Before",
+            start_time=now,
+            end_time=now + timedelta(hours=1),
+        ))
+        db_session.commit()
+
+        def event(event_id, summary):
+            return {
+                "id": event_id,
+                "summary": summary,
+                "start": {"dateTime": now.isoformat()},
+                "end": {"dateTime": (now + timedelta(hours=1)).isoformat()},
+            }
+
+        # Load the account expired by the commit outside the budget
+        db_session.refresh(google_account)
+        with assert_max_queries(1):
+            cached = calendar_service._cache_events(google_account, [
+                event("page_existing", "After"),
+                event("page_new", "First"),
+                event("page_new", "Repeated"),
+                {"id": "page_no_times"},
+            ])
+
+        assert {e.google_event_id: e.summary for e in cached} == {
+            "page_existing": "After",
+            "page_new": "Repeated",
+        }
+        assert db_session.query(CalendarEvent).filter(
+            CalendarEvent.google_event_id.like("page_%")
+        ).count() == 2
+
+    def test_delete_events_in_bulk(self, db_session, google_account, calendar_service):
+        """Test that cancelled events are deleted by ID in one call."""
+        now = datetime.now(timezone.utc)
+        for event_id in ("bulk_a", "bulk_b", "bulk_c"):
+            db_session.add(CalendarEvent(
+                google_account_id=google_account.id,
+                google_event_id=event_id,
+                start_time=now,
+                end_time=now + timedelta(hours=1),
+            ))
+        db_session.commit()
+
+        assert calendar_service._delete_events(google_account, ["bulk_a", "bulk_b", "missing"]) == 2
+        remaining = db_session.query(CalendarEvent.google_event_id).filter(
+            CalendarEvent.google_event_id.like("bulk_%")
+        ).all()
+        assert [r[0] for r in remaining] == ["bulk_c"]
+
     def test_parse_event_time_datetime(self, calendar_service):
         """Test parsing dateTime format."""
         time_data = {"dateTime": "2025-12-08T10:00:00-05:00"}
@@ -177,23 +234,16 @@ class TestAttendeeMatching:
 
     def test_find_person_by_email(self, db_session, person_with_email, calendar_service):
         """Test finding person by email."""
-        # Reset cache
-        calendar_service._email_to_person_cache = None
-
         person_id = calendar_service._find_person_by_email("testperson@example.com")
         assert person_id == person_with_email.id
 
     def test_find_person_by_email_case_insensitive(self, db_session, person_with_email, calendar_service):
         """Test case insensitive email lookup."""
-        calendar_service._email_to_person_cache = None
-
         person_id = calendar_service._find_person_by_email("TESTPERSON@EXAMPLE.COM")
         assert person_id == person_with_email.id
 
     def test_find_person_by_email_not_found(self, db_session, calendar_service):
         """Test email not found returns None."""
-        calendar_service._email_to_person_cache = None
-
         person_id = calendar_service._find_person_by_email("unknown@example.com")
         assert person_id is None
 
@@ -214,9 +264,6 @@ class TestAttendeeMatching:
         db_session.add(event)
         db_session.commit()
 
-        # Reset cache
-        calendar_service._email_to_person_cache = None
-
         matched = calendar_service.match_attendees_to_persons(event)
 
         assert len(matched) == 2
@@ -250,9 +297,6 @@ class TestPendingContactProcessing:
         db_session.add(event)
         db_session.commit()
 
-        # Reset cache
-        calendar_service._email_to_person_cache = None
-
         created = calendar_service._process_attendees_for_pending(event)
         db_session.commit()
 
@@ -289,8 +333,6 @@ class TestPendingContactProcessing:
         db_session.add(event)
         db_session.commit()
 
-        calendar_service._email_to_person_cache = None
-
         created = calendar_service._process_attendees_for_pending(event)
         db_session.commit()
 
@@ -315,8 +357,6 @@ class TestPendingContactProcessing:
         db_session.add(event)
         db_session.commit()
 
-        calendar_service._email_to_person_cache = None
-
         created = calendar_service._process_attendees_for_pending(event)
 
         assert created == 0
@@ -337,8 +377,6 @@ class TestPendingContactProcessing:
         db_session.add(event)
         db_session.commit()
 
-        calendar_service._email_to_person_cache = None
-
         created = calendar_service._process_attendees_for_pending(event)
 
         assert created == 0
@@ -352,7 +390,7 @@ class TestFetchEvents:
         with pytest.raises(CalendarServiceError, match="Account not found"):
             calendar_service.fetch_events(uuid4())
 
-    @patch("app.services.calendar_service.build")
+    @patch("app.services.google_clients.build")
     def test_fetch_events_with_mocked_api(self, mock_build, db_session, google_account, calendar_service):
         """Test fetch_events with mocked Google API."""
         now = datetime.now(timezone.utc)
@@ -403,8 +441,6 @@ class TestAutoCreateInteractions:
         db_session.add(event)
         db_session.commit()
 
-        calendar_service._email_to_person_cache = None
-
         created = calendar_service._create_interactions_for_event(event)
         db_session.commit()
 
@@ -438,8 +474,6 @@ class TestAutoCreateInteractions:
         db_session.add(event)
         db_session.commit()
 
-        calendar_service._email_to_person_cache = None
-
         created = calendar_service._create_interactions_for_event(event)
         db_session.commit()
 
@@ -479,8 +513,6 @@ class TestAutoCreateInteractions:
         db_session.add(existing)
         db_session.commit()
 
-        calendar_service._email_to_person_cache = None
-
         created = calendar_service._create_interactions_for_event(event)
 
         assert created == 0
@@ -509,8 +541,6 @@ class TestAutoCreateInteractions:
         db_session.add(event)
         db_session.commit()
 
-        calendar_service._email_to_person_cache = None
-
         created = calendar_service._create_interactions_for_event(event)
 
         assert created == 0
@@ -533,8 +563,6 @@ class TestAutoCreateInteractions:
         db_session.add(event)
         db_session.commit()
 
-        calendar_service._email_to_person_cache = None
-
         created = calendar_service._create_interactions_for_event(event)
 
         assert created == 0
@@ -558,8 +586,6 @@ class TestAutoCreateInteractions:
         db_session.add(event)
         db_session.commit()
 
-        calendar_service._email_to_person_cache = None
-
         result = calendar_service.auto_create_interactions(days=7)
 
         assert result["events_processed"] >= 1
@@ -584,8 +610,6 @@ class TestAutoCreateInteractions:
         db_session.add(event)
         db_session.commit()
 
-        calendar_service._email_to_person_cache = None
-
         result = calendar_service.auto_create_interactions(days=7, only_past=True)
 
         # Future event should not be processed
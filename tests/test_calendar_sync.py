@@ -0,0 +1,260 @@
+"""
+Tests for the background calendar sync (sync tokens and 410 resyncs).
+"""
+
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+from sqlalchemy.orm import Session
+
+from app.models import CalendarEvent, CalendarSyncState, GoogleAccount, SyncStatus
+from app.services.calendar_service import CalendarService
+from app.services.calendar_sync_service import CalendarSyncService, _pending_ranges, _sync_lock
+from app.services.google_clients import clear_google_clients
+
+
+@pytest.fixture
+def google_account(db_session, monkeypatch):
+    """Create a test Google account."""
+    monkeypatch.setenv("ENCRYPTION_KEY", "izZY7IUIzei-kSYNOCgiIpwOSv9_hioCMBrs2mD9drs=")
+    from app.config import get_settings
+    from app.services.encryption import get_encryption_service
+    get_settings.cache_clear()
+    get_encryption_service.cache_clear()
+
+    account = GoogleAccount.create_with_credentials(
+        email="calendar-sync-test@gmail.com",
+        credentials={
+            "token": "test_token",
+            "refresh_token": "test_refresh_token",
+            "token_uri": "https://oauth2.googleapis.com/token",
+            "client_id": "test_client_id",
+            "client_secret": "test_client_secret",
+        },
+    )
+    db_session.add(account)
+    db_session.commit()
+    return account
+
+
+@pytest.fixture
+def sync_db(db_session):
+    """
+    A session on the test transaction whose commits and rollbacks use savepoints.
+
+    The service rolls back on errors; on db_session that would also undo the
+    test's outer transaction and the fixture rows.
+    """
+    with Session(bind=db_session.connection(), join_transaction_mode="create_savepoint") as session:
+        yield session
+
+
+def _sync_state(db: Session, account_id) -> CalendarSyncState:
+    return db.query(CalendarSyncState).filter_by(google_account_id=account_id).one()
+
+
+def _event(event_id: str, summary: str, start: datetime) -> dict:
+    return {
+        "id": event_id,
+        "summary": summary,
+        "start": {"dateTime": start.isoformat()},
+        "end": {"dateTime": (start + timedelta(hours=1)).isoformat()},
+    }
+
+
+def _mock_pages(mock_build, *responses):
+    """Make events().list().execute() return/raise each response in turn."""
+    clear_google_clients()
+    mock_service = MagicMock()
+    mock_build.return_value = mock_service
+    mock_service.events.return_value.list.return_value.execute.side_effect = list(responses)
+    return mock_service.events.return_value.list
+
+
+class TestFullSync:
+    """Test the initial sync."""
+
+    @patch("app.services.google_clients.build")
+    def test_stores_events_and_token(self, mock_build, db_session, google_account):
+        """Test that all pages are stored and the final sync token is kept."""
+        now = datetime.now(timezone.utc)
+        list_call = _mock_pages(
+            mock_build,
+            {"items": [_event("e1", "First", now)], "nextPageToken": "page2"},
+            {"items": [_event("e2", "Second", now + timedelta(days=1))], "nextSyncToken": "token-1"},
+        )
+
+        result = CalendarSyncService(db_session).sync_account(google_account)
+
+        assert result.success and result.full_sync
+        assert result.events_synced == 2
+        assert "timeMin" in list_call.call_args.kwargs
+        state = db_session.query(CalendarSyncState).filter_by(google_account_id=google_account.id).one()
+        assert state.sync_token == "token-1"
+        assert state.sync_status == SyncStatus.IDLE.value
+
+    @patch("app.services.google_clients.build")
+    def test_removes_events_google_no_longer_returns(self, mock_build, db_session, google_account):
+        """Test that stale local events inside the window are deleted."""
+        now = datetime.now(timezone.utc)
+        db_session.add(CalendarEvent(
+            google_account_id=google_account.id,
+            google_event_id="gone",
+            summary="Deleted upstream",
+            start_time=now,
+            end_time=now + timedelta(hours=1),
+        ))
+        db_session.commit()
+        _mock_pages(mock_build, {"items": [_event("kept", "Kept", now)], "nextSyncToken": "token-1"})
+
+        result = CalendarSyncService(db_session).full_sync(google_account)
+
+        assert result.events_deleted == 1
+        ids = {e.google_event_id for e in db_session.query(CalendarEvent).filter_by(google_account_id=google_account.id)}
+        assert ids == {"kept"}
+
+
+class TestIncrementalSync:
+    """Test syncs with a stored token."""
+
+    @pytest.fixture
+    def synced_state(self, db_session, google_account):
+        state = CalendarSyncState(
+            google_account_id=google_account.id,
+            sync_token="token-1",
+            sync_status=SyncStatus.IDLE.value,
+        )
+        db_session.add(state)
+        db_session.commit()
+        return state
+
+    @patch("app.services.google_clients.build")
+    def test_applies_changes_and_cancellations(self, mock_build, db_session, google_account, synced_state):
+        """Test that changed events are upserted and cancelled ones deleted."""
+        now = datetime.now(timezone.utc)
+        db_session.add(CalendarEvent(
+            google_account_id=google_account.id,
+            google_event_id="cancel-me",
+            start_time=now,
+            end_time=now + timedelta(hours=1),
+        ))
+        db_session.commit()
+        list_call = _mock_pages(mock_build, {
+            "items": [_event("new", "New", now), {"id": "cancel-me", "status": "cancelled"}],
+            "nextSyncToken": "token-2",
+        })
+
+        result = CalendarSyncService(db_session).sync_account(google_account)
+
+        assert result.success and not result.full_sync
+        assert (result.events_synced, result.events_deleted) == (1, 1)
+        assert list_call.call_args.kwargs["syncToken"] == "token-1"
+        assert synced_state.sync_token == "token-2"
+
+    @patch("app.services.google_clients.build")
+    def test_gone_token_triggers_full_sync(self, mock_build, sync_db, google_account, synced_state):
+        """Test that 410 Gone drops the token and resyncs from scratch."""
+        now = datetime.now(timezone.utc)
+        _mock_pages(
+            mock_build,
+            HttpError(MagicMock(status=410), b"Sync token is no longer valid"),
+            {"items": [_event("e1", "Resynced", now)], "nextSyncToken": "token-fresh"},
+        )
+
+        result = CalendarSyncService(sync_db).sync_account(sync_db.get(GoogleAccount, google_account.id))
+
+        assert result.success and result.full_sync
+        assert _sync_state(sync_db, google_account.id).sync_token == "token-fresh"
+
+    @patch("app.services.google_clients.build")
+    def test_api_error_marks_state_failed(self, mock_build, sync_db, google_account, synced_state):
+        """Test that other API errors keep the token and record the failure."""
+        _mock_pages(mock_build, HttpError(MagicMock(status=400), b"Bad request"))
+
+        result = CalendarSyncService(sync_db).sync_account(sync_db.get(GoogleAccount, google_account.id))
+
+        assert not result.success
+        state = _sync_state(sync_db, google_account.id)
+        assert state.has_error
+        assert state.sync_token == "token-1"
+
+
+class TestEnsureRange:
+    """Test fetching view ranges outside the synced window."""
+
+    @pytest.fixture
+    def window(self, db_session, google_account):
+        now = datetime.now(timezone.utc)
+        state = CalendarSyncState(
+            google_account_id=google_account.id,
+            sync_token="token-1",
+            sync_status=SyncStatus.IDLE.value,
+            window_start=now - timedelta(days=90),
+            window_end=now + timedelta(days=365),
+        )
+        db_session.add(state)
+        db_session.commit()
+        return state
+
+    @patch("app.services.google_clients.build")
+    def test_range_inside_window_not_fetched(self, mock_build, db_session, google_account, window):
+        """Test that views inside the window read only the local table."""
+        list_call = _mock_pages(mock_build)
+        now = datetime.now(timezone.utc)
+
+        CalendarService(db_session).get_events_for_range(now, now + timedelta(days=7))
+
+        assert CalendarSyncService(db_session).ensure_range(now, now + timedelta(days=7)) == []
+        list_call.assert_not_called()
+
+    @patch("app.services.calendar_sync_service._range_fetcher")
+    @patch("app.services.google_clients.build")
+    def test_view_queues_fetch_without_waiting(self, mock_build, mock_fetcher, db_session, google_account, window):
+        """Test that a view outside the window renders local rows and queues the fetch."""
+        list_call = _mock_pages(mock_build)
+        start = window.window_start - timedelta(days=200)
+        end = start + timedelta(days=31)
+
+        with _sync_lock:
+            # A running sync must not block the render
+            assert CalendarService(db_session).get_events_for_range(start, end) == []
+            CalendarService(db_session).get_events_for_range(start, end)
+
+        list_call.assert_not_called()
+        mock_fetcher.submit.assert_called_once()
+        _pending_ranges.clear()
+
+    @patch("app.services.google_clients.build")
+    def test_older_range_fetched_and_window_widened(self, mock_build, db_session, sync_db, google_account, window):
+        """Test that a month before the window is fetched, stored and then covered."""
+        start = window.window_start - timedelta(days=200)
+        end = start + timedelta(days=31)
+        list_call = _mock_pages(mock_build, {"items": [_event("old", "Old", start + timedelta(days=1))]})
+
+        futures = CalendarSyncService(db_session).ensure_range(
+            start, end, session_factory=lambda: nullcontext(sync_db)
+        )
+        for future in futures:
+            future.result()
+
+        assert len(futures) == 1
+        assert list_call.call_args.kwargs["timeMin"] == start.isoformat()
+        state = _sync_state(sync_db, google_account.id)
+        assert state.window_start == start
+        assert state.sync_token == "token-1"
+        events = CalendarService(sync_db).get_events_for_range(start, end)
+        assert [e.google_event_id for e in events] == ["old"]
+        assert list_call.call_count == 1
+
+    @patch("app.services.google_clients.build")
+    def test_fetch_error_keeps_window(self, mock_build, sync_db, google_account, window):
+        """Test that a failed fetch is logged and leaves the window unchanged."""
+        window_end = window.window_end
+        _mock_pages(mock_build, HttpError(MagicMock(status=400), b"Bad request"))
+
+        CalendarSyncService(sync_db).fetch_range(google_account.id, window_end, window_end + timedelta(days=30))
+
+        assert _sync_state(sync_db, google_account.id).window_end == window_end
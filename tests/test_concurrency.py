@@ -0,0 +1,47 @@
+"""
+Tests for the threadpool helpers.
+"""
+
+import threading
+
+import anyio.to_thread
+import pytest
+
+from app.utils.concurrency import configure_threadpool, run_blocking
+
+
+class TestRunBlocking:
+    """Test offloading blocking calls."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_thread(self):
+        """Test that the callable does not run on the event loop thread."""
+        loop_thread = threading.get_ident()
+        worker_thread = await run_blocking(threading.get_ident)
+        assert worker_thread != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_passes_arguments(self):
+        """Test that positional and keyword arguments are forwarded."""
+        assert await run_blocking(int, "ff", base=16) == 255
+
+    @pytest.mark.asyncio
+    async def test_propagates_exceptions(self):
+        """Test that errors raised in the thread reach the caller."""
+        with pytest.raises(ValueError):
+            await run_blocking(int, "not a number")
+
+
+class TestConfigureThreadpool:
+    """Test sizing the shared threadpool."""
+
+    @pytest.mark.asyncio
+    async def test_sets_limiter_tokens(self):
+        """Test that the default AnyIO limiter is resized."""
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        original = limiter.total_tokens
+        try:
+            configure_threadpool(7)
+            assert limiter.total_tokens == 7
+        finally:
+            limiter.total_tokens = original
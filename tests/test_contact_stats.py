@@ -0,0 +1,95 @@
+"""
+Tests for the denormalized person contact statistics.
+"""
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from app.models import Interaction, Person
+from app.services.contact_stats import backfill_contact_stats, refresh_contact_stats
+
+
+class TestRefreshContactStats:
+    """Test incremental maintenance of last_contact_at / interaction_count."""
+
+    @pytest.fixture
+    def person(self, db_session):
+        """Create a person with no interactions."""
+        person = Person(full_name="Contact Stats Person")
+        db_session.add(person)
+        db_session.flush()
+        return person
+
+    def test_new_person_has_no_contact(self, db_session, person):
+        """Test that a fresh person starts with zero interactions."""
+        db_session.refresh(person)
+        assert person.interaction_count == 0
+        assert person.last_contact is None
+
+    def test_create_updates_stats(self, db_session, person):
+        """Test that adding interactions sets count and latest date."""
+        db_session.add_all([
+            Interaction(person_id=person.id, interaction_date=date(2025, 3, 1)),
+            Interaction(person_id=person.id, interaction_date=date(2025, 6, 15)),
+        ])
+        refresh_contact_stats(db_session, [person.id])
+
+        assert person.interaction_count == 2
+        assert person.last_contact_at == datetime(2025, 6, 15, tzinfo=timezone.utc)
+
+    def test_delete_updates_stats(self, db_session, person):
+        """Test that removing the latest interaction moves last contact back."""
+        older = Interaction(person_id=person.id, interaction_date=date(2025, 3, 1))
+        newer = Interaction(person_id=person.id, interaction_date=date(2025, 6, 15))
+        db_session.add_all([older, newer])
+        refresh_contact_stats(db_session, [person.id])
+
+        db_session.delete(newer)
+        refresh_contact_stats(db_session, [person.id])
+
+        assert person.interaction_count == 1
+        assert person.last_contact_at == datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+    def test_reassign_updates_both_persons(self, db_session, person):
+        """Test that moving an interaction updates the old and new person."""
+        other = Person(full_name="Contact Stats Other")
+        db_session.add(other)
+        db_session.flush()
+        interaction = Interaction(person_id=person.id, interaction_date=date(2025, 1, 1))
+        db_session.add(interaction)
+        refresh_contact_stats(db_session, [person.id])
+
+        interaction.person_id = other.id
+        refresh_contact_stats(db_session, [person.id, other.id])
+
+        assert person.interaction_count == 0
+        assert person.last_contact_at is None
+        assert other.interaction_count == 1
+
+    def test_undated_interaction_uses_created_at(self, db_session, person):
+        """Test that interactions without a date fall back to when they were logged."""
+        db_session.add(Interaction(person_id=person.id))
+        refresh_contact_stats(db_session, [person.id])
+
+        assert person.interaction_count == 1
+        assert person.last_contact_at is not None
+
+    def test_none_ids_ignored(self, db_session):
+        """Test that unlinked interactions (no person) are a no-op."""
+        refresh_contact_stats(db_session, [None])
+
+
+class TestBackfillContactStats:
+    """Test the full recompute."""
+
+    def test_backfill_repairs_drift(self, db_session):
+        """Test that backfill recomputes stale columns."""
+        person = Person(full_name="Backfill Person", interaction_count=99)
+        db_session.add(person)
+        db_session.flush()
+        db_session.add(Interaction(person_id=person.id, interaction_date=date(2024, 12, 24)))
+
+        assert backfill_contact_stats(db_session) >= 1
+        assert person.interaction_count == 1
+        assert person.last_contact_at == datetime(2024, 12, 24, tzinfo=timezone.utc)
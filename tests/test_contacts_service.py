@@ -96,8 +96,8 @@ class TestContactsService:
         assert isinstance(service, ContactsService)
         assert service.db == db_session
 
-    def test_build_email_cache(self, db_session):
-        """Test building email lookup cache."""
+    def test_build_person_indexes_by_email(self, db_session):
+        """Test that the person indexes map each PersonEmail address to its person."""
         # Create a person with emails
         person = Person(full_name="Test Person")
         db_session.add(person)
@@ -117,11 +117,10 @@ class TestContactsService:
         db_session.flush()
 
         service = ContactsService(db_session)
-        service._build_email_cache()
+        service._build_person_indexes()
 
-        assert "test1@example.com" in service._email_to_person_cache
-        assert "test2@example.com" in service._email_to_person_cache
-        assert service._email_to_person_cache["test1@example.com"] == person.id
+        assert [p.id for p in service._persons_by_email["test1@example.com"]] == [person.id]
+        assert [p.id for p in service._persons_by_email["test2@example.com"]] == [person.id]
 
     def test_match_contact_to_person_found(self, db_session):
         """Test matching contact by email to existing person."""
@@ -6,6 +6,7 @@ import pytest
 from sqlalchemy.exc import IntegrityError
 
 from app.models import EmailIgnoreList, IgnorePatternType
+from app.services.email_ignore_matcher import IgnoreMatcher, get_ignore_matcher
 
 
 class TestEmailIgnoreListCreate:
@@ -249,6 +250,44 @@ class TestPatternMatching:
         assert domain_pattern.matches("user@testcasedomain.com") is True
 
 
+class TestIgnoreMatcher:
+    """Test the compiled, shared ignore list."""
+
+    def test_compiled_matching(self):
+        """Test exact, domain and combined wildcard matching."""
+        matcher = IgnoreMatcher([
+            ("Exact@Example.com", "email"),
+            ("spamdomain.com", "domain"),
+            ("noreply@*", "email"),
+            ("*@bounces.example.org", "email"),
+        ])
+
+        assert matcher.matches("EXACT@example.com")
+        assert matcher.matches("news@spamdomain.com")
+        assert not matcher.matches("news@notspamdomain.com")
+        assert matcher.matches("noreply@anything.io")
+        assert matcher.matches("x@bounces.example.org")
+        assert not matcher.matches("x@bouncesXexample.org")
+        assert not matcher.matches("friend@example.com")
+        assert not matcher.matches(None)
+        assert not IgnoreMatcher([])
+
+    def test_shared_until_changed(self, db_session, assert_max_queries):
+        """Test that lookups reuse the matcher until a pattern is added or removed."""
+        get_ignore_matcher(db_session)
+        with assert_max_queries(0):
+            assert not get_ignore_matcher(db_session).matches("added@matcher-test.com")
+
+        pattern = EmailIgnoreList(pattern="matcher-test.com", pattern_type=IgnorePatternType.domain)
+        db_session.add(pattern)
+        db_session.flush()
+        assert get_ignore_matcher(db_session).matches("added@matcher-test.com")
+
+        db_session.delete(pattern)
+        db_session.flush()
+        assert not get_ignore_matcher(db_session).matches("added@matcher-test.com")
+
+
 class TestIgnorePatternTypeEnum:
     """Test IgnorePatternType enum values."""
 
@@ -0,0 +1,111 @@
+"""
+Tests for inbox search (full-text search vector and Gmail-style operators).
+"""
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from app.models import EmailMessage
+from app.services.email_search import (
+    build_text_tsquery,
+    email_search_filters,
+    email_search_rank,
+    parse_email_search,
+)
+
+
+class TestParseEmailSearch:
+    """Test splitting search input into operators and free text."""
+
+    def test_empty_input(self):
+        """Test that empty input searches nothing."""
+        search = parse_email_search(None)
+        assert build_text_tsquery(search) is None
+        assert email_search_filters(search) == []
+
+    def test_operators(self):
+        """Test that each operator is parsed into its field."""
+        search = parse_email_search(
+            'from:Alice@Example.com to:"Bob Smith" has:attachment after:2025/01/01 before:2025-02-01 budget'
+        )
+        assert search.from_values == ["alice@example.com"]
+        assert search.to_values == ["bob smith"]
+        assert search.has_attachment
+        assert search.after == date(2025, 1, 1)
+        assert search.before == date(2025, 2, 1)
+        assert search.words == ["budget"]
+
+    def test_invalid_operators_are_text(self):
+        """Test that unknown operators and bad dates are searched as words."""
+        search = parse_email_search("re:deal before:soon")
+        assert search.words == ["re", "deal", "before", "soon"]
+        assert search.before is None
+
+    def test_phrase_and_prefix(self):
+        """Test that words match by prefix and quoted phrases in order."""
+        search = parse_email_search('q3 "board deck"')
+        assert build_text_tsquery(search) == "q3:* & (board <-> deck:*)"
+
+    def test_tsquery_operators_are_stripped(self):
+        """Test that tsquery operators in user input are ignored."""
+        search = parse_email_search("a & (b | !c):")
+        assert build_text_tsquery(search) == "a:* & b:* & c:*"
+
+
+class TestEmailSearchQuery:
+    """Test search filters and ranking against the database."""
+
+    @pytest.fixture
+    def emails(self, db_session, sample_google_account):
+        """Create messages matching in different fields."""
+        def message(msg_id, **fields):
+            return EmailMessage(
+                google_account_id=sample_google_account.id,
+                gmail_message_id=msg_id,
+                gmail_thread_id=msg_id,
+                internal_date=datetime(2025, 1, int(msg_id[1:]), tzinfo=timezone.utc),
+                **fields,
+            )
+
+        messages = [
+            message("m1", subject="Zyxquarterly board deck", from_email="alice@acme.com"),
+            message("m2", subject="Lunch", snippet="attached the zyxquarterly numbers",
+                    from_email="carol@fund.io", from_name="Carol Zyxquarterly", has_attachments=True),
+            message("m3", subject="Intro", from_email="dave@example.org",
+                    to_emails=[{"email": "erin@acme.com", "name": "Erin Frost"}]),
+            message("m4", subject="Unrelated", snippet="nothing to see"),
+        ]
+        db_session.add_all(messages)
+        db_session.flush()
+        return messages
+
+    def _search(self, db_session, q):
+        search = parse_email_search(q)
+        query = db_session.query(EmailMessage).filter(*email_search_filters(search))
+        rank = email_search_rank(search)
+        order = [rank] if rank is not None else []
+        return query.order_by(*order, EmailMessage.internal_date.desc()).all()
+
+    def test_prefix_match_ranks_subject_first(self, db_session, emails):
+        """Test that partial words match and subject hits outrank snippet hits."""
+        results = self._search(db_session, "zyxquart")
+        assert results[:2] == [emails[0], emails[1]]
+        assert emails[3] not in results
+
+    def test_from_address_and_fragment(self, db_session, emails):
+        """Test that from: matches a full address exactly, or sender words."""
+        assert self._search(db_session, "from:alice@acme.com") == [emails[0]]
+        assert self._search(db_session, "from:acme") == [emails[0]]
+        assert self._search(db_session, "from:zyxquarterly") == [emails[1]]
+
+    def test_to_address_and_name(self, db_session, emails):
+        """Test that to: matches recipients, not senders."""
+        assert self._search(db_session, "to:erin@acme.com") == [emails[2]]
+        assert self._search(db_session, "to:frost") == [emails[2]]
+        assert self._search(db_session, "to:alice") == []
+
+    def test_attachment_and_dates(self, db_session, emails):
+        """Test has:attachment and the before:/after: date bounds."""
+        assert self._search(db_session, "has:attachment") == [emails[1]]
+        assert self._search(db_session, "after:2025/01/02 before:2025/01/04") == [emails[2], emails[1]]
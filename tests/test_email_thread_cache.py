@@ -0,0 +1,172 @@
+"""
+Tests for the read-through email_cache layer over Gmail searches.
+"""
+
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.models import EmailCache, Person
+from app.services.email_thread_cache import (
+    EmailThreadCache,
+    email_cache_stats,
+    evict_expired,
+    refresh_person_threads,
+)
+from app.services.gmail_service import EmailThread
+
+
+@pytest.fixture
+def person(db_session):
+    """A person to cache searches for."""
+    person = Person(full_name="Thread Cache Person")
+    db_session.add(person)
+    db_session.flush()
+    return person
+
+
+@pytest.fixture
+def gmail(sample_google_account):
+    """A GmailService stand-in whose search finds one thread."""
+    service = MagicMock()
+    service.search_emails_for_person.return_value = [
+        EmailThread(
+            thread_id="thread1",
+            account_id=sample_google_account.id,
+            account_email=sample_google_account.email,
+            subject="Old intro",
+            last_message_date=datetime(2024, 3, 1, tzinfo=timezone.utc),
+            message_count=2,
+        )
+    ]
+    return service
+
+
+class TestPersonThreads:
+    """Test read-through person searches."""
+
+    def test_fresh_entries_skip_gmail(self, db_session, person, gmail):
+        """Test that a second lookup is served from email_cache."""
+        cache = EmailThreadCache(db_session, gmail)
+        before = email_cache_stats()
+
+        first = cache.person_threads(person.id)
+        second = cache.person_threads(person.id)
+
+        assert not first.from_cache
+        assert second.from_cache and not second.stale
+        assert [t.subject for t in second.threads] == ["Old intro"]
+        assert gmail.search_emails_for_person.call_count == 1
+        stats = email_cache_stats()
+        assert stats["misses"] == before["misses"] + 1
+        assert stats["hits"] == before["hits"] + 1
+
+    def test_miss_without_fetch(self, db_session, person, gmail):
+        """Test that fetch=False reports a miss instead of searching Gmail."""
+        assert EmailThreadCache(db_session, gmail).person_threads(person.id, fetch=False) is None
+        gmail.search_emails_for_person.assert_not_called()
+
+    def test_empty_search_remembered(self, db_session, person, gmail):
+        """Test that a search with no threads is not repeated within the TTL."""
+        gmail.search_emails_for_person.return_value = []
+        cache = EmailThreadCache(db_session, gmail)
+
+        cache.person_threads(person.id)
+        result = cache.person_threads(person.id)
+
+        assert result.from_cache and result.threads == []
+        assert gmail.search_emails_for_person.call_count == 1
+
+    def test_stale_entries_served_then_refreshed(self, db_session, person, gmail):
+        """Test that stale rows are returned and a background refresh replaces them."""
+        cache = EmailThreadCache(db_session, gmail)
+        cache.person_threads(person.id)
+        db_session.query(EmailCache).update({"cached_at": datetime.now(timezone.utc) - timedelta(hours=2)})
+
+        result = cache.person_threads(person.id)
+        assert result.from_cache and result.stale
+
+        with patch("app.services.email_thread_cache.GmailService", return_value=gmail):
+            refresh_person_threads(person.id, session_factory=lambda: nullcontext(db_session))
+
+        assert gmail.search_emails_for_person.call_count == 2
+        assert not cache.person_threads(person.id).stale
+
+
+    def test_refresh_upserts_and_prunes(self, db_session, person, sample_google_account, gmail):
+        """Test that a new search updates found threads in place and drops the rest."""
+        cache = EmailThreadCache(db_session, gmail)
+        cache.person_threads(person.id)
+        db_session.add(EmailCache(
+            person_id=person.id,
+            google_account_id=sample_google_account.id,
+            gmail_thread_id="gone",
+            cached_at=datetime.now(timezone.utc),
+        ))
+        db_session.commit()
+        row_id = db_session.query(EmailCache.id).filter_by(gmail_thread_id="thread1").scalar()
+        gmail.search_emails_for_person.return_value[0].subject = "Old intro, replied"
+
+        cache.person_threads(person.id, refresh=True)
+
+        rows = db_session.query(EmailCache).filter_by(person_id=person.id).all()
+        assert [(row.id, row.subject) for row in rows] == [(row_id, "Old intro, replied")]
+
+
+class TestThreadDetails:
+    """Test read-through thread details."""
+
+    def test_details_refresh_cached_rows(self, db_session, person, sample_google_account, gmail):
+        """Test that fetched details update the person's row and are then served without Gmail."""
+        cache = EmailThreadCache(db_session, gmail)
+        cache.person_threads(person.id)
+        db_session.query(EmailCache).update({"cached_at": datetime.now(timezone.utc) - timedelta(hours=2)})
+        details = gmail.search_emails_for_person.return_value[0]
+        details.message_count = 3
+        gmail.get_thread_details.return_value = details
+
+        cache.thread_details("thread1", sample_google_account.id)
+        thread = cache.thread_details("thread1", sample_google_account.id)
+
+        assert thread.message_count == 3
+        assert gmail.get_thread_details.call_count == 1
+        assert not cache.person_threads(person.id).stale
+
+    def test_details_not_stored_as_person_search(self, db_session, person, sample_google_account, gmail):
+        """Test that details of an uncached thread add no email_cache rows."""
+        gmail.get_thread_details.return_value = gmail.search_emails_for_person.return_value[0]
+        cache = EmailThreadCache(db_session, gmail)
+
+        cache.thread_details("thread1", sample_google_account.id)
+
+        assert db_session.query(EmailCache).count() == 0
+        assert cache.person_threads(person.id, fetch=False) is None
+
+
+class TestEviction:
+    """Test deletion of expired rows."""
+
+    def test_evict_expired(self, db_session, person, sample_google_account):
+        """Test that only rows past the max age are deleted."""
+        now = datetime.now(timezone.utc)
+        db_session.add_all([
+            EmailCache(
+                person_id=person.id,
+                google_account_id=sample_google_account.id,
+                gmail_thread_id="old",
+                cached_at=now - timedelta(hours=48),
+            ),
+            EmailCache(
+                person_id=person.id,
+                google_account_id=sample_google_account.id,
+                gmail_thread_id="recent",
+                cached_at=now,
+            ),
+        ])
+        db_session.flush()
+
+        assert evict_expired(db_session, max_age_hours=24) == 1
+        remaining = [row.gmail_thread_id for row in db_session.query(EmailCache).filter_by(person_id=person.id)]
+        assert remaining == ["recent"]
@@ -0,0 +1,61 @@
+"""
+Tests for the email inbox list partial (cursor pages).
+"""
+
+import html
+import re
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models import EmailMessage, GoogleAccount
+
+
+@pytest.fixture
+def inbox(db_session, monkeypatch):
+    """An account with three inbox emails received today."""
+    monkeypatch.setenv("ENCRYPTION_KEY", "izZY7IUIzei-kSYNOCgiIpwOSv9_hioCMBrs2mD9drs=")
+    from app.config import get_settings
+    from app.services.encryption import get_encryption_service
+    get_settings.cache_clear()
+    get_encryption_service.cache_clear()
+
+    account = GoogleAccount.create_with_credentials(
+        email="inbox-router-test@gmail.com",
+        credentials={"token": "test_token", "refresh_token": "test_refresh_token"},
+    )
+    db_session.add(account)
+    db_session.flush()
+    now = datetime.now(timezone.utc).replace(hour=12)
+    for i in range(3):
+        db_session.add(EmailMessage(
+            google_account_id=account.id,
+            gmail_message_id=f"inbox-router-{i}",
+            gmail_thread_id=f"inbox-router-thread-{i}",
+            subject=f"Router message {i}",
+            labels=["INBOX"],
+            internal_date=now - timedelta(minutes=i),
+        ))
+    db_session.flush()
+    return account
+
+
+def _next_url(body: str) -> str | None:
+    match = re.search(r'class="scroll-sentinel[^"]*" hx-get="([^"]+)"', body)
+    return html.unescape(match.group(1)) if match else None
+
+
+class TestCursorPages:
+    """Test infinite-scroll pages of the inbox list."""
+
+    def test_group_header_not_repeated(self, budget_client, inbox):
+        """Test that a date group continuing on the next page gets no second header."""
+        first = budget_client.get(f"/emails/table?cursor=&per_page=2&account_id={inbox.id}")
+        assert "Today" in first.text
+        next_url = _next_url(first.text)
+        assert "last_group=Today" in next_url
+
+        second = budget_client.get(next_url)
+
+        assert "Router message 2" in second.text
+        assert "Today" not in second.text
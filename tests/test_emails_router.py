@@ -11,7 +11,14 @@ from fastapi.testclient import TestClient
 
 from app.main import app
 from app.database import get_db
-from app.models import Person, GoogleAccount, EmailCache, Interaction
+from app.models import (
+    Person,
+    GoogleAccount,
+    EmailCache,
+    EmailMessage,
+    EmailPersonLink,
+    Interaction,
+)
 from app.services.gmail_service import EmailThread
 
 
@@ -96,6 +103,32 @@ class TestGetPersonEmails:
         assert "cached_thread_123" in response.text
         assert "Cached results" in response.text  # from_cache indicator
 
+    @patch("app.services.google_clients.build")
+    def test_serves_synced_threads_without_gmail(
+        self, mock_build, client, test_person, test_google_account, db_session
+    ):
+        """Test that synced messages are listed without searching Gmail."""
+        message = EmailMessage(
+            google_account_id=test_google_account.id,
+            gmail_message_id="synced_msg",
+            gmail_thread_id="synced_thread",
+            subject="Synced Subject",
+            from_email="testperson@example.com",
+            internal_date=datetime.now(timezone.utc),
+        )
+        db_session.add(message)
+        db_session.flush()
+        db_session.add(EmailPersonLink(email_message_id=message.id, person_id=test_person.id, link_type="from"))
+        db_session.commit()
+
+        response = client.get(f"/emails/person/{test_person.id}")
+
+        assert response.status_code == 200
+        assert "Synced Subject" in response.text
+        # The account has never synced, so older history may still be in Gmail
+        assert "Search older emails in Gmail" in response.text
+        mock_build.assert_not_called()
+
     def test_returns_empty_when_no_accounts(self, client, test_person, db_session):
         """Test empty results when no Google accounts connected."""
         # Make sure no accounts exist
@@ -329,3 +362,11 @@ class TestClearCache:
 
         assert response.status_code == 200
         assert response.json()["success"] is True
+
+    def test_cache_stats(self, client):
+        """Test that cache counters and the row count are reported."""
+        response = client.get("/emails/cache/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert {"hits", "stale_hits", "misses", "refreshes", "evicted", "rows"} <= set(data)
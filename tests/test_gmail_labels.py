@@ -0,0 +1,62 @@
+"""
+Tests for the inbox Gmail label sidebar built from stored label lists.
+"""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.models import EmailSyncState
+from app.services.gmail_labels import build_label_hierarchy, inbox_label_hierarchy
+
+
+class TestBuildLabelHierarchy:
+    """Test filtering and nesting of labels."""
+
+    def test_nests_and_sorts_labels(self):
+        """Test that "/" labels nest under their parent, which keeps its own ID."""
+        labels = build_label_hierarchy({
+            "Label_2": "News/Bloomberg",
+            "Label_1": "News",
+            "Label_4": "Receipts",
+            "Label_5": "Work/Deals/2024",
+            "Label_6": "Archive",
+        })
+
+        assert [label["display_name"] for label in labels] == ["News", "Work", "Archive", "Receipts"]
+        news = next(label for label in labels if label["display_name"] == "News")
+        assert news["name"] == "Label_1"
+        assert [child["display_name"] for child in news["children"]] == ["Bloomberg"]
+        work = next(label for label in labels if label["display_name"] == "Work")
+        assert work["name"] is None
+        assert work["children"] == [{"name": "Label_5", "display_name": "Deals/2024"}]
+
+    def test_hides_system_labels(self):
+        """Test that system labels, folders and star/circle labels are dropped."""
+        labels = build_label_hierarchy({
+            "INBOX": "INBOX",
+            "UNREAD": "UNREAD",
+            "CATEGORY_SOCIAL": "CATEGORY_SOCIAL",
+            "Label_1": "Blue Star",
+            "Label_2": "Junk E-mail",
+            "Label_3": "Clients",
+        })
+
+        assert labels == [{"name": "Label_3", "display_name": "Clients", "children": []}]
+
+
+class TestInboxLabelHierarchy:
+    """Test merging and caching of the stored label lists."""
+
+    def test_merges_accounts_and_skips_unfetched(self):
+        """Test that stored lists are merged and accounts without labels ignored."""
+        synced_at = datetime.now(timezone.utc)
+        states = [
+            EmailSyncState(google_account_id=uuid4(), label_names={"Label_1": "Clients"}, labels_synced_at=synced_at),
+            EmailSyncState(google_account_id=uuid4(), label_names={"Label_2": "Family"}, labels_synced_at=synced_at),
+            EmailSyncState(google_account_id=uuid4()),
+        ]
+
+        labels = inbox_label_hierarchy(states)
+
+        assert [label["display_name"] for label in labels] == ["Clients", "Family"]
+        assert inbox_label_hierarchy(states) is labels
@@ -5,13 +5,23 @@ These tests use mocking to avoid requiring actual Gmail API access.
 """
 
 import pytest
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from unittest.mock import patch, MagicMock
 from uuid import uuid4
 
-from app.models import Person, PersonEmail, GoogleAccount, EmailIgnoreList
+from app.models import (
+    EmailIgnoreList,
+    EmailMessage,
+    EmailPersonLink,
+    EmailSyncState,
+    GoogleAccount,
+    Person,
+    PersonEmail,
+    SyncStatus,
+)
 from app.models.person_email import EmailLabel
 from app.models.email_ignore import IgnorePatternType
+from app.services.email_ignore_matcher import IgnoreMatcher
 from app.services.gmail_service import (
     GmailService,
     GmailServiceError,
@@ -256,32 +266,30 @@ class TestIgnorePatternFiltering:
 
 
 class TestEmailPatternMatching:
-    """Test email pattern matching."""
+    """Test email pattern matching (the compiled ignore matcher)."""
 
-    def test_matches_exact_email(self, db_session):
-        """Test matching exact email."""
-        service = GmailService(db_session)
+    @staticmethod
+    def _matches(email: str, pattern: str) -> bool:
+        return IgnoreMatcher([(pattern, IgnorePatternType.email.value)]).matches(email)
 
-        assert service._matches_email_pattern("test@example.com", "test@example.com") is True
-        assert service._matches_email_pattern("other@example.com", "test@example.com") is False
+    def test_matches_exact_email(self):
+        """Test matching exact email."""
+        assert self._matches("test@example.com", "test@example.com") is True
+        assert self._matches("other@example.com", "test@example.com") is False
 
-    def test_matches_wildcard_pattern(self, db_session):
+    def test_matches_wildcard_pattern(self):
         """Test matching wildcard patterns."""
-        service = GmailService(db_session)
-
         # noreply@* should match noreply@anything.com
-        assert service._matches_email_pattern("noreply@company.com", "noreply@*") is True
-        assert service._matches_email_pattern("noreply@test.org", "noreply@*") is True
-        assert service._matches_email_pattern("support@company.com", "noreply@*") is False
+        assert self._matches("noreply@company.com", "noreply@*") is True
+        assert self._matches("noreply@test.org", "noreply@*") is True
+        assert self._matches("support@company.com", "noreply@*") is False
 
-    def test_matches_prefix_wildcard(self, db_session):
+    def test_matches_prefix_wildcard(self):
         """Test matching prefix wildcards."""
-        service = GmailService(db_session)
-
         # *@domain.com should match any email at that domain
-        assert service._matches_email_pattern("user@domain.com", "*@domain.com") is True
-        assert service._matches_email_pattern("admin@domain.com", "*@domain.com") is True
-        assert service._matches_email_pattern("user@other.com", "*@domain.com") is False
+        assert self._matches("user@domain.com", "*@domain.com") is True
+        assert self._matches("admin@domain.com", "*@domain.com") is True
+        assert self._matches("user@other.com", "*@domain.com") is False
 
 
 class TestExtractEmails:
@@ -341,7 +349,7 @@ class TestSearchEmailsForPerson:
 
         assert results == []
 
-    @patch("app.services.gmail_service.build")
+    @patch("app.services.google_clients.build")
     def test_search_returns_sorted_threads(self, mock_build, db_session, monkeypatch):
         """Test that search results are sorted by date."""
         # Set up encryption
@@ -415,6 +423,124 @@ class TestSearchEmailsForPerson:
         assert results[1].thread_id == "older"
 
 
+class TestLocalEmailHistory:
+    """Test person email history served from synced messages."""
+
+    @pytest.fixture
+    def person(self, db_session):
+        """Create a person with a legacy email."""
+        person = Person(full_name="Local History", email="local@example.com")
+        db_session.add(person)
+        db_session.flush()
+        return person
+
+    def _message(self, db_session, account, person, msg_id, thread_id, day, linked=True, **fields):
+        message = EmailMessage(
+            google_account_id=account.id,
+            gmail_message_id=msg_id,
+            gmail_thread_id=thread_id,
+            internal_date=datetime(2025, 12, day, tzinfo=timezone.utc),
+            **fields,
+        )
+        db_session.add(message)
+        db_session.flush()
+        if linked:
+            db_session.add(EmailPersonLink(email_message_id=message.id, person_id=person.id, link_type="from"))
+            db_session.flush()
+        return message
+
+    @patch("app.services.google_clients.build")
+    def test_groups_linked_messages_into_threads(self, mock_build, db_session, sample_google_account, person):
+        """Test that threads come from synced messages, newest first, without API calls."""
+        account = sample_google_account
+        self._message(db_session, account, person, "m1", "t1", 1, subject="Intro", from_email="local@example.com")
+        self._message(
+            db_session, account, person, "m2", "t1", 3, linked=False,
+            subject="Re: Intro", snippet="Sounds good", from_email="me@gmail.com",
+            to_emails=[{"email": "local@example.com", "name": None}],
+        )
+        self._message(db_session, account, person, "m3", "t2", 2, subject="Deck", from_email="local@example.com")
+        self._message(db_session, account, person, "m4", "t3", 4, linked=False, subject="Other")
+
+        threads = GmailService(db_session).local_email_history(person.id)
+
+        assert [t.thread_id for t in threads] == ["t1", "t2"]
+        assert threads[0].subject == "Intro"
+        assert threads[0].snippet == "Sounds good"
+        assert threads[0].message_count == 2
+        assert threads[0].participants == ["local@example.com", "me@gmail.com"]
+        assert threads[0].account_email == account.email
+        mock_build.assert_not_called()
+
+    def test_limit_and_ignore_patterns(self, db_session, sample_google_account, person):
+        """Test that max_results bounds threads and ignored senders are dropped."""
+        db_session.add(EmailIgnoreList(pattern="example.com", pattern_type=IgnorePatternType.domain))
+        self._message(db_session, sample_google_account, person, "m1", "t1", 1, from_email="local@example.com")
+        self._message(db_session, sample_google_account, person, "m2", "t2", 2, from_email="me@gmail.com")
+        self._message(db_session, sample_google_account, person, "m3", "t3", 3, from_email="me@gmail.com")
+
+        threads = GmailService(db_session).local_email_history(person.id, max_results=2)
+        assert [t.thread_id for t in threads] == ["t3", "t2"]
+
+        threads = GmailService(db_session).local_email_history(person.id, max_results=3)
+        assert "t1" not in [t.thread_id for t in threads]
+
+
+class TestSearchOlderThanSync:
+    """Test the Gmail fallback for history older than the sync."""
+
+    @patch("app.services.google_clients.build")
+    def test_searches_before_horizon_only(self, mock_build, db_session, monkeypatch):
+        """Test that only unsynced history is searched, and fully synced accounts are skipped."""
+        monkeypatch.setenv("ENCRYPTION_KEY", "izZY7IUIzei-kSYNOCgiIpwOSv9_hioCMBrs2mD9drs=")
+        from app.config import get_settings
+        from app.services.encryption import get_encryption_service
+        get_settings.cache_clear()
+        get_encryption_service.cache_clear()
+
+        person = Person(full_name="Test Person", email="test@example.com")
+        db_session.add(person)
+        partial = GoogleAccount.create_with_credentials(
+            email="partial@gmail.com",
+            credentials={"token": "test", "refresh_token": "test"},
+        )
+        complete = GoogleAccount.create_with_credentials(
+            email="complete@gmail.com",
+            credentials={"token": "test", "refresh_token": "test"},
+        )
+        db_session.add_all([partial, complete])
+        db_session.flush()
+        db_session.add_all([
+            EmailSyncState(
+                google_account_id=partial.id,
+                last_history_id=100,
+                sync_status=SyncStatus.IDLE.value,
+                backfill_before=date(2025, 6, 1),
+            ),
+            EmailSyncState(
+                google_account_id=complete.id,
+                last_history_id=100,
+                sync_status=SyncStatus.IDLE.value,
+                backfill_completed_at=datetime.now(timezone.utc),
+            ),
+        ])
+        db_session.flush()
+
+        list_call = mock_build.return_value.users.return_value.threads.return_value.list
+        list_call.return_value.execute.return_value = {}
+
+        service = GmailService(db_session)
+        results = service.search_emails_for_person(person.id, older_than_sync=True)
+
+        assert results == []
+        assert mock_build.call_count == 1
+        assert list_call.call_args.kwargs["q"] == (
+            "(from:test@example.com OR to:test@example.com) before:2025/06/01"
+        )
+        assert service.has_unsynced_history()
+        assert not service.has_unsynced_history(complete.id)
+
+
 class TestGetThreadDetails:
     """Test getting thread details."""
 
@@ -0,0 +1,404 @@
+"""
+Tests for Gmail sync message fetching (batch endpoint), bulk storage and
+the resumable backfill.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+from sqlalchemy.orm import Session
+
+from app.models import (
+    EmailIgnoreList,
+    EmailMessage,
+    EmailPersonLink,
+    EmailSyncState,
+    GoogleAccount,
+    IgnorePatternType,
+    Person,
+    PersonEmail,
+    SyncStatus,
+)
+from app.services import google_executor
+from app.services.gmail_sync_service import GmailSyncService
+from app.services.google_clients import clear_google_clients
+
+
+@pytest.fixture
+def google_account(db_session, monkeypatch):
+    """Create a test Google account."""
+    monkeypatch.setenv("ENCRYPTION_KEY", "izZY7IUIzei-kSYNOCgiIpwOSv9_hioCMBrs2mD9drs=")
+    from app.config import get_settings
+    from app.services.encryption import get_encryption_service
+    get_settings.cache_clear()
+    get_encryption_service.cache_clear()
+
+    account = GoogleAccount.create_with_credentials(
+        email="gmail-sync-test@gmail.com",
+        credentials={
+            "token": "test_token",
+            "refresh_token": "test_refresh_token",
+            "token_uri": "https://oauth2.googleapis.com/token",
+            "client_id": "test_client_id",
+            "client_secret": "test_client_secret",
+        },
+    )
+    db_session.add(account)
+    db_session.commit()
+    return account
+
+
+@pytest.fixture
+def person(db_session):
+    """A person to link synced messages to."""
+    person = Person(full_name="Sync Test Person")
+    db_session.add(person)
+    db_session.flush()
+    return person
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(google_executor.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def _message(msg_id: str) -> dict:
+    return {
+        "id": msg_id,
+        "threadId": f"thread-{msg_id}",
+        "labelIds": ["INBOX"],
+        "snippet": "Hello",
+        "payload": {"headers": [
+            {"name": "Subject", "value": f"Message {msg_id}"},
+            {"name": "From", "value": "Alice <alice@example.com>"},
+            {"name": "To", "value": "Bob <bob@example.com>, alice@example.com"},
+        ]},
+    }
+
+
+class FakeBatch:
+    """Stands in for BatchHttpRequest: answers each get() from canned responses."""
+
+    def __init__(self, callback, answers, sizes):
+        self.callback = callback
+        self.answers = answers
+        self.sizes = sizes
+        self.calls = []
+
+    def add(self, request, request_id):
+        self.calls.append((request_id, request))
+
+    def execute(self):
+        self.sizes.append(len(self.calls))
+        for request_id, request in self.calls:
+            answers = self.answers.get(request.msg_id)
+            answer = answers.pop(0) if answers else _message(request.msg_id)
+            if isinstance(answer, Exception):
+                self.callback(request_id, None, answer)
+            else:
+                self.callback(request_id, answer, None)
+
+
+def _mock_gmail(mock_build, message_ids, answers=None, pages=None):
+    """
+    A messages.list page of message_ids (or the given pages, in turn);
+    batches answer from answers, else with a message.
+    """
+    sizes = []
+    clear_google_clients()
+    mock_service = MagicMock()
+    mock_build.return_value = mock_service
+    users = mock_service.users.return_value
+    users.getProfile.return_value.execute.return_value = {"historyId": "100"}
+    users.labels.return_value.list.return_value.execute.return_value = {"labels": [
+        {"id": "INBOX", "name": "INBOX"},
+        {"id": "Label_1", "name": "News/Bloomberg"},
+    ]}
+    users.messages.return_value.list.return_value.execute.side_effect = pages or [
+        {"messages": [{"id": msg_id} for msg_id in message_ids]},
+    ]
+    users.messages.return_value.get.side_effect = lambda **kwargs: MagicMock(msg_id=kwargs["id"])
+    mock_service.new_batch_http_request.side_effect = (
+        lambda callback: FakeBatch(callback, answers or {}, sizes)
+    )
+    return sizes
+
+
+class TestBatchedFetch:
+    """Test that message metadata is fetched through the batch endpoint."""
+
+    @patch("app.services.google_clients.build")
+    def test_full_sync_batches_gets(self, mock_build, db_session, google_account):
+        """Test that a 100-message page takes two batch requests, not 100 calls."""
+        sizes = _mock_gmail(mock_build, [f"m{i:03d}" for i in range(100)])
+
+        result = GmailSyncService(db_session).full_sync(google_account, max_results=100)
+
+        assert result.success
+        assert result.messages_synced == 100
+        assert sizes == [50, 50]
+        assert result.duration_seconds > 0
+        assert result.messages_per_second > 0
+        assert db_session.query(EmailMessage).filter_by(google_account_id=google_account.id).count() == 100
+
+    @patch("app.services.google_clients.build")
+    def test_rate_limited_messages_retried(self, mock_build, db_session, google_account, no_sleep):
+        """Test that per-message 429s are fetched again and 404s reported."""
+        sizes = _mock_gmail(mock_build, ["m1", "m2", "m3"], answers={
+            "m2": [HttpError(MagicMock(status=429), b"Too many requests"), _message("m2")],
+            "m3": [HttpError(MagicMock(status=404), b"Not found")],
+        })
+
+        result = GmailSyncService(db_session).full_sync(google_account, max_results=3)
+
+        assert result.success
+        assert result.messages_synced == 2
+        assert sizes == [3, 1]
+        assert len(no_sleep) == 1
+        assert len(result.errors) == 1 and "m3" in result.errors[0]
+
+
+class TestBulkStore:
+    """Test the staged upsert of messages and person links."""
+
+    @patch("app.services.google_clients.build")
+    def test_resync_updates_without_duplicates(self, mock_build, db_session, google_account, person):
+        """Test that syncing twice keeps one row per message and one link per role."""
+        db_session.add(PersonEmail(person_id=person.id, email="alice@example.com"))
+        db_session.commit()
+        service = GmailSyncService(db_session)
+
+        _mock_gmail(mock_build, ["m1", "m1"])
+        service.full_sync(google_account, max_results=2)
+        _mock_gmail(mock_build, ["m1"], answers={"m1": [{**_message("m1"), "labelIds": ["STARRED"]}]})
+        result = service.full_sync(google_account, max_results=1)
+
+        assert result.success
+        message = db_session.query(EmailMessage).filter_by(google_account_id=google_account.id).one()
+        assert message.is_starred
+        link_types = {
+            link.link_type for link in db_session.query(EmailPersonLink).filter_by(email_message_id=message.id)
+        }
+        assert link_types == {"from", "to"}
+        assert db_session.query(EmailPersonLink).filter_by(email_message_id=message.id).count() == 2
+
+    @patch("app.services.google_clients.build")
+    def test_resync_fills_missing_dates(self, mock_build, db_session, google_account):
+        """Test that a resync fills in a missing internal date but never clears one."""
+        service = GmailSyncService(db_session)
+        _mock_gmail(mock_build, ["m1"])
+        service.full_sync(google_account, max_results=1)
+        message = db_session.query(EmailMessage).filter_by(google_account_id=google_account.id).one()
+        assert message.internal_date is None
+
+        _mock_gmail(mock_build, ["m1"], answers={"m1": [{**_message("m1"), "internalDate": "1735732800000"}]})
+        service.full_sync(google_account, max_results=1)
+        db_session.refresh(message)
+        dated = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+        assert message.internal_date == dated
+        assert message.received_at == dated
+
+        _mock_gmail(mock_build, ["m1"])
+        service.full_sync(google_account, max_results=1)
+        db_session.refresh(message)
+        assert message.internal_date == dated
+
+    @patch("app.services.google_clients.build")
+    def test_ignored_senders_not_stored_or_linked(self, mock_build, db_session, google_account, person):
+        """Test that ignored senders are skipped and ignored recipients not linked."""
+        db_session.add(PersonEmail(person_id=person.id, email="bob@example.com"))
+        db_session.add(EmailIgnoreList(pattern="bob@*", pattern_type=IgnorePatternType.email))
+        db_session.add(EmailIgnoreList(pattern="spam-sender.com", pattern_type=IgnorePatternType.domain))
+        db_session.commit()
+        spam = {**_message("m2"), "payload": {"headers": [
+            {"name": "From", "value": "News <news@spam-sender.com>"},
+        ]}}
+
+        _mock_gmail(mock_build, ["m1", "m2"], answers={"m2": [spam]})
+        result = GmailSyncService(db_session).full_sync(google_account, max_results=2)
+
+        assert result.messages_synced == 1
+        message = db_session.query(EmailMessage).filter_by(google_account_id=google_account.id).one()
+        assert message.gmail_message_id == "m1"
+        assert db_session.query(EmailPersonLink).filter_by(email_message_id=message.id).count() == 0
+
+    @patch("app.services.google_clients.build")
+    def test_commits_each_page(self, mock_build, db_session, google_account):
+        """Test that a page is committed before the next one is listed."""
+        commits_before_page_2 = []
+        pages = iter([{"messages": [{"id": "m1"}, {"id": "m2"}], "nextPageToken": "page2"}])
+
+        with patch.object(db_session, "commit", wraps=db_session.commit) as commit:
+            def list_page():
+                page = next(pages, None)
+                if page is None:
+                    commits_before_page_2.append(commit.call_count)
+                    raise HttpError(MagicMock(status=400), b"Bad request")
+                return page
+
+            _mock_gmail(mock_build, [], pages=list_page)
+            result = GmailSyncService(db_session).full_sync(google_account, max_results=10)
+
+        assert not result.success
+        assert result.messages_synced == 2
+        # start_sync, then the first page
+        assert commits_before_page_2 == [2]
+
+
+    @patch("app.services.google_clients.build")
+    def test_failure_keeps_committed_pages(self, mock_build, db_session, google_account):
+        """Test that pages stored before a failing page are not rolled back."""
+        _mock_gmail(mock_build, [], pages=[
+            {"messages": [{"id": "m1"}, {"id": "m2"}], "nextPageToken": "page2"},
+            HttpError(MagicMock(status=400), b"Bad request"),
+        ])
+        # The service commits and rolls back; a savepoint session keeps that
+        # inside the test transaction instead of rolling back the whole test
+        with Session(bind=db_session.connection(), join_transaction_mode="create_savepoint") as sync_db:
+            account = sync_db.get(GoogleAccount, google_account.id)
+            result = GmailSyncService(sync_db).full_sync(account, max_results=10)
+
+        assert not result.success
+        assert result.messages_synced == 2
+        assert db_session.query(EmailMessage).filter_by(google_account_id=google_account.id).count() == 2
+
+
+class TestStoredLabels:
+    """Test the label list kept per account by the sync."""
+
+    @patch("app.services.google_clients.build")
+    def test_sync_stores_labels_once_per_ttl(self, mock_build, db_session, google_account):
+        """Test that labels are stored by the sync and not listed again while fresh."""
+        _mock_gmail(mock_build, ["m1"])
+        service = GmailSyncService(db_session)
+        service.full_sync(google_account, max_results=1)
+
+        state = db_session.query(EmailSyncState).filter_by(google_account_id=google_account.id).one()
+        assert state.label_names == {"INBOX": "INBOX", "Label_1": "News/Bloomberg"}
+        assert state.labels_synced_at is not None
+
+        _mock_gmail(mock_build, ["m2"])
+        service.full_sync(google_account, max_results=1)
+        mock_build.return_value.users.return_value.labels.return_value.list.assert_not_called()
+
+
+class TestUnreadCounts:
+    """Test the per-label unread counters kept by the sync."""
+
+    @patch("app.services.google_clients.build")
+    def test_full_sync_counts_unread_per_label(self, mock_build, db_session, google_account):
+        """Test that unread messages are counted per label when the sync completes."""
+        _mock_gmail(mock_build, ["m1", "m2", "m3"], answers={
+            "m1": [{**_message("m1"), "labelIds": ["INBOX", "UNREAD", "Label_7"]}],
+            "m2": [{**_message("m2"), "labelIds": ["INBOX", "UNREAD"]}],
+        })
+
+        GmailSyncService(db_session).full_sync(google_account, max_results=3)
+
+        state = db_session.query(EmailSyncState).filter_by(google_account_id=google_account.id).one()
+        assert state.unread_counts == {"INBOX": 2, "UNREAD": 2, "Label_7": 1}
+
+
+class TestIncrementalLabels:
+    """Test label changes applied by the incremental sync."""
+
+    @patch("app.services.google_clients.build")
+    def test_label_changes_update_stored_messages(self, mock_build, db_session, google_account):
+        """Test that a page's label changes update the messages, the last change winning."""
+        _mock_gmail(mock_build, ["m1", "m2"])
+        service = GmailSyncService(db_session)
+        service.full_sync(google_account, max_results=2)
+        history = mock_build.return_value.users.return_value.history.return_value
+        history.list.return_value.execute.return_value = {"historyId": "120", "history": [
+            {"labelsAdded": [{"message": {"id": "m1", "labelIds": ["INBOX", "UNREAD"]}}]},
+            {"labelsRemoved": [{"message": {"id": "m1", "labelIds": ["INBOX"]}}]},
+            {"labelsAdded": [{"message": {"id": "m2", "labelIds": ["INBOX", "STARRED"]}}]},
+            {"labelsAdded": [{"message": {"id": "unknown", "labelIds": ["INBOX"]}}]},
+        ]}
+
+        result = service.incremental_sync(google_account)
+
+        assert result.success
+        messages = {
+            m.gmail_message_id: m
+            for m in db_session.query(EmailMessage).filter_by(google_account_id=google_account.id)
+        }
+        assert messages["m1"].labels == ["INBOX"] and messages["m1"].is_read
+        assert messages["m2"].is_starred
+        assert "unknown" not in messages
+
+
+class TestBackfill:
+    """Test the checkpointed backfill of older history."""
+
+    @pytest.fixture
+    def synced_state(self, db_session, google_account):
+        state = EmailSyncState(
+            google_account_id=google_account.id,
+            last_history_id=100,
+            sync_status=SyncStatus.IDLE.value,
+        )
+        db_session.add(state)
+        db_session.commit()
+        return state
+
+    @patch("app.services.google_clients.build")
+    def test_resumes_from_checkpoint(self, mock_build, db_session, google_account, synced_state):
+        """Test that the page token and window survive between chunks."""
+        _mock_gmail(mock_build, [], pages=[
+            {"messages": [{"id": "m1"}], "nextPageToken": "page2"},
+            {"messages": [{"id": "m2"}]},
+        ])
+        list_call = mock_build.return_value.users.return_value.messages.return_value.list
+        tomorrow = datetime.now(timezone.utc).date() + timedelta(days=1)
+
+        GmailSyncService(db_session).backfill(google_account, max_pages=1, depth_days=90, window_days=30)
+
+        assert synced_state.backfill_page_token == "page2"
+        assert synced_state.backfill_before == tomorrow
+        assert f"before:{tomorrow:%Y/%m/%d}" in list_call.call_args.kwargs["q"]
+
+        result = GmailSyncService(db_session).backfill(google_account, max_pages=1, depth_days=90, window_days=30)
+
+        assert result.success and result.messages_synced == 1
+        assert list_call.call_args.kwargs["pageToken"] == "page2"
+        assert synced_state.backfill_page_token is None
+        assert synced_state.backfill_before == tomorrow - timedelta(days=30)
+        assert synced_state.backfill_messages == 2
+        assert synced_state.sync_status == SyncStatus.IDLE.value
+
+    @patch("app.services.google_clients.build")
+    def test_whole_mailbox_completes(self, mock_build, db_session, google_account, synced_state):
+        """Test that an empty window with nothing older ends an unlimited backfill."""
+        _mock_gmail(mock_build, [], pages=[{}, {}])
+
+        GmailSyncService(db_session).backfill(google_account, max_pages=5, depth_days=0)
+
+        assert synced_state.backfill_completed_at is not None
+        with patch("app.services.google_clients.build") as api:
+            GmailSyncService(db_session).backfill(google_account)
+        api.assert_not_called()
+
+    @patch("app.services.google_clients.build")
+    def test_depth_limit_completes(self, mock_build, db_session, google_account, synced_state):
+        """Test that reaching depth_days marks the backfill complete."""
+        _mock_gmail(mock_build, [], pages=[{"messages": [{"id": "m1"}]}, {}])
+        list_call = mock_build.return_value.users.return_value.messages.return_value.list
+
+        GmailSyncService(db_session).backfill(google_account, max_pages=5, depth_days=30, window_days=20)
+
+        assert list_call.call_count == 2
+        assert synced_state.backfill_completed_at is not None
+        assert synced_state.backfill_before == datetime.now(timezone.utc).date() - timedelta(days=30)
+
+    @patch("app.services.google_clients.build")
+    def test_waits_for_initial_sync(self, mock_build, db_session, google_account):
+        """Test that accounts without a first sync are left to full_sync."""
+        result = GmailSyncService(db_session).backfill(google_account)
+
+        assert result.success and result.messages_synced == 0
+        mock_build.assert_not_called()
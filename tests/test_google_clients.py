@@ -0,0 +1,90 @@
+"""
+Tests for the per-account Google credential and API client cache.
+"""
+
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from app.models import GoogleAccount
+from app.services.google_auth import GMAIL_SCOPES
+from app.services.google_clients import get_credentials, get_service
+
+
+@pytest.fixture
+def google_account(db_session, monkeypatch):
+    """Create a test Google account whose access token has expired."""
+    monkeypatch.setenv("ENCRYPTION_KEY", "izZY7IUIzei-kSYNOCgiIpwOSv9_hioCMBrs2mD9drs=")
+    from app.config import get_settings
+    from app.services.encryption import get_encryption_service
+    get_settings.cache_clear()
+    get_encryption_service.cache_clear()
+
+    account = GoogleAccount.create_with_credentials(
+        email="clients-test@gmail.com",
+        credentials={
+            "token": "old_token",
+            "refresh_token": "test_refresh_token",
+            "token_uri": "https://oauth2.googleapis.com/token",
+            "client_id": "test_client_id",
+            "client_secret": "test_client_secret",
+            "expiry": (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat(),
+        },
+    )
+    db_session.add(account)
+    db_session.commit()
+    return account
+
+
+class TestCredentials:
+    """Test decryption caching and refreshed token persistence."""
+
+    def test_decrypted_once_until_reconnected(self, google_account):
+        """Test that credentials are shared until the account's credentials change."""
+        decrypt_json = GoogleAccount.get_credentials
+        with patch.object(GoogleAccount, "get_credentials", autospec=True, side_effect=decrypt_json) as decrypt:
+            first = get_credentials(google_account, GMAIL_SCOPES)
+            assert get_credentials(google_account, GMAIL_SCOPES) is first
+            assert decrypt.call_count == 1
+
+            google_account.set_credentials({"token": "reconnected", "refresh_token": "new_refresh"})
+            assert get_credentials(google_account, GMAIL_SCOPES).token == "reconnected"
+            assert decrypt.call_count == 2
+
+        assert first.expired
+
+    def test_refreshed_token_persisted(self, db_session, google_account, monkeypatch):
+        """Test that a refreshed access token is stored and the credentials kept."""
+        monkeypatch.setattr("app.database.SessionLocal", lambda: nullcontext(db_session))
+
+        def refresh(self, request):
+            self.token = "new_token"
+            self.expiry = datetime.utcnow() + timedelta(hours=1)
+
+        credentials = get_credentials(google_account, GMAIL_SCOPES)
+        with patch.object(Credentials, "refresh", refresh):
+            credentials.refresh(MagicMock())
+
+        db_session.refresh(google_account)
+        assert google_account.get_credentials()["token"] == "new_token"
+        assert google_account.get_credentials()["refresh_token"] == "test_refresh_token"
+        assert get_credentials(google_account, GMAIL_SCOPES) is credentials
+        assert credentials.valid
+
+
+class TestServices:
+    """Test the per-thread API client cache."""
+
+    @patch("app.services.google_clients.build")
+    def test_built_once_per_api(self, mock_build, google_account):
+        """Test that a client is built once per API, from bundled discovery documents."""
+        gmail = get_service(google_account, "gmail", "v1", GMAIL_SCOPES)
+        assert get_service(google_account, "gmail", "v1", GMAIL_SCOPES) is gmail
+        get_service(google_account, "calendar", "v3", GMAIL_SCOPES)
+
+        assert mock_build.call_count == 2
+        assert mock_build.call_args.kwargs["static_discovery"] is True
+        assert mock_build.call_args.kwargs["credentials"] is get_credentials(google_account, GMAIL_SCOPES)
@@ -0,0 +1,160 @@
+"""
+Tests for the shared Google API executor (fan-out and backoff).
+"""
+
+import threading
+import time
+from collections import defaultdict
+from unittest.mock import MagicMock
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from app.services import google_executor
+from app.services.google_executor import GoogleExecutor, execute, execute_batch
+
+
+@pytest.fixture
+def executor():
+    executor = GoogleExecutor(max_workers=6, per_account_limit=2)
+    yield executor
+    executor.shutdown()
+
+
+class TestMap:
+    """Test fanning calls out over the pool."""
+
+    def test_preserves_order_and_captures_errors(self, executor):
+        """Test that outcomes follow input order and exceptions are kept per item."""
+        def square(n):
+            if n == 3:
+                raise ValueError("boom")
+            time.sleep(0.01 * (5 - n))
+            return n * n
+
+        outcomes = executor.map(square, [1, 2, 3, 4])
+
+        assert [o.item for o in outcomes] == [1, 2, 3, 4]
+        assert [o.value for o in outcomes if o.ok] == [1, 4, 16]
+        assert isinstance(outcomes[2].error, ValueError)
+
+    def test_per_account_limit(self, executor):
+        """Test that no account runs more calls at once than its limit."""
+        lock = threading.Lock()
+        running = defaultdict(int)
+        peak = defaultdict(int)
+
+        def call(item):
+            account, _ = item
+            with lock:
+                running[account] += 1
+                peak[account] = max(peak[account], running[account])
+            time.sleep(0.02)
+            with lock:
+                running[account] -= 1
+
+        items = [(account, i) for account in ("a", "b") for i in range(6)]
+        outcomes = executor.map(call, items, account_key=lambda item: item[0])
+
+        assert all(o.ok for o in outcomes)
+        assert peak["a"] <= 2 and peak["b"] <= 2
+
+
+class TestExecute:
+    """Test retries of rate-limited requests."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(google_executor.time, "sleep", sleeps.append)
+        return sleeps
+
+    def test_retries_rate_limit(self, no_sleep):
+        """Test that a 429 is retried with growing delays until it succeeds."""
+        request = MagicMock()
+        request.execute.side_effect = [
+            HttpError(MagicMock(status=429), b"Too many requests"),
+            HttpError(MagicMock(status=429), b"Too many requests"),
+            {"items": []},
+        ]
+
+        assert execute(request, base_delay=1.0) == {"items": []}
+        assert len(no_sleep) == 2
+        assert no_sleep[0] < no_sleep[1]
+
+    def test_does_not_retry_client_errors(self, no_sleep):
+        """Test that a 404 propagates immediately."""
+        request = MagicMock()
+        request.execute.side_effect = HttpError(MagicMock(status=404), b"Not found")
+
+        with pytest.raises(HttpError):
+            execute(request)
+        assert request.execute.call_count == 1
+        assert no_sleep == []
+
+
+class FakeBatch:
+    """Stands in for BatchHttpRequest: answers each call from a canned script."""
+
+    def __init__(self, callback, answers, sizes):
+        self.callback = callback
+        self.answers = answers
+        self.sizes = sizes
+        self.calls = []
+
+    def add(self, request, request_id):
+        self.calls.append((request_id, request))
+
+    def execute(self):
+        self.sizes.append(len(self.calls))
+        for request_id, request in self.calls:
+            answer = self.answers[request.key].pop(0)
+            if isinstance(answer, Exception):
+                self.callback(request_id, None, answer)
+            else:
+                self.callback(request_id, answer, None)
+
+
+def _fake_service(answers):
+    """A service whose batches answer per key; returns (service, batch sizes)."""
+    sizes = []
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback, answers, sizes)
+    return service, sizes
+
+
+class TestExecuteBatch:
+    """Test batched calls and per-call retries."""
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(google_executor.time, "sleep", sleeps.append)
+        return sleeps
+
+    def test_chunks_calls(self):
+        """Test that keys are deduplicated and sent batch_size per request."""
+        answers = {k: [{"id": k}] for k in range(7)}
+        service, sizes = _fake_service(answers)
+
+        responses, errors = execute_batch(service, [*range(7), 3], lambda k: MagicMock(key=k), batch_size=3)
+
+        assert sizes == [3, 3, 1]
+        assert responses == {k: {"id": k} for k in range(7)}
+        assert errors == {}
+
+    def test_retries_rate_limited_calls(self, no_sleep):
+        """Test that only calls answered 429 are sent again, after a backoff."""
+        answers = {
+            "a": [{"id": "a"}],
+            "b": [HttpError(MagicMock(status=429), b"Too many requests"), {"id": "b"}],
+            "c": [HttpError(MagicMock(status=404), b"Not found")],
+        }
+        service, sizes = _fake_service(answers)
+
+        responses, errors = execute_batch(service, ["a", "b", "c"], lambda k: MagicMock(key=k))
+
+        assert sizes == [3, 1]
+        assert set(responses) == {"a", "b"}
+        assert list(errors) == ["c"]
+        assert len(no_sleep) == 1
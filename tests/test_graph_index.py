@@ -0,0 +1,145 @@
+"""
+Tests for the in-memory graph index: neighborhoods, intro paths and layout.
+"""
+
+import json
+
+import pytest
+
+from app.models import Organization, OrgType, Person, PersonOrganization
+from app.models.person_relationship import PersonRelationship
+from app.services.graph_index import (
+    GraphIndex,
+    GraphNodeNotFoundError,
+    build_path_payload,
+    compute_layout,
+    get_graph_index,
+    get_neighborhood_json,
+)
+from app.services.graph_service import invalidate_graph_caches
+
+
+@pytest.fixture
+def chain():
+    """a - b - c - d - e, plus an isolated node z."""
+    index = GraphIndex()
+    for name in "abcdez":
+        index.nodes[name] = (name.upper(), None)
+    for a, b in zip("abcd", "bcde"):
+        index.add_edge(a, b, "person_relationship", "Knows")
+    return index
+
+
+@pytest.fixture
+def network(db_session):
+    """Two people linked through a shared organization, one directly."""
+    invalidate_graph_caches()
+    org = Organization(name="Index Test Org", org_type=OrgType.company)
+    db_session.add(org)
+    persons = [Person(full_name=f"Index Person {i}") for i in range(4)]
+    db_session.add_all(persons)
+    db_session.flush()
+    db_session.add(PersonOrganization(person_id=persons[0].id, organization_id=org.id))
+    db_session.add(PersonOrganization(person_id=persons[1].id, organization_id=org.id))
+    db_session.add(PersonRelationship(person_id=persons[1].id, related_person_id=persons[2].id))
+    db_session.flush()
+    return {"org": org, "persons": persons}
+
+
+class TestNeighborhood:
+    """Test BFS neighborhoods."""
+
+    def test_depth_limits_hops(self, chain):
+        """Test that only nodes within depth hops are returned, with distances."""
+        assert chain.neighborhood("c", depth=1, max_nodes=100) == {"c": 0, "b": 1, "d": 1}
+        assert chain.neighborhood("a", depth=2, max_nodes=100) == {"a": 0, "b": 1, "c": 2}
+
+    def test_max_nodes_truncates(self, chain):
+        """Test that max_nodes caps the result."""
+        assert len(chain.neighborhood("c", depth=4, max_nodes=2)) == 2
+
+    def test_unknown_node(self, chain):
+        """Test that an unknown center raises."""
+        with pytest.raises(GraphNodeNotFoundError):
+            chain.neighborhood("missing", depth=1, max_nodes=10)
+
+    def test_edges_among(self, chain):
+        """Test that edges are limited to the visited nodes and listed once."""
+        edges = chain.edges_among(["a", "b", "c"])
+        assert sorted((a, b) for a, b, _, _ in edges) == [("a", "b"), ("b", "c")]
+
+
+class TestShortestPath:
+    """Test intro paths."""
+
+    def test_path_found(self, chain):
+        """Test that the shortest path is returned end to end."""
+        assert chain.shortest_path("a", "d", max_depth=6) == ["a", "b", "c", "d"]
+
+    def test_path_too_long(self, chain):
+        """Test that paths longer than max_depth are not found."""
+        assert chain.shortest_path("a", "e", max_depth=3) is None
+
+    def test_disconnected(self, chain):
+        """Test that disconnected nodes have no path."""
+        assert chain.shortest_path("a", "z", max_depth=6) is None
+
+    def test_path_through_organization(self, db_session, network):
+        """Test that colleagues connect via their shared organization."""
+        p0, _, p2, p3 = network["persons"]
+        payload = build_path_payload(db_session, f"person_{p0.id}", f"person_{p2.id}")
+
+        assert payload["found"]
+        assert payload["hops"] == 3
+        assert payload["path"][1]["id"] == f"org_{network['org'].id}"
+        assert not build_path_payload(db_session, f"person_{p0.id}", f"person_{p3.id}")["found"]
+
+
+class TestLayout:
+    """Test the server-side force layout."""
+
+    def test_positions_deterministic(self, chain):
+        """Test that every node gets a position and reruns are identical."""
+        pytest.importorskip("numpy")
+        node_ids = list("abcde")
+        edges = chain.edges_among(node_ids)
+
+        first = compute_layout(node_ids, edges, center="c")
+        assert set(first) == set(node_ids)
+        assert first["c"] == (0.0, 0.0)
+        assert compute_layout(node_ids, edges, center="c") == first
+
+
+class TestIndexCache:
+    """Test the cached index and neighborhood payloads."""
+
+    def test_index_built_once(self, db_session, network, assert_max_queries):
+        """Test that the index is reused until the graph changes."""
+        get_graph_index(db_session)
+        with assert_max_queries(0):
+            get_graph_index(db_session)
+
+        db_session.add(PersonOrganization(person_id=network["persons"][3].id, organization_id=network["org"].id))
+        db_session.commit()
+
+        with assert_max_queries(6):
+            index = get_graph_index(db_session)
+        assert f"org_{network['org'].id}" in index.neighbors(f"person_{network['persons'][3].id}")
+
+    def test_neighborhood_payload(self, db_session, network):
+        """Test that the ego graph payload contains the center and its ring."""
+        center = f"org_{network['org'].id}"
+        payload = json.loads(get_neighborhood_json(db_session, center, depth=1))
+
+        node_ids = {n["id"] for n in payload["nodes"]}
+        assert node_ids == {center, f"person_{network['persons'][0].id}", f"person_{network['persons'][1].id}"}
+        assert payload["stats"]["edge_count"] == 2
+
+    def test_neighborhoods_do_not_evict_index(self, db_session, network, assert_max_queries):
+        """Test that many cached neighborhoods leave the index cached."""
+        get_graph_index(db_session)
+        center = f"org_{network['org'].id}"
+        for max_nodes in range(10, 110):
+            get_neighborhood_json(db_session, center, depth=1, max_nodes=max_nodes, layout=False)
+        with assert_max_queries(0):
+            get_graph_index(db_session)
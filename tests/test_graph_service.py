@@ -0,0 +1,103 @@
+"""
+Tests for the social graph payload builder and cache.
+"""
+
+import json
+
+import pytest
+
+from app.models import Organization, OrgType, Person, PersonOrganization
+from app.models.org_relationship import OrganizationRelationship, OrgRelationshipType
+from app.services.graph_service import (
+    build_graph_payload,
+    encode_json,
+    get_graph_json,
+    invalidate_graph_caches,
+)
+
+
+@pytest.fixture
+def graph(db_session):
+    """Two organizations with an investment link and several employees."""
+    invalidate_graph_caches()
+    fund = Organization(name="Graph Test Fund", org_type=OrgType.investment_firm)
+    startup = Organization(name="Graph Test Startup", org_type=OrgType.company)
+    db_session.add_all([fund, startup])
+    db_session.flush()
+
+    persons = [Person(full_name=f"Graph Person {i}", title="Partner") for i in range(6)]
+    db_session.add_all(persons)
+    db_session.flush()
+    for i, person in enumerate(persons):
+        org = fund if i % 2 == 0 else startup
+        db_session.add(PersonOrganization(person_id=person.id, organization_id=org.id))
+    db_session.add(OrganizationRelationship(
+        from_organization_id=fund.id,
+        to_organization_id=startup.id,
+        relationship_type=OrgRelationshipType.invested_in,
+    ))
+    db_session.flush()
+    return {"fund": fund, "startup": startup, "persons": persons}
+
+
+class TestBuildGraphPayload:
+    """Test node/edge construction."""
+
+    def test_focus_org(self, db_session, graph):
+        """Test that a focused org returns its people, itself and linked orgs once."""
+        payload = build_graph_payload(db_session, focus_org=str(graph["fund"].id))
+
+        node_ids = [n["id"] for n in payload["nodes"]]
+        assert len(node_ids) == len(set(node_ids))
+        assert f"org_{graph['fund'].id}" in node_ids
+        assert f"org_{graph['startup'].id}" in node_ids
+        assert payload["stats"]["person_count"] == 3
+        assert payload["stats"]["edge_count"] == 4
+
+    def test_constant_query_count(self, db_session, graph, assert_max_queries):
+        """Test that nodes are bulk-loaded instead of one query per node."""
+        with assert_max_queries(4):
+            build_graph_payload(db_session, limit=2000)
+
+    def test_invalid_filters_ignored(self, db_session, graph):
+        """Test that bad UUIDs and relationship types fall back to no filter."""
+        payload = build_graph_payload(
+            db_session, relationship_type="nonsense", focus_person="not-a-uuid", limit=2000
+        )
+        assert payload["stats"]["person_count"] >= 6
+
+
+class TestGraphCache:
+    """Test cached payloads and invalidation."""
+
+    def test_cached_until_graph_changes(self, db_session, graph, assert_max_queries):
+        """Test that repeat calls hit the cache and writes invalidate it."""
+        focus = str(graph["fund"].id)
+        first = get_graph_json(db_session, focus_org=focus)
+
+        with assert_max_queries(0):
+            assert get_graph_json(db_session, focus_org=focus) == first
+
+        graph["persons"][0].full_name = "Graph Person Renamed"
+        db_session.commit()
+
+        refreshed = json.loads(get_graph_json(db_session, focus_org=focus))
+        labels = [n["label"] for n in refreshed["nodes"]]
+        assert "Graph Person Renamed" in labels
+
+    def test_unrelated_columns_keep_cache(self, db_session, graph, assert_max_queries):
+        """Test that edits to columns the graph does not show keep the cached payload."""
+        db_session.commit()
+        focus = str(graph["fund"].id)
+        first = get_graph_json(db_session, focus_org=focus)
+
+        graph["persons"][0].notes = "Met at the graph test"
+        db_session.commit()
+
+        with assert_max_queries(0):
+            assert get_graph_json(db_session, focus_org=focus) == first
+
+    def test_encode_json_round_trip(self):
+        """Test that the encoder produces standard JSON bytes."""
+        payload = {"nodes": [{"id": "person_1", "label": "Zoë"}], "edges": []}
+        assert json.loads(encode_json(payload)) == payload
@@ -0,0 +1,164 @@
+"""
+Tests for the id-first list pagination helpers.
+"""
+
+from datetime import date, datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import selectinload
+
+from app.models import Person, Interaction, Tag
+from app.utils.pagination import (
+    InvalidCursorError,
+    PageResult,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    paginate_by_cursor,
+    paginate_by_ids,
+)
+
+
+class TestPageResult:
+    """Test PageResult totals."""
+
+    def test_total_pages_rounds_up(self):
+        """Test that a partial last page counts as a page."""
+        result = PageResult(items=[], total_count=41, page=1, per_page=20)
+        assert result.total_pages == 3
+
+    def test_total_pages_empty(self):
+        """Test that no rows means no pages."""
+        result = PageResult(items=[], total_count=0, page=1, per_page=20)
+        assert result.total_pages == 0
+
+
+class TestPaginateByIds:
+    """Test paginate_by_ids against the database."""
+
+    @pytest.fixture
+    def people(self, db_session):
+        """Create persons with many interactions and a shared tag."""
+        tag = Tag(name="Pagination Test Tag")
+        persons = []
+        for i in range(5):
+            person = Person(full_name=f"Paginate Person {i}", tags=[tag])
+            db_session.add(person)
+            persons.append(person)
+        db_session.flush()
+        for person in persons:
+            for _ in range(4):
+                db_session.add(Interaction(person_id=person.id, notes="Call"))
+        db_session.flush()
+        return persons
+
+    def _query(self, db_session):
+        return (
+            db_session.query(Person)
+            .filter(Person.full_name.like("Paginate Person %"))
+            .order_by(Person.full_name.desc(), Person.id.desc())
+        )
+
+    def test_count_ignores_collections(self, db_session, people):
+        """Test that count is per person, not per interaction."""
+        assert count_rows(self._query(db_session), Person.id) == 5
+
+    def test_pages_preserve_order(self, db_session, people):
+        """Test that pages follow the query ORDER BY."""
+        first = paginate_by_ids(db_session, self._query(db_session), Person, 1, 2)
+        second = paginate_by_ids(db_session, self._query(db_session), Person, 2, 2)
+
+        assert [p.full_name for p in first.items] == ["Paginate Person 4", "Paginate Person 3"]
+        assert [p.full_name for p in second.items] == ["Paginate Person 2", "Paginate Person 1"]
+        assert first.total_count == 5
+        assert first.total_pages == 3
+
+    def test_load_options_applied(self, db_session, people):
+        """Test that requested collections are loaded for the page."""
+        result = paginate_by_ids(
+            db_session,
+            self._query(db_session),
+            Person,
+            1,
+            5,
+            [selectinload(Person.interactions), selectinload(Person.tags)],
+        )
+        assert all(len(p.interactions) == 4 for p in result.items)
+        assert all(len(p.tags) == 1 for p in result.items)
+
+    def test_page_past_end(self, db_session, people):
+        """Test that a page beyond the data is empty but keeps the total."""
+        result = paginate_by_ids(db_session, self._query(db_session), Person, 10, 2)
+        assert result.items == []
+        assert result.total_count == 5
+
+
+class TestCursorEncoding:
+    """Test opaque cursor round-trips."""
+
+    @pytest.mark.parametrize("value", [
+        "Smith",
+        None,
+        42,
+        date(2025, 12, 1),
+        datetime(2025, 12, 1, 9, 30, tzinfo=timezone.utc),
+    ])
+    def test_round_trip(self, value):
+        """Test that sort values and ids survive encoding."""
+        pk = uuid4()
+        assert decode_cursor(encode_cursor(value, pk)) == (value, pk)
+
+    def test_cursor_is_url_safe(self):
+        """Test that cursors need no URL escaping."""
+        cursor = encode_cursor("a/b+c=d", uuid4())
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    def test_invalid_cursor(self):
+        """Test that garbage cursors raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor")
+
+
+class TestPaginateByCursor:
+    """Test keyset pagination against the database."""
+
+    @pytest.fixture
+    def people(self, db_session):
+        """Create persons, some sharing a title and some without one."""
+        titles = ["Alpha", "Beta", "Beta", None, "Gamma", None, "Beta"]
+        persons = [
+            Person(full_name=f"Cursor Person {i}", title=title)
+            for i, title in enumerate(titles)
+        ]
+        db_session.add_all(persons)
+        db_session.flush()
+        return persons
+
+    def _walk(self, db_session, descending):
+        order = Person.title.desc() if descending else Person.title.asc()
+        pk_order = Person.id.desc() if descending else Person.id.asc()
+        query = (
+            db_session.query(Person)
+            .filter(Person.full_name.like("Cursor Person %"))
+            .order_by(order, pk_order)
+        )
+        expected = [p.id for p in query.all()]
+
+        seen, cursor = [], ""
+        while True:
+            page = paginate_by_cursor(
+                db_session, query, Person, Person.title, descending, cursor, 2
+            )
+            seen.extend(page.ids)
+            if not page.has_more:
+                break
+            cursor = page.next_cursor
+        return expected, seen
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_walk_matches_offset_order(self, db_session, people, descending):
+        """Test that walking cursors visits every row once, in order, across NULLs and ties."""
+        expected, seen = self._walk(db_session, descending)
+        assert seen == expected
+        assert len(seen) == len(people)
@@ -0,0 +1,98 @@
+"""
+Tests for the shared email -> person index and its invalidation.
+"""
+
+import pytest
+
+from app.models import Person, PersonEmail
+from app.services.person_email_index import get_email_person_index
+
+
+@pytest.fixture
+def person(db_session):
+    """A person with one PersonEmail and a legacy email."""
+    person = Person(
+        full_name="Index Person",
+        first_name="Index",
+        last_name="Person",
+        email="Legacy@Index-Test.com, other@index-test.com",
+    )
+    db_session.add(person)
+    db_session.flush()
+    db_session.add(PersonEmail(person_id=person.id, email="Primary@Index-Test.com"))
+    db_session.commit()
+    return person
+
+
+class TestEmailPersonIndex:
+    """Test lookups, sharing and invalidation."""
+
+    def test_maps_person_and_legacy_emails(self, db_session, person):
+        """Test that PersonEmail and comma-separated legacy emails are indexed lowercase."""
+        index = get_email_person_index(db_session)
+
+        assert index["primary@index-test.com"] == person.id
+        assert index["legacy@index-test.com"] == person.id
+        assert index["other@index-test.com"] == person.id
+
+    def test_shared_until_changed(self, db_session, person, assert_max_queries):
+        """Test that a second lookup, from any caller, runs no queries."""
+        get_email_person_index(db_session)
+        person_id = person.id
+
+        with assert_max_queries(0):
+            assert get_email_person_index(db_session)["primary@index-test.com"] == person_id
+
+    def test_commit_adds_new_email_in_place(self, db_session, person, assert_max_queries):
+        """Test that a committed PersonEmail is added without a rebuild."""
+        get_email_person_index(db_session)
+
+        person_id = person.id
+        db_session.add(PersonEmail(person_id=person_id, email="New@Index-Test.com"))
+        db_session.commit()
+
+        with assert_max_queries(0):
+            assert get_email_person_index(db_session)["new@index-test.com"] == person_id
+
+    def test_edit_and_delete_invalidate(self, db_session, person):
+        """Test that moving or deleting an address (as merges do) is picked up."""
+        other = Person(full_name="Other Person", first_name="Other")
+        db_session.add(other)
+        db_session.commit()
+        get_email_person_index(db_session)
+
+        person_email = db_session.query(PersonEmail).filter_by(person_id=person.id).one()
+        person_email.person_id = other.id
+        db_session.commit()
+        assert get_email_person_index(db_session)["primary@index-test.com"] == other.id
+
+        db_session.delete(person)
+        db_session.commit()
+        assert "legacy@index-test.com" not in get_email_person_index(db_session)
+
+    def test_rollback_discards_additions(self, db_session, person):
+        """Test that rolled-back addresses never reach the index."""
+        get_email_person_index(db_session)
+
+        savepoint = db_session.begin_nested()
+        db_session.add(PersonEmail(person_id=person.id, email="gone@index-test.com"))
+        db_session.flush()
+        savepoint.rollback()
+        db_session.commit()
+
+        assert "gone@index-test.com" not in get_email_person_index(db_session)
+
+    def test_bulk_update_of_other_columns_keeps_index(self, db_session, person, assert_max_queries):
+        """Test that bulk updates invalidate only when they write addresses."""
+        get_email_person_index(db_session)
+
+        db_session.query(Person).filter_by(id=person.id).update({"title": "Partner"})
+        db_session.commit()
+        with assert_max_queries(0):
+            get_email_person_index(db_session)
+
+        db_session.query(Person).filter_by(id=person.id).update({"email": "moved@index-test.com"})
+        db_session.commit()
+        index = get_email_person_index(db_session)
+        assert index["moved@index-test.com"] == person.id
+        assert "legacy@index-test.com" not in index
@@ -0,0 +1,84 @@
+"""
+Tests for the People search service (full-text + trigram search).
+"""
+
+import pytest
+
+from app.models import Person
+from app.services.person_search import (
+    build_prefix_tsquery,
+    person_search_filter,
+    person_search_rank,
+)
+
+
+class TestBuildPrefixTsquery:
+    """Test conversion of search input to tsquery text."""
+
+    def test_empty_input(self):
+        """Test that empty input produces no query."""
+        assert build_prefix_tsquery(None) is None
+        assert build_prefix_tsquery("") is None
+        assert build_prefix_tsquery("   ") is None
+
+    def test_single_token_is_prefix(self):
+        """Test that a single token becomes a prefix match."""
+        assert build_prefix_tsquery("Smi") == "smi:*"
+
+    def test_multiple_tokens_are_anded(self):
+        """Test that all tokens must match."""
+        assert build_prefix_tsquery("jo  smith") == "jo:* & smith:*"
+
+    def test_operators_are_stripped(self):
+        """Test that tsquery operators in user input are ignored."""
+        assert build_prefix_tsquery("a & (b | !c):") == "a:* & b:* & c:*"
+
+    def test_only_punctuation(self):
+        """Test that punctuation-only input produces no query."""
+        assert build_prefix_tsquery("&|!()") is None
+
+
+class TestPersonSearchQuery:
+    """Test search filter and ranking against the database."""
+
+    @pytest.fixture
+    def people(self, db_session):
+        """Create persons matching in different fields."""
+        persons = [
+            Person(full_name="Zyxwaldo Prefixson", first_name="Zyxwaldo", last_name="Prefixson"),
+            Person(full_name="Other Human", title="Zyxwaldo Capital Partner"),
+            Person(full_name="Email Only", email="contact@zyxwaldo-fund.io"),
+            Person(full_name="Unrelated Person", notes="nothing to see"),
+        ]
+        db_session.add_all(persons)
+        db_session.flush()
+        return persons
+
+    def _search(self, db_session, q):
+        return (
+            db_session.query(Person)
+            .filter(person_search_filter(q))
+            .order_by(*person_search_rank(q), Person.full_name)
+            .all()
+        )
+
+    def test_prefix_match(self, db_session, people):
+        """Test that partial tokens match by prefix."""
+        results = self._search(db_session, "zyxwal")
+        assert people[0] in results
+        assert people[3] not in results
+
+    def test_email_substring_match(self, db_session, people):
+        """Test that email fragments match via the trigram branch."""
+        results = self._search(db_session, "zyxwaldo-fund")
+        assert people[2] in results
+
+    def test_name_hits_rank_first(self, db_session, people):
+        """Test that name matches outrank title matches."""
+        results = self._search(db_session, "zyxwaldo")
+        assert results.index(people[0]) < results.index(people[1])
+
+    def test_like_wildcards_are_escaped(self, db_session, people):
+        """Test that % in the query is matched literally."""
+        results = self._search(db_session, "%")
+        assert people[3] not in results
@@ -0,0 +1,94 @@
+"""
+Query budget tests for list pages and batch endpoints.
+
+Each route asserts the @query_budget declared next to it, so a change that
+adds per-row queries (N+1) fails here instead of showing up as a slow page.
+"""
+
+import pytest
+
+from app.models import Interaction, OrgType, Organization, Person, PersonEmail, PersonOrganization, Tag
+from app.models.tag import PersonTag
+from app.services.person_merge import find_potential_duplicates
+
+
+@pytest.fixture
+def populated(db_session):
+    """Enough rows that per-row queries would blow every budget."""
+    tag = Tag(name="Budget Test Tag")
+    org = Organization(name="Budget Test Org", org_type=OrgType.company)
+    db_session.add_all([tag, org])
+    db_session.flush()
+
+    persons = []
+    for i in range(30):
+        person = Person(full_name=f"Budget Person {i:02d}", tags=[tag])
+        db_session.add(person)
+        persons.append(person)
+    db_session.flush()
+
+    for person in persons:
+        db_session.add(PersonOrganization(person_id=person.id, organization_id=org.id))
+        db_session.add(PersonEmail(person_id=person.id, email=f"{person.id.hex}@budget-test.example"))
+        db_session.add(Interaction(person_id=person.id, notes="Budget call"))
+    db_session.flush()
+    return {"persons": persons, "tag": tag, "org": org}
+
+
+class TestListPageBudgets:
+    """Test that list pages stay within their declared budgets."""
+
+    @pytest.mark.parametrize("url", [
+        "/people",
+        "/people/table",
+        "/people/table?cursor=",
+        "/people/table?q=budget",
+        "/organizations",
+        "/organizations/table",
+        "/interactions",
+        "/interactions/table",
+        "/emails/table",
+    ])
+    def test_list_within_budget(self, budget_client, populated, url):
+        """Test that rendering a list page does not scale queries with rows."""
+        response = budget_client.get(url)
+        assert response.status_code == 200
+
+
+class TestBatchBudgets:
+    """Test that batch endpoints use a fixed number of queries."""
+
+    def test_batch_add_tags(self, budget_client, populated, db_session):
+        """Test that tagging many persons runs a constant number of queries."""
+        new_tag = Tag(name="Budget Batch Tag")
+        db_session.add(new_tag)
+        db_session.flush()
+        person_ids = [str(p.id) for p in populated["persons"]]
+
+        response = budget_client.post(
+            "/people/batch/tags",
+            json={"person_ids": person_ids, "tag_ids": [str(new_tag.id), str(populated["tag"].id)]},
+        )
+
+        assert response.status_code == 200
+        # Only the new tag is added; the existing links are skipped
+        assert response.json()["added_count"] == len(person_ids)
+        assert db_session.query(PersonTag).filter_by(tag_id=new_tag.id).count() == len(person_ids)
+
+    def test_batch_delete_modal(self, budget_client, populated):
+        """Test that the delete modal counts Google-linked persons in one query."""
+        ids = [str(p.id) for p in populated["persons"]]
+        response = budget_client.post("/people/batch/delete/modal", json={"ids": ids})
+        assert response.status_code == 200
+
+
+class TestServiceBudgets:
+    """Test query counts of services called from pages."""
+
+    def test_find_potential_duplicates(self, db_session, populated, assert_max_queries):
+        """Test that same-domain matches load their persons in the same query."""
+        person = populated["persons"][0]
+        with assert_max_queries(5):
+            duplicates = find_potential_duplicates(db_session, person.id, limit=20)
+            assert all(d["person"].full_name for d in duplicates)
+        assert len(duplicates) == 20
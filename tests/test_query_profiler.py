@@ -0,0 +1,83 @@
+"""
+Tests for the per-request query profiler.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.utils import query_profiler
+from app.utils.query_profiler import QueryProfiler, QueryStats, capture
+
+
+class TestQueryStats:
+    """Test per-request statement accounting."""
+
+    def test_record_counts_and_times(self):
+        """Test that statements add to count and total time."""
+        stats = QueryStats()
+        stats.record("SELECT 1", 1.5)
+        stats.record("SELECT 1", 2.5)
+        assert stats.count == 2
+        assert stats.total_ms == 4.0
+
+    def test_most_repeated(self):
+        """Test that the most frequent statement is reported."""
+        stats = QueryStats()
+        for _ in range(3):
+            stats.record("SELECT * FROM persons WHERE id = %(id)s", 0.1)
+        stats.record("SELECT 1", 0.1)
+        assert stats.most_repeated() == ("SELECT * FROM persons WHERE id = %(id)s", 3)
+
+    def test_most_repeated_empty(self):
+        """Test that no statements reports nothing."""
+        assert QueryStats().most_repeated() == (None, 0)
+
+
+class TestQueryProfiler:
+    """Test per-route aggregation."""
+
+    def test_aggregates_per_route(self):
+        """Test averages, maxima and the worst repeated statement."""
+        profiler = QueryProfiler()
+        first, second = QueryStats(), QueryStats()
+        first.record("SELECT 1", 2.0)
+        for _ in range(4):
+            second.record("SELECT 2", 1.0)
+
+        profiler.add("GET /people", first)
+        profiler.add("GET /people", second)
+
+        (route,) = profiler.routes()
+        assert route.requests == 2
+        assert route.avg_queries == 2.5
+        assert route.max_queries == 4
+        assert route.worst_repeat_count == 4
+        assert route.worst_repeat_statement == "SELECT 2"
+
+    def test_route_limit(self):
+        """Test that new routes are ignored once max_routes is reached."""
+        profiler = QueryProfiler(max_routes=1)
+        profiler.add("GET /a", QueryStats())
+        profiler.add("GET /b", QueryStats())
+        assert [r.route for r in profiler.routes()] == ["GET /a"]
+
+
+class TestCapture:
+    """Test statement capture through engine events."""
+
+    def test_counts_executed_statements(self, db_session):
+        """Test that statements inside the block are counted."""
+        query_profiler.enable(Engine)
+        with capture() as stats:
+            db_session.execute(text("SELECT 1"))
+            db_session.execute(text("SELECT 2"))
+        assert stats.count == 2
+        assert stats.total_ms >= 0
+
+    def test_outside_block_not_counted(self, db_session):
+        """Test that statements after the block are ignored."""
+        query_profiler.enable(Engine)
+        with capture() as stats:
+            db_session.execute(text("SELECT 1"))
+        db_session.execute(text("SELECT 2"))
+        assert stats.count == 1
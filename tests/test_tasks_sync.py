@@ -0,0 +1,172 @@
+"""
+Tests for the local Google Tasks mirror (refresh and write-through).
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.models import GoogleAccount, GoogleTask, GoogleTaskList
+from app.services.google_clients import clear_google_clients
+from app.services.tasks_service import TasksService
+from app.services.tasks_sync_service import TasksSyncService
+
+
+@pytest.fixture
+def google_account(db_session, monkeypatch):
+    """Create a test Google account."""
+    monkeypatch.setenv("ENCRYPTION_KEY", "izZY7IUIzei-kSYNOCgiIpwOSv9_hioCMBrs2mD9drs=")
+    from app.config import get_settings
+    from app.services.encryption import get_encryption_service
+    get_settings.cache_clear()
+    get_encryption_service.cache_clear()
+
+    account = GoogleAccount.create_with_credentials(
+        email="tasks-sync-test@gmail.com",
+        credentials={
+            "token": "test_token",
+            "refresh_token": "test_refresh_token",
+            "token_uri": "https://oauth2.googleapis.com/token",
+            "client_id": "test_client_id",
+            "client_secret": "test_client_secret",
+        },
+    )
+    db_session.add(account)
+    db_session.commit()
+    return account
+
+
+def _mock_api(mock_build, task_lists, *task_pages):
+    """Make tasklists().list() return task_lists and tasks().list() each page in turn."""
+    clear_google_clients()
+    mock_service = MagicMock()
+    mock_build.return_value = mock_service
+    mock_service.tasklists.return_value.list.return_value.execute.return_value = {"items": task_lists}
+    mock_service.tasks.return_value.list.return_value.execute.side_effect = list(task_pages)
+    return mock_service
+
+
+def _mirrored(db_session, account) -> dict[str, GoogleTask]:
+    return {
+        task.google_task_id: task
+        for task in db_session.query(GoogleTask).join(GoogleTaskList).filter(
+            GoogleTaskList.google_account_id == account.id
+        )
+    }
+
+
+class TestFullRefresh:
+    """Test the first refresh of a task list."""
+
+    @patch("app.services.google_clients.build")
+    def test_stores_open_tasks(self, mock_build, db_session, google_account):
+        """Test that lists and tasks are stored with due dates split once."""
+        _mock_api(mock_build, [{"id": "list-1", "title": "Work"}], {
+            "items": [
+                {"id": "t1", "title": "Date only", "status": "needsAction", "position": "001",
+                 "due": "2026-03-05T00:00:00.000Z"},
+                {"id": "t2", "title": "Timed", "status": "needsAction", "position": "002",
+                 "due": "2026-03-05T17:30:00.000Z"},
+                {"id": "t3", "title": "Child", "status": "needsAction", "position": "000", "parent": "t1"},
+            ],
+            "nextPageToken": "page2",
+        }, {"items": [{"id": "t4", "title": "Second page", "status": "needsAction", "position": "003"}]})
+
+        result = TasksSyncService(db_session).sync_account(google_account)
+
+        assert result.success
+        assert (result.lists_synced, result.tasks_synced) == (1, 4)
+        tasks = _mirrored(db_session, google_account)
+        assert tasks["t1"].due_date == date(2026, 3, 5) and tasks["t1"].due_time is None
+        assert tasks["t2"].due_time.strftime("%H:%M") == "12:30"
+        task_list = db_session.query(GoogleTaskList).filter_by(google_account_id=google_account.id).one()
+        assert task_list.title == "Work"
+        assert task_list.tasks_synced_at is not None
+
+    @patch("app.services.google_clients.build")
+    def test_widgets_read_mirror(self, mock_build, db_session, google_account):
+        """Test that get_tasks_by_list nests subtasks without calling Google."""
+        _mock_api(mock_build, [{"id": "list-1", "title": "Work"}], {"items": [
+            {"id": "parent", "title": "Parent", "status": "needsAction", "position": "001"},
+            {"id": "child", "title": "Child", "status": "needsAction", "position": "000", "parent": "parent"},
+        ]})
+        TasksSyncService(db_session).sync_account(google_account)
+
+        with patch("app.services.google_clients.build") as api:
+            task_lists = TasksService(db_session).get_tasks_by_list(account_id=google_account.id)
+        api.assert_not_called()
+
+        assert [tl["list_name"] for tl in task_lists] == ["Work"]
+        (parent,) = task_lists[0]["other_tasks"]
+        assert [t["id"] for t in parent["subtasks"]] == ["child"]
+
+
+class TestIncrementalRefresh:
+    """Test refreshes of lists synced before."""
+
+    @pytest.fixture
+    def synced_list(self, db_session, google_account):
+        task_list = GoogleTaskList(
+            google_account_id=google_account.id,
+            google_list_id="list-1",
+            title="Work",
+            tasks_synced_at=datetime.now(timezone.utc) - timedelta(minutes=10),
+        )
+        task_list.tasks = [
+            GoogleTask(google_task_id="done", title="Will complete"),
+            GoogleTask(google_task_id="kept", title="Untouched"),
+        ]
+        db_session.add(task_list)
+        db_session.commit()
+        return task_list
+
+    @patch("app.services.google_clients.build")
+    def test_applies_changes_since_last_refresh(self, mock_build, db_session, google_account, synced_list):
+        """Test that updatedMin is used and completed tasks leave the mirror."""
+        mock_service = _mock_api(mock_build, [{"id": "list-1", "title": "Work"}], {"items": [
+            {"id": "done", "title": "Will complete", "status": "completed"},
+            {"id": "new", "title": "New", "status": "needsAction"},
+        ]})
+
+        result = TasksSyncService(db_session).sync_account(google_account)
+
+        assert (result.tasks_synced, result.tasks_removed) == (1, 1)
+        kwargs = mock_service.tasks.return_value.list.call_args.kwargs
+        assert "updatedMin" in kwargs and kwargs["showDeleted"] is True
+        assert set(_mirrored(db_session, google_account)) == {"kept", "new"}
+
+    @patch("app.services.google_clients.build")
+    def test_deleted_list_removed(self, mock_build, db_session, google_account, synced_list):
+        """Test that lists gone from Google are dropped with their tasks."""
+        _mock_api(mock_build, [])
+
+        TasksSyncService(db_session).sync_account(google_account)
+
+        assert db_session.query(GoogleTaskList).filter_by(google_account_id=google_account.id).count() == 0
+        assert _mirrored(db_session, google_account) == {}
+
+
+class TestWriteThrough:
+    """Test that writes update the mirror without a refetch."""
+
+    @patch("app.services.google_clients.build")
+    def test_create_and_toggle(self, mock_build, db_session, google_account):
+        """Test that a created task appears and a completed one disappears."""
+        db_session.add(GoogleTaskList(google_account_id=google_account.id, google_list_id="list-1", title="Work"))
+        db_session.commit()
+        tasks_api = mock_build.return_value.tasks.return_value
+        tasks_api.insert.return_value.execute.return_value = {
+            "id": "created", "title": "Write tests", "status": "needsAction",
+        }
+        service = TasksService(db_session)
+
+        assert service.create_task("list-1", "Write tests")["success"]
+        assert set(_mirrored(db_session, google_account)) == {"created"}
+
+        tasks_api.get.return_value.execute.return_value = {"id": "created", "status": "needsAction"}
+        tasks_api.patch.return_value.execute.return_value = {
+            "id": "created", "title": "Write tests", "status": "completed",
+        }
+        assert service.toggle_task("list-1", "created")["completed"]
+        assert _mirrored(db_session, google_account) == {}